@@ -176,7 +176,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             await state.browser_pool.start()
 
             # Initialize queue manager
-            state.queue_manager = ExecutionQueue()
+            state.queue_manager = ExecutionQueue(
+                max_contexts_per_service=int(
+                    os.environ.get("MAX_CONTEXTS_PER_SERVICE", "4")
+                ),
+                min_contexts_per_service=int(
+                    os.environ.get("MIN_CONTEXTS_PER_SERVICE", "1")
+                ),
+            )
 
             # Initialize WebSocket handler
             state.websocket_handler = WebSocketHandler()
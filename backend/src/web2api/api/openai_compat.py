@@ -15,19 +15,27 @@ Workflow:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
 import time
 import uuid
+from dataclasses import dataclass
 from typing import Any, AsyncIterator
 
 import structlog
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from web2api.auth.service_cache import CachedService, get_service_cache
+
 logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
+# Maximum time to wait for a queued chat completion (seconds)
+DEFAULT_COMPLETION_TIMEOUT_SECONDS = 180.0
+
 
 # OpenAI API Models
 class ChatMessage(BaseModel):
@@ -45,6 +53,7 @@ class ChatCompletionRequest(BaseModel):
     temperature: float | None = None
     max_tokens: int | None = None
     stream: bool = False
+    timeout: float | None = Field(default=None, gt=0)  # Web2API extension (seconds)
 
 
 class ChatCompletionChoice(BaseModel):
@@ -104,6 +113,36 @@ class ServiceContainer:
 _container = ServiceContainer()
 
 
+@dataclass(frozen=True, slots=True)
+class _ReadyContainer:
+    """Service dependencies once the app has injected them."""
+
+    db: Any
+    browser: Any
+    queue_manager: Any
+    websocket_handler: Any
+
+
+def _require_container() -> _ReadyContainer:
+    """
+    Get the injected service dependencies.
+
+    Raises:
+        HTTPException: 503 while the database, browser or queue is not set
+    """
+    if not _container.db or not _container.browser or not _container.queue_manager:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service not ready. Please ensure browser and database are connected.",
+        )
+    return _ReadyContainer(
+        db=_container.db,
+        browser=_container.browser,
+        queue_manager=_container.queue_manager,
+        websocket_handler=_container.websocket_handler,
+    )
+
+
 def set_container(db, browser, queue_manager, websocket_handler=None):
     """Set service container dependencies."""
     _container.db = db
@@ -113,7 +152,10 @@ def set_container(db, browser, queue_manager, websocket_handler=None):
 
 
 @router.post("/v1/chat/completions", response_model=ChatCompletionResponse)
-async def chat_completion(request: ChatCompletionRequest) -> ChatCompletionResponse:
+async def chat_completion(
+    request: ChatCompletionRequest,
+    http_request: Request,
+) -> ChatCompletionResponse:
     """
     OpenAI-compatible chat completion endpoint.
 
@@ -131,37 +173,17 @@ async def chat_completion(request: ChatCompletionRequest) -> ChatCompletionRespo
 
     try:
         # Validate dependencies
-        if not _container.db or not _container.browser or not _container.queue_manager:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Service not ready. Please ensure browser and database are connected.",
-            )
-
-        # Get service from database
-        from sqlalchemy import select
+        container = _require_container()
 
         # Validate and parse service ID as UUID
         try:
             service_uuid = uuid.UUID(request.model)
-        except ValueError:
+        except ValueError as e:
             log.warning("Invalid service ID format", service_id=request.model)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid service ID format. Service ID must be a valid UUID.",
-            )
-
-        result = await _container.db.execute(
-            select(ServiceModel).where(ServiceModel.id == service_uuid)
-        )
-        service = result.scalar_one_or_none()
-
-        if not service:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Service {request.model} not found",
-            )
-
-        log.info("Processing chat completion", service_id=str(service.id), url=service.url)
+            ) from e
 
         # Get last message from user
         user_message = ""
@@ -176,129 +198,59 @@ async def chat_completion(request: ChatCompletionRequest) -> ChatCompletionRespo
                 detail="No user message provided",
             )
 
-        # Get service configuration (should be saved from discovery)
-        service_config = service.config or {}
-
-        # Auto-configure if not discovered yet
-        if not service_config or not service_config.get("ui_selectors"):
-            log.info("Service not configured, running auto-discovery...")
-            service_config = await _auto_discover_service(
-                service_id=str(service.id),
-                url=service.url,
-                browser=_container.browser,
-                context_id="default",
-            )
-            
-            # Save config to database
-            service.config = service_config
-            await _container.db.commit()
-
-        # Get credentials
-        from web2api.auth.credential_store import CredentialStore
-
-        cred_store = CredentialStore()
-        cred_result = await _container.db.execute(
-            select(ServiceCredentialModel).where(
-                ServiceCredentialModel.service_id == service.id
-            )
-        )
-        credentials_db = cred_result.scalar_one_or_none()
-
-        if not credentials_db:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Service credentials not found. Please add credentials first.",
-            )
+        # Resolve service config and credentials (cached after first request)
+        service_cache = get_service_cache()
+        service_id = str(service_uuid)
+        service = service_cache.get(service_id)
+        if service is None:
+            service = service_cache.put(await _load_service(service_uuid, log))
 
-        # Decrypt credentials
-        credentials = cred_store.decrypt_credentials(
-            encrypted_email=credentials_db.encrypted_email,
-            encrypted_password=credentials_db.encrypted_password,
-        )
-
-        # Ensure authenticated session
-        from web2api.auth.session_manager import SessionManager
-        from web2api.auth.form_filler import FormFiller
-        from web2api.storage.database import SessionCookieStorage
+        log.info("Processing chat completion", service_id=service.service_id, url=service.url)
 
-        session_manager = SessionManager()
-        cookie_storage = SessionCookieStorage(_container.db)
-        context_id = f"service_{service.id}"  # Use service-specific context
+        service_config = service.config
+        context_id = f"service_{service.service_id}"  # Use service-specific context
 
-        # Try to restore existing session (loads cookies)
-        session_restored = await session_manager.restore_session(
-            str(service.id),
-            _container.browser,
-            context_id=context_id,
-            storage=cookie_storage,
-            service_url=service.url,
-        )
-
-        # If no session or session invalid, need to login
-        if not session_restored:
-            log.info("No valid session, performing login...")
-            
-            # Navigate to service URL first
-            await _container.browser.browser_navigate({
-                "context_id": context_id,
-                "url": service.url,
-            })
-            await _container.browser.browser_wait_for_load({
-                "context_id": context_id,
-                "state": "domcontentloaded",
-                "timeout": 30000,
-            })
-            
-            # Perform login
-            form_filler = FormFiller()
-            login_success = await form_filler.complete_login_flow(
-                _container.browser,
-                context_id,
-                credentials,
-            )
-
-            if not login_success:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Failed to authenticate with service. Check credentials.",
-                )
-
-            # Save session cookies for future requests
-            await session_manager.save_session(
-                str(service.id),
-                _container.browser,
-                context_id,
-                cookie_storage,
-                service_url=service.url,
-            )
-            
-            log.info("Login successful, session saved")
-        else:
-            log.info("Session restored from cookies")
+        # Ensure authenticated session; skipped while the context is known to be logged in
+        if not service.session_valid:
+            async with service_cache.session_lock(service.service_id):
+                if not service.session_valid:
+                    await _ensure_session(service, context_id, log)
+                    service_cache.mark_session_valid(service.service_id)
 
         # Execute chat completion operation
-        task_id = await _container.queue_manager.add_task(
-            service_id=str(service.id),
+        task_id = await container.queue_manager.add_task(
+            service_id=service.service_id,
             service_config=service_config,
             operation_id="chat_completion",
             parameters={"message": user_message},
-            browser=_container.browser,
+            browser=container.browser,
             context_id=context_id,
-            websocket_handler=_container.websocket_handler,
+            websocket_handler=container.websocket_handler,
+            stream=request.stream,
         )
+        timeout = request.timeout or DEFAULT_COMPLETION_TIMEOUT_SECONDS
 
-        # Wait for task to complete
-        max_wait = 180  # 3 minutes max wait
-        waited = 0
-        while waited < max_wait:
-            task = await _container.queue_manager.get_task_status(task_id)
-            if task and task["status"] in ["completed", "failed"]:
-                break
-            await asyncio.sleep(0.5)
-            waited += 0.5
+        # Handle streaming response: deltas are forwarded as the service generates them
+        if request.stream:
+            completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+            return StreamingResponse(
+                generate_stream_response(
+                    completion_id, request.model, task_id, timeout, service.service_id
+                ),
+                media_type="text/event-stream",
+                headers={
+                    "Cache-Control": "no-cache",
+                    "Connection": "keep-alive",
+                },
+            )
+
+        # Wait for task to complete (resolves as soon as the worker finishes)
+        task = await _wait_for_task_or_disconnect(task_id, http_request, timeout=timeout)
 
-        if not task or task["status"] == "failed":
-            error_msg = task.get("error", "Unknown error") if task else "Task not found"
+        if task["status"] != "completed":
+            # The session may have expired; re-check it on the next request
+            service_cache.invalidate_session(service.service_id)
+            error_msg = task.get("error", "Unknown error")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Execution failed: {error_msg}",
@@ -336,18 +288,6 @@ async def chat_completion(request: ChatCompletionRequest) -> ChatCompletionRespo
             tokens=total_tokens,
             response_length=len(result),
         )
-        
-        # Handle streaming response
-        if request.stream:
-            completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
-            return StreamingResponse(
-                generate_stream_response(completion_id, request.model, result),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                },
-            )
 
         return response
 
@@ -358,7 +298,188 @@ async def chat_completion(request: ChatCompletionRequest) -> ChatCompletionRespo
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Chat completion failed: {str(e)}",
+        ) from e
+
+
+async def _load_service(service_uuid: uuid.UUID, log: Any) -> CachedService:
+    """
+    Load service config and decrypted credentials from the database.
+
+    Runs auto-discovery (and persists the result) if the service has no
+    UI selectors yet.
+    """
+    from sqlalchemy import select
+
+    from web2api.auth.credential_store import CredentialStore
+
+    container = _require_container()
+    result = await container.db.execute(
+        select(ServiceModel).where(ServiceModel.id == service_uuid)
+    )
+    service = result.scalar_one_or_none()
+
+    if not service:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Service {service_uuid} not found",
+        )
+
+    # Get service configuration (should be saved from discovery)
+    service_config = service.config or {}
+
+    # Auto-configure if not discovered yet
+    if not service_config or not service_config.get("ui_selectors"):
+        log.info("Service not configured, running auto-discovery...")
+        service_config = await _auto_discover_service(
+            service_id=str(service.id),
+            url=service.url,
+            browser=container.browser,
+            context_id="default",
+        )
+
+        # Save config to database
+        service.config = service_config
+        await container.db.commit()
+
+    # Get credentials
+    cred_result = await container.db.execute(
+        select(ServiceCredentialModel).where(
+            ServiceCredentialModel.service_id == service.id
         )
+    )
+    credentials_db = cred_result.scalar_one_or_none()
+
+    if not credentials_db:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Service credentials not found. Please add credentials first.",
+        )
+
+    # Decrypt credentials
+    credentials = CredentialStore().decrypt_credentials(
+        encrypted_email=credentials_db.encrypted_email,
+        encrypted_password=credentials_db.encrypted_password,
+    )
+
+    return CachedService(
+        service_id=str(service.id),
+        url=service.url,
+        config=service_config,
+        credentials=credentials,
+    )
+
+
+async def _ensure_session(service: CachedService, context_id: str, log: Any) -> None:
+    """Restore saved session cookies into the service context, or log in and save them."""
+    from web2api.auth.form_filler import FormFiller
+    from web2api.auth.session_manager import SessionManager
+    from web2api.storage.database import SessionCookieStorage
+
+    container = _require_container()
+    session_manager = SessionManager()
+    cookie_storage = SessionCookieStorage(container.db)
+
+    # Try to restore existing session (loads cookies)
+    session_restored = await session_manager.restore_session(
+        service.service_id,
+        container.browser,
+        context_id=context_id,
+        storage=cookie_storage,
+        service_url=service.url,
+    )
+
+    if session_restored:
+        log.info("Session restored from cookies")
+        return
+
+    # If no session or session invalid, need to login
+    log.info("No valid session, performing login...")
+
+    # Navigate to service URL first
+    await container.browser.browser_navigate({
+        "context_id": context_id,
+        "url": service.url,
+    })
+    await container.browser.browser_wait_for_load({
+        "context_id": context_id,
+        "state": "domcontentloaded",
+        "timeout": 30000,
+    })
+
+    # Perform login
+    form_filler = FormFiller()
+    login_success = await form_filler.complete_login_flow(
+        container.browser,
+        context_id,
+        service.credentials,
+    )
+
+    if not login_success:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Failed to authenticate with service. Check credentials.",
+        )
+
+    # Save session cookies for future requests
+    await session_manager.save_session(
+        service.service_id,
+        container.browser,
+        context_id,
+        cookie_storage,
+        service_url=service.url,
+    )
+
+    log.info("Login successful, session saved")
+
+
+async def _wait_for_task_or_disconnect(
+    task_id: str,
+    http_request: Request,
+    timeout: float,
+) -> dict[str, Any]:
+    """
+    Wait for a queued task, cancelling it if the client goes away or time runs out.
+
+    Raises:
+        HTTPException: 504 on timeout, 499 if the client disconnected
+    """
+    wait_task = asyncio.create_task(
+        _require_container().queue_manager.wait_for_task(task_id, timeout=timeout)
+    )
+    disconnect_task = asyncio.create_task(_wait_for_disconnect(http_request))
+
+    try:
+        await asyncio.wait(
+            {wait_task, disconnect_task},
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+    finally:
+        disconnect_task.cancel()
+
+    if not wait_task.done():
+        # Client disconnected first; cancelling the wait drops the queued task
+        wait_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await wait_task
+        logger.info("Client disconnected, task abandoned", task_id=task_id)
+        raise HTTPException(status_code=499, detail="Client closed request")
+
+    try:
+        result: dict[str, Any] = wait_task.result()
+    except TimeoutError as e:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Execution timed out after {int(timeout)}s",
+        ) from e
+    return result
+
+
+async def _wait_for_disconnect(http_request: Request) -> None:
+    """Return once the HTTP client disconnects."""
+    while True:
+        message = await http_request.receive()
+        if message["type"] == "http.disconnect":
+            return
 
 
 async def _auto_discover_service(
@@ -405,6 +526,7 @@ async def _auto_discover_service(
             "output": selectors.output_selector,
             "stop_button": selectors.stop_button,
             "new_chat_button": selectors.new_chat_button,
+            "message_container": selectors.message_container,
         },
         "operations": [
             {
@@ -457,7 +579,7 @@ async def list_models() -> ModelsResponse:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list models. Please try again later.",
-        )
+        ) from e
 
 
 # ============================================================================
@@ -485,73 +607,62 @@ class ChatCompletionChunk(BaseModel):
 async def generate_stream_response(
     completion_id: str,
     model: str,
-    result: str,
+    task_id: str,
+    timeout: float,
+    service_id: str,
 ) -> AsyncIterator[str]:
     """
-    Generate SSE stream from the result.
-    
-    Since web chat interfaces don't provide true streaming,
-    we simulate streaming by yielding chunks of the final response.
+    Generate SSE stream for a queued streaming task.
+
+    Each chunk carries the text that appeared in the web chat's output
+    area since the previous chunk, so the first token reaches the client
+    while the remote service is still generating. If the client goes
+    away, the stream is closed and a still-queued task is dropped. A
+    failed task invalidates the service's session, as for non-streaming
+    requests.
     """
     created = int(time.time())
     
-    # Send initial chunk with role
-    initial_chunk = ChatCompletionChunk(
-        id=completion_id,
-        created=created,
-        model=model,
-        choices=[
-            ChatCompletionChunkChoice(
-                index=0,
-                delta={"role": "assistant"},
-            )
-        ],
-    )
-    yield f"data: {initial_chunk.model_dump_json()}\n\n"
-    
-    # Split result into chunks and yield
-    # Use word boundaries for natural chunking
-    words = result.split(" ")
-    chunk_size = 5  # Words per chunk
-    
-    for i in range(0, len(words), chunk_size):
-        chunk_words = words[i:i + chunk_size]
-        chunk_text = " ".join(chunk_words)
-        
-        # Add space before next chunk (except at start)
-        if i > 0:
-            chunk_text = " " + chunk_text
-        
-        chunk = ChatCompletionChunk(
+    def chunk(delta: dict[str, str], finish_reason: str | None = None) -> str:
+        payload = ChatCompletionChunk(
             id=completion_id,
             created=created,
             model=model,
             choices=[
                 ChatCompletionChunkChoice(
                     index=0,
-                    delta={"content": chunk_text},
+                    delta=delta,
+                    finish_reason=finish_reason,
                 )
             ],
         )
-        yield f"data: {chunk.model_dump_json()}\n\n"
-        
-        # Small delay to simulate streaming
-        await asyncio.sleep(0.02)
+        return f"data: {payload.model_dump_json()}\n\n"
+    
+    # Send initial chunk with role
+    yield chunk({"role": "assistant"})
+    
+    queue_manager = _require_container().queue_manager
+    error: str | None = None
+    try:
+        async for delta in queue_manager.stream_task(task_id, timeout=timeout):
+            yield chunk({"content": delta})
+
+        task = await queue_manager.get_task_status(task_id)
+        if not task or task["status"] != "completed":
+            error = (task or {}).get("error", "Unknown error")
+    except TimeoutError:
+        error = f"Execution timed out after {int(timeout)}s"
+
+    if error is not None:
+        # The session may have expired; re-check it on the next request
+        get_service_cache().invalidate_session(service_id)
+        logger.error("Streaming chat completion failed", task_id=task_id, error=error)
+        error_payload = {"error": {"message": f"Execution failed: {error}", "type": "server_error"}}
+        yield f"data: {json.dumps(error_payload)}\n\n"
+    else:
+        # Send final chunk with finish_reason
+        yield chunk({}, finish_reason="stop")
     
-    # Send final chunk with finish_reason
-    final_chunk = ChatCompletionChunk(
-        id=completion_id,
-        created=created,
-        model=model,
-        choices=[
-            ChatCompletionChunkChoice(
-                index=0,
-                delta={},
-                finish_reason="stop",
-            )
-        ],
-    )
-    yield f"data: {final_chunk.model_dump_json()}\n\n"
     yield "data: [DONE]\n\n"
 
 
@@ -15,6 +15,7 @@ from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel, EmailStr, HttpUrl
 
 from web2api.auth.credential_store import CredentialStore
+from web2api.auth.service_cache import get_service_cache
 from web2api.discovery.orchestrator import DiscoveryOrchestrator
 from web2api.storage.service_models import (
     ServiceModel,
@@ -246,6 +247,9 @@ async def delete_service(
         )
         await db.commit()
 
+        # Drop cached config, credentials and session state
+        get_service_cache().invalidate(str(uuid.UUID(service_id)))
+
         logger.info("Service deleted", service_id=service_id)
 
         return {"status": "deleted", "service_id": service_id}
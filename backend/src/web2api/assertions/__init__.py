@@ -21,6 +21,7 @@ from web2api.assertions.ml_engine import (
     ColorAnalyzer,
     ColorInfo,
     ContrastResult,
+    DecodedImage,
     DetectedElement,
     FormFieldDetector,
     IconMatcher,
@@ -31,11 +32,13 @@ from web2api.assertions.ml_engine import (
     LayoutInfo,
     MLAssertionEngine,
     MLAssertionResult,
+    MLBatchAssertion,
     OCRAssertion,
     OCRResult,
     RegionDiffAnalyzer,
     UIState,
 )
+from web2api.assertions.ocr_service import OCRService, get_ocr_service
 
 __all__ = [
     # Core assertion engine
@@ -45,9 +48,12 @@ __all__ = [
     # ML assertion engine
     "MLAssertionEngine",
     "MLAssertionResult",
+    "MLBatchAssertion",
     # ML assertion types
     "OCRAssertion",
     "OCRResult",
+    "OCRService",
+    "get_ocr_service",
     "ImageClassifier",
     "UIState",
     "ColorAnalyzer",
@@ -64,4 +70,5 @@ __all__ = [
     "RegionDiffAnalyzer",
     # Utilities
     "ImageLoader",
+    "DecodedImage",
 ]
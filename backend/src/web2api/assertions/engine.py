@@ -913,7 +913,8 @@ class AssertionEngine:
         """
         Execute a unified ML-based assertion.
 
-        Runs all specified ML assertion types in the config.
+        Runs all specified ML assertion types in the config as one batch,
+        so the screenshot is decoded once and intermediate results are shared.
 
         Returns:
             True if all assertions passed
@@ -921,38 +922,33 @@ class AssertionEngine:
         Raises:
             AssertionError: If any ML assertion fails
         """
+        from web2api.assertions.ml_engine import MLBatchAssertion
+
         screenshot = self._page.screenshot()
         ml_engine = self._get_ml_engine()
 
+        # (custom failure message, assertion) in evaluation order
+        batch: list[tuple[str | None, MLBatchAssertion]] = []
+
         if config.ocr is not None:
-            result = ml_engine.ocr.validate(
-                screenshot,
-                expected_text=config.ocr.expected_text,
-                contains=config.ocr.contains,
-                min_confidence=config.ocr.min_confidence,
-                region=config.ocr.region,
-            )
-            if not result.passed:
-                raise AssertionError(
-                    config.ocr.message or result.message,
-                    expected=result.expected,
-                    actual=result.actual,
-                    details=result.details,
-                )
+            batch.append((
+                config.ocr.message,
+                MLBatchAssertion("ocr", {
+                    "expected_text": config.ocr.expected_text,
+                    "contains": config.ocr.contains,
+                    "min_confidence": config.ocr.min_confidence,
+                    "region": config.ocr.region,
+                }),
+            ))
 
         if config.ui_state is not None:
-            result = ml_engine.classifier.validate(
-                screenshot,
-                expected_state=config.ui_state.expected_state,
-                min_confidence=config.ui_state.min_confidence,
-            )
-            if not result.passed:
-                raise AssertionError(
-                    config.ui_state.message or result.message,
-                    expected=result.expected,
-                    actual=result.actual,
-                    details=result.details,
-                )
+            batch.append((
+                config.ui_state.message,
+                MLBatchAssertion("classifier", {
+                    "expected_state": config.ui_state.expected_state,
+                    "min_confidence": config.ui_state.min_confidence,
+                }),
+            ))
 
         if config.color is not None:
             color_kwargs: dict[str, Any] = {
@@ -964,58 +960,47 @@ class AssertionEngine:
             if config.color.has_color:
                 color_kwargs["has_color"] = config.color.has_color
 
-            result = ml_engine.color_analyzer.validate(screenshot, **color_kwargs)
-            if not result.passed:
-                raise AssertionError(
-                    config.color.message or result.message,
-                    expected=result.expected,
-                    actual=result.actual,
-                    details=result.details,
-                )
+            batch.append((config.color.message, MLBatchAssertion("color_analyzer", color_kwargs)))
 
         if config.layout is not None:
-            result = ml_engine.layout_analyzer.validate(
-                screenshot,
-                expected_count=config.layout.expected_count,
-                min_count=config.layout.min_count,
-                max_count=config.layout.max_count,
-                alignment=config.layout.alignment,
-                element_type=config.layout.element_type,
-                alignment_tolerance=config.layout.alignment_tolerance,
-            )
-            if not result.passed:
-                raise AssertionError(
-                    config.layout.message or result.message,
-                    expected=result.expected,
-                    actual=result.actual,
-                    details=result.details,
-                )
+            batch.append((
+                config.layout.message,
+                MLBatchAssertion("layout_analyzer", {
+                    "expected_count": config.layout.expected_count,
+                    "min_count": config.layout.min_count,
+                    "max_count": config.layout.max_count,
+                    "alignment": config.layout.alignment,
+                    "element_type": config.layout.element_type,
+                    "alignment_tolerance": config.layout.alignment_tolerance,
+                }),
+            ))
 
         if config.icon is not None:
-            result = ml_engine.icon_matcher.validate(
-                screenshot,
-                template_path=config.icon.template_path,
-                method=config.icon.method,
-                min_confidence=config.icon.min_confidence,
-            )
-            if not result.passed:
-                raise AssertionError(
-                    config.icon.message or result.message,
-                    expected=result.expected,
-                    actual=result.actual,
-                    details=result.details,
-                )
+            batch.append((
+                config.icon.message,
+                MLBatchAssertion("icon_matcher", {
+                    "template_path": config.icon.template_path,
+                    "method": config.icon.method,
+                    "min_confidence": config.icon.min_confidence,
+                }),
+            ))
 
         if config.accessibility is not None:
-            result = ml_engine.accessibility_checker.validate(
-                screenshot,
-                min_contrast_ratio=config.accessibility.min_contrast_ratio,
-                wcag_level=config.accessibility.wcag_level,
-                region=config.accessibility.region,
-            )
+            batch.append((
+                config.accessibility.message,
+                MLBatchAssertion("accessibility_checker", {
+                    "min_contrast_ratio": config.accessibility.min_contrast_ratio,
+                    "wcag_level": config.accessibility.wcag_level,
+                    "region": config.accessibility.region,
+                }),
+            ))
+
+        results = ml_engine.validate_batch(screenshot, [assertion for _, assertion in batch])
+
+        for (message, _), result in zip(batch, results, strict=True):
             if not result.passed:
                 raise AssertionError(
-                    config.accessibility.message or result.message,
+                    message or result.message,
                     expected=result.expected,
                     actual=result.actual,
                     details=result.details,
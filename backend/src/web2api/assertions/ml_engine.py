@@ -11,17 +11,25 @@ Provides machine learning and computer vision-based assertions:
 - Form field detection
 - Accessibility checks (contrast ratios, font sizes)
 - Screenshot diff with region-based analysis
+
+Several assertions over one screenshot can be run together with
+``MLAssertionEngine.validate_batch``, which decodes the image once and
+shares derived arrays and OCR results between them.
 """
 
 from __future__ import annotations
 
 import colorsys
 import io
+import multiprocessing
+import os
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import StrEnum
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import cv2
 import numpy as np
@@ -29,10 +37,17 @@ import structlog
 from PIL import Image
 from sklearn.cluster import KMeans
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Sequence
+
+    from web2api.assertions.ocr_service import OCRService
+
 logger = structlog.get_logger(__name__)
 
 # Type aliases for clarity
-type ImageInput = bytes | str | Path | Image.Image | np.ndarray[Any, np.dtype[np.uint8]]
+type ImageInput = (
+    bytes | str | Path | Image.Image | np.ndarray[Any, np.dtype[np.uint8]] | DecodedImage
+)
 type BoundingBox = tuple[int, int, int, int]  # x, y, width, height
 
 
@@ -166,12 +181,102 @@ class MLAssertionResult:
     details: dict[str, Any] = field(default_factory=dict)
 
 
+class DecodedImage:
+    """
+    An image decoded once, with derived arrays computed on first use.
+
+    Accepted anywhere an ImageInput is, so assertions run on the same
+    DecodedImage share the decode, the grayscale/HSV/edge conversions and
+    memoised results such as OCR text and color clusters. The arrays are
+    shared, so callers must not modify them in place.
+    """
+
+    def __init__(self, image: ImageInput) -> None:
+        """
+        Decode an image.
+
+        Args:
+            image: Input image in any supported format
+        """
+        self._bgr = ImageLoader.to_cv2(image)
+        self._rgb: np.ndarray[Any, np.dtype[np.uint8]] | None = None
+        self._pil: Image.Image | None = None
+        self._gray: np.ndarray[Any, np.dtype[np.uint8]] | None = None
+        self._hsv: np.ndarray[Any, np.dtype[np.uint8]] | None = None
+        self._edges: np.ndarray[Any, np.dtype[np.uint8]] | None = None
+        self._memo: dict[tuple[Hashable, ...], object] = {}
+
+    @classmethod
+    def of(cls, image: ImageInput) -> DecodedImage:
+        """Get a DecodedImage for an input, decoding only if needed."""
+        return image if isinstance(image, DecodedImage) else cls(image)
+
+    @property
+    def bgr(self) -> np.ndarray[Any, np.dtype[np.uint8]]:
+        """OpenCV BGR array."""
+        return self._bgr
+
+    @property
+    def rgb(self) -> np.ndarray[Any, np.dtype[np.uint8]]:
+        """RGB array."""
+        if self._rgb is None:
+            self._rgb = cv2.cvtColor(self._bgr, cv2.COLOR_BGR2RGB).astype(np.uint8, copy=False)
+        return self._rgb
+
+    @property
+    def pil(self) -> Image.Image:
+        """RGB PIL image."""
+        if self._pil is None:
+            self._pil = Image.fromarray(self.rgb)
+        return self._pil
+
+    @property
+    def gray(self) -> np.ndarray[Any, np.dtype[np.uint8]]:
+        """Grayscale array."""
+        if self._gray is None:
+            self._gray = cv2.cvtColor(self._bgr, cv2.COLOR_BGR2GRAY).astype(np.uint8, copy=False)
+        return self._gray
+
+    @property
+    def hsv(self) -> np.ndarray[Any, np.dtype[np.uint8]]:
+        """HSV array."""
+        if self._hsv is None:
+            self._hsv = cv2.cvtColor(self._bgr, cv2.COLOR_BGR2HSV).astype(np.uint8, copy=False)
+        return self._hsv
+
+    @property
+    def edges(self) -> np.ndarray[Any, np.dtype[np.uint8]]:
+        """Canny edge map of the grayscale image."""
+        if self._edges is None:
+            self._edges = cv2.Canny(self.gray, 50, 150).astype(np.uint8, copy=False)
+        return self._edges
+
+    def memoize[T](self, key: tuple[Hashable, ...], compute: Callable[[], T]) -> T:
+        """
+        Get a result derived from this image, computing it on first request.
+
+        Args:
+            key: Identifies the computation and its parameters
+            compute: Produces the result on a miss
+
+        Returns:
+            The memoised result
+        """
+        if key in self._memo:
+            return cast("T", self._memo[key])
+        result = compute()
+        self._memo[key] = result
+        return result
+
+
 class ImageLoader:
     """Utility class for loading images from various sources."""
 
     @staticmethod
     def to_pil(image: ImageInput) -> Image.Image:
         """Convert various image formats to PIL Image."""
+        if isinstance(image, DecodedImage):
+            return image.pil
         if isinstance(image, Image.Image):
             return image.convert("RGB")
         if isinstance(image, np.ndarray):
@@ -186,18 +291,47 @@ class ImageLoader:
     @staticmethod
     def to_cv2(image: ImageInput) -> np.ndarray[Any, np.dtype[np.uint8]]:
         """Convert various image formats to OpenCV BGR array."""
+        if isinstance(image, DecodedImage):
+            return image.bgr
         if isinstance(image, np.ndarray):
             if len(image.shape) == 2:  # Grayscale
-                return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+                return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR).astype(np.uint8, copy=False)
             return image
         pil_img = ImageLoader.to_pil(image)
-        return cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+        return cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR).astype(np.uint8, copy=False)
 
     @staticmethod
     def to_grayscale(image: ImageInput) -> np.ndarray[Any, np.dtype[np.uint8]]:
         """Convert image to grayscale numpy array."""
+        if isinstance(image, DecodedImage):
+            return image.gray
         cv2_img = ImageLoader.to_cv2(image)
-        return cv2.cvtColor(cv2_img, cv2.COLOR_BGR2GRAY)
+        return cv2.cvtColor(cv2_img, cv2.COLOR_BGR2GRAY).astype(np.uint8, copy=False)
+
+    @staticmethod
+    def to_rgb(image: ImageInput) -> np.ndarray[Any, np.dtype[np.uint8]]:
+        """Convert image to RGB numpy array."""
+        if isinstance(image, DecodedImage):
+            return image.rgb
+        return cv2.cvtColor(ImageLoader.to_cv2(image), cv2.COLOR_BGR2RGB).astype(
+            np.uint8, copy=False
+        )
+
+    @staticmethod
+    def to_hsv(image: ImageInput) -> np.ndarray[Any, np.dtype[np.uint8]]:
+        """Convert image to HSV numpy array."""
+        if isinstance(image, DecodedImage):
+            return image.hsv
+        return cv2.cvtColor(ImageLoader.to_cv2(image), cv2.COLOR_BGR2HSV).astype(
+            np.uint8, copy=False
+        )
+
+    @staticmethod
+    def to_edges(image: ImageInput) -> np.ndarray[Any, np.dtype[np.uint8]]:
+        """Get the Canny edge map (thresholds 50/150) of an image."""
+        if isinstance(image, DecodedImage):
+            return image.edges
+        return cv2.Canny(ImageLoader.to_grayscale(image), 50, 150).astype(np.uint8, copy=False)
 
 
 class BaseMLAssertion(ABC):
@@ -223,21 +357,33 @@ class OCRAssertion(BaseMLAssertion):
         self,
         backend: Literal["pytesseract", "easyocr"] = "easyocr",
         languages: list[str] | None = None,
+        service: OCRService | None = None,
     ) -> None:
+        """
+        Initialize OCR assertion.
+
+        Args:
+            backend: OCR backend to use
+            languages: OCR languages (default: English)
+            service: OCR service running the models (default: the shared
+                process-wide service)
+        """
         super().__init__()
         self._backend = backend
         self._languages = languages or ["en"]
-        self._reader: Any = None
+        self._service = service
 
-    def _get_reader(self) -> Any:
-        """Lazy-load the OCR reader."""
-        if self._reader is None:
-            if self._backend == "easyocr":
-                import easyocr
+    def _get_service(self) -> OCRService:
+        """Get the OCR service (lazy-loaded)."""
+        if self._service is None:
+            from web2api.assertions.ocr_service import get_ocr_service
+
+            self._service = get_ocr_service()
+        return self._service
 
-                self._reader = easyocr.Reader(self._languages, gpu=False)
-            # For pytesseract, no reader initialization needed
-        return self._reader
+    def _get_reader(self) -> Any:
+        """Get the shared OCR reader (None for pytesseract)."""
+        return self._get_service().reader(self._backend, self._languages)
 
     def extract_text(
         self,
@@ -254,72 +400,20 @@ class OCRAssertion(BaseMLAssertion):
         Returns:
             OCRResult with extracted text and confidence
         """
+        if isinstance(image, DecodedImage):
+            key = ("ocr", self._backend, tuple(self._languages), region)
+            return image.memoize(key, lambda: self._extract(image, region))
+        return self._extract(image, region)
+
+    def _extract(self, image: ImageInput, region: BoundingBox | None) -> OCRResult:
+        """Run OCR on an image or one of its regions."""
         pil_img = ImageLoader.to_pil(image)
 
         if region:
             x, y, w, h = region
             pil_img = pil_img.crop((x, y, x + w, y + h))
 
-        if self._backend == "easyocr":
-            return self._extract_easyocr(pil_img)
-        return self._extract_pytesseract(pil_img)
-
-    def _extract_easyocr(self, image: Image.Image) -> OCRResult:
-        """Extract text using EasyOCR."""
-        reader = self._get_reader()
-        img_array = np.array(image)
-
-        results = reader.readtext(img_array, detail=1)
-
-        if not results:
-            return OCRResult(text="", confidence=0.0)
-
-        texts = []
-        word_confidences = []
-        total_conf = 0.0
-
-        for _bbox, text, conf in results:
-            texts.append(text)
-            word_confidences.append((text, conf))
-            total_conf += conf
-
-        full_text = " ".join(texts)
-        avg_confidence = total_conf / len(results) if results else 0.0
-
-        return OCRResult(
-            text=full_text,
-            confidence=avg_confidence,
-            word_confidences=tuple(word_confidences),
-        )
-
-    def _extract_pytesseract(self, image: Image.Image) -> OCRResult:
-        """Extract text using pytesseract."""
-        import pytesseract
-
-        data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
-
-        texts = []
-        word_confidences = []
-        total_conf = 0.0
-        word_count = 0
-
-        for i, text in enumerate(data["text"]):
-            if text.strip():
-                conf = float(data["conf"][i])
-                if conf > 0:  # pytesseract returns -1 for non-text
-                    texts.append(text)
-                    word_confidences.append((text, conf / 100.0))
-                    total_conf += conf / 100.0
-                    word_count += 1
-
-        full_text = " ".join(texts)
-        avg_confidence = total_conf / word_count if word_count > 0 else 0.0
-
-        return OCRResult(
-            text=full_text,
-            confidence=avg_confidence,
-            word_confidences=tuple(word_confidences),
-        )
+        return self._get_service().recognize(pil_img, self._backend, self._languages)
 
     def validate(
         self,
@@ -421,14 +515,14 @@ class ImageClassifier(BaseMLAssertion):
             Tuple of (detected state, confidence)
         """
         cv2_img = ImageLoader.to_cv2(image)
-        hsv = cv2.cvtColor(cv2_img, cv2.COLOR_BGR2HSV)
+        hsv = ImageLoader.to_hsv(image)
 
         # Analyze color distribution
         state_scores: dict[UIState, float] = {
             UIState.ERROR: self._score_error_state(hsv, cv2_img),
             UIState.SUCCESS: self._score_success_state(hsv),
-            UIState.LOADING: self._score_loading_state(cv2_img),
-            UIState.EMPTY: self._score_empty_state(cv2_img),
+            UIState.LOADING: self._score_loading_state(ImageLoader.to_grayscale(image)),
+            UIState.EMPTY: self._score_empty_state(ImageLoader.to_edges(image)),
         }
 
         # Get best match
@@ -470,10 +564,8 @@ class ImageClassifier(BaseMLAssertion):
 
         return min(green_ratio * 10, 1.0)
 
-    def _score_loading_state(self, bgr: np.ndarray[Any, np.dtype[np.uint8]]) -> float:
+    def _score_loading_state(self, gray: np.ndarray[Any, np.dtype[np.uint8]]) -> float:
         """Score likelihood of loading state using circular detection."""
-        gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
-
         # Detect circles (spinners often contain circular elements)
         circles = cv2.HoughCircles(
             gray,
@@ -492,12 +584,9 @@ class ImageClassifier(BaseMLAssertion):
 
         return 0.0
 
-    def _score_empty_state(self, bgr: np.ndarray[Any, np.dtype[np.uint8]]) -> float:
+    def _score_empty_state(self, edges: np.ndarray[Any, np.dtype[np.uint8]]) -> float:
         """Score likelihood of empty state based on content sparsity."""
-        gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
-
         # Calculate edge density (empty states have fewer edges)
-        edges = cv2.Canny(gray, 50, 150)
         edge_ratio = np.sum(edges > 0) / edges.size
 
         # Low edge density suggests empty state
@@ -580,14 +669,18 @@ class ColorAnalyzer(BaseMLAssertion):
         Returns:
             List of ColorInfo sorted by dominance (percentage)
         """
-        pil_img = ImageLoader.to_pil(image)
-        img_array = np.array(pil_img)
+        n = n_colors or self._n_colors
+        if isinstance(image, DecodedImage):
+            colors = image.memoize(("dominant_colors", n), lambda: self._cluster_colors(image, n))
+            return list(colors)
+        return self._cluster_colors(image, n)
 
+    def _cluster_colors(self, image: ImageInput, n: int) -> list[ColorInfo]:
+        """Cluster image pixels into ``n`` colors."""
         # Reshape to list of pixels
-        pixels = img_array.reshape(-1, 3)
+        pixels = ImageLoader.to_rgb(image).reshape(-1, 3)
 
         # Use K-means clustering
-        n = n_colors or self._n_colors
         kmeans = KMeans(n_clusters=n, random_state=42, n_init=10)
         kmeans.fit(pixels)
 
@@ -635,8 +728,7 @@ class ColorAnalyzer(BaseMLAssertion):
         else:
             target_rgb = target_color
 
-        cv2_img = ImageLoader.to_cv2(image)
-        rgb_img = cv2.cvtColor(cv2_img, cv2.COLOR_BGR2RGB)
+        rgb_img = ImageLoader.to_rgb(image)
 
         # Calculate distance from target color
         target_array = np.array(target_rgb, dtype=np.float32)
@@ -754,10 +846,9 @@ class LayoutAnalyzer(BaseMLAssertion):
             List of detected elements with bounding boxes
         """
         cv2_img = ImageLoader.to_cv2(image)
-        gray = cv2.cvtColor(cv2_img, cv2.COLOR_BGR2GRAY)
 
         # Apply edge detection
-        edges = cv2.Canny(gray, 50, 150)
+        edges = ImageLoader.to_edges(image)
 
         # Dilate to connect nearby edges
         kernel = np.ones((3, 3), np.uint8)
@@ -1089,12 +1180,9 @@ class IconMatcher(BaseMLAssertion):
         Returns:
             IconMatchResult with match details
         """
-        img = ImageLoader.to_cv2(image)
-        tmpl = ImageLoader.to_cv2(template)
-
         # Convert to grayscale for matching
-        img_gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        tmpl_gray = cv2.cvtColor(tmpl, cv2.COLOR_BGR2GRAY)
+        img_gray = ImageLoader.to_grayscale(image)
+        tmpl_gray = ImageLoader.to_grayscale(template)
 
         # Ensure template is smaller than image
         if tmpl_gray.shape[0] > img_gray.shape[0] or tmpl_gray.shape[1] > img_gray.shape[1]:
@@ -1383,8 +1471,7 @@ class FormFieldDetector(BaseMLAssertion):
         Returns:
             List of detected form elements
         """
-        cv2_img = ImageLoader.to_cv2(image)
-        gray = cv2.cvtColor(cv2_img, cv2.COLOR_BGR2GRAY)
+        gray = ImageLoader.to_grayscale(image)
 
         # Apply adaptive thresholding
         binary = cv2.adaptiveThreshold(
@@ -1400,7 +1487,7 @@ class FormFieldDetector(BaseMLAssertion):
         contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
         elements = []
-        image_height, image_width = cv2_img.shape[:2]
+        image_height, image_width = gray.shape[:2]
         image_area = image_height * image_width
 
         for contour in contours:
@@ -1580,25 +1667,22 @@ class RegionDiffAnalyzer(BaseMLAssertion):
         region_height = height // rows
         region_width = width // cols
 
-        changed_regions = []
-
-        for row in range(rows):
-            for col in range(cols):
-                x = col * region_width
-                y = row * region_height
-                w = region_width
-                h = region_height
+        if region_height == 0 or region_width == 0:
+            return []
 
-                # Extract regions
-                r1 = img1[y : y + h, x : x + w]
-                r2 = img2[y : y + h, x : x + w]
+        # Diff the gridded area once and average each region as a block
+        grid_height = rows * region_height
+        grid_width = cols * region_width
+        diff = cv2.absdiff(img1[:grid_height, :grid_width], img2[:grid_height, :grid_width])
+        blocks = diff.reshape(rows, region_height, cols, region_width, -1)
+        diff_scores = blocks.mean(axis=(1, 3, 4)) / 255
 
-                # Calculate difference
-                diff = cv2.absdiff(r1, r2)
-                diff_score = np.mean(diff) / 255
-
-                if diff_score > threshold:
-                    changed_regions.append(((x, y, w, h), float(diff_score)))
+        changed_regions = []
+        for row, col in zip(*np.nonzero(diff_scores > threshold), strict=True):
+            changed_regions.append((
+                (int(col) * region_width, int(row) * region_height, region_width, region_height),
+                float(diff_scores[row, col]),
+            ))
 
         return changed_regions
 
@@ -1659,6 +1743,33 @@ class RegionDiffAnalyzer(BaseMLAssertion):
         )
 
 
+# Analyzers addressable by MLBatchAssertion, by engine attribute name
+BATCH_ANALYZERS = frozenset({
+    "ocr",
+    "classifier",
+    "color_analyzer",
+    "layout_analyzer",
+    "icon_matcher",
+    "accessibility_checker",
+    "form_detector",
+    "region_diff",
+})
+
+# OCR always runs in the calling process so its model is only loaded once
+IN_PROCESS_ANALYZERS = frozenset({"ocr"})
+
+
+@dataclass(frozen=True, slots=True)
+class MLBatchAssertion:
+    """One assertion in an MLAssertionEngine.validate_batch call."""
+
+    analyzer: str
+    """Engine analyzer to run (e.g. "classifier", "color_analyzer")."""
+
+    options: dict[str, Any] = field(default_factory=dict)
+    """Keyword arguments for the analyzer's ``validate``."""
+
+
 class MLAssertionEngine:
     """
     Unified engine for ML-based UI assertions.
@@ -1672,13 +1783,24 @@ class MLAssertionEngine:
     - Accessibility checks
     - Form field detection
     - Region-based diff
+    - Batches of assertions over one decoded screenshot
     """
 
     def __init__(
         self,
         ocr_backend: Literal["pytesseract", "easyocr"] = "easyocr",
         ocr_languages: list[str] | None = None,
+        max_workers: int | None = None,
     ) -> None:
+        """
+        Initialize ML assertion engine.
+
+        Args:
+            ocr_backend: OCR backend to use
+            ocr_languages: OCR languages (default: English)
+            max_workers: Process pool size for parallel batches
+                (default: CPU count)
+        """
         self._log = logger.bind(component="ml_assertion_engine")
 
         # Lazy-initialized analyzers
@@ -1694,6 +1816,10 @@ class MLAssertionEngine:
         self._ocr_backend = ocr_backend
         self._ocr_languages = ocr_languages
 
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._pool_finalizer: weakref.finalize[..., MLAssertionEngine] | None = None
+
     @property
     def ocr(self) -> OCRAssertion:
         """Get OCR assertion engine (lazy-loaded)."""
@@ -1753,6 +1879,97 @@ class MLAssertionEngine:
             self._region_diff = RegionDiffAnalyzer()
         return self._region_diff
 
+    # Batch evaluation
+
+    def validate_batch(
+        self,
+        image: ImageInput,
+        assertions: Sequence[MLBatchAssertion],
+        parallel: bool = False,
+    ) -> list[MLAssertionResult]:
+        """
+        Run several assertions against one image.
+
+        The image is decoded once and its grayscale, HSV and edge maps,
+        color clusters and OCR results are shared by all assertions. With
+        ``parallel``, assertions other than OCR are spread over the engine's
+        process pool (each worker decodes nothing, receiving the pixels),
+        while OCR runs in this process.
+
+        Args:
+            image: Input image
+            assertions: Assertions to run
+            parallel: Run CPU-heavy assertions in worker processes
+
+        Returns:
+            One result per assertion, in order
+
+        Raises:
+            ValueError: If an assertion names an unknown analyzer
+        """
+        for assertion in assertions:
+            if assertion.analyzer not in BATCH_ANALYZERS:
+                msg = f"Unknown ML analyzer: {assertion.analyzer}"
+                raise ValueError(msg)
+
+        decoded = DecodedImage.of(image)
+        results: list[MLAssertionResult | None] = [None] * len(assertions)
+
+        pooled = [
+            i
+            for i, assertion in enumerate(assertions)
+            if parallel and assertion.analyzer not in IN_PROCESS_ANALYZERS
+        ]
+        futures: list[tuple[list[int], Future[list[MLAssertionResult]]]] = []
+        if pooled:
+            # One chunk per worker, so each worker shares intermediates too
+            n_chunks = min(self._max_workers, len(pooled))
+            pool = self._get_process_pool()
+            for chunk in (pooled[i::n_chunks] for i in range(n_chunks)):
+                tasks = [(assertions[i].analyzer, assertions[i].options) for i in chunk]
+                futures.append((chunk, pool.submit(_validate_in_worker, decoded.bgr, tasks)))
+
+        pooled_set = set(pooled)
+        for i, assertion in enumerate(assertions):
+            if i not in pooled_set:
+                analyzer = getattr(self, assertion.analyzer)
+                results[i] = analyzer.validate(decoded, **assertion.options)
+
+        for chunk, future in futures:
+            for i, result in zip(chunk, future.result(), strict=True):
+                results[i] = result
+
+        self._log.debug(
+            "ML assertion batch complete",
+            assertions=len(assertions),
+            pooled=len(pooled),
+        )
+        return [result for result in results if result is not None]
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the worker pool for parallel batches, starting it on first use."""
+        if self._process_pool is None:
+            # Spawned workers avoid inheriting OpenMP/OpenCV thread state
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            # Engines are rarely closed explicitly: stop the workers once this
+            # engine is garbage collected, or at interpreter exit at the latest
+            self._pool_finalizer = weakref.finalize(
+                self, self._process_pool.shutdown, wait=False, cancel_futures=True
+            )
+        return self._process_pool
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._process_pool is not None:
+            if self._pool_finalizer is not None:
+                self._pool_finalizer.detach()
+                self._pool_finalizer = None
+            self._process_pool.shutdown(wait=True, cancel_futures=True)
+            self._process_pool = None
+
     # Convenience methods for common assertions
 
     def assert_ocr_text_equals(
@@ -1928,3 +2145,24 @@ class MLAssertionEngine:
             max_changed_regions=max_changed_regions,
             grid_size=grid_size,
         )
+
+
+# Engine reused by all batch tasks run in a worker process
+_worker_engine: MLAssertionEngine | None = None
+
+
+def _validate_in_worker(
+    pixels: np.ndarray[Any, np.dtype[np.uint8]],
+    tasks: list[tuple[str, dict[str, Any]]],
+) -> list[MLAssertionResult]:
+    """Run a chunk of batch assertions on decoded pixels in a worker process."""
+    global _worker_engine
+
+    if _worker_engine is None:
+        _worker_engine = MLAssertionEngine()
+
+    image = DecodedImage(pixels)
+    return [
+        getattr(_worker_engine, analyzer).validate(image, **options)
+        for analyzer, options in tasks
+    ]
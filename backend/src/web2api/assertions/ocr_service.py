@@ -0,0 +1,371 @@
+"""
+Shared OCR service for OCR assertions.
+
+OCR models take seconds to load and hold hundreds of megabytes of weights,
+so one service per process owns them for every OCRAssertion and engine:
+- Readers loaded once per backend and language set, on first use
+- Requests queued to a single worker thread that batches same-sized
+  images into one inference call
+- Identical in-flight requests coalesced into one recognition
+- Results cached by image-region content hash, so OCR of stable headers
+  and footers is only ever run once
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import structlog
+
+from web2api.assertions.ml_engine import OCRResult
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+logger = structlog.get_logger(__name__)
+
+# Backend name and languages that identify one loaded model
+type ReaderKey = tuple[str, tuple[str, ...]]
+
+
+@dataclass(slots=True)
+class _OCRRequest:
+    """A queued recognition."""
+
+    key: str
+    reader_key: ReaderKey
+    image: Image.Image
+    future: Future[OCRResult]
+
+
+def _easyocr_result(detections: list[Any]) -> OCRResult:
+    """Build an OCRResult from EasyOCR ``readtext`` detections."""
+    if not detections:
+        return OCRResult(text="", confidence=0.0)
+
+    texts = []
+    word_confidences = []
+    total_conf = 0.0
+
+    for _bbox, text, conf in detections:
+        texts.append(text)
+        word_confidences.append((text, conf))
+        total_conf += conf
+
+    return OCRResult(
+        text=" ".join(texts),
+        confidence=total_conf / len(detections),
+        word_confidences=tuple(word_confidences),
+    )
+
+
+def _pytesseract_result(image: Image.Image) -> OCRResult:
+    """Run pytesseract on an image."""
+    import pytesseract
+
+    data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+
+    texts = []
+    word_confidences = []
+    total_conf = 0.0
+    word_count = 0
+
+    for i, text in enumerate(data["text"]):
+        if text.strip():
+            conf = float(data["conf"][i])
+            if conf > 0:  # pytesseract returns -1 for non-text
+                texts.append(text)
+                word_confidences.append((text, conf / 100.0))
+                total_conf += conf / 100.0
+                word_count += 1
+
+    return OCRResult(
+        text=" ".join(texts),
+        confidence=total_conf / word_count if word_count > 0 else 0.0,
+        word_confidences=tuple(word_confidences),
+    )
+
+
+class OCRService:
+    """
+    Process-wide OCR model service with batching and a result cache.
+
+    All inference runs on one worker thread, so models are never used
+    concurrently and requests from many runner threads are batched.
+    """
+
+    def __init__(
+        self,
+        max_cache_entries: int = 2048,
+        max_batch_size: int = 8,
+        batch_window: float = 0.005,
+    ) -> None:
+        """
+        Initialize OCR service.
+
+        Args:
+            max_cache_entries: Recognition results kept (LRU)
+            max_batch_size: Maximum images per inference call
+            batch_window: Seconds to wait for more requests to batch
+        """
+        self._max_cache_entries = max_cache_entries
+        self._max_batch_size = max_batch_size
+        self._batch_window = batch_window
+
+        self._cache: OrderedDict[str, OCRResult] = OrderedDict()
+        self._in_flight: dict[str, Future[OCRResult]] = {}
+        self._readers: dict[ReaderKey, Any] = {}
+        self._lock = threading.Lock()
+        self._reader_lock = threading.Lock()
+        self._queue: queue.Queue[_OCRRequest | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._log = logger.bind(component="ocr_service")
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "batches": 0,
+            "inferences": 0,
+            "models_loaded": 0,
+        }
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Get service statistics."""
+        return {**self._stats, "cache_size": len(self._cache)}
+
+    @staticmethod
+    def cache_key(image: Image.Image, reader_key: ReaderKey) -> str:
+        """Content hash of an image (region) for one backend and language set."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((reader_key, image.mode, image.size)).encode())
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def recognize(
+        self,
+        image: Image.Image,
+        backend: str = "easyocr",
+        languages: list[str] | None = None,
+    ) -> OCRResult:
+        """
+        Recognize text in an image, blocking until the result is ready.
+
+        Args:
+            image: RGB image (already cropped to the region of interest)
+            backend: "easyocr" or "pytesseract"
+            languages: OCR languages (default: English)
+
+        Returns:
+            OCRResult with extracted text and confidence
+        """
+        return self.submit(image, backend, languages).result()
+
+    def submit(
+        self,
+        image: Image.Image,
+        backend: str = "easyocr",
+        languages: list[str] | None = None,
+    ) -> Future[OCRResult]:
+        """
+        Queue an image for recognition.
+
+        Args:
+            image: RGB image (already cropped to the region of interest)
+            backend: "easyocr" or "pytesseract"
+            languages: OCR languages (default: English)
+
+        Returns:
+            Future resolving to the OCRResult
+        """
+        reader_key: ReaderKey = (backend, tuple(languages or ["en"]))
+        key = self.cache_key(image, reader_key)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._stats["hits"] += 1
+                future: Future[OCRResult] = Future()
+                future.set_result(cached)
+                return future
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                self._stats["coalesced"] += 1
+                return in_flight
+
+            self._stats["misses"] += 1
+            future = Future()
+            self._in_flight[key] = future
+            self._ensure_worker()
+
+        self._queue.put(_OCRRequest(key=key, reader_key=reader_key, image=image, future=future))
+        return future
+
+    def reader(self, backend: str = "easyocr", languages: list[str] | None = None) -> Any:
+        """
+        Get the shared model for a backend and language set, loading it once.
+
+        Returns:
+            EasyOCR reader, or None for pytesseract (no model to load)
+        """
+        reader_key: ReaderKey = (backend, tuple(languages or ["en"]))
+        # Separate lock: loading takes seconds and must not block cache hits
+        with self._reader_lock:
+            if reader_key not in self._readers:
+                self._readers[reader_key] = self._load_reader(reader_key)
+                self._stats["models_loaded"] += 1
+            return self._readers[reader_key]
+
+    def _load_reader(self, reader_key: ReaderKey) -> Any:
+        """Load an OCR model."""
+        backend, languages = reader_key
+        if backend != "easyocr":
+            return None
+
+        import easyocr
+
+        self._log.info("Loading OCR model", backend=backend, languages=list(languages))
+        return easyocr.Reader(list(languages), gpu=False)
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread if it is not running (caller holds the lock)."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="ocr-service", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Worker loop: collect a batch of requests and process it."""
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+
+            batch = [request]
+            deadline = time.monotonic() + self._batch_window
+            while len(batch) < self._max_batch_size:
+                try:
+                    request = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._process(batch)
+                    return
+                batch.append(request)
+
+            self._process(batch)
+
+    def _process(self, batch: list[_OCRRequest]) -> None:
+        """Recognize a batch, grouping images that can share one inference call."""
+        self._stats["batches"] += 1
+
+        groups: dict[tuple[ReaderKey, tuple[int, int]], list[_OCRRequest]] = {}
+        for request in batch:
+            groups.setdefault((request.reader_key, request.image.size), []).append(request)
+
+        for (reader_key, _), requests in groups.items():
+            try:
+                results = self._recognize_group(reader_key, [r.image for r in requests])
+            except Exception as e:
+                self._log.warning("OCR failed", backend=reader_key[0], error=str(e))
+                for request in requests:
+                    self._finish(request, error=e)
+                continue
+
+            for request, result in zip(requests, results, strict=True):
+                self._finish(request, result=result)
+
+    def _recognize_group(
+        self,
+        reader_key: ReaderKey,
+        images: list[Image.Image],
+    ) -> list[OCRResult]:
+        """Recognize same-sized images with one model, batched where supported."""
+        reader = self.reader(reader_key[0], list(reader_key[1]))
+        self._stats["inferences"] += 1
+
+        if reader is None:
+            return [_pytesseract_result(image) for image in images]
+
+        arrays = [np.asarray(image) for image in images]
+        if len(arrays) > 1 and hasattr(reader, "readtext_batched"):
+            return [
+                _easyocr_result(detections)
+                for detections in reader.readtext_batched(arrays, detail=1)
+            ]
+
+        return [_easyocr_result(reader.readtext(array, detail=1)) for array in arrays]
+
+    def _finish(
+        self,
+        request: _OCRRequest,
+        result: OCRResult | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Cache a result and resolve the request's future."""
+        with self._lock:
+            self._in_flight.pop(request.key, None)
+            if result is not None:
+                self._cache[request.key] = result
+                while len(self._cache) > self._max_cache_entries:
+                    self._cache.popitem(last=False)
+
+        if error is not None:
+            request.future.set_exception(error)
+        elif result is None:
+            request.future.set_exception(RuntimeError("OCR finished without a result"))
+        else:
+            request.future.set_result(result)
+
+    def clear(self) -> None:
+        """Drop all cached results (loaded models are kept)."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Stop the worker thread after queued requests are processed."""
+        with self._lock:
+            worker = self._worker
+            self._worker = None
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join()
+
+
+# =============================================================================
+# Global Service Instance
+# =============================================================================
+
+_global_service: OCRService | None = None
+_global_lock = threading.Lock()
+
+
+def get_ocr_service() -> OCRService:
+    """
+    Get the process-wide OCR service, creating it on first use.
+
+    Configured from the environment:
+    - AUTOQA_OCR_CACHE_ENTRIES: Cached recognition results (default 2048)
+    - AUTOQA_OCR_BATCH_SIZE: Maximum images per inference call (default 8)
+    """
+    global _global_service
+
+    with _global_lock:
+        if _global_service is None:
+            _global_service = OCRService(
+                max_cache_entries=int(os.environ.get("AUTOQA_OCR_CACHE_ENTRIES", "2048")),
+                max_batch_size=int(os.environ.get("AUTOQA_OCR_BATCH_SIZE", "8")),
+            )
+
+    return _global_service
@@ -7,5 +7,13 @@ Provides secure credential storage, session management, and form filling.
 from web2api.auth.credential_store import CredentialStore
 from web2api.auth.session_manager import SessionManager
 from web2api.auth.form_filler import FormFiller
+from web2api.auth.service_cache import CachedService, ServiceCache, get_service_cache
 
-__all__ = ["CredentialStore", "SessionManager", "FormFiller"]
+__all__ = [
+    "CredentialStore",
+    "SessionManager",
+    "FormFiller",
+    "CachedService",
+    "ServiceCache",
+    "get_service_cache",
+]
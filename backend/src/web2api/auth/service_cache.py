@@ -0,0 +1,183 @@
+"""
+In-process cache of resolved service state for the chat completion hot path.
+
+Holds service configuration, decrypted credentials and whether the
+service's browser context is known to hold a valid session, so steady-state
+requests need no database round-trips and no cookie re-injection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class CachedService:
+    """Resolved service state for one service."""
+
+    service_id: str
+    """Canonical service identifier (UUID string)."""
+
+    url: str
+    """Service URL."""
+
+    config: dict[str, Any]
+    """Service configuration (UI selectors, operations)."""
+
+    credentials: dict[str, str | None]
+    """Decrypted credentials."""
+
+    cached_at: float = field(default_factory=time.time)
+    """Unix timestamp when the entry was cached."""
+
+    session_valid_until: float = 0.0
+    """Unix timestamp until which the browser session is trusted without restoring."""
+
+    @property
+    def session_valid(self) -> bool:
+        """Whether the browser context is known to hold a valid session."""
+        return time.time() < self.session_valid_until
+
+
+class ServiceCache:
+    """
+    TTL- and size-bounded LRU cache of resolved services.
+
+    Features:
+    - Entries expire after ``ttl_seconds``
+    - Session validity expires separately after ``session_ttl_seconds``
+    - Least recently used entries are evicted past ``max_entries``
+    - Explicit invalidation when services change
+    - Per-service lock so only one request restores a session at a time
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        session_ttl_seconds: float = 600.0,
+        max_entries: int = 1024,
+    ) -> None:
+        """
+        Initialize service cache.
+
+        Args:
+            ttl_seconds: Lifetime of cached config and credentials
+            session_ttl_seconds: How long a restored/logged-in session is trusted
+            max_entries: Maximum number of cached services
+        """
+        self._ttl = ttl_seconds
+        self._session_ttl = session_ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, CachedService] = OrderedDict()
+        self._session_locks: dict[str, asyncio.Lock] = {}
+        self._log = logger.bind(component="service_cache")
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {**self._stats, "size": len(self._entries)}
+
+    def get(self, service_id: str) -> CachedService | None:
+        """
+        Get a cached service if present and not expired.
+
+        Args:
+            service_id: Service identifier
+
+        Returns:
+            Cached entry or None
+        """
+        entry = self._entries.get(service_id)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        if time.time() - entry.cached_at > self._ttl:
+            del self._entries[service_id]
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(service_id)
+        self._stats["hits"] += 1
+        return entry
+
+    def put(self, entry: CachedService) -> CachedService:
+        """
+        Cache a resolved service, keeping any still-valid session state.
+
+        Args:
+            entry: Resolved service
+
+        Returns:
+            The cached entry
+        """
+        previous = self._entries.get(entry.service_id)
+        if previous is not None and previous.session_valid:
+            entry.session_valid_until = previous.session_valid_until
+
+        self._entries[entry.service_id] = entry
+        self._entries.move_to_end(entry.service_id)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+        return entry
+
+    def mark_session_valid(self, service_id: str) -> None:
+        """Record that the service's browser context holds a valid session."""
+        entry = self._entries.get(service_id)
+        if entry is not None:
+            entry.session_valid_until = time.time() + self._session_ttl
+
+    def session_lock(self, service_id: str) -> asyncio.Lock:
+        """Get the lock serialising session restore/login for a service."""
+        return self._session_locks.setdefault(service_id, asyncio.Lock())
+
+    def invalidate_session(self, service_id: str) -> None:
+        """Force the next request to restore or re-establish the session."""
+        entry = self._entries.get(service_id)
+        if entry is not None:
+            entry.session_valid_until = 0.0
+
+    def invalidate(self, service_id: str) -> None:
+        """Drop everything cached for a service (e.g. after it was changed)."""
+        if self._entries.pop(service_id, None) is not None:
+            self._stats["invalidations"] += 1
+            self._log.debug("Service cache invalidated", service_id=service_id)
+
+    def clear(self) -> None:
+        """Drop all cached services."""
+        self._entries.clear()
+
+
+# =============================================================================
+# Global Cache Instance
+# =============================================================================
+
+_global_cache: ServiceCache | None = None
+
+
+def get_service_cache() -> ServiceCache:
+    """Get the process-wide service cache, creating it on first use."""
+    global _global_cache
+
+    if _global_cache is None:
+        _global_cache = ServiceCache()
+
+    return _global_cache
@@ -338,8 +338,9 @@ class PageAnalyzer:
         Returns:
             Complete page analysis result
         """
-        url = page.get_current_url()
-        title = page.get_title() or "Untitled"
+        url_result, title_result = page.batch([("getCurrentURL", {}), ("getPageTitle", {})])
+        url = url_result.unwrap()
+        title = title_result.unwrap() or "Untitled"
 
         self._log.info("Starting page analysis", url=url)
 
@@ -347,7 +348,7 @@ class PageAnalyzer:
         dom_analysis = await self._analyze_dom(page)
         components = await self._detect_components(page)
         interactive_elements = await self._catalog_interactive_elements(page)
-        frames = await self._analyze_frames(page)
+        frames = await self._analyze_frames(page, url)
         spa_info = await self._detect_spa(page)
         meta_info = await self._extract_meta_info(page)
         dynamic_regions = await self._detect_dynamic_regions(page)
@@ -530,22 +531,38 @@ class PageAnalyzer:
         return PageComplexity.HIGHLY_COMPLEX
 
     async def _detect_components(self, page: BrowserContext) -> list[ComponentInfo]:
-        """Detect UI components on the page."""
-        components: list[ComponentInfo] = []
+        """
+        Detect UI components on the page.
+
+        The queries for all pattern selectors are pipelined in one batch
+        rather than sent one round-trip per selector.
+        """
+        patterns = [
+            (selector, component_type, config.get("indicators", []))
+            for component_type, config in self.COMPONENT_PATTERNS.items()
+            for selector in config["selectors"]
+        ]
+        try:
+            results = page.batch([
+                ("evaluate", {"expression": self._component_script(selector)})
+                for selector, _, _ in patterns
+            ])
+        except Exception as e:
+            self._log.debug("Component detection failed", error=str(e))
+            return []
 
-        for component_type, config in self.COMPONENT_PATTERNS.items():
-            for selector in config["selectors"]:
-                try:
-                    detected = await self._find_components(
-                        page, selector, component_type, config.get("indicators", [])
-                    )
-                    components.extend(detected)
-                except Exception as e:
-                    self._log.debug(
-                        "Component detection failed",
-                        selector=selector,
-                        error=str(e),
-                    )
+        components: list[ComponentInfo] = []
+        for (selector, component_type, indicators), result in zip(patterns, results, strict=True):
+            try:
+                components.extend(
+                    self._parse_components(result.unwrap(), component_type, indicators)
+                )
+            except Exception as e:
+                self._log.debug(
+                    "Component detection failed",
+                    selector=selector,
+                    error=str(e),
+                )
 
         # Remove duplicates based on selector
         seen_selectors: set[str] = set()
@@ -557,15 +574,10 @@ class PageAnalyzer:
 
         return unique_components
 
-    async def _find_components(
-        self,
-        page: BrowserContext,
-        selector: str,
-        component_type: ComponentType,
-        indicators: list[str],
-    ) -> list[ComponentInfo]:
-        """Find components matching selector."""
-        script = f"""
+    @staticmethod
+    def _component_script(selector: str) -> str:
+        """Script listing the visible components matching a selector."""
+        return f"""
         (() => {{
             const elements = document.querySelectorAll("{selector}");
             const results = [];
@@ -636,7 +648,13 @@ class PageAnalyzer:
         }})()
         """
 
-        raw_results = page.expression(script)
+    @staticmethod
+    def _parse_components(
+        raw_results: list[dict[str, Any]],
+        component_type: ComponentType,
+        indicators: list[str],
+    ) -> list[ComponentInfo]:
+        """Build components from the results of ``_component_script``."""
         components: list[ComponentInfo] = []
 
         for raw in raw_results:
@@ -879,9 +897,8 @@ class PageAnalyzer:
 
         return elements
 
-    async def _analyze_frames(self, page: BrowserContext) -> list[FrameInfo]:
+    async def _analyze_frames(self, page: BrowserContext, current_url: str) -> list[FrameInfo]:
         """Analyze iframes and frames."""
-        current_url = page.get_current_url()
         current_origin = urlparse(current_url).netloc
 
         script = """
@@ -6,6 +6,7 @@ Provides:
 - State-aware crawling with tracking
 - Form submission exploration
 - Authentication flow handling
+- Structural template detection for near-duplicate pages
 """
 
 from web2api.builder.crawler.intelligent_crawler import (
@@ -16,6 +17,11 @@ from web2api.builder.crawler.intelligent_crawler import (
     URLPriority,
     CrawlState,
 )
+from web2api.builder.crawler.template_index import (
+    PageTemplate,
+    PageTemplateIndex,
+    TemplateMatch,
+)
 from web2api.builder.crawler.state_manager import (
     StateManager,
     StateConfig,
@@ -32,6 +38,10 @@ __all__ = [
     "CrawledPage",
     "URLPriority",
     "CrawlState",
+    # Template Index
+    "PageTemplate",
+    "PageTemplateIndex",
+    "TemplateMatch",
     # State Manager
     "StateManager",
     "StateConfig",
@@ -7,6 +7,7 @@ Features:
 - Form submission exploration
 - Authentication flow detection and handling
 - Rate limiting and politeness
+- Optional concurrent crawling over a BrowserPool
 """
 
 from __future__ import annotations
@@ -15,6 +16,8 @@ import asyncio
 import hashlib
 import re
 import time
+import weakref
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import IntEnum, StrEnum, auto
@@ -24,8 +27,12 @@ from urllib.parse import urljoin, urlparse
 
 import structlog
 
+from web2api.builder.crawler.template_index import PageTemplateIndex, skeleton_fingerprint
+from web2api.concurrency.browser_pool import BrowserPool
+from web2api.concurrency.config import ConcurrencyConfig
+
 if TYPE_CHECKING:
-    from owl_browser import Browser, BrowserContext
+    from owl_browser import Browser, BrowserContext, Cookie
 
     from web2api.builder.analyzer.page_analyzer import PageAnalysisResult
     from web2api.builder.crawler.state_manager import ApplicationState, StateManager
@@ -74,6 +81,9 @@ class CrawlConfig:
     priority_patterns: dict[str, URLPriority] = field(default_factory=dict)
     max_retries: int = 2
     authentication: dict[str, str] | None = None
+    concurrency: int = 1  # Parallel page workers; >1 crawls over a BrowserPool
+    max_pages_per_template: int = 0  # Pages sampled per DOM template (0 = unlimited)
+    template_max_distance: int = 3  # SimHash bits two pages of one template may differ by
 
 
 @dataclass
@@ -87,12 +97,26 @@ class CrawlQueueItem:
     context: dict[str, Any] = field(default_factory=dict)
     retry_count: int = 0
     added_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    sequence: int = 0  # Enqueue order, breaks added_at ties deterministically
 
     def __lt__(self, other: CrawlQueueItem) -> bool:
         """Compare for priority queue ordering."""
         if self.priority != other.priority:
             return self.priority < other.priority
-        return self.added_at < other.added_at
+        if self.added_at != other.added_at:
+            return self.added_at < other.added_at
+        return self.sequence < other.sequence
+
+
+@dataclass
+class _CrawlSlot:
+    """A queue item being crawled ahead of its turn in concurrent mode."""
+
+    item: CrawlQueueItem
+    normalized_url: str
+    fetched: asyncio.Future[tuple[CrawledPage, tuple[str, int] | None]]
+    decision: asyncio.Future[bool]  # True = finish the page, False = release it
+    task: asyncio.Task[None] | None = None
 
 
 @dataclass
@@ -112,6 +136,7 @@ class CrawledPage:
     forms_found: list[dict[str, Any]] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     crawl_time_ms: int = 0
+    template_id: str | None = None  # Structural template (see PageTemplateIndex)
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
@@ -132,6 +157,8 @@ class CrawlResult:
     coverage_score: float
     errors: list[str]
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    templates_found: int = 0
+    template_pages_skipped: int = 0
 
 
 class IntelligentCrawler:
@@ -145,6 +172,15 @@ class IntelligentCrawler:
     - Authentication detection and handling
     - Rate limiting for politeness
     - Deduplication and cycle detection
+
+    With ``CrawlConfig.concurrency > 1`` pages are fetched by several
+    workers, each holding a BrowserPool context. Workers only fetch;
+    results are committed (dedup, visited tracking, enqueueing) strictly
+    in priority-queue order, so the crawl produces the same pages as a
+    serial crawl with the same page budget. Politeness is per host:
+    requests to one host start at least ``rate_limit_ms`` apart. Once
+    authentication completes, its session cookies are copied into every
+    pool context and pages fetched ahead of the login are fetched again.
     """
 
     # URL patterns for priority assignment
@@ -171,30 +207,45 @@ class IntelligentCrawler:
         browser: Browser,
         config: CrawlConfig,
         state_manager: StateManager | None = None,
+        pool: BrowserPool | None = None,
     ) -> None:
         self._browser = browser
         self._config = config
         self._state_manager = state_manager
+        self._pool = pool
         self._log = logger.bind(component="intelligent_crawler")
 
         # Crawl state
         self._queue: list[CrawlQueueItem] = []  # Priority queue
+        self._enqueued_count = 0
         self._visited_urls: set[str] = set()
         self._visited_content_hashes: set[str] = set()
         self._url_redirects: dict[str, str] = {}
         self._crawled_pages: list[CrawledPage] = []
         self._failed_pages: list[CrawledPage] = []
         self._skipped_urls: list[str] = []
+        self._template_index = PageTemplateIndex(
+            max_samples=config.max_pages_per_template,
+            max_distance=config.template_max_distance,
+        )
+        self._template_pages_skipped = 0
 
         # Statistics
         self._start_time: float = 0
         self._last_request_time: float = 0
+        self._host_next_request: dict[str, float] = {}
         self._urls_discovered = 0
         self._forms_found = 0
         self._state_transitions = 0
         self._auth_detected = False
         self._auth_completed = False
 
+        # Session of the authenticated context, shared with pool contexts
+        self._session_cookies: list[Cookie] = []
+        # Contexts holding the session; weak, so a closed context's
+        # successor never inherits its entry
+        self._session_pages: weakref.WeakSet[BrowserContext] = weakref.WeakSet()
+
         # Domain extraction
         parsed = urlparse(config.start_url)
         self._base_domain = parsed.netloc
@@ -240,49 +291,13 @@ class IntelligentCrawler:
         # Add start URL to queue
         self._enqueue(crawl_start_url, URLPriority.HIGH, depth=0)
 
-        # Create page context
-        page = self._browser.new_page()
-
-        try:
-            # Process queue
-            while self._queue and not self._should_stop():
-                item = heappop(self._queue)
-
-                # Check if already visited (could be added multiple times)
-                normalized_url = self._normalize_url(item.url)
-                if normalized_url in self._visited_urls:
-                    continue
-
-                # Rate limiting
-                await self._apply_rate_limit()
-
-                # Crawl the page
-                crawled_page = await self._crawl_page(page, item)
-
-                if crawled_page.state == CrawlState.COMPLETED:
-                    self._crawled_pages.append(crawled_page)
-                    self._visited_urls.add(normalized_url)
+        if self._config.concurrency > 1:
+            await self._crawl_concurrent()
+        else:
+            await self._crawl_serial()
 
-                    # Discover and enqueue new URLs
-                    for url in crawled_page.discovered_urls:
-                        self._enqueue(url, self._determine_priority(url), item.depth + 1, item.url)
-
-                elif crawled_page.state == CrawlState.FAILED:
-                    if item.retry_count < self._config.max_retries:
-                        # Re-enqueue for retry
-                        item.retry_count += 1
-                        heappush(self._queue, item)
-                    else:
-                        self._failed_pages.append(crawled_page)
-
-                elif crawled_page.state == CrawlState.SKIPPED:
-                    self._skipped_urls.append(item.url)
-
-            # Calculate coverage score
-            coverage_score = self._calculate_coverage_score()
-
-        finally:
-            page.close()
+        # Calculate coverage score
+        coverage_score = self._calculate_coverage_score()
 
         # Build result
         total_duration = int((time.time() - self._start_time) * 1000)
@@ -300,6 +315,8 @@ class IntelligentCrawler:
             state_transitions=self._state_transitions,
             coverage_score=coverage_score,
             errors=[],
+            templates_found=len(self._template_index.templates),
+            template_pages_skipped=self._template_pages_skipped,
         )
 
         self._log.info(
@@ -312,6 +329,311 @@ class IntelligentCrawler:
 
         return result
 
+    async def _crawl_serial(self) -> None:
+        """Crawl the queue one page at a time in a single context."""
+        page = self._browser.new_page()
+
+        try:
+            # Process queue
+            while self._queue and not self._should_stop():
+                item = heappop(self._queue)
+
+                # Check if already visited (could be added multiple times)
+                normalized_url = self._normalize_url(item.url)
+                if normalized_url in self._visited_urls:
+                    continue
+
+                if self._skip_by_url_shape(item):
+                    continue
+
+                # Rate limiting
+                await self._apply_rate_limit()
+
+                # Crawl the page
+                crawled_page = await self._crawl_page(page, item)
+                self._record_outcome(item, normalized_url, crawled_page)
+
+        finally:
+            page.close()
+
+    def _skip_by_url_shape(self, item: CrawlQueueItem) -> bool:
+        """Skip, without loading, a URL whose shape maps to a fully sampled template."""
+        if not self._template_index.is_saturated_shape(item.url):
+            return False
+
+        self._template_index.record_shape_skip(item.url)
+        self._template_pages_skipped += 1
+        self._skipped_urls.append(item.url)
+        self._log.debug("Skipping templated page by URL shape", url=item.url)
+        return True
+
+    def _admit_page(
+        self,
+        item: CrawlQueueItem,
+        crawled: CrawledPage,
+        signature: tuple[str, int],
+    ) -> bool:
+        """
+        Decide whether a loaded page is new enough to crawl.
+
+        Marks the page SKIPPED when its content was already seen or its
+        template already has ``max_pages_per_template`` samples.
+        """
+        content_hash, fingerprint = signature
+
+        # Track redirects
+        if crawled.final_url != item.url:
+            self._url_redirects[item.url] = crawled.final_url
+
+        # Check if we've already seen this content
+        if content_hash in self._visited_content_hashes:
+            crawled.state = CrawlState.SKIPPED
+            self._log.debug("Skipping duplicate content", url=item.url)
+            return False
+
+        self._visited_content_hashes.add(content_hash)
+
+        # Sample only a few pages per structural template
+        match = self._template_index.assign(item.url, fingerprint)
+        crawled.template_id = match.template.template_id
+        if not match.sample:
+            crawled.state = CrawlState.SKIPPED
+            self._template_pages_skipped += 1
+            self._log.debug(
+                "Skipping templated page",
+                url=item.url,
+                template=match.template.template_id,
+            )
+            return False
+
+        return True
+
+    def _record_outcome(
+        self,
+        item: CrawlQueueItem,
+        normalized_url: str,
+        crawled_page: CrawledPage,
+    ) -> None:
+        """Apply a crawled page to the crawl state, in queue order."""
+        if crawled_page.state == CrawlState.COMPLETED:
+            self._crawled_pages.append(crawled_page)
+            self._visited_urls.add(normalized_url)
+
+            # Discover and enqueue new URLs
+            for url in crawled_page.discovered_urls:
+                self._enqueue(url, self._determine_priority(url), item.depth + 1, item.url)
+
+        elif crawled_page.state == CrawlState.FAILED:
+            if item.retry_count < self._config.max_retries:
+                # Re-enqueue for retry
+                item.retry_count += 1
+                heappush(self._queue, item)
+            else:
+                self._failed_pages.append(crawled_page)
+
+        elif crawled_page.state == CrawlState.SKIPPED:
+            self._skipped_urls.append(item.url)
+
+    async def _crawl_concurrent(self) -> None:
+        """
+        Crawl the queue with several pool contexts in flight.
+
+        The slots in the window are the next items a serial crawl would
+        pop, provided committing the earlier ones enqueues nothing that
+        sorts before them. After each commit, slots that a newly
+        enqueued (or retried) item now precedes go back to the queue and
+        their speculative fetches are discarded.
+        """
+        pool = self._pool
+        owns_pool = pool is None
+        if pool is None:
+            pool = BrowserPool(
+                self._browser,
+                ConcurrencyConfig(
+                    max_parallel_tests=self._config.concurrency,
+                    max_browser_contexts=self._config.concurrency,
+                    min_browser_contexts=0,
+                    acquire_timeout_seconds=self._config.timeout_ms / 1000,
+                    enable_resource_monitoring=False,
+                ),
+            )
+            await pool.start()
+
+        workers = min(self._config.concurrency, pool.max_size)
+        window: deque[_CrawlSlot] = deque()
+        tasks: list[asyncio.Task[None]] = []
+
+        try:
+            while True:
+                self._fill_window(pool, window, workers, tasks)
+                if not window or self._should_stop():
+                    break
+
+                slot = window.popleft()
+                auth_completed = self._auth_completed
+                await self._commit_slot(pool, slot, tasks)
+                if self._auth_completed and not auth_completed:
+                    # Pages fetched ahead of the login lack its session
+                    self._requeue_window(window)
+                else:
+                    self._reconcile_window(window)
+
+        finally:
+            for slot in window:
+                self._release_slot(slot)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            if owns_pool:
+                await pool.stop()
+
+    def _fill_window(
+        self,
+        pool: BrowserPool,
+        window: deque[_CrawlSlot],
+        workers: int,
+        tasks: list[asyncio.Task[None]],
+    ) -> None:
+        """Pop queue items into the window and start fetching them."""
+        # Never fetch further ahead than the remaining page budget
+        limit = max(1, min(workers, self._config.max_pages - len(self._crawled_pages)))
+        loop = asyncio.get_running_loop()
+
+        while len(window) < limit and self._queue:
+            item = heappop(self._queue)
+            normalized_url = self._normalize_url(item.url)
+            if normalized_url in self._visited_urls:
+                continue
+
+            slot = _CrawlSlot(
+                item=item,
+                normalized_url=normalized_url,
+                fetched=loop.create_future(),
+                decision=loop.create_future(),
+            )
+            # A duplicate of an in-flight URL is fetched only if, at its
+            # turn, the earlier copy did not complete
+            # Likewise a URL that will probably be skipped by its shape
+            if not any(
+                other.normalized_url == normalized_url for other in window
+            ) and not self._template_index.is_saturated_shape(item.url):
+                self._start_slot(pool, slot, tasks)
+            window.append(slot)
+
+    def _start_slot(
+        self,
+        pool: BrowserPool,
+        slot: _CrawlSlot,
+        tasks: list[asyncio.Task[None]],
+    ) -> asyncio.Task[None]:
+        """Start the worker task for a slot."""
+        task = slot.task = asyncio.create_task(self._run_slot(pool, slot))
+        tasks.append(task)
+        return task
+
+    async def _run_slot(self, pool: BrowserPool, slot: _CrawlSlot) -> None:
+        """Fetch a slot's page in a pool context, then finish or release it."""
+        item = slot.item
+        start_time = time.time()
+        crawled = CrawledPage(
+            url=item.url,
+            final_url=item.url,
+            title="",
+            depth=item.depth,
+            state=CrawlState.IN_PROGRESS,
+        )
+
+        try:
+            async with pool.acquire(f"crawl:{item.url}") as page:
+                if self._session_cookies and page not in self._session_pages:
+                    await asyncio.to_thread(self._share_session, page)
+                await self._wait_for_host(item.url)
+
+                try:
+                    signature = await asyncio.to_thread(self._fetch_page, page, item, crawled)
+                except Exception as e:
+                    crawled.state = CrawlState.FAILED
+                    crawled.errors.append(str(e))
+                    self._log.warning("Page crawl failed", url=item.url, error=str(e))
+                    slot.fetched.set_result((crawled, None))
+                    return
+
+                slot.fetched.set_result((crawled, signature))
+                if not await slot.decision:
+                    return
+
+                try:
+                    await self._finish_page(page, crawled)
+                    crawled.state = CrawlState.COMPLETED
+                except Exception as e:
+                    crawled.state = CrawlState.FAILED
+                    crawled.errors.append(str(e))
+                    self._log.warning("Page crawl failed", url=item.url, error=str(e))
+
+        except Exception as e:
+            # Context acquisition failed
+            if not slot.fetched.done():
+                crawled.state = CrawlState.FAILED
+                crawled.errors.append(str(e))
+                slot.fetched.set_result((crawled, None))
+
+        finally:
+            crawled.crawl_time_ms = int((time.time() - start_time) * 1000)
+
+    async def _commit_slot(
+        self,
+        pool: BrowserPool,
+        slot: _CrawlSlot,
+        tasks: list[asyncio.Task[None]],
+    ) -> None:
+        """Apply the window head exactly as the serial crawl would."""
+        # Visited since it was queued (an earlier copy completed) or now
+        # known to be a fully sampled template by its URL shape
+        if slot.normalized_url in self._visited_urls or self._skip_by_url_shape(slot.item):
+            self._release_slot(slot)
+            return
+
+        task = slot.task or self._start_slot(pool, slot, tasks)
+
+        crawled, signature = await slot.fetched
+        if signature is None or not self._admit_page(slot.item, crawled, signature):
+            self._release_slot(slot)
+        else:
+            self._urls_discovered += len(crawled.discovered_urls)
+            self._forms_found += len(crawled.forms_found)
+            slot.decision.set_result(True)
+            await task
+
+        self._record_outcome(slot.item, slot.normalized_url, crawled)
+
+    def _reconcile_window(self, window: deque[_CrawlSlot]) -> None:
+        """Return slots that a newly queued item now precedes to the queue."""
+        while window and self._queue and self._queue[0] < window[-1].item:
+            slot = window.pop()
+            self._release_slot(slot)
+            heappush(self._queue, slot.item)
+
+    def _requeue_window(self, window: deque[_CrawlSlot]) -> None:
+        """Return every slot to the queue, discarding speculative fetches."""
+        while window:
+            slot = window.pop()
+            self._release_slot(slot)
+            heappush(self._queue, slot.item)
+
+    @staticmethod
+    def _release_slot(slot: _CrawlSlot) -> None:
+        """Tell a slot's worker to discard its page and free its context."""
+        if not slot.decision.done():
+            slot.decision.set_result(False)
+
+    async def _wait_for_host(self, url: str) -> None:
+        """Space out request starts to one host by ``rate_limit_ms``."""
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        start_at = max(now, self._host_next_request.get(host, 0.0))
+        self._host_next_request[host] = start_at + self._config.rate_limit_ms / 1000
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
     async def _crawl_page(
         self,
         page: BrowserContext,
@@ -332,57 +654,15 @@ class IntelligentCrawler:
         )
 
         try:
-            # Navigate to URL
-            page.goto(url, timeout=self._config.timeout_ms)
-
-            # Wait for page load
-            time.sleep(self._config.wait_after_navigation_ms / 1000)
-
-            # Get final URL (after redirects)
-            final_url = page.get_current_url()
-            crawled.final_url = final_url
-
-            # Track redirects
-            if final_url != url:
-                self._url_redirects[url] = final_url
-
-            # Check if we've already seen this content
-            content_hash = self._get_content_hash(page)
-            if content_hash in self._visited_content_hashes:
-                crawled.state = CrawlState.SKIPPED
-                self._log.debug("Skipping duplicate content", url=url)
+            signature = self._load_page(page, item, crawled)
+            if not self._admit_page(item, crawled, signature):
                 return crawled
 
-            self._visited_content_hashes.add(content_hash)
-
-            # Get page title
-            crawled.title = page.get_title() or "Untitled"
-
-            # Capture HTML content for analysis
-            crawled.html_content = page.get_html()
-
-            # Capture screenshot if needed
-            crawled.screenshot = page.screenshot()
-
-            # Discover URLs
-            crawled.discovered_urls = self._discover_urls(page, url)
+            self._collect_page(page, crawled)
             self._urls_discovered += len(crawled.discovered_urls)
-
-            # Discover forms
-            crawled.forms_found = self._discover_forms(page)
             self._forms_found += len(crawled.forms_found)
 
-            # Check for authentication
-            if self._detect_authentication_form(crawled.forms_found):
-                self._auth_detected = True
-                if self._config.authentication:
-                    auth_success = await self._handle_authentication(page)
-                    self._auth_completed = auth_success
-
-            # Track state if state manager available
-            if self._state_manager:
-                current_state = await self._state_manager.capture_state(page)
-                crawled.app_state = current_state
+            await self._finish_page(page, crawled)
 
             crawled.state = CrawlState.COMPLETED
 
@@ -394,6 +674,69 @@ class IntelligentCrawler:
         crawled.crawl_time_ms = int((time.time() - start_time) * 1000)
         return crawled
 
+    def _fetch_page(
+        self,
+        page: BrowserContext,
+        item: CrawlQueueItem,
+        crawled: CrawledPage,
+    ) -> tuple[str, int]:
+        """Load and collect a page without touching crawl state (blocking)."""
+        signature = self._load_page(page, item, crawled)
+        self._collect_page(page, crawled)
+        return signature
+
+    def _load_page(
+        self,
+        page: BrowserContext,
+        item: CrawlQueueItem,
+        crawled: CrawledPage,
+    ) -> tuple[str, int]:
+        """Navigate to the item's URL and return the page's signature."""
+        # Navigate to URL
+        page.goto(item.url, timeout=self._config.timeout_ms)
+
+        # Wait for page load
+        time.sleep(self._config.wait_after_navigation_ms / 1000)
+
+        # Get final URL (after redirects)
+        crawled.final_url = page.get_current_url()
+
+        return self._get_page_signature(page)
+
+    def _collect_page(self, page: BrowserContext, crawled: CrawledPage) -> None:
+        """Capture title, content, links and forms of the loaded page."""
+        # Get page title
+        crawled.title = page.get_title() or "Untitled"
+
+        # Capture HTML content for analysis
+        crawled.html_content = page.get_html()
+
+        # Capture screenshot if needed
+        crawled.screenshot = page.screenshot()
+
+        # Discover URLs
+        crawled.discovered_urls = self._discover_urls(page, crawled.url)
+
+        # Discover forms
+        crawled.forms_found = self._discover_forms(page)
+
+    async def _finish_page(self, page: BrowserContext, crawled: CrawledPage) -> None:
+        """Handle authentication and capture app state for a new page."""
+        # Check for authentication
+        if self._detect_authentication_form(crawled.forms_found):
+            self._auth_detected = True
+            if self._config.authentication:
+                auth_success = await self._handle_authentication(page)
+                if auth_success and self._config.concurrency > 1:
+                    self._session_cookies = page.get_cookies()
+                    self._session_pages = weakref.WeakSet([page])
+                self._auth_completed = auth_success
+
+        # Track state if state manager available
+        if self._state_manager:
+            current_state = await self._state_manager.capture_state(page)
+            crawled.app_state = current_state
+
     def _enqueue(
         self,
         url: str,
@@ -421,7 +764,9 @@ class IntelligentCrawler:
             priority=priority,
             depth=depth,
             parent_url=parent_url,
+            sequence=self._enqueued_count,
         )
+        self._enqueued_count += 1
 
         heappush(self._queue, item)
 
@@ -611,20 +956,73 @@ class IntelligentCrawler:
             self._log.warning("Authentication failed", error=str(e))
             return False
 
-    def _get_content_hash(self, page: BrowserContext) -> str:
-        """Get hash of page content for deduplication."""
+    def _share_session(self, page: BrowserContext) -> None:
+        """Copy the authenticated session cookies into a pool context (blocking)."""
+        for cookie in self._session_cookies:
+            domain = cookie.domain.lstrip(".") or self._base_domain
+            page.set_cookie(
+                f"{self._base_scheme}://{domain}{cookie.path or '/'}",
+                cookie.name,
+                cookie.value,
+                domain=cookie.domain or None,
+                path=cookie.path or "/",
+                secure=cookie.secure,
+                http_only=cookie.http_only,
+                same_site=cookie.same_site,
+                expires=cookie.expires,
+            )
+        self._session_pages.add(page)
+
+    def _get_page_signature(self, page: BrowserContext) -> tuple[str, int]:
+        """
+        Get the content hash and structural fingerprint of the page.
+
+        The content hash covers the full text (hashed in the page, so long
+        pages are not transferred); the fingerprint is a SimHash of the
+        DOM skeleton used to group pages by template.
+        """
         script = """
         (() => {
             const body = document.body;
             const text = body ? body.innerText : '';
+
+            // 53-bit cyrb53 hash of the full text
+            let h1 = 0xdeadbeef, h2 = 0x41c6ce57;
+            for (let i = 0; i < text.length; i++) {
+                const ch = text.charCodeAt(i);
+                h1 = Math.imul(h1 ^ ch, 2654435761);
+                h2 = Math.imul(h2 ^ ch, 1597334677);
+            }
+            h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+            h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+            const textHash = (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(16);
+
             // Include structural info for better deduplication
             const structure = document.querySelectorAll('h1, h2, h3, main, article').length;
-            return text.substring(0, 1000) + '|' + structure;
+
+            // Skeleton: parent>tag.classes token counts, digits normalised
+            const skeleton = {};
+            const elements = body ? body.getElementsByTagName('*') : [];
+            const limit = Math.min(elements.length, 5000);
+            for (let i = 0; i < limit; i++) {
+                const el = elements[i];
+                const classes = Array.from(el.classList)
+                    .map(c => c.replace(/[0-9]+/g, '#'))
+                    .sort()
+                    .slice(0, 3)
+                    .join('.');
+                const parent = el.parentElement ? el.parentElement.tagName : '';
+                const token = parent + '>' + el.tagName + (classes ? '.' + classes : '');
+                skeleton[token] = (skeleton[token] || 0) + 1;
+            }
+
+            return {content: textHash + '|' + text.length + '|' + structure, skeleton: skeleton};
         })()
         """
 
-        content = page.expression(script)
-        return hashlib.md5(content.encode()).hexdigest()
+        signature = page.expression(script)
+        content_hash = hashlib.md5(signature["content"].encode()).hexdigest()
+        return content_hash, skeleton_fingerprint(signature["skeleton"])
 
     def _should_stop(self) -> bool:
         """Check if crawling should stop."""
@@ -688,5 +1086,7 @@ class IntelligentCrawler:
             "forms_found": self._forms_found,
             "auth_detected": self._auth_detected,
             "auth_completed": self._auth_completed,
+            "templates_found": len(self._template_index.templates),
+            "template_pages_skipped": self._template_pages_skipped,
             "elapsed_seconds": time.time() - self._start_time if self._start_time else 0,
         }
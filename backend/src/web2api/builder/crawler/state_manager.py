@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum, auto
@@ -42,7 +43,7 @@ class StateConfig:
     """Whether to track DOM state changes."""
 
     max_states: int = 100
-    """Maximum number of states to track."""
+    """Maximum number of states to track (least recently seen are evicted)."""
 
     state_timeout: int = 30000
     """Timeout for state capture in ms."""
@@ -149,54 +150,161 @@ class StateTransition:
 
 @dataclass
 class StateGraph:
-    """Graph of application states and transitions."""
+    """
+    Graph of application states and transitions.
+
+    States are keyed by their storage+DOM hash, so revisiting a state
+    reuses its node. Outgoing transitions are indexed per state and
+    duplicate transitions are ignored. Shortest paths from the initial
+    state come from one BFS parent tree that is cached until a
+    transition is added or the initial state changes. With
+    ``max_states`` set, the least recently seen state (never the initial
+    one) is evicted with its transitions once the limit is exceeded.
+    """
 
     states: dict[str, ApplicationState]
     transitions: list[StateTransition]
     initial_state_id: str | None = None
     authenticated_states: list[str] = field(default_factory=list)
+    max_states: int | None = None
+
+    _outgoing: dict[str, list[StateTransition]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _transition_keys: set[tuple[str, str, str, str | None]] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    _last_seen: OrderedDict[str, None] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    # BFS parent tree from the initial state: state_id -> incoming tree edge
+    _path_tree: dict[str, StateTransition | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _path_tree_root: str | None = field(default=None, init=False, repr=False, compare=False)
+    _entry_points: list[StateTransition] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index states and transitions passed to the constructor."""
+        for state_id in self.states:
+            self._last_seen[state_id] = None
+        transitions, self.transitions = self.transitions, []
+        for transition in transitions:
+            self.add_transition(transition)
 
     def add_state(self, state: ApplicationState) -> bool:
         """Add state to graph. Returns True if new state."""
-        if state.state_id not in self.states:
+        is_new = state.state_id not in self.states
+        if is_new:
             self.states[state.state_id] = state
             if state.is_authenticated:
                 self.authenticated_states.append(state.state_id)
-            return True
-        return False
+                self._entry_points = None
+        self.touch(state.state_id)
+
+        if is_new and self.max_states is not None:
+            self._evict_over_limit(self.max_states, keep=state.state_id)
+        return is_new
+
+    def touch(self, state_id: str) -> None:
+        """Mark a state as most recently seen."""
+        if state_id in self.states:
+            self._last_seen[state_id] = None
+            self._last_seen.move_to_end(state_id)
+
+    def add_transition(self, transition: StateTransition) -> bool:
+        """Add transition to graph. Returns True if it was not already known."""
+        key = (
+            transition.from_state_id,
+            transition.to_state_id,
+            transition.trigger_action,
+            transition.trigger_selector,
+        )
+        if key in self._transition_keys:
+            return False
 
-    def add_transition(self, transition: StateTransition) -> None:
-        """Add transition to graph."""
+        self._transition_keys.add(key)
         self.transitions.append(transition)
+        self._outgoing.setdefault(transition.from_state_id, []).append(transition)
+        self._invalidate_paths()
+        return True
+
+    def _invalidate_paths(self) -> None:
+        """Drop cached paths and entry points after a graph change."""
+        self._path_tree = None
+        self._entry_points = None
+
+    def _evict_over_limit(self, limit: int, keep: str) -> None:
+        """Evict least recently seen states until at most ``limit`` remain."""
+        evicted: set[str] = set()
+        candidates = iter(list(self._last_seen))
+        while len(self.states) > limit:
+            victim = next(candidates, None)
+            if victim is None:
+                break
+            if victim in (keep, self.initial_state_id):
+                continue
+            del self.states[victim]
+            del self._last_seen[victim]
+            self._outgoing.pop(victim, None)
+            evicted.add(victim)
+
+        if not evicted:
+            return
+
+        self.transitions = [
+            t for t in self.transitions
+            if t.from_state_id not in evicted and t.to_state_id not in evicted
+        ]
+        for state_id, outgoing in self._outgoing.items():
+            if any(t.to_state_id in evicted for t in outgoing):
+                self._outgoing[state_id] = [t for t in outgoing if t.to_state_id not in evicted]
+        self._transition_keys = {
+            key for key in self._transition_keys
+            if key[0] not in evicted and key[1] not in evicted
+        }
+        self.authenticated_states = [s for s in self.authenticated_states if s not in evicted]
+        self._invalidate_paths()
+
+    def _get_path_tree(self) -> dict[str, StateTransition | None]:
+        """BFS parent tree over outgoing transitions, cached per graph version."""
+        if self._path_tree is not None and self._path_tree_root == self.initial_state_id:
+            return self._path_tree
+
+        tree: dict[str, StateTransition | None] = {}
+        if self.initial_state_id:
+            tree[self.initial_state_id] = None
+            queue: deque[str] = deque([self.initial_state_id])
+            while queue:
+                current_state = queue.popleft()
+                for transition in self._outgoing.get(current_state, ()):
+                    if transition.to_state_id not in tree:
+                        tree[transition.to_state_id] = transition
+                        queue.append(transition.to_state_id)
+
+        self._path_tree = tree
+        self._path_tree_root = self.initial_state_id
+        return tree
 
     def get_path_to_state(self, target_state_id: str) -> list[StateTransition]:
         """Get transitions needed to reach a target state from initial state."""
         if not self.initial_state_id or target_state_id == self.initial_state_id:
             return []
 
-        # BFS to find shortest path
-        from collections import deque
-
-        visited: set[str] = set()
-        queue: deque[tuple[str, list[StateTransition]]] = deque()
-        queue.append((self.initial_state_id, []))
-
-        while queue:
-            current_state, path = queue.popleft()
-
-            if current_state in visited:
-                continue
-            visited.add(current_state)
-
-            if current_state == target_state_id:
-                return path
-
-            # Find transitions from current state
-            for transition in self.transitions:
-                if transition.from_state_id == current_state:
-                    queue.append((transition.to_state_id, path + [transition]))
+        tree = self._get_path_tree()
+        if target_state_id not in tree:
+            return []
 
-        return []
+        # Walk parent pointers back to the initial state
+        path: list[StateTransition] = []
+        edge = tree[target_state_id]
+        while edge is not None:
+            path.append(edge)
+            edge = tree[edge.from_state_id]
+        path.reverse()
+        return path
 
     def get_prerequisites(self, state_id: str) -> list[str]:
         """Get prerequisite states for a given state."""
@@ -205,14 +313,15 @@ class StateGraph:
 
     def get_authenticated_entry_points(self) -> list[StateTransition]:
         """Get transitions that lead to authenticated states."""
-        entry_points: list[StateTransition] = []
-
-        for transition in self.transitions:
-            if transition.to_state_id in self.authenticated_states:
-                if transition.from_state_id not in self.authenticated_states:
-                    entry_points.append(transition)
+        if self._entry_points is None:
+            authenticated = set(self.authenticated_states)
+            self._entry_points = [
+                transition for transition in self.transitions
+                if transition.to_state_id in authenticated
+                and transition.from_state_id not in authenticated
+            ]
 
-        return entry_points
+        return list(self._entry_points)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert graph to dictionary for serialization."""
@@ -255,9 +364,8 @@ class StateManager:
     def __init__(self, config: StateConfig | None = None) -> None:
         self.config = config or StateConfig()
         self._log = logger.bind(component="state_manager")
-        self._graph = StateGraph(states={}, transitions=[])
+        self._graph = StateGraph(states={}, transitions=[], max_states=self.config.max_states)
         self._current_state: ApplicationState | None = None
-        self._state_counter = 0
 
     @property
     def state_graph(self) -> StateGraph:
@@ -287,9 +395,8 @@ class StateManager:
         # Capture DOM state
         dom_state = await self._capture_dom_state(page)
 
-        # Generate state ID
-        self._state_counter += 1
-        state_id = f"state_{self._state_counter}_{storage_state.get_hash()}_{dom_state.get_hash()}"
+        # State ID is the storage+DOM hash, so revisited states share a node
+        state_id = f"state_{storage_state.get_hash()}_{dom_state.get_hash()}"
 
         state = ApplicationState(
             state_id=state_id,
@@ -548,9 +655,8 @@ class StateManager:
 
     def reset(self) -> None:
         """Reset state manager to initial state."""
-        self._graph = StateGraph(states={}, transitions=[])
+        self._graph = StateGraph(states={}, transitions=[], max_states=self.config.max_states)
         self._current_state = None
-        self._state_counter = 0
 
     def export_graph(self) -> dict[str, Any]:
         """Export state graph for visualization or storage."""
@@ -0,0 +1,229 @@
+"""
+Structural page-template index for near-duplicate detection.
+
+Catalog-style sites render thousands of pages from a handful of
+templates ("same template, different data"). This module fingerprints a
+page's DOM skeleton (parent/tag/class tokens, digits normalised away)
+with a 64-bit SimHash and groups pages whose fingerprints are within a
+small Hamming distance, so the crawler can sample a few pages per
+template instead of crawling every one.
+
+Provides:
+- SimHash fingerprinting of skeleton token counts
+- Banded Hamming-distance lookup (no full scan per page)
+- URL-shape learning to skip template pages before loading them
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+FINGERPRINT_BITS = 64
+
+# Path segments that look like record identifiers
+_ID_SEGMENT = re.compile(r"\d|^[0-9a-f]{8,}$|^[0-9a-f-]{32,36}$", re.IGNORECASE)
+
+
+def simhash(features: dict[str, float]) -> int:
+    """
+    Compute a 64-bit SimHash of weighted features.
+
+    Args:
+        features: Feature token to weight
+
+    Returns:
+        Fingerprint as an unsigned 64-bit integer
+    """
+    vector = [0.0] * FINGERPRINT_BITS
+    for token, weight in features.items():
+        digest = int.from_bytes(
+            hashlib.blake2b(token.encode(), digest_size=8).digest(), "big"
+        )
+        for bit in range(FINGERPRINT_BITS):
+            if digest >> bit & 1:
+                vector[bit] += weight
+            else:
+                vector[bit] -= weight
+
+    fingerprint = 0
+    for bit, value in enumerate(vector):
+        if value > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def skeleton_fingerprint(skeleton: dict[str, int]) -> int:
+    """
+    Fingerprint a DOM skeleton given as token -> occurrence count.
+
+    Counts are log-damped so a list with 10 or 50 items yields nearly
+    the same fingerprint.
+    """
+    return simhash({token: 1.0 + math.log(count) for token, count in skeleton.items() if count > 0})
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return (a ^ b).bit_count()
+
+
+def url_shape(url: str) -> str:
+    """
+    Reduce a URL to its shape: identifier-like path segments and query
+    values are replaced, so ``/product/123?ref=a`` and
+    ``/product/456?ref=b`` share the shape ``host/product/{id}?ref``.
+    """
+    parsed = urlparse(url)
+    segments = [
+        "{id}" if _ID_SEGMENT.search(segment) else segment
+        for segment in parsed.path.strip("/").split("/")
+    ]
+    shape = f"{parsed.netloc}/{'/'.join(segments)}"
+    if parsed.query:
+        keys = sorted({pair.split("=", 1)[0] for pair in parsed.query.split("&") if pair})
+        shape += "?" + "&".join(keys)
+    return shape
+
+
+@dataclass
+class PageTemplate:
+    """A group of structurally near-identical pages."""
+
+    template_id: str
+    """Stable identifier (hex of the first member's fingerprint)."""
+
+    fingerprint: int
+    """Fingerprint of the first page assigned to the template."""
+
+    sample_urls: list[str] = field(default_factory=list)
+    """URLs sampled (crawled) for this template."""
+
+    skipped_count: int = 0
+    """Pages recognised as this template but not crawled."""
+
+
+@dataclass
+class TemplateMatch:
+    """Result of assigning a page to a template."""
+
+    template: PageTemplate
+    """The template the page belongs to."""
+
+    is_new: bool
+    """Whether the page started a new template."""
+
+    sample: bool
+    """Whether the page should be crawled as a sample of its template."""
+
+
+class PageTemplateIndex:
+    """
+    Index of page templates keyed by skeleton SimHash.
+
+    Lookups use the pigeonhole trick: with ``max_distance`` d, the
+    fingerprint is split into d + 1 bands and any fingerprint within
+    distance d shares at least one band exactly, so only templates in
+    matching band buckets are compared.
+    """
+
+    def __init__(self, max_samples: int, max_distance: int = 3) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            max_samples: Pages to crawl per template (0 = unlimited)
+            max_distance: Maximum Hamming distance for the same template
+        """
+        self._max_samples = max_samples
+        self._max_distance = max_distance
+        self._band_count = max_distance + 1
+        self._band_bits = math.ceil(FINGERPRINT_BITS / self._band_count)
+        self._bands: list[dict[int, list[PageTemplate]]] = [{} for _ in range(self._band_count)]
+        self._templates: dict[str, PageTemplate] = {}
+        # URL shape -> ids of templates seen with that shape
+        self._shape_templates: dict[str, set[str]] = {}
+        self._shape_counts: dict[str, int] = {}
+
+    @property
+    def templates(self) -> list[PageTemplate]:
+        """All templates in discovery order."""
+        return list(self._templates.values())
+
+    def _band_keys(self, fingerprint: int) -> list[int]:
+        mask = (1 << self._band_bits) - 1
+        return [fingerprint >> (i * self._band_bits) & mask for i in range(self._band_count)]
+
+    def find(self, fingerprint: int) -> PageTemplate | None:
+        """Find the closest template within the distance threshold."""
+        best: PageTemplate | None = None
+        best_distance = self._max_distance + 1
+        seen: set[str] = set()
+        for band, key in zip(self._bands, self._band_keys(fingerprint), strict=True):
+            for template in band.get(key, ()):
+                if template.template_id in seen:
+                    continue
+                seen.add(template.template_id)
+                distance = hamming_distance(fingerprint, template.fingerprint)
+                if distance < best_distance:
+                    best, best_distance = template, distance
+        return best
+
+    def assign(self, url: str, fingerprint: int) -> TemplateMatch:
+        """
+        Assign a loaded page to a template and decide whether to sample it.
+
+        Args:
+            url: Page URL
+            fingerprint: Skeleton fingerprint of the page
+
+        Returns:
+            Template match with the sampling decision
+        """
+        template = self.find(fingerprint)
+        is_new = template is None
+        if template is None:
+            template = PageTemplate(template_id=f"{fingerprint:016x}", fingerprint=fingerprint)
+            self._templates[template.template_id] = template
+            for band, key in zip(self._bands, self._band_keys(fingerprint), strict=True):
+                band.setdefault(key, []).append(template)
+
+        shape = url_shape(url)
+        self._shape_templates.setdefault(shape, set()).add(template.template_id)
+        self._shape_counts[shape] = self._shape_counts.get(shape, 0) + 1
+
+        sample = not self._max_samples or len(template.sample_urls) < self._max_samples
+        if sample:
+            template.sample_urls.append(url)
+        else:
+            template.skipped_count += 1
+        return TemplateMatch(template=template, is_new=is_new, sample=sample)
+
+    def is_saturated_shape(self, url: str) -> bool:
+        """
+        Whether the URL's shape is known to render one saturated template.
+
+        True only when every page seen with this shape belonged to the same
+        template and that template already has all its samples, so the page
+        can be skipped without loading it.
+        """
+        if not self._max_samples:
+            return False
+        shape = url_shape(url)
+        template_ids = self._shape_templates.get(shape)
+        if not template_ids or len(template_ids) != 1:
+            return False
+        if self._shape_counts[shape] < self._max_samples:
+            return False
+        (template_id,) = template_ids
+        return len(self._templates[template_id].sample_urls) >= self._max_samples
+
+    def record_shape_skip(self, url: str) -> None:
+        """Count a page skipped by URL shape against its template."""
+        template_ids = self._shape_templates.get(url_shape(url))
+        if template_ids and len(template_ids) == 1:
+            (template_id,) = template_ids
+            self._templates[template_id].skipped_count += 1
@@ -263,6 +263,40 @@ class LLMEnhancedTestBuilder(AutoTestBuilder):
 
         return result or default_fallback
 
+    def _generate_step_names_llm(self, requests: list[dict[str, Any]]) -> list[str]:
+        """
+        Generate several step names concurrently using LLM or fallback.
+
+        Issuing the requests together lets the LLM service coalesce and
+        batch them into a few model calls.
+
+        Args:
+            requests: ``generate_step_name`` keyword arguments per step
+
+        Returns:
+            Step names, in request order
+        """
+        fallbacks = [
+            r.get("fallback")
+            or f"{r['action'].title()}: {r.get('selector') or r.get('text') or 'action'}"
+            for r in requests
+        ]
+
+        if not self.llm_enabled or not requests:
+            return fallbacks
+
+        async def generate_all() -> list[str]:
+            return await asyncio.gather(*(
+                self._llm_service.generate_step_name(**{**request, "fallback": fallback})
+                for request, fallback in zip(requests, fallbacks, strict=True)
+            ))
+
+        results = self._run_async(generate_all())
+        if not results:
+            return fallbacks
+
+        return [result or fallback for result, fallback in zip(results, fallbacks, strict=True)]
+
     def _generate_login_steps_llm(self) -> list[dict[str, Any]]:
         """Generate login steps with LLM-enhanced names."""
         # Get base login steps
@@ -272,19 +306,18 @@ class LLMEnhancedTestBuilder(AutoTestBuilder):
             return base_steps
 
         # Enhance step names
-        enhanced_steps = []
-        for step in base_steps:
-            new_name = self._generate_step_name_llm(
-                action=step.get("action", ""),
-                selector=step.get("selector"),
-                text=step.get("text"),
-                context="Login flow step",
-                fallback=step.get("name"),
-            )
-            enhanced_step = {**step, "name": new_name}
-            enhanced_steps.append(enhanced_step)
+        names = self._generate_step_names_llm([
+            {
+                "action": step.get("action", ""),
+                "selector": step.get("selector"),
+                "text": step.get("text"),
+                "context": "Login flow step",
+                "fallback": step.get("name"),
+            }
+            for step in base_steps
+        ])
 
-        return enhanced_steps
+        return [{**step, "name": name} for step, name in zip(base_steps, names, strict=True)]
 
     def _generate_page_steps_llm(self, analysis: PageAnalysis) -> list[dict[str, Any]]:
         """Generate page steps with LLM-enhanced names."""
@@ -294,33 +327,25 @@ class LLMEnhancedTestBuilder(AutoTestBuilder):
         if not self.llm_enabled:
             return base_steps
 
+        # Element descriptions by selector, from the analysis
+        descriptions: dict[str, str] = {}
+        for el in analysis.elements:
+            descriptions.setdefault(el.selector, el.semantic_description)
+
         # Enhance step names
-        enhanced_steps = []
-        for step in base_steps:
-            action = step.get("action", "")
-            selector = step.get("selector")
-            text = step.get("text")
-
-            # Get element description from analysis if available
-            element_desc = None
-            if selector:
-                for el in analysis.elements:
-                    if el.selector == selector:
-                        element_desc = el.semantic_description
-                        break
-
-            new_name = self._generate_step_name_llm(
-                action=action,
-                selector=selector,
-                text=text,
-                element_description=element_desc,
-                context=f"Testing page: {analysis.title}",
-                fallback=step.get("name"),
-            )
-            enhanced_step = {**step, "name": new_name}
-            enhanced_steps.append(enhanced_step)
+        names = self._generate_step_names_llm([
+            {
+                "action": step.get("action", ""),
+                "selector": step.get("selector"),
+                "text": step.get("text"),
+                "element_description": descriptions.get(step.get("selector") or ""),
+                "context": f"Testing page: {analysis.title}",
+                "fallback": step.get("name"),
+            }
+            for step in base_steps
+        ])
 
-        return enhanced_steps
+        return [{**step, "name": name} for step, name in zip(base_steps, names, strict=True)]
 
     def _get_llm_assertion_suggestions(
         self,
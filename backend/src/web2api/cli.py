@@ -19,6 +19,7 @@ from web2api import __version__
 from web2api.ci.generator import CIProvider, CITemplateGenerator
 from web2api.dsl.models import TestSpec, TestSuite
 from web2api.dsl.parser import DSLParseError, DSLParser
+from web2api.runner.healing_store import create_healing_store
 from web2api.runner.self_healing import SelfHealingEngine
 from web2api.runner.test_runner import StepStatus, TestRunner, TestRunResult
 from web2api.storage.artifact_manager import ArtifactManager
@@ -123,6 +124,12 @@ def create_parser() -> argparse.ArgumentParser:
         "--healing-history",
         help="Path to self-healing history file",
     )
+    run_parser.add_argument(
+        "--healing-store",
+        default=os.getenv("AUTOQA_HEALING_STORE"),
+        help="Shared self-healing store: SQLite file path or redis:// URL "
+        "(default: $AUTOQA_HEALING_STORE)",
+    )
     run_parser.add_argument(
         "--default-timeout",
         type=int,
@@ -444,11 +451,6 @@ def cmd_run(args: argparse.Namespace) -> int:
             key, value = var.split("=", 1)
             variables[key] = value
 
-    healing_engine = SelfHealingEngine(
-        history_path=args.healing_history,
-        enable_learning=True,
-    )
-
     ArtifactManager(storage_path=args.artifacts_dir)
 
     # Remote browser configuration - required
@@ -475,6 +477,12 @@ def cmd_run(args: argparse.Namespace) -> int:
         network_idle_timeout = 2000
         wait_for_network_idle = not args.no_network_idle_wait
 
+    healing_engine = SelfHealingEngine(
+        history_path=args.healing_history,
+        enable_learning=True,
+        store=create_healing_store(args.healing_store) if args.healing_store else None,
+    )
+
     runner = TestRunner(
         browser=browser,
         healing_engine=healing_engine,
@@ -500,6 +508,7 @@ def cmd_run(args: argparse.Namespace) -> int:
                 all_results.append(result)
     finally:
         browser.close()
+        healing_engine.close()
 
     output = format_results(all_results, args.output_format)
 
@@ -5,7 +5,8 @@ Provides a pool of browser contexts with:
 - Lifecycle management (creation, recycling, cleanup)
 - Usage tracking and limits
 - Health checks and automatic recovery
-- Async-first design with proper cleanup
+- Async-first design with proper cleanup; blocking browser calls run
+  in worker threads so a slow browser never stalls the event loop
 """
 
 from __future__ import annotations
@@ -14,6 +15,7 @@ import asyncio
 import contextlib
 import time
 import uuid
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
 from typing import TYPE_CHECKING, Any, AsyncIterator
@@ -29,6 +31,9 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Index key for available contexts not yet used for any service
+_UNASSIGNED = ""
+
 
 class BrowserPoolError(Exception):
     """Base exception for browser pool errors."""
@@ -90,6 +95,9 @@ class BrowserContext:
     metadata: dict[str, Any] = field(default_factory=dict)
     """Additional metadata for the context."""
 
+    services: set[str] = field(default_factory=set)
+    """Services this context has been used for (and so holds cookies of)."""
+
     @property
     def age_seconds(self) -> float:
         """Get the age of this context in seconds."""
@@ -124,6 +132,16 @@ class BrowserPool:
     - Health checks and recovery
     - Resource-aware scaling
     - Async-first with proper cancellation handling
+    - Blocking owl-browser calls run in worker threads, never on the loop
+    - Minimum contexts are pre-warmed in the background
+    - Available contexts are indexed (overall and per service) in
+      most-recently-released order, so lookups and removals are O(1) and
+      service acquisitions prefer contexts already holding its cookies
+
+    The acquire and release paths take no lock: pool bookkeeping happens
+    synchronously between awaits, and capacity for a new context is
+    reserved before its (slow) creation starts, so one slow context
+    creation never blocks releases or other acquisitions.
 
     Usage:
         async with BrowserPool(browser, config) as pool:
@@ -151,8 +169,13 @@ class BrowserPool:
         self._resource_monitor = resource_monitor
 
         self._contexts: dict[str, BrowserContext] = {}
-        self._available: asyncio.Queue[str] = asyncio.Queue()
-        self._lock = asyncio.Lock()
+        # Available context IDs, most recently released last
+        self._available: OrderedDict[str, None] = OrderedDict()
+        self._available_by_service: dict[str, OrderedDict[str, None]] = {}
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._acquire_latencies_ms: deque[float] = deque(maxlen=1024)
+        self._pending_creates = 0
+        self._prewarm_task: asyncio.Task[None] | None = None
         self._cleanup_task: asyncio.Task[None] | None = None
         self._running = False
         self._closed = False
@@ -166,6 +189,12 @@ class BrowserPool:
             "total_failed": 0,
             "total_acquisitions": 0,
             "total_releases": 0,
+            "service_hits": 0,
+            "service_misses": 0,
+            "recycled_max_uses": 0,
+            "recycled_max_age": 0,
+            "recycled_idle": 0,
+            "recycled_unhealthy": 0,
         }
 
     @property
@@ -173,10 +202,15 @@ class BrowserPool:
         """Get current pool size."""
         return len(self._contexts)
 
+    @property
+    def max_size(self) -> int:
+        """Get the maximum number of contexts the pool may hold."""
+        return self._config.max_browser_contexts
+
     @property
     def available_count(self) -> int:
         """Get number of available contexts."""
-        return self._available.qsize()
+        return len(self._available)
 
     @property
     def in_use_count(self) -> int:
@@ -188,19 +222,33 @@ class BrowserPool:
 
     @property
     def statistics(self) -> dict[str, Any]:
-        """Get pool statistics."""
+        """Get pool statistics, including acquire latency over recent acquisitions."""
+        latencies = sorted(self._acquire_latencies_ms)
+        if latencies:
+            latency = {
+                "avg_ms": sum(latencies) / len(latencies),
+                "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                "max_ms": latencies[-1],
+            }
+        else:
+            latency = {"avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+
         return {
             **self._stats,
             "current_size": self.size,
             "available": self.available_count,
             "in_use": self.in_use_count,
+            "pending_creates": self._pending_creates,
+            "acquire_latency": latency,
         }
 
     async def start(self) -> None:
         """
-        Start the pool and initialize minimum contexts.
+        Start the pool and begin pre-warming minimum contexts.
 
-        Called automatically when using as async context manager.
+        Pre-warming runs in the background; use ``wait_until_warm()`` to
+        block until it has finished. Called automatically when using as
+        async context manager.
         """
         if self._running:
             return
@@ -213,17 +261,18 @@ class BrowserPool:
             min_contexts=self._config.min_browser_contexts,
         )
 
-        # Create minimum contexts
-        for _ in range(self._config.min_browser_contexts):
-            try:
-                await self._create_context()
-            except Exception as e:
-                self._log.warning("Failed to create initial context", error=str(e))
+        self._schedule_prewarm()
 
         # Start cleanup task
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
 
-        self._log.info("Browser pool started", initial_size=self.size)
+        self._log.info("Browser pool started", prewarming=self._config.min_browser_contexts)
+
+    async def wait_until_warm(self) -> None:
+        """Wait until background pre-warming of minimum contexts has finished."""
+        if self._prewarm_task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await asyncio.shield(self._prewarm_task)
 
     async def stop(self) -> None:
         """
@@ -237,11 +286,12 @@ class BrowserPool:
         self._running = False
         self._log.info("Stopping browser pool")
 
-        # Stop cleanup task
-        if self._cleanup_task is not None:
-            self._cleanup_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._cleanup_task
+        # Stop background tasks
+        for task in (self._prewarm_task, self._cleanup_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
 
         # Wait for in-use contexts with timeout
         timeout = self._config.graceful_shutdown_timeout_seconds
@@ -254,13 +304,13 @@ class BrowserPool:
                 in_use=self.in_use_count,
             )
 
-        # Force close all contexts
-        async with self._lock:
-            for ctx in list(self._contexts.values()):
-                await self._close_context(ctx)
-            self._contexts.clear()
-
+        # Force close all contexts. Mark the pool closed first: contexts whose
+        # creation finishes while these close are closed by _create_context.
         self._closed = True
+        contexts = list(self._contexts.values())
+        self._contexts.clear()
+        await asyncio.gather(*(self._close_context(ctx) for ctx in contexts))
+
         self._log.info("Browser pool stopped", stats=self._stats)
 
     @contextlib.asynccontextmanager
@@ -268,6 +318,7 @@ class BrowserPool:
         self,
         test_name: str | None = None,
         timeout: float | None = None,
+        service_id: str | None = None,
     ) -> AsyncIterator[OwlBrowserContext]:
         """
         Acquire a browser context from the pool.
@@ -279,6 +330,7 @@ class BrowserPool:
         Args:
             test_name: Optional name of the test for tracking
             timeout: Acquisition timeout (uses config default if not specified)
+            service_id: Prefer a context already used for this service
 
         Yields:
             The underlying owl-browser context
@@ -291,7 +343,7 @@ class BrowserPool:
             raise BrowserPoolError("Pool is closed")
 
         effective_timeout = timeout or self._config.acquire_timeout_seconds
-        context = await self._acquire_context(test_name, effective_timeout)
+        context = await self._acquire_context(test_name, effective_timeout, service_id)
 
         try:
             yield context.context
@@ -302,65 +354,33 @@ class BrowserPool:
         self,
         test_name: str | None,
         timeout: float,
+        service_id: str | None = None,
     ) -> BrowserContext:
-        """Acquire a context from the pool or create new one."""
+        """
+        Acquire a context from the pool or create new one.
+
+        With a ``service_id``, a warm context of that service is preferred,
+        then one not yet used by any service, then a new context (keeping
+        services isolated while there is room), then any available context.
+        """
         self._stats["total_acquisitions"] += 1
         start = time.monotonic()
-
-        while (time.monotonic() - start) < timeout:
-            # Try to get available context
-            try:
-                context_id = await asyncio.wait_for(
-                    self._available.get(),
-                    timeout=min(1.0, timeout - (time.monotonic() - start)),
-                )
-
-                async with self._lock:
-                    context = self._contexts.get(context_id)
-                    if context is None:
-                        continue
-
-                    # Check if context needs recycling
-                    if self._should_recycle(context):
-                        await self._recycle_context(context)
-                        continue
-
-                    # Check context health
-                    if not await self._check_context_health(context):
-                        await self._recycle_context(context)
-                        continue
-
-                    context.mark_used(test_name)
-                    self._log.debug(
-                        "Context acquired",
-                        context_id=context.id,
-                        test=test_name,
-                        use_count=context.use_count,
-                    )
-                    return context
-
-            except asyncio.TimeoutError:
-                # No available context, try to create new one
-                pass
-
-            # Try to create new context if pool not full
-            async with self._lock:
-                if self.size < self._config.max_browser_contexts:
-                    # Check resource constraints
-                    if self._resource_monitor is not None:
-                        snapshot = self._resource_monitor.take_snapshot()
-                        if not snapshot.can_scale_up and self.size > 0:
-                            self._log.debug(
-                                "Resource constraints prevent new context",
-                                pressure=snapshot.memory_pressure.name,
-                            )
-                            continue
-
-                    # Create context without adding to available queue
-                    # since we're immediately acquiring it
+        deadline = start + timeout
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            context = None
+            if service_id is not None:
+                context = self._pop_available(service_id) or self._pop_available(_UNASSIGNED)
+            if context is None and (service_id is None or not self._has_capacity()):
+                context = self._pop_available()
+
+            if context is None:
+                # Nothing idle: create a context if there is room, otherwise
+                # wait for a release
+                if self._has_capacity():
                     context = await self._create_context(make_available=False)
                     if context is not None:
-                        context.mark_used(test_name)
+                        self._mark_acquired(context, test_name, service_id, start)
                         self._log.debug(
                             "New context created and acquired",
                             context_id=context.id,
@@ -368,109 +388,269 @@ class BrowserPool:
                         )
                         return context
 
-            # Brief wait before retry
-            await asyncio.sleep(0.1)
+                    # Brief wait before retry
+                    await asyncio.sleep(0.1)
+                    continue
+
+                await self._wait_for_available(min(1.0, remaining))
+                continue
+
+            # Claim the context before the health check yields to the loop
+            context.state = ContextState.IN_USE
+
+            # Check if context needs recycling
+            reason = self._recycle_reason(context)
+            if reason is not None:
+                await self._recycle_context(context, reason)
+                continue
+
+            # Check context health
+            if not await self._check_context_health(context):
+                await self._recycle_context(context, "unhealthy")
+                continue
+
+            self._mark_acquired(context, test_name, service_id, start)
+            self._log.debug(
+                "Context acquired",
+                context_id=context.id,
+                test=test_name,
+                use_count=context.use_count,
+            )
+            return context
 
         raise PoolExhaustedError(
             f"Could not acquire browser context within {timeout}s "
             f"(pool size: {self.size}, available: {self.available_count})"
         )
 
-    async def _release_context(self, context: BrowserContext) -> None:
-        """Release a context back to the pool."""
-        self._stats["total_releases"] += 1
+    def _mark_acquired(
+        self,
+        context: BrowserContext,
+        test_name: str | None,
+        service_id: str | None,
+        started_at: float,
+    ) -> None:
+        """Mark a context in use and record acquisition latency."""
+        context.mark_used(test_name)
+        if service_id is not None:
+            hit = service_id in context.services
+            self._stats["service_hits" if hit else "service_misses"] += 1
+            context.services.add(service_id)
+            context.metadata["service_id"] = service_id
+        self._acquire_latencies_ms.append((time.monotonic() - started_at) * 1000)
+
+    def _add_available(self, context: BrowserContext) -> None:
+        """Index a context as available (most recently released last)."""
+        self._available[context.id] = None
+        for service in context.services or (_UNASSIGNED,):
+            self._available_by_service.setdefault(service, OrderedDict())[context.id] = None
+
+        # Wake one waiting acquirer
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def _remove_available(self, context: BrowserContext) -> None:
+        """Remove a context from the available indexes."""
+        self._available.pop(context.id, None)
+        for service in context.services or (_UNASSIGNED,):
+            index = self._available_by_service.get(service)
+            if index is not None:
+                index.pop(context.id, None)
+                if not index:
+                    del self._available_by_service[service]
+
+    def _pop_available(self, service_id: str | None = None) -> BrowserContext | None:
+        """
+        Take the most recently released available context without waiting.
+
+        Args:
+            service_id: Only consider contexts already used for this service
+                (``_UNASSIGNED`` for contexts not used by any service yet)
+        """
+        index = self._available if service_id is None else self._available_by_service.get(service_id)
+        while index:
+            context_id = next(reversed(index))
+            context = self._contexts.get(context_id)
+            if context is None:
+                index.pop(context_id, None)
+                self._available.pop(context_id, None)
+                continue
+
+            self._remove_available(context)
+            return context
+
+        return None
 
-        async with self._lock:
-            if context.id not in self._contexts:
-                self._log.warning(
-                    "Released context not in pool",
-                    context_id=context.id,
+    async def _wait_for_available(self, timeout: float) -> None:
+        """Wait until a context is released or the timeout expires."""
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def _has_capacity(self) -> bool:
+        """Check whether another context may be created, counting in-flight creations."""
+        committed = self.size + self._pending_creates
+        if committed >= self._config.max_browser_contexts:
+            return False
+
+        # Check resource constraints
+        if self._resource_monitor is not None and committed > 0:
+            snapshot = self._resource_monitor.take_snapshot()
+            if not snapshot.can_scale_up:
+                self._log.debug(
+                    "Resource constraints prevent new context",
+                    pressure=snapshot.memory_pressure.name,
                 )
-                return
+                return False
 
-            # Check if context should be recycled
-            if self._should_recycle(context):
-                await self._recycle_context(context)
-                return
+        return True
 
-            # Mark as available
-            context.mark_released()
-            await self._available.put(context.id)
+    async def _release_context(self, context: BrowserContext) -> None:
+        """Release a context back to the pool."""
+        self._stats["total_releases"] += 1
 
-            self._log.debug(
-                "Context released",
+        if context.id not in self._contexts:
+            self._log.warning(
+                "Released context not in pool",
                 context_id=context.id,
-                use_count=context.use_count,
             )
+            return
+
+        # Check if context should be recycled
+        reason = self._recycle_reason(context)
+        if reason is not None:
+            await self._recycle_context(context, reason)
+            return
+
+        # Mark as available
+        context.mark_released()
+        self._add_available(context)
+
+        self._log.debug(
+            "Context released",
+            context_id=context.id,
+            use_count=context.use_count,
+        )
 
     async def _create_context(self, make_available: bool = True) -> BrowserContext | None:
         """
         Create a new browser context.
 
+        The blocking ``new_page()`` call runs in a worker thread. Capacity
+        is reserved synchronously before it starts, so concurrent callers
+        see the in-flight creation when checking ``_has_capacity()``.
+
         Args:
             make_available: If True, add to available queue. If False, caller
                            is responsible for managing the context state.
         """
+        self._pending_creates += 1
         try:
-            owl_context = self._browser.new_page()
-            context_id = str(uuid.uuid4())[:8]
-
-            context = BrowserContext(
-                id=context_id,
-                context=owl_context,
-            )
-
-            self._contexts[context_id] = context
-            if make_available:
-                await self._available.put(context_id)
-            self._stats["total_created"] += 1
-
-            self._log.debug("Created browser context", context_id=context_id)
-            return context
-
+            owl_context = await asyncio.to_thread(self._browser.new_page)
         except Exception as e:
             self._stats["total_failed"] += 1
             self._log.error("Failed to create browser context", error=str(e))
             return None
+        finally:
+            self._pending_creates -= 1
+
+        context_id = str(uuid.uuid4())[:8]
+        context = BrowserContext(
+            id=context_id,
+            context=owl_context,
+        )
+
+        if self._closed:
+            await self._close_context(context)
+            return None
+
+        self._contexts[context_id] = context
+        if make_available:
+            self._add_available(context)
+        self._stats["total_created"] += 1
+
+        self._log.debug("Created browser context", context_id=context_id)
+        return context
+
+    def _schedule_prewarm(self) -> None:
+        """Start background creation of contexts up to the pool minimum."""
+        if not self._running or (self._prewarm_task is not None and not self._prewarm_task.done()):
+            return
+        self._prewarm_task = asyncio.create_task(self._prewarm())
+
+    async def _prewarm(self) -> None:
+        """Create contexts concurrently until the pool reaches its minimum."""
+        missing = self._config.min_browser_contexts - (self.size + self._pending_creates)
+        if missing <= 0:
+            return
+
+        results = await asyncio.gather(
+            *(self._create_context() for _ in range(missing))
+        )
+        failed = sum(1 for context in results if context is None)
+        if failed:
+            self._log.warning("Failed to pre-warm contexts", failed=failed)
+        else:
+            self._log.debug("Pre-warmed contexts", count=missing, pool_size=self.size)
+
+    async def _recycle_context(self, context: BrowserContext, reason: str) -> None:
+        """
+        Recycle a context by closing it and replenishing the pool in the background.
 
-    async def _recycle_context(self, context: BrowserContext) -> None:
-        """Recycle a context by closing and replacing it."""
+        Args:
+            context: Context to recycle
+            reason: Why it is recycled ("max_uses", "max_age", "idle" or "unhealthy")
+        """
         context.state = ContextState.RECYCLING
+        self._remove_available(context)
         self._stats["total_recycled"] += 1
+        self._stats[f"recycled_{reason}"] += 1
 
         self._log.debug(
             "Recycling context",
             context_id=context.id,
+            reason=reason,
             age=context.age_seconds,
             uses=context.use_count,
         )
 
-        # Close old context
-        await self._close_context(context)
-
-        # Remove from pool
+        # Remove from pool, then close old context
         self._contexts.pop(context.id, None)
+        await self._close_context(context)
 
         # Create replacement if pool below minimum
-        if self.size < self._config.min_browser_contexts:
-            await self._create_context()
+        if self.size + self._pending_creates < self._config.min_browser_contexts:
+            self._schedule_prewarm()
 
     async def _close_context(self, context: BrowserContext) -> None:
         """Close a browser context safely."""
         try:
-            context.context.close()
+            await asyncio.to_thread(context.context.close)
         except Exception as e:
             self._log.debug("Error closing context", context_id=context.id, error=str(e))
 
     def _should_recycle(self, context: BrowserContext) -> bool:
         """Check if a context should be recycled."""
+        return self._recycle_reason(context) is not None
+
+    def _recycle_reason(self, context: BrowserContext) -> str | None:
+        """Get the reason a context should be recycled, or None to keep it."""
         # Check use count
         if context.use_count >= self._config.context_max_uses:
-            return True
+            return "max_uses"
 
         # Check age
         if context.age_seconds >= self._config.context_max_age_seconds:
-            return True
+            return "max_age"
 
         # Check idle time (only for available contexts)
         if (
@@ -478,15 +658,15 @@ class BrowserPool:
             and context.idle_seconds >= self._config.context_idle_timeout_seconds
             and self.size > self._config.min_browser_contexts
         ):
-            return True
+            return "idle"
 
-        return False
+        return None
 
     async def _check_context_health(self, context: BrowserContext) -> bool:
         """Check if a context is healthy and usable."""
         try:
             # Try a simple operation to verify context is alive
-            context.context.get_current_url()
+            await asyncio.to_thread(context.context.get_current_url)
             return True
         except Exception as e:
             self._log.warning(
@@ -503,39 +683,43 @@ class BrowserPool:
             try:
                 await asyncio.sleep(self._config.monitoring_interval_seconds)
 
-                async with self._lock:
-                    # Find contexts to recycle
-                    to_recycle: list[BrowserContext] = []
+                # Find contexts to recycle, least recently released first
+                to_recycle: list[tuple[BrowserContext, str]] = []
+
+                for context_id in self._available:
+                    context = self._contexts.get(context_id)
+                    if context is None:
+                        continue
+                    reason = self._recycle_reason(context)
+                    if reason is not None:
+                        to_recycle.append((context, reason))
+
+                # Respect minimum pool size
+                max_recycle = max(
+                    0,
+                    self.size - self._config.min_browser_contexts,
+                )
+                to_recycle = to_recycle[:max_recycle]
 
-                    for context in self._contexts.values():
-                        if context.state == ContextState.AVAILABLE and self._should_recycle(context):
-                            to_recycle.append(context)
+                if to_recycle:
+                    # Unindex before yielding so acquirers cannot take them
+                    for context, _ in to_recycle:
+                        context.state = ContextState.RECYCLING
+                        self._remove_available(context)
 
-                    # Respect minimum pool size
-                    max_recycle = max(
-                        0,
-                        self.size - self._config.min_browser_contexts,
+                    # Recycle contexts
+                    await asyncio.gather(
+                        *(self._recycle_context(context, reason) for context, reason in to_recycle)
                     )
-                    to_recycle = to_recycle[:max_recycle]
 
-                    # Recycle contexts
-                    for context in to_recycle:
-                        # Remove from available queue
-                        new_queue: asyncio.Queue[str] = asyncio.Queue()
-                        while not self._available.empty():
-                            ctx_id = self._available.get_nowait()
-                            if ctx_id != context.id:
-                                await new_queue.put(ctx_id)
-                        self._available = new_queue
-
-                        await self._recycle_context(context)
-
-                    if to_recycle:
-                        self._log.info(
-                            "Cleaned up idle contexts",
-                            count=len(to_recycle),
-                            pool_size=self.size,
-                        )
+                    self._log.info(
+                        "Cleaned up idle contexts",
+                        count=len(to_recycle),
+                        pool_size=self.size,
+                    )
+
+                # Keep the pool warm after failures or recycling
+                self._schedule_prewarm()
 
             except asyncio.CancelledError:
                 break
@@ -567,7 +751,9 @@ class BrowserPool:
         """
         Acquire or create a browser context for a specific service.
 
-        Provides service isolation by maintaining separate contexts per service.
+        Prefers a warm context that already holds the service's cookies,
+        then an unused or new context while the pool has room (keeping
+        services isolated), and only then a context used by another service.
 
         Args:
             service_id: Service identifier
@@ -582,41 +768,7 @@ class BrowserPool:
         """
         effective_timeout = timeout or self._config.acquire_timeout_seconds
 
-        # Check if service already has a dedicated context
-        async with self._lock:
-            for ctx_id, ctx in self._contexts.items():
-                if ctx.metadata.get("service_id") == service_id and ctx.state == ContextState.AVAILABLE:
-                    # Found existing service context
-                    context = await self._acquire_context(service_id, effective_timeout)
-                    try:
-                        yield context.context
-                    finally:
-                        await self._release_context(context)
-                    return
-
-        # No existing context, create new one for service
-        async with self._lock:
-            if self.size < self._config.max_browser_contexts:
-                context = await self._create_context(make_available=False)
-                if context:
-                    context.metadata["service_id"] = service_id
-                    context.mark_used(service_id)
-
-                    self._log.info(
-                        "Created service context",
-                        service_id=service_id,
-                        context_id=context.id,
-                    )
-
-                    try:
-                        yield context.context
-                    finally:
-                        await self._release_context(context)
-                    return
-
-        # Fallback to regular pool
-        self._log.warning("No dedicated context available, using pool", service_id=service_id)
-        async with self.acquire(service_id, timeout=effective_timeout) as context:
+        async with self.acquire(service_id, timeout=effective_timeout, service_id=service_id) as context:
             yield context
 
     async def new_service_tab(self, service_id: str) -> str:
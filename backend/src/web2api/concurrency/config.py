@@ -126,6 +126,9 @@ class ConcurrencyConfig:
     max_context_retries: int = 2
     """Maximum retries for context-related failures."""
 
+    healing_store_url: str | None = None
+    """Shared selector-healing store (SQLite path or redis:// URL)."""
+
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
         self._validate()
@@ -183,6 +186,7 @@ class ConcurrencyConfig:
             graceful_shutdown_timeout_seconds=self.graceful_shutdown_timeout_seconds,
             retry_on_context_failure=self.retry_on_context_failure,
             max_context_retries=self.max_context_retries,
+            healing_store_url=self.healing_store_url,
         )
 
 
@@ -206,6 +210,7 @@ def load_concurrency_config(
     - AUTOQA_MAX_MEMORY_PERCENT: Memory threshold percentage
     - AUTOQA_CRITICAL_MEMORY_PERCENT: Critical memory threshold
     - AUTOQA_MIN_AVAILABLE_MEMORY_MB: Minimum available memory
+    - AUTOQA_HEALING_STORE: Shared selector-healing store URL
 
     Args:
         env_prefix: Prefix for environment variables
@@ -319,6 +324,7 @@ def load_concurrency_config(
             "RETRY_ON_CONTEXT_FAILURE", base.retry_on_context_failure
         ),
         max_context_retries=get_int("MAX_CONTEXT_RETRIES", base.max_context_retries),
+        healing_store_url=os.environ.get(f"{env_prefix}HEALING_STORE", base.healing_store_url),
     )
 
     logger.info(
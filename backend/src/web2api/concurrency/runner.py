@@ -24,6 +24,7 @@ from web2api.concurrency.browser_pool import BrowserPool
 from web2api.concurrency.config import ConcurrencyConfig, ScalingStrategy, load_concurrency_config
 from web2api.concurrency.resource_monitor import MemoryPressure, ResourceMonitor
 from web2api.dsl.models import TestSpec, TestSuite
+from web2api.runner.healing_store import create_healing_store
 from web2api.runner.self_healing import SelfHealingEngine
 from web2api.runner.test_runner import StepStatus, TestRunResult
 
@@ -158,7 +159,8 @@ class AsyncTestRunner:
         Args:
             browser: The owl-browser instance
             config: Concurrency configuration (loads from env if not provided)
-            healing_engine: Self-healing engine for selector recovery
+            healing_engine: Self-healing engine for selector recovery (one created
+                here from the config is closed by stop())
             artifact_dir: Directory for test artifacts
             record_video: Enable video recording
             screenshot_on_failure: Capture screenshots on failure
@@ -170,7 +172,15 @@ class AsyncTestRunner:
         """
         self._browser = browser
         self._config = config or load_concurrency_config()
-        self._healing_engine = healing_engine or SelfHealingEngine()
+        # A healing engine created here (and its store) is closed by stop()
+        self._owns_healing_engine = healing_engine is None
+        self._healing_engine = healing_engine or SelfHealingEngine(
+            store=(
+                create_healing_store(self._config.healing_store_url)
+                if self._config.healing_store_url
+                else None
+            )
+        )
         self._artifact_dir = artifact_dir
         self._record_video = record_video
         self._screenshot_on_failure = screenshot_on_failure
@@ -246,6 +256,10 @@ class AsyncTestRunner:
         if self._resource_monitor is not None:
             await self._resource_monitor.stop_monitoring()
 
+        # Release the shared healing store connection
+        if self._owns_healing_engine:
+            self._healing_engine.close()
+
         self._log.info("Async test runner stopped")
 
     async def run_tests(
@@ -21,6 +21,7 @@ from web2api.dsl.models import (
     VisualAssertionConfig,
     VisualComparisonMode,
 )
+from web2api.dsl.parse_cache import ParseCache, get_parse_cache
 from web2api.dsl.parser import DSLParser
 from web2api.dsl.transformer import StepTransformer
 from web2api.dsl.validator import DSLValidator
@@ -45,4 +46,7 @@ __all__ = [
     "DSLParser",
     "DSLValidator",
     "StepTransformer",
+    # Parse cache
+    "ParseCache",
+    "get_parse_cache",
 ]
@@ -0,0 +1,262 @@
+"""
+Cache of compiled test specifications.
+
+Parsing a spec means YAML loading, variable resolution, Pydantic validation
+and semantic validation, which adds up to seconds for suites with hundreds
+of files. Compiled specs are cached by a hash of the file content, the
+variables it was parsed with and the DSL schema, so unchanged files skip
+all of that work:
+- Files without secret references are cached as validated specs
+- Files with secret references are cached as variable-resolved data, so
+  secrets are still resolved on every parse and never written to disk
+- Entries live in memory and, optionally, as pickle files in a cache
+  directory shared across runs and processes
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from web2api.dsl.models import TestSpec, TestSuite
+
+logger = structlog.get_logger(__name__)
+
+# Bump when the layout of CompiledSpec changes
+CACHE_FORMAT = 1
+
+
+@functools.cache
+def _schema_fingerprint() -> str:
+    """Hash of everything that decides how a file compiles."""
+    import pydantic
+    import yaml
+
+    from web2api.dsl import models, parser, validator
+
+    digest = hashlib.sha256(f"{CACHE_FORMAT}:{pydantic.VERSION}:{yaml.__version__}".encode())
+    for module in (models, parser, validator):
+        if module.__file__:
+            digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class CompiledSpec:
+    """Result of compiling one file, up to the first step that needs secrets."""
+
+    spec: TestSpec | TestSuite | None = None
+    """Validated spec, if the file has no secret references."""
+
+    data: dict[str, Any] | None = None
+    """Variable-resolved data still holding secret references, otherwise."""
+
+
+class ParseCache:
+    """
+    Content-hash keyed cache of compiled specs.
+
+    Cached entries are pickles, so the cache directory must only be
+    writable by users trusted to run tests.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_memory_entries: int = 1024,
+    ) -> None:
+        """
+        Initialize parse cache.
+
+        Args:
+            cache_dir: Directory for cache files (None keeps the cache in memory)
+            max_memory_entries: Compiled specs kept in memory (LRU)
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._max_memory_entries = max(1, max_memory_entries)
+        # Pickled bytes, so every hit returns a fresh, unshared spec
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._log = logger.bind(component="parse_cache")
+
+        if self._cache_dir:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._stats = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "errors": 0,
+        }
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "size": len(self._entries),
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+        }
+
+    @staticmethod
+    def make_key(content: str, variables: dict[str, Any] | None = None) -> str:
+        """
+        Build the cache key of a file.
+
+        Args:
+            content: File content
+            variables: Variables passed in by the caller
+
+        Returns:
+            Hex digest of the content, variables and DSL schema
+        """
+        digest = hashlib.sha256(_schema_fingerprint().encode())
+        digest.update(json.dumps(variables or {}, sort_keys=True, default=str).encode())
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CompiledSpec | None:
+        """
+        Get a compiled spec.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            Compiled spec, or None on a miss
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+
+        if payload is None:
+            payload = self._read(key)
+            if payload is not None:
+                self._stats["disk_hits"] += 1
+                self._remember(key, payload)
+
+        if payload is None:
+            self._stats["misses"] += 1
+            return None
+
+        try:
+            entry = pickle.loads(payload)
+            if not isinstance(entry, CompiledSpec):
+                raise TypeError(f"unexpected {type(entry).__name__} entry")
+        except Exception as e:
+            # Pickles of classes that no longer exist, truncated files, ...
+            self._log.warning("Dropping unreadable cache entry", key=key, error=str(e))
+            self._stats["errors"] += 1
+            self._stats["misses"] += 1
+            self._discard(key)
+            return None
+
+        self._stats["hits"] += 1
+        return entry
+
+    def put(self, key: str, entry: CompiledSpec) -> None:
+        """
+        Cache a compiled spec.
+
+        Args:
+            key: Key from ``make_key``
+            entry: Compiled spec
+        """
+        payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, payload)
+        self._write(key, payload)
+        self._stats["stores"] += 1
+
+    def _remember(self, key: str, payload: bytes) -> None:
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_memory_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path | None:
+        return self._cache_dir / f"{key}.pkl" if self._cache_dir else None
+
+    def _read(self, key: str) -> bytes | None:
+        """Read a cache file, if one exists."""
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self._log.warning("Failed to read cache file", path=str(path), error=str(e))
+            return None
+
+    def _write(self, key: str, payload: bytes) -> None:
+        """Write a cache file (atomically)."""
+        path = self._path(key)
+        if path is None:
+            return
+
+        tmp_path: str | None = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".pkl.tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            Path(tmp_path).replace(path)
+        except OSError as e:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            self._log.warning("Failed to write cache file", path=str(path), error=str(e))
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        path = self._path(key)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all cached specs, including cache files."""
+        with self._lock:
+            self._entries.clear()
+        if self._cache_dir:
+            for path in self._cache_dir.glob("*.pkl"):
+                path.unlink(missing_ok=True)
+
+
+# =============================================================================
+# Global Cache Instance
+# =============================================================================
+
+_global_cache: ParseCache | None = None
+_global_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache:
+    """
+    Get the process-wide parse cache, creating it on first use.
+
+    Configured from the environment:
+    - AUTOQA_DSL_CACHE_DIR: Cache directory (default: in-memory only)
+    """
+    global _global_cache
+
+    with _global_lock:
+        if _global_cache is None:
+            _global_cache = ParseCache(cache_dir=os.environ.get("AUTOQA_DSL_CACHE_DIR") or None)
+
+    return _global_cache
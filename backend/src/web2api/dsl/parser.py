@@ -6,10 +6,15 @@ Handles parsing, variable interpolation, and secret resolution.
 
 from __future__ import annotations
 
+import multiprocessing
 import os
 import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 import yaml
@@ -21,10 +26,22 @@ from web2api.dsl.models import (
     TestSpec,
     TestSuite,
 )
+from web2api.dsl.parse_cache import CompiledSpec, ParseCache, get_parse_cache
 from web2api.dsl.validator import DSLValidator
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger = structlog.get_logger(__name__)
 
+# C-accelerated loader when PyYAML was built with libyaml
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Directory parses with at least this many uncached files use a process pool.
+# Compiling a file takes milliseconds while a spawned worker takes seconds to
+# import this package, so only very large cold suites gain from the pool.
+PARALLEL_PARSE_THRESHOLD = 500
+
 
 class SecretResolutionError(Exception):
     """Raised when a secret cannot be resolved."""
@@ -50,40 +67,240 @@ class DSLParseError(Exception):
         super().__init__(f"{message}{location}")
 
 
+# Unit a backend returns in one call: (source, path or namespace, name, version).
+# Kubernetes returns every key of a secret at once, so its version is None.
+type SecretFetchKey = tuple[SecretSource, str | None, str, str | None]
+
+# Fetched secret: a value, or all keys of a Kubernetes secret
+type SecretPayload = str | dict[str, str]
+
+
+def _fetch_key(ref: SecretReference) -> SecretFetchKey:
+    """The fetch that returns a reference's value."""
+    match ref.source:
+        case SecretSource.VAULT:
+            return (ref.source, ref.path or "secret/data", ref.key, ref.version)
+        case SecretSource.K8S_SECRET:
+            return (ref.source, ref.path or "default", ref.key, None)
+        case _:
+            return (ref.source, None, ref.key, ref.version)
+
+
+class SecretCache:
+    """
+    TTL-bounded cache of fetched secrets.
+
+    Entries expire after ``ttl_seconds`` so rotated secrets are picked up
+    by long-running processes. Only successful fetches are cached.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0) -> None:
+        """
+        Initialize secret cache.
+
+        Args:
+            ttl_seconds: Lifetime of a fetched secret
+        """
+        self._ttl = ttl_seconds
+        self._entries: dict[SecretFetchKey, tuple[float, SecretPayload]] = {}
+        self._lock = threading.Lock()
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+        }
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {**self._stats, "size": len(self._entries)}
+
+    def get(self, key: SecretFetchKey) -> SecretPayload | None:
+        """Get a fetched secret, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self._ttl:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                entry = None
+
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def put(self, key: SecretFetchKey, payload: SecretPayload) -> None:
+        """Cache a fetched secret."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), payload)
+
+    def clear(self) -> None:
+        """Drop all cached secrets."""
+        with self._lock:
+            self._entries.clear()
+
+
+class StubSecretBackend:
+    """
+    In-memory stand-in for the remote secret backends, for tests.
+
+    Serves Vault, AWS Secrets Manager and Kubernetes references from a
+    mapping and records every fetch, so tests can check batching and
+    caching without network access.
+    """
+
+    def __init__(self, secrets: dict[SecretReference, str], latency: float = 0.0) -> None:
+        """
+        Initialize stub backend.
+
+        Args:
+            secrets: Value of each reference
+            latency: Seconds each fetch sleeps, to simulate a remote call
+        """
+        self._secrets = dict(secrets)
+        self._latency = latency
+        self._lock = threading.Lock()
+        self.fetches: list[SecretFetchKey] = []
+
+    def fetch(self, key: SecretFetchKey) -> SecretPayload:
+        """Fetch a secret the way its real backend would return it."""
+        if self._latency:
+            time.sleep(self._latency)
+        with self._lock:
+            self.fetches.append(key)
+
+        source, _, name, _ = key
+        matches = {ref: value for ref, value in self._secrets.items() if _fetch_key(ref) == key}
+        if not matches:
+            raise SecretResolutionError(source, name, "Secret not found in stub backend")
+        if source == SecretSource.K8S_SECRET:
+            return {ref.version or "value": value for ref, value in matches.items()}
+        return next(iter(matches.values()))
+
+
 class SecretResolver:
-    """Resolves secret references from various backends."""
+    """
+    Resolves secret references from various backends.
+
+    References are resolved in batches: duplicates share one fetch, fetches
+    from remote backends run concurrently, and fetched secrets are kept in
+    a TTL cache. Resolvers using the default clients share one process-wide
+    cache; resolvers given their own clients or a stub keep a private one.
+    """
 
     def __init__(
         self,
         vault_client: Any | None = None,
         aws_client: Any | None = None,
         k8s_client: Any | None = None,
+        stub_backend: StubSecretBackend | None = None,
+        cache: SecretCache | None = None,
+        max_workers: int = 8,
     ) -> None:
         self._vault_client = vault_client
         self._aws_client = aws_client
         self._k8s_client = k8s_client
-        self._cache: dict[str, str] = {}
+        self._stub_backend = stub_backend
+        self._max_workers = max(1, max_workers)
+        self._client_lock = threading.Lock()
+
+        if cache is None:
+            injected = (vault_client, aws_client, k8s_client, stub_backend)
+            cache = SecretCache() if any(injected) else get_secret_cache()
+        self._cache = cache
 
     def resolve(self, ref: SecretReference) -> str:
         """Resolve a secret reference to its actual value."""
-        cache_key = f"{ref.source}:{ref.key}:{ref.path}:{ref.version}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        return self.resolve_many([ref])[ref]
+
+    def resolve_many(self, refs: Iterable[SecretReference]) -> dict[SecretReference, str]:
+        """
+        Resolve secret references together.
+
+        Args:
+            refs: References to resolve (duplicates allowed)
+
+        Returns:
+            Value of each reference
 
-        match ref.source:
-            case SecretSource.ENV:
-                value = self._resolve_env(ref)
+        Raises:
+            SecretResolutionError: If any reference cannot be resolved
+        """
+        refs = list(dict.fromkeys(refs))
+        payloads: dict[SecretFetchKey, SecretPayload] = {}
+        missing: list[SecretFetchKey] = []
+
+        for key in dict.fromkeys(_fetch_key(ref) for ref in refs):
+            if key[0] == SecretSource.ENV:
+                continue
+            cached = self._cache.get(key)
+            if cached is None:
+                missing.append(key)
+            else:
+                payloads[key] = cached
+
+        if len(missing) == 1:
+            payloads[missing[0]] = self._fetch(missing[0])
+            self._cache.put(missing[0], payloads[missing[0]])
+        elif missing:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_workers, len(missing)),
+                thread_name_prefix="secret-resolver",
+            ) as pool:
+                futures = {key: pool.submit(self._fetch, key) for key in missing}
+
+            # Cache every successful fetch, then report the first failure in order
+            errors: list[BaseException] = []
+            for key, future in futures.items():
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+                    continue
+                payloads[key] = future.result()
+                self._cache.put(key, payloads[key])
+            if errors:
+                raise errors[0]
+
+        return {ref: self._extract(ref, payloads) for ref in refs}
+
+    def _extract(
+        self,
+        ref: SecretReference,
+        payloads: dict[SecretFetchKey, SecretPayload],
+    ) -> str:
+        """Get a reference's value from the fetched secrets."""
+        if ref.source == SecretSource.ENV:
+            return self._resolve_env(ref)
+
+        payload = payloads[_fetch_key(ref)]
+        if isinstance(payload, str):
+            return payload
+
+        key_name = ref.version or "value"
+        if key_name not in payload:
+            raise SecretResolutionError(
+                ref.source, ref.key, f"Key '{key_name}' not found in secret"
+            )
+        return payload[key_name]
+
+    def _fetch(self, key: SecretFetchKey) -> SecretPayload:
+        """Fetch one secret from its backend."""
+        if self._stub_backend is not None:
+            return self._stub_backend.fetch(key)
+
+        source, path, name, version = key
+        match source:
             case SecretSource.VAULT:
-                value = self._resolve_vault(ref)
+                return self._fetch_vault(path or "secret/data", name, version)
             case SecretSource.AWS_SECRETS:
-                value = self._resolve_aws_secrets(ref)
+                return self._fetch_aws_secret(name, version)
             case SecretSource.K8S_SECRET:
-                value = self._resolve_k8s_secret(ref)
+                return self._fetch_k8s_secret(path or "default", name)
             case _:
-                raise SecretResolutionError(ref.source, ref.key, f"Unknown source: {ref.source}")
-
-        self._cache[cache_key] = value
-        return value
+                raise SecretResolutionError(source, name, f"Unknown source: {source}")
 
     def _resolve_env(self, ref: SecretReference) -> str:
         """Resolve environment variable."""
@@ -94,105 +311,146 @@ class SecretResolver:
             )
         return value
 
-    def _resolve_vault(self, ref: SecretReference) -> str:
-        """Resolve HashiCorp Vault secret."""
-        if self._vault_client is None:
-            vault_addr = os.environ.get("VAULT_ADDR")
-            vault_token = os.environ.get("VAULT_TOKEN")
-            if not vault_addr or not vault_token:
-                raise SecretResolutionError(
-                    ref.source,
-                    ref.key,
-                    "Vault client not configured and VAULT_ADDR/VAULT_TOKEN not set",
-                )
-            try:
-                import hvac
+    def _get_vault_client(self, key: str) -> Any:
+        """Get the Vault client, creating it from the environment on first use."""
+        with self._client_lock:
+            if self._vault_client is None:
+                vault_addr = os.environ.get("VAULT_ADDR")
+                vault_token = os.environ.get("VAULT_TOKEN")
+                if not vault_addr or not vault_token:
+                    raise SecretResolutionError(
+                        SecretSource.VAULT,
+                        key,
+                        "Vault client not configured and VAULT_ADDR/VAULT_TOKEN not set",
+                    )
+                try:
+                    import hvac
 
-                self._vault_client = hvac.Client(url=vault_addr, token=vault_token)
-            except ImportError as e:
-                raise SecretResolutionError(
-                    ref.source, ref.key, "hvac package not installed for Vault support"
-                ) from e
+                    self._vault_client = hvac.Client(url=vault_addr, token=vault_token)
+                except ImportError as e:
+                    raise SecretResolutionError(
+                        SecretSource.VAULT, key, "hvac package not installed for Vault support"
+                    ) from e
+            return self._vault_client
 
-        path = ref.path or "secret/data"
+    def _fetch_vault(self, path: str, key: str, version: str | None) -> str:
+        """Fetch a HashiCorp Vault secret."""
+        client = self._get_vault_client(key)
         try:
-            response = self._vault_client.secrets.kv.v2.read_secret_version(
-                path=f"{path}/{ref.key}",
-                version=int(ref.version) if ref.version else None,
+            response = client.secrets.kv.v2.read_secret_version(
+                path=f"{path}/{key}",
+                version=int(version) if version else None,
             )
             data = response.get("data", {}).get("data", {})
             if not data:
-                raise SecretResolutionError(ref.source, ref.key, "Secret not found in Vault")
+                raise SecretResolutionError(SecretSource.VAULT, key, "Secret not found in Vault")
             return data.get("value", str(data))
         except Exception as e:
-            raise SecretResolutionError(ref.source, ref.key, str(e)) from e
+            if isinstance(e, SecretResolutionError):
+                raise
+            raise SecretResolutionError(SecretSource.VAULT, key, str(e)) from e
 
-    def _resolve_aws_secrets(self, ref: SecretReference) -> str:
-        """Resolve AWS Secrets Manager secret."""
-        if self._aws_client is None:
-            try:
-                import boto3
+    def _get_aws_client(self, key: str) -> Any:
+        """Get the AWS Secrets Manager client, creating it on first use."""
+        with self._client_lock:
+            if self._aws_client is None:
+                try:
+                    import boto3
 
-                self._aws_client = boto3.client("secretsmanager")
-            except ImportError as e:
-                raise SecretResolutionError(
-                    ref.source, ref.key, "boto3 package not installed for AWS Secrets support"
-                ) from e
+                    self._aws_client = boto3.client("secretsmanager")
+                except ImportError as e:
+                    raise SecretResolutionError(
+                        SecretSource.AWS_SECRETS,
+                        key,
+                        "boto3 package not installed for AWS Secrets support",
+                    ) from e
+            return self._aws_client
 
+    def _fetch_aws_secret(self, key: str, version: str | None) -> str:
+        """Fetch an AWS Secrets Manager secret."""
+        client = self._get_aws_client(key)
         try:
-            kwargs: dict[str, Any] = {"SecretId": ref.key}
-            if ref.version:
-                kwargs["VersionId"] = ref.version
-            response = self._aws_client.get_secret_value(**kwargs)
+            kwargs: dict[str, Any] = {"SecretId": key}
+            if version:
+                kwargs["VersionId"] = version
+            response = client.get_secret_value(**kwargs)
             return response.get("SecretString", "")
         except Exception as e:
-            raise SecretResolutionError(ref.source, ref.key, str(e)) from e
+            raise SecretResolutionError(SecretSource.AWS_SECRETS, key, str(e)) from e
 
-    def _resolve_k8s_secret(self, ref: SecretReference) -> str:
-        """Resolve Kubernetes secret."""
-        if self._k8s_client is None:
-            try:
-                from kubernetes import client, config
-
-                config.load_incluster_config()
-                self._k8s_client = client.CoreV1Api()
-            except ImportError as e:
-                raise SecretResolutionError(
-                    ref.source, ref.key, "kubernetes package not installed"
-                ) from e
-            except Exception:
+    def _get_k8s_client(self, key: str) -> Any:
+        """Get the Kubernetes client, configuring it on first use."""
+        with self._client_lock:
+            if self._k8s_client is None:
                 try:
-                    from kubernetes import config
-
-                    config.load_kube_config()
+                    from kubernetes import client, config
+
+                    try:
+                        config.load_incluster_config()
+                    except Exception:
+                        config.load_kube_config()
+                    self._k8s_client = client.CoreV1Api()
+                except ImportError as e:
+                    raise SecretResolutionError(
+                        SecretSource.K8S_SECRET, key, "kubernetes package not installed"
+                    ) from e
                 except Exception as e:
                     raise SecretResolutionError(
-                        ref.source, ref.key, f"Failed to configure Kubernetes client: {e}"
+                        SecretSource.K8S_SECRET,
+                        key,
+                        f"Failed to configure Kubernetes client: {e}",
                     ) from e
+            return self._k8s_client
 
-        namespace = ref.path or "default"
+    def _fetch_k8s_secret(self, namespace: str, key: str) -> dict[str, str]:
+        """Fetch all keys of a Kubernetes secret."""
+        client = self._get_k8s_client(key)
         try:
             import base64
 
-            secret = self._k8s_client.read_namespaced_secret(name=ref.key, namespace=namespace)
+            secret = client.read_namespaced_secret(name=key, namespace=namespace)
             if secret.data is None:
-                raise SecretResolutionError(ref.source, ref.key, "Secret has no data")
-            key_name = ref.version or "value"
-            if key_name not in secret.data:
-                raise SecretResolutionError(
-                    ref.source, ref.key, f"Key '{key_name}' not found in secret"
-                )
-            return base64.b64decode(secret.data[key_name]).decode("utf-8")
+                raise SecretResolutionError(SecretSource.K8S_SECRET, key, "Secret has no data")
+            return {
+                name: base64.b64decode(value).decode("utf-8")
+                for name, value in secret.data.items()
+            }
         except Exception as e:
             if isinstance(e, SecretResolutionError):
                 raise
-            raise SecretResolutionError(ref.source, ref.key, str(e)) from e
+            raise SecretResolutionError(SecretSource.K8S_SECRET, key, str(e)) from e
 
     def clear_cache(self) -> None:
-        """Clear the secret cache."""
+        """Clear the secret cache (shared with other default resolvers)."""
         self._cache.clear()
 
 
+# =============================================================================
+# Global Secret Cache Instance
+# =============================================================================
+
+_global_secret_cache: SecretCache | None = None
+_global_lock = threading.Lock()
+
+
+def get_secret_cache() -> SecretCache:
+    """
+    Get the process-wide secret cache, creating it on first use.
+
+    Configured from the environment:
+    - AUTOQA_SECRET_CACHE_TTL: Seconds a fetched secret is reused (default 300)
+    """
+    global _global_secret_cache
+
+    with _global_lock:
+        if _global_secret_cache is None:
+            _global_secret_cache = SecretCache(
+                ttl_seconds=float(os.environ.get("AUTOQA_SECRET_CACHE_TTL", "300")),
+            )
+
+    return _global_secret_cache
+
+
 class DSLParser:
     """Parser for YAML test DSL files."""
 
@@ -203,11 +461,18 @@ class DSLParser:
         self,
         secret_resolver: SecretResolver | None = None,
         validator: DSLValidator | None = None,
+        cache: ParseCache | None = None,
+        use_cache: bool = True,
     ) -> None:
         self._secret_resolver = secret_resolver or SecretResolver()
         self._validator = validator or DSLValidator()
         self._log = logger.bind(component="dsl_parser")
 
+        # Cache keys do not cover custom validators, so they always compile
+        self._cache: ParseCache | None = None
+        if use_cache and type(self._validator) is DSLValidator:
+            self._cache = cache or get_parse_cache()
+
     def parse_file(self, path: str | Path) -> TestSpec | TestSuite:
         """Parse a YAML test file."""
         file_path = Path(path)
@@ -227,8 +492,24 @@ class DSLParser:
         variables: dict[str, str] | None = None,
     ) -> TestSpec | TestSuite:
         """Parse YAML content string."""
+        key: str | None = None
+        entry: CompiledSpec | None = None
+        if self._cache is not None:
+            key = self._cache.make_key(content, variables)
+            entry = self._cache.get(key)
+
+        cached = entry is not None
+        if entry is None:
+            entry = self._compile(content, variables)
+            if key is not None and self._cache is not None:
+                self._cache.put(key, entry)
+
+        return self._finish(entry, source_file=source_file, cached=cached)
+
+    def _compile(self, content: str, variables: dict[str, str] | None = None) -> CompiledSpec:
+        """Compile YAML content as far as possible without resolving secrets."""
         try:
-            raw_data = yaml.safe_load(content)
+            raw_data = yaml.load(content, Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             line = getattr(e, "problem_mark", None)
             if line:
@@ -243,15 +524,48 @@ class DSLParser:
             combined_vars.update(raw_data["variables"])
 
         resolved_data = self._resolve_variables(raw_data, combined_vars)
-        resolved_data = self._resolve_secrets(resolved_data)
+        if self._has_secrets(resolved_data):
+            return CompiledSpec(data=resolved_data)
+        return CompiledSpec(spec=self._validate(resolved_data))
+
+    def _finish(
+        self,
+        entry: CompiledSpec,
+        source_file: str | None = None,
+        cached: bool = False,
+    ) -> TestSpec | TestSuite:
+        """Resolve the secrets of a compiled spec and validate it, if still needed."""
+        if entry.spec is not None:
+            result = entry.spec
+        else:
+            assert entry.data is not None
+            result = self._validate(self._resolve_secrets(entry.data))
+
+        if isinstance(result, TestSuite):
+            self._log.info(
+                "Parsed test suite",
+                name=result.name,
+                test_count=len(result.tests),
+                source_file=source_file,
+                cached=cached,
+            )
+        else:
+            self._log.info(
+                "Parsed test spec",
+                name=result.name,
+                step_count=len(result.steps),
+                source_file=source_file,
+                cached=cached,
+            )
+        return result
 
+    def _validate(self, resolved_data: dict[str, Any]) -> TestSpec | TestSuite:
+        """Validate fully resolved data against the models and semantic rules."""
         try:
             if "tests" in resolved_data:
-                result = TestSuite.model_validate(resolved_data)
-                self._log.info("Parsed test suite", name=result.name, test_count=len(result.tests))
+                result: TestSpec | TestSuite = TestSuite.model_validate(resolved_data)
             else:
                 result = TestSpec.model_validate(resolved_data)
-                self._log.info("Parsed test spec", name=result.name, step_count=len(result.steps))
         except ValidationError as e:
             error_messages = []
             for error in e.errors():
@@ -269,6 +583,16 @@ class DSLParser:
 
         return result
 
+    def _has_secrets(self, data: Any) -> bool:
+        """Whether data holds any secret reference."""
+        if isinstance(data, str):
+            return self.SECRET_PATTERN.search(data) is not None
+        elif isinstance(data, dict):
+            return any(self._has_secrets(v) for v in data.values())
+        elif isinstance(data, list):
+            return any(self._has_secrets(item) for item in data)
+        return False
+
     def _resolve_variables(
         self, data: Any, variables: dict[str, str], depth: int = 0
     ) -> Any:
@@ -298,66 +622,174 @@ class DSLParser:
 
         return self.VARIABLE_PATTERN.sub(replace_var, value)
 
-    def _resolve_secrets(self, data: Any, depth: int = 0) -> Any:
-        """Recursively resolve secret references in data."""
+    def _resolve_secrets(self, data: Any) -> Any:
+        """Resolve all secret references in data, fetching them as one batch."""
+        refs: list[SecretReference] = []
+        self._collect_secrets(data, refs)
+        values = self._secret_resolver.resolve_many(refs) if refs else {}
+        return self._substitute_secrets(data, values)
+
+    def _collect_secrets(self, data: Any, refs: list[SecretReference], depth: int = 0) -> None:
+        """Recursively collect secret references in data."""
         if depth > 50:
             raise DSLParseError("Maximum secret resolution depth exceeded")
 
         if isinstance(data, str):
-            return self._resolve_secret_string(data)
+            refs.extend(self._secret_ref(m) for m in self.SECRET_PATTERN.finditer(data))
         elif isinstance(data, dict):
-            return {k: self._resolve_secrets(v, depth + 1) for k, v in data.items()}
+            for v in data.values():
+                self._collect_secrets(v, refs, depth + 1)
         elif isinstance(data, list):
-            return [self._resolve_secrets(item, depth + 1) for item in data]
-        return data
-
-    def _resolve_secret_string(self, value: str) -> str:
-        """Resolve secret references in a string."""
+            for item in data:
+                self._collect_secrets(item, refs, depth + 1)
 
-        def replace_secret(match: re.Match[str]) -> str:
-            source_str = match.group(1)
-            key = match.group(2)
+    def _substitute_secrets(self, data: Any, values: dict[SecretReference, str]) -> Any:
+        """Recursively replace secret references in data with resolved values."""
+        if isinstance(data, str):
+            return self.SECRET_PATTERN.sub(lambda m: values[self._secret_ref(m)], data)
+        elif isinstance(data, dict):
+            return {k: self._substitute_secrets(v, values) for k, v in data.items()}
+        elif isinstance(data, list):
+            return [self._substitute_secrets(item, values) for item in data]
+        return data
 
-            parts = key.split(":", 2)
-            main_key = parts[0]
-            path = parts[1] if len(parts) > 1 else None
-            version = parts[2] if len(parts) > 2 else None
+    def _secret_ref(self, match: re.Match[str]) -> SecretReference:
+        """Build the secret reference of a ``${source:key[:path[:version]]}`` match."""
+        source_str = match.group(1)
+        key = match.group(2)
 
-            try:
-                source = SecretSource(source_str)
-            except ValueError as e:
-                raise DSLParseError(f"Unknown secret source: {source_str}") from e
+        parts = key.split(":", 2)
+        main_key = parts[0]
+        path = parts[1] if len(parts) > 1 else None
+        version = parts[2] if len(parts) > 2 else None
 
-            ref = SecretReference(source=source, key=main_key, path=path, version=version)
-            return self._secret_resolver.resolve(ref)
+        try:
+            source = SecretSource(source_str)
+        except ValueError as e:
+            raise DSLParseError(f"Unknown secret source: {source_str}") from e
 
-        return self.SECRET_PATTERN.sub(replace_secret, value)
+        return SecretReference(source=source, key=main_key, path=path, version=version)
 
     def parse_directory(
         self,
         directory: str | Path,
         pattern: str = "**/*.yaml",
         recursive: bool = True,
+        workers: int | None = None,
     ) -> list[TestSpec | TestSuite]:
-        """Parse all YAML files in a directory."""
+        """
+        Parse all YAML files in a directory.
+
+        Files found in the parse cache skip compilation. When at least
+        ``PARALLEL_PARSE_THRESHOLD`` files are not cached, they are compiled
+        in a process pool; secrets are always resolved in this process.
+
+        Args:
+            directory: Directory to search
+            pattern: Glob pattern of test files
+            recursive: Search subdirectories
+            workers: Worker processes for uncached files (None: one per CPU,
+                1: compile in this process)
+
+        Returns:
+            Parsed specs and suites, in file name order
+        """
         dir_path = Path(directory)
         if not dir_path.exists():
             raise DSLParseError(f"Directory not found: {dir_path}")
         if not dir_path.is_dir():
             raise DSLParseError(f"Path is not a directory: {dir_path}")
 
-        results: list[TestSpec | TestSuite] = []
         glob_method = dir_path.rglob if recursive else dir_path.glob
+        files = [p for p in sorted(glob_method(pattern)) if not p.name.startswith(".")]
+
+        contents: list[str] = []
+        for file_path in files:
+            if not file_path.is_file():
+                raise DSLParseError(f"Path is not a file: {file_path}")
+            contents.append(file_path.read_text(encoding="utf-8"))
+        keys: list[str | None] = [None] * len(files)
+        entries: list[CompiledSpec | None] = [None] * len(files)
+        if self._cache is not None:
+            for i, content in enumerate(contents):
+                keys[i] = cache_key = self._cache.make_key(content)
+                entries[i] = self._cache.get(cache_key)
+
+        uncached = {i: contents[i] for i, entry in enumerate(entries) if entry is None}
+        compiled: dict[int, CompiledSpec | BaseException] = {}
+        if len(uncached) >= PARALLEL_PARSE_THRESHOLD and workers != 1:
+            compiled = self._compile_in_pool(uncached, workers)
 
-        for file_path in sorted(glob_method(pattern)):
-            if file_path.name.startswith("."):
-                continue
+        results: list[TestSpec | TestSuite] = []
+        for i, file_path in enumerate(files):
+            self._log.info("Parsing test file", path=str(file_path))
             try:
-                result = self.parse_file(file_path)
-                results.append(result)
+                entry = entries[i]
+                if entry is None:
+                    outcome = compiled.get(i)
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+                    entry = outcome or self._compile(contents[i])
+                    key = keys[i]
+                    if key is not None and self._cache is not None:
+                        self._cache.put(key, entry)
+                results.append(
+                    self._finish(
+                        entry,
+                        source_file=str(file_path),
+                        cached=entries[i] is not None,
+                    )
+                )
             except DSLParseError as e:
                 self._log.error("Failed to parse file", path=str(file_path), error=str(e))
                 raise
 
-        self._log.info("Parsed directory", path=str(dir_path), file_count=len(results))
+        self._log.info(
+            "Parsed directory",
+            path=str(dir_path),
+            file_count=len(results),
+            cached=len(files) - len(uncached),
+        )
         return results
+
+    def _compile_in_pool(
+        self,
+        contents: dict[int, str],
+        workers: int | None,
+    ) -> dict[int, CompiledSpec | BaseException]:
+        """
+        Compile file contents in worker processes.
+
+        Returns:
+            Compiled spec or raised exception by index; empty if the pool
+            could not be used, so callers compile in this process instead
+        """
+        max_workers = min(workers or os.cpu_count() or 1, len(contents))
+        results: dict[int, CompiledSpec | BaseException] = {}
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                futures = {
+                    i: pool.submit(_compile_in_worker, content) for i, content in contents.items()
+                }
+                for i, future in futures.items():
+                    try:
+                        results[i] = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        results[i] = e
+        except (BrokenProcessPool, OSError) as e:
+            self._log.warning("Parallel parse unavailable", error=str(e))
+            return {}
+
+        self._log.debug("Compiled files in parallel", files=len(contents), workers=max_workers)
+        return results
+
+
+def _compile_in_worker(content: str) -> CompiledSpec:
+    """Compile one file's content in a worker process."""
+    return DSLParser(use_cache=False)._compile(content)
@@ -5,6 +5,7 @@ This module contains the core execution components:
 - ChatExecutor: Web chat interface interaction
 - OperationRunner: Operation execution engine
 - ExecutionQueue: FIFO queue manager for operations
+- ServiceContextPool: Warm per-service browser contexts for concurrent execution
 """
 
 from web2api.execution.chat_executor import (
@@ -13,7 +14,10 @@ from web2api.execution.chat_executor import (
     ChatUISelectors,
     ChatExecutionResult,
     ChatUIDetector,
+    ExtractionMetrics,
+    get_extraction_metrics,
 )
+from web2api.execution.context_pool import ServiceContext, ServiceContextPool
 from web2api.execution.operation_runner import OperationRunner
 from web2api.execution.queue_manager import ExecutionQueue
 
@@ -23,6 +27,10 @@ __all__ = [
     "ChatUISelectors",
     "ChatExecutionResult",
     "ChatUIDetector",
+    "ExtractionMetrics",
+    "get_extraction_metrics",
     "OperationRunner",
     "ExecutionQueue",
+    "ServiceContext",
+    "ServiceContextPool",
 ]
@@ -7,12 +7,15 @@ Handles the complete flow:
 3. Type message into input field
 4. Click send button
 5. Track send button state to detect response completion
-6. Extract and return response text
+   (optionally streaming new output text while it is generated)
+6. Extract and return response text (structurally, AI only as fallback)
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
 import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
@@ -20,11 +23,120 @@ from typing import TYPE_CHECKING, Any
 import structlog
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from owl_browser import Browser
 
 logger = structlog.get_logger(__name__)
 
 
+# Structural response extraction. Returns the last matching message's text
+# and a markdown rendering of its HTML in a single evaluate call.
+_EXTRACT_RESPONSE_SCRIPT = """
+(() => {
+  const outSel = %(output)s, containerSel = %(container)s;
+  const all = (sel) => { try { return sel ? Array.from(document.querySelectorAll(sel)) : []; } catch (e) { return []; } };
+  const candidates = all(containerSel).length ? all(containerSel) : all(outSel);
+  const el = candidates[candidates.length - 1];
+  if (!el) return null;
+  const SKIP = new Set(['SCRIPT', 'STYLE', 'BUTTON', 'SVG', 'NOSCRIPT', 'TEXTAREA']);
+  const md = (node, ctx) => {
+    if (node.nodeType === 3) return ctx.pre ? node.nodeValue : node.nodeValue.replace(/\\s+/g, ' ');
+    if (node.nodeType !== 1 || SKIP.has(node.tagName)) return '';
+    const tag = node.tagName;
+    if (tag === 'PRE') {
+      const code = node.querySelector('code');
+      const lang = code ? ((code.className.match(/language-([\\w+-]+)/) || [])[1] || '') : '';
+      return '\\n```' + lang + '\\n' + node.innerText.replace(/\\n$/, '') + '\\n```\\n';
+    }
+    const inner = () => Array.from(node.childNodes).map((c) => md(c, ctx)).join('');
+    switch (tag) {
+      case 'BR': return '\\n';
+      case 'P': case 'DIV': case 'SECTION': case 'ARTICLE': return '\\n' + inner().trim() + '\\n';
+      case 'H1': case 'H2': case 'H3': case 'H4': case 'H5': case 'H6':
+        return '\\n' + '#'.repeat(Number(tag[1])) + ' ' + inner().trim() + '\\n';
+      case 'STRONG': case 'B': return '**' + inner() + '**';
+      case 'EM': case 'I': return '*' + inner() + '*';
+      case 'CODE': return '`' + node.textContent + '`';
+      case 'A': return '[' + inner() + '](' + (node.getAttribute('href') || '') + ')';
+      case 'BLOCKQUOTE': return '\\n' + inner().trim().split('\\n').map((l) => '> ' + l).join('\\n') + '\\n';
+      case 'UL': case 'OL': {
+        const items = Array.from(node.children).filter((c) => c.tagName === 'LI');
+        return '\\n' + items.map((li, i) => (tag === 'OL' ? (i + 1) + '. ' : '- ') + md(li, ctx).trim()).join('\\n') + '\\n';
+      }
+      case 'LI': return Array.from(node.childNodes).map((c) => md(c, ctx)).join('');
+      default: return inner();
+    }
+  };
+  const markdown = md(el, { pre: false }).replace(/\\n{3,}/g, '\\n\\n').trim();
+  return { text: (el.innerText || '').trim(), markdown: markdown, count: candidates.length };
+})()
+"""
+
+
+# In-page completion detector. Watches the send/stop buttons and the output
+# area with a MutationObserver and resolves waiters once the UI is idle again
+# and the output text has been stable for the quiet period.
+_COMPLETION_OBSERVER_SCRIPT = """
+(() => {
+  const sendSel = %(send)s, stopSel = %(stop)s, outSel = %(output)s;
+  const quietMs = %(quiet_ms)d;
+  const q = (sel) => { try { return sel ? document.querySelector(sel) : null; } catch (e) { return null; } };
+  const text = () => { const el = q(outSel); return el ? (el.innerText || '') : ''; };
+  const busy = () => {
+    const stop = q(stopSel);
+    if (stop && stop.offsetParent !== null) return true;
+    const send = q(sendSel);
+    return !!send && (send.disabled || send.getAttribute('aria-disabled') === 'true');
+  };
+  const prev = window.__web2apiCompletion;
+  if (prev && prev.stop) prev.stop();
+  const initialText = text();
+  const state = {
+    done: false, sawBusy: false, changed: false, lastText: initialText,
+    lastChange: Date.now(), startedAt: Date.now(), waiters: [],
+  };
+  state.snapshot = () => ({
+    done: state.done, saw_busy: state.sawBusy, text_length: state.lastText.length,
+    quiet_ms: Date.now() - state.lastChange,
+  });
+  const finish = () => {
+    if (state.done) return;
+    state.done = true;
+    state.stop();
+    state.waiters.splice(0).forEach((resolve) => resolve(state.snapshot()));
+  };
+  const check = () => {
+    if (state.done) return;
+    const current = text();
+    if (current !== state.lastText) {
+      state.lastText = current;
+      state.changed = current !== initialText;
+      state.lastChange = Date.now();
+    }
+    if (busy()) { state.sawBusy = true; state.lastChange = Date.now(); return; }
+    if ((state.sawBusy || state.changed) && Date.now() - state.lastChange >= quietMs) finish();
+  };
+  const observer = new MutationObserver(check);
+  observer.observe(document.body, {
+    subtree: true, childList: true, characterData: true, attributes: true,
+    attributeFilter: ['disabled', 'aria-disabled', 'class', 'style', 'hidden'],
+  });
+  // Quiet-period expiry produces no mutation, so re-check on a coarse timer
+  const timer = setInterval(check, Math.max(50, Math.floor(quietMs / 4)));
+  state.stop = () => { observer.disconnect(); clearInterval(timer); };
+  state.wait = (ms) => state.done
+    ? Promise.resolve(state.snapshot())
+    : new Promise((resolve) => {
+        state.waiters.push(resolve);
+        setTimeout(() => resolve(state.snapshot()), ms);
+      });
+  window.__web2apiCompletion = state;
+  return true;
+})()
+"""
+
+
 @dataclass
 class ChatUISelectors:
     """Selectors for chat interface elements."""
@@ -46,7 +158,7 @@ class ChatUISelectors:
     """Selector for 'Stop' button (appears during generation)."""
     
     message_container: str | None = None
-    """Selector for individual message containers."""
+    """Selector for individual messages; its last match is read before the output area."""
 
 
 @dataclass
@@ -77,6 +189,21 @@ class ChatConfig:
     initial_button_check_delay_ms: int = 1000
     """Initial delay before starting button state checks."""
 
+    stream_interval_ms: int = 150
+    """Interval between output text reads when streaming deltas (ms)."""
+
+    completion_detection: str = "observer"
+    """Completion detection mode: "observer" (in-page MutationObserver) or "polling"."""
+
+    quiet_period_ms: int = 800
+    """Output must be unchanged this long after generation ends (observer mode, ms)."""
+
+    observer_long_poll_ms: int = 15000
+    """Maximum duration of one observer long-poll call (ms)."""
+
+    ai_extraction_fallback: bool = True
+    """Use AI extraction when all structural extraction strategies fail."""
+
 
 @dataclass 
 class ChatExecutionResult:
@@ -123,6 +250,7 @@ class ChatExecutor:
         config: ChatConfig,
         message: str,
         websocket_handler: Any = None,
+        on_delta: Callable[[str], Awaitable[None]] | None = None,
     ) -> ChatExecutionResult:
         """
         Execute a chat message and return the response.
@@ -133,6 +261,8 @@ class ChatExecutor:
             config: Chat configuration with selectors
             message: Message to send
             websocket_handler: Optional WebSocket for progress updates
+            on_delta: Optional callback receiving new response text as it
+                appears in the output area (enables streaming mode)
             
         Returns:
             ChatExecutionResult with response or error
@@ -174,6 +304,13 @@ class ChatExecutor:
                 enabled=initial_button_state.get("enabled"),
             )
             
+            # Output text before sending, so streaming ignores the previous answer
+            baseline_output = ""
+            if on_delta is not None:
+                baseline_output = await self._read_output_text(
+                    browser, context_id, config.selectors.output_selector
+                )
+
             # Step 4: Clear any existing text and type the message
             await self._type_message(
                 browser, context_id, config, message
@@ -197,10 +334,27 @@ class ChatExecutor:
                     None, "info", "Message sent, waiting for response..."
                 )
             
-            # Step 7: Wait for response to complete (button re-enabled)
-            await self._wait_for_response_complete(
-                browser, context_id, config, initial_button_state, websocket_handler
-            )
+            # Step 7: Wait for response to complete (button re-enabled),
+            # pushing new output text to on_delta while generating
+            stream_stop = asyncio.Event()
+            streamer: asyncio.Task[str] | None = None
+            if on_delta is not None:
+                streamer = asyncio.create_task(
+                    self._stream_output(
+                        browser, context_id, config, baseline_output, message,
+                        on_delta, stream_stop,
+                    )
+                )
+
+            streamed = ""
+            try:
+                detection = await self._wait_for_response_complete(
+                    browser, context_id, config, initial_button_state, websocket_handler
+                )
+            finally:
+                if streamer is not None:
+                    stream_stop.set()
+                    streamed = await streamer
             
             if websocket_handler:
                 await websocket_handler.send_execution_log(
@@ -208,9 +362,29 @@ class ChatExecutor:
                 )
             
             # Step 8: Extract the response
-            response = await self._extract_response(
-                browser, context_id, config.selectors.output_selector
+            if detection == "polling":
+                # Small delay to ensure DOM is fully updated (the observer
+                # already waited for a quiet period)
+                await asyncio.sleep(0.5)
+
+            response, extraction_method = await self._extract_response(
+                browser, context_id, config, message, prefer_text=on_delta is not None
             )
+
+            # Flush whatever the final extraction adds beyond the streamed text
+            if on_delta is not None:
+                response = self._new_output_text(response, baseline_output, message) or response
+                if response.startswith(streamed):
+                    if len(response) > len(streamed):
+                        await on_delta(response[len(streamed):])
+                else:
+                    # Deltas cannot be retracted: resend the final text in full
+                    self._log.warning(
+                        "Final response diverged from streamed text",
+                        streamed_length=len(streamed),
+                        response_length=len(response),
+                    )
+                    await on_delta("\n\n" + response)
             
             duration_ms = int((time.time() - start_time) * 1000)
             
@@ -227,6 +401,8 @@ class ChatExecutor:
                 metadata={
                     "message_length": len(message),
                     "response_length": len(response),
+                    "detection_method": detection,
+                    "extraction_method": extraction_method,
                 },
             )
             
@@ -405,9 +581,146 @@ class ChatExecutor:
         config: ChatConfig,
         initial_button_state: dict[str, Any],
         websocket_handler: Any = None,
-    ) -> None:
+    ) -> str:
         """
         Wait for the response to complete.
+
+        Uses the in-page observer when ``config.completion_detection`` is
+        "observer", falling back to button state polling if the page does
+        not support it.
+
+        Returns:
+            The detection method used ("observer" or "polling")
+        """
+        if config.completion_detection == "observer":
+            if await self._wait_with_observer(browser, context_id, config, websocket_handler):
+                return "observer"
+            self._log.debug("Observer detection unavailable, falling back to polling")
+
+        await self._poll_for_response_complete(
+            browser, context_id, config, initial_button_state, websocket_handler
+        )
+        return "polling"
+
+    async def _wait_with_observer(
+        self,
+        browser: Browser,
+        context_id: str,
+        config: ChatConfig,
+        websocket_handler: Any = None,
+    ) -> bool:
+        """
+        Wait for completion using one in-page observer and long-poll calls.
+
+        The observer script resolves when the send button is usable again
+        (and no stop button is shown) and the output text has been stable
+        for ``quiet_period_ms``. If the browser does not await promises
+        returned by evaluate, the observer state is read once per poll
+        interval instead; that is still one call per tick instead of two.
+
+        Returns:
+            True if completion was detected (or the UI never went busy before
+            the timeout), False if the observer could not be used
+
+        Raises:
+            TimeoutError: If generation was still in progress at the timeout
+        """
+        selectors = config.selectors
+        script = _COMPLETION_OBSERVER_SCRIPT % {
+            "send": json.dumps(selectors.send_button_selector),
+            "stop": json.dumps(selectors.stop_button),
+            "output": json.dumps(selectors.output_selector),
+            "quiet_ms": config.quiet_period_ms,
+        }
+
+        try:
+            installed = await self._evaluate(browser, context_id, script)
+        except Exception as e:
+            self._log.debug("Observer install failed", error=str(e))
+            return False
+
+        if installed is not True:
+            return False
+
+        timeout_seconds = config.timeout_ms / 1000
+        start_time = time.time()
+        long_poll = True
+        snapshot: dict[str, Any] = {}
+
+        while (time.time() - start_time) < timeout_seconds:
+            remaining_ms = int(timeout_seconds * 1000 - (time.time() - start_time) * 1000)
+            wait_ms = max(0, min(config.observer_long_poll_ms, remaining_ms))
+            expression = (
+                f"window.__web2apiCompletion ? window.__web2apiCompletion.wait({wait_ms}) : null"
+                if long_poll
+                else "window.__web2apiCompletion ? window.__web2apiCompletion.snapshot() : null"
+            )
+
+            try:
+                value = await self._evaluate(browser, context_id, expression)
+            except Exception as e:
+                self._log.debug("Observer poll failed", error=str(e))
+                return False
+
+            if not isinstance(value, dict):
+                # Observer state lost (e.g. page navigated)
+                return False
+
+            if "done" not in value:
+                if not long_poll:
+                    return False
+                # Promise was not awaited; read the state synchronously instead
+                long_poll = False
+                continue
+
+            snapshot = value
+            if snapshot["done"]:
+                self._log.info(
+                    "Response complete - detected by observer",
+                    text_length=snapshot.get("text_length"),
+                )
+                return True
+
+            if not long_poll:
+                await asyncio.sleep(config.poll_interval_ms / 1000)
+            elif websocket_handler:
+                # One progress update per long-poll round
+                await websocket_handler.send_execution_log(
+                    None, "info", f"Still waiting for response... ({int(time.time() - start_time)}s)"
+                )
+
+        if snapshot.get("saw_busy"):
+            self._log.warning("Timeout while waiting for response to complete")
+            raise TimeoutError("Response generation timeout")
+
+        self._log.info("Button never disabled, assuming fast response completed")
+        return True
+
+    async def _evaluate(
+        self,
+        browser: Browser,
+        context_id: str,
+        expression: str,
+    ) -> Any:
+        """Evaluate a JavaScript expression in the page and return its value."""
+        result = await browser.browser_evaluate({
+            "context_id": context_id,
+            "expression": expression,
+        })
+        if isinstance(result, dict) and "result" in result:
+            return result["result"]
+        return result
+
+    async def _poll_for_response_complete(
+        self,
+        browser: Browser,
+        context_id: str,
+        config: ChatConfig,
+        initial_button_state: dict[str, Any],
+        websocket_handler: Any = None,
+    ) -> None:
+        """
+        Wait for the response to complete by polling button state.
         
         Detection strategy:
         1. Wait for button to become disabled (indicates processing started)
@@ -495,39 +808,143 @@ class ChatExecutor:
             # Button was never disabled - assume fast response
             self._log.info("Button never disabled, assuming fast response completed")
     
-    async def _extract_response(
+    async def _read_output_text(
         self,
         browser: Browser,
         context_id: str,
         output_selector: str,
     ) -> str:
+        """Read the current output area text (empty string on failure)."""
+        try:
+            result = await browser.browser_extract_text({
+                "context_id": context_id,
+                "selector": output_selector,
+            })
+            return (result or {}).get("text") or ""
+        except Exception as e:
+            self._log.debug("Output text read failed", error=str(e))
+            return ""
+
+    async def _stream_output(
+        self,
+        browser: Browser,
+        context_id: str,
+        config: ChatConfig,
+        baseline_output: str,
+        message: str,
+        on_delta: Callable[[str], Awaitable[None]],
+        stop: asyncio.Event,
+    ) -> str:
+        """
+        Push new output text to ``on_delta`` until ``stop`` is set.
+
+        Uses incremental text diffing: only text that extends what has
+        already been emitted is pushed, so re-rendered content never
+        produces contradictory deltas. Output present before sending and
+        the echoed message are never emitted (see ``_new_output_text``).
+
+        Returns:
+            The text emitted so far
+        """
+        interval = config.stream_interval_ms / 1000
+        emitted = ""
+
+        while not stop.is_set():
+            text = self._new_output_text(
+                await self._read_output_text(
+                    browser, context_id, config.selectors.output_selector
+                ),
+                baseline_output,
+                message,
+            )
+
+            if len(text) > len(emitted) and text.startswith(emitted):
+                delta = text[len(emitted):]
+                emitted = text
+                try:
+                    await on_delta(delta)
+                except Exception as e:
+                    self._log.warning("Delta callback failed, stopping stream", error=str(e))
+                    break
+
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+
+        return emitted
+
+    @staticmethod
+    def _new_output_text(text: str, baseline_output: str, message: str) -> str:
+        """
+        Strip output that does not belong to the new response.
+
+        An output selector matching the whole transcript keeps the earlier
+        turns and then the sent message in front of the response; one
+        matching the last message first shows the sent message alone.
+
+        Args:
+            text: Current output area text
+            baseline_output: Output area text before the message was sent
+            message: The sent message
+
+        Returns:
+            The new response text (empty while there is none yet)
+        """
+        sent = message.strip()
+        if text.startswith(baseline_output):
+            text = text[len(baseline_output):].lstrip()
+        if sent and (text.strip() == sent or text.startswith(sent + "\n")):
+            text = text[len(sent):].lstrip()
+        return text
+
+    async def _extract_response(
+        self,
+        browser: Browser,
+        context_id: str,
+        config: ChatConfig,
+        message: str = "",
+        prefer_text: bool = False,
+    ) -> tuple[str, str]:
         """
         Extract the response text from the output area.
         
-        Strategies:
-        1. Try AI extraction for clean text
-        2. Fallback to text extraction
-        3. Handle multiple message containers (get last one)
+        Strategies, cheapest first; each result must pass a quality check:
+        1. Structural: one in-page script returns the last message's text
+           and a markdown rendering of its HTML
+        2. Direct text extraction
+        3. Inner HTML parsed locally
+        4. AI extraction (only if enabled and everything else failed)
+
+        Args:
+            browser: Owl-Browser instance
+            context_id: Browser context ID
+            config: Chat configuration with selectors
+            message: The sent message (a response equal to it is rejected)
+            prefer_text: Return plain text instead of markdown (keeps
+                streamed deltas and the final response consistent)
+
+        Returns:
+            Tuple of (response text, extraction method)
         """
-        # Small delay to ensure DOM is fully updated
-        await asyncio.sleep(0.5)
+        output_selector = config.selectors.output_selector
         
-        # Strategy 1: AI extraction for best quality
+        # Strategy 1: Structural extraction in a single call
         try:
-            result = await browser.browser_ai_extract({
-                "context_id": context_id,
-                "selector": output_selector,
-                "prompt": "Extract the complete AI assistant response text. Return only the response content, no UI elements or metadata.",
-            })
+            script = _EXTRACT_RESPONSE_SCRIPT % {
+                "output": json.dumps(output_selector),
+                "container": json.dumps(config.selectors.message_container),
+            }
+            value = await self._evaluate(browser, context_id, script)
             
-            if result and result.get("content"):
-                content = result["content"].strip()
-                if content:
-                    self._log.debug("Response extracted via AI", length=len(content))
-                    return content
+            if isinstance(value, dict):
+                text = (value.get("text") or "").strip()
+                markdown = (value.get("markdown") or "").strip()
+                content = text if prefer_text else (markdown or text)
+                if self._passes_quality_check(content, message):
+                    self._log.debug("Response extracted structurally", length=len(content))
+                    return content, "structural"
                     
         except Exception as e:
-            self._log.debug("AI extraction failed", error=str(e))
+            self._log.debug("Structural extraction failed", error=str(e))
         
         # Strategy 2: Direct text extraction
         try:
@@ -538,9 +955,9 @@ class ChatExecutor:
             
             if result and result.get("text"):
                 text = result["text"].strip()
-                if text:
+                if self._passes_quality_check(text, message):
                     self._log.debug("Response extracted via text", length=len(text))
-                    return text
+                    return text, "text"
                     
         except Exception as e:
             self._log.debug("Text extraction failed", error=str(e))
@@ -568,15 +985,45 @@ class ChatExecutor:
                 # Decode entities
                 text = unescape(html).strip()
                 
-                if text:
+                if self._passes_quality_check(text, message):
                     self._log.debug("Response extracted via HTML", length=len(text))
-                    return text
+                    return text, "html"
                     
         except Exception as e:
             self._log.debug("HTML extraction failed", error=str(e))
         
+        # Strategy 4: AI extraction, an extra model round-trip, as last resort
+        if config.ai_extraction_fallback:
+            try:
+                result = await browser.browser_ai_extract({
+                    "context_id": context_id,
+                    "selector": output_selector,
+                    "prompt": "Extract the complete AI assistant response text. Return only the response content, no UI elements or metadata.",
+                })
+
+                if result and result.get("content"):
+                    content = result["content"].strip()
+                    if content:
+                        self._log.info("Response extracted via AI fallback", length=len(content))
+                        return content, "ai"
+
+            except Exception as e:
+                self._log.debug("AI extraction failed", error=str(e))
+
         raise Exception("Failed to extract response from chat interface")
 
+    @staticmethod
+    def _passes_quality_check(text: str, message: str = "") -> bool:
+        """
+        Check that extracted text looks like an assistant response.
+
+        Rejects empty or symbol-only text, and text equal to the sent
+        message (the selector matched the user's own turn).
+        """
+        if not text or not any(ch.isalnum() for ch in text):
+            return False
+        return not message or text.strip() != message.strip()
+
 
 class ChatUIDetector:
     """
@@ -845,3 +1292,47 @@ class ChatUIDetector:
                 continue
         
         return None
+
+
+class ExtractionMetrics:
+    """
+    Per-service counts of which response extraction strategy succeeded.
+
+    A high share of "ai" extractions for a service points at stale output
+    selectors, since every such request pays for an extra model call.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[str, dict[str, int]] = {}
+
+    def record(self, service_id: str, method: str) -> None:
+        """Record a successful extraction for a service."""
+        counts = self._counts.setdefault(service_id, {})
+        counts[method] = counts.get(method, 0) + 1
+
+    def snapshot(self, service_id: str | None = None) -> dict[str, Any]:
+        """
+        Get extraction counts.
+
+        Args:
+            service_id: Limit to one service (all services if None)
+
+        Returns:
+            Method counts for the service, or a mapping of service to counts
+        """
+        if service_id is not None:
+            return dict(self._counts.get(service_id, {}))
+        return {sid: dict(counts) for sid, counts in self._counts.items()}
+
+
+_global_extraction_metrics: ExtractionMetrics | None = None
+
+
+def get_extraction_metrics() -> ExtractionMetrics:
+    """Get the process-wide extraction metrics, creating them on first use."""
+    global _global_extraction_metrics
+
+    if _global_extraction_metrics is None:
+        _global_extraction_metrics = ExtractionMetrics()
+
+    return _global_extraction_metrics
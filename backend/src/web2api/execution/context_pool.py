@@ -0,0 +1,332 @@
+"""
+Per-service pool of warm, authenticated browser contexts.
+
+Lets the execution queue run several chat completions for the same
+service concurrently. The caller's primary context (``service_{id}``)
+holds the logged-in session; additional contexts are cloned from its
+cookies up to the warm minimum when the pool starts, cloned on demand
+beyond that, and closed again when demand drops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from owl_browser import Browser
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class ServiceContext:
+    """A browser context belonging to a service pool."""
+
+    context_id: str
+    """Owl-Browser context ID."""
+
+    owned: bool = True
+    """Whether the pool created this context (and may close it)."""
+
+    active_tasks: int = 0
+    """Number of tasks currently running on this context."""
+
+    total_tasks: int = 0
+    """Number of tasks executed on this context."""
+
+    created_at: float = field(default_factory=time.time)
+    """Unix timestamp when context was added to the pool."""
+
+    last_used_at: float = field(default_factory=time.time)
+    """Unix timestamp when context was last released."""
+
+    @property
+    def idle_seconds(self) -> float:
+        """Get time since last use in seconds."""
+        return time.time() - self.last_used_at
+
+
+class ServiceContextPool:
+    """
+    Pool of browser contexts for a single service.
+
+    Features:
+    - Primary context supplied by the caller is always kept
+    - Extra contexts cloned from the primary context's session cookies
+    - Least-busy context selection
+    - Clones up to ``min_contexts`` created in the background by ``start()``
+    - Grow on demand up to ``max_contexts``, shrink idle clones
+    """
+
+    def __init__(
+        self,
+        service_id: str,
+        browser: Browser,
+        primary_context_id: str,
+        service_url: str | None = None,
+        max_contexts: int = 1,
+        min_contexts: int = 1,
+    ) -> None:
+        """
+        Initialize service context pool.
+
+        Args:
+            service_id: Service identifier
+            browser: Owl-Browser instance
+            primary_context_id: Logged-in context used as the cookie source
+            service_url: Service URL to load before applying cookies
+            max_contexts: Maximum number of contexts (including primary)
+            min_contexts: Minimum number of contexts to keep warm
+        """
+        self._service_id = service_id
+        self._browser = browser
+        self._primary_context_id = primary_context_id
+        self._service_url = service_url
+        self._max_contexts = max(1, max_contexts)
+        self._min_contexts = max(1, min(min_contexts, self._max_contexts))
+
+        self._contexts: dict[str, ServiceContext] = {
+            primary_context_id: ServiceContext(context_id=primary_context_id, owned=False),
+        }
+        self._pending_clones = 0
+        self._warm_task: asyncio.Task[None] | None = None
+        self._closed = False
+        self._lock = asyncio.Lock()
+        self._log = logger.bind(component="service_context_pool", service_id=service_id)
+
+        self._stats = {
+            "total_cloned": 0,
+            "total_closed": 0,
+            "total_clone_failures": 0,
+        }
+
+    @property
+    def size(self) -> int:
+        """Get current pool size."""
+        return len(self._contexts)
+
+    @property
+    def busy_count(self) -> int:
+        """Get number of contexts with running tasks."""
+        return sum(1 for c in self._contexts.values() if c.active_tasks > 0)
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            **self._stats,
+            "current_size": self.size,
+            "busy": self.busy_count,
+            "max_contexts": self._max_contexts,
+        }
+
+    def start(self) -> None:
+        """Begin cloning contexts up to ``min_contexts`` in the background."""
+        if self._closed or (self._warm_task is not None and not self._warm_task.done()):
+            return
+        self._warm_task = asyncio.create_task(self._warm())
+
+    async def wait_until_warm(self) -> None:
+        """Wait until background warming started by ``start()`` has finished."""
+        if self._warm_task is not None:
+            await asyncio.shield(self._warm_task)
+
+    async def _warm(self) -> None:
+        """Clone contexts concurrently until the pool reaches its minimum."""
+        async with self._lock:
+            missing = self._min_contexts - (self.size + self._pending_clones)
+            if missing <= 0:
+                return
+            self._pending_clones += missing
+
+        try:
+            clones = await asyncio.gather(*(self._clone_context() for _ in range(missing)))
+        finally:
+            self._pending_clones -= missing
+
+        async with self._lock:
+            for clone in clones:
+                if clone is None:
+                    continue
+                self._contexts[clone.context_id] = clone
+                if self._closed:
+                    # Closed while cloning: do not leave the clone open
+                    await self._close_context(clone)
+
+        failed = sum(1 for clone in clones if clone is None)
+        if failed:
+            self._log.warning("Failed to warm contexts", failed=failed)
+        else:
+            self._log.debug("Warmed contexts", count=missing, pool_size=self.size)
+
+    async def acquire(self) -> ServiceContext:
+        """
+        Acquire the least-busy context, cloning a new one if all are busy.
+
+        Returns:
+            The acquired service context
+        """
+        async with self._lock:
+            context = min(
+                self._contexts.values(),
+                key=lambda c: (c.active_tasks, c.total_tasks),
+            )
+            should_clone = (
+                context.active_tasks > 0
+                and self.size + self._pending_clones < self._max_contexts
+            )
+            if should_clone:
+                self._pending_clones += 1
+            else:
+                self._mark_acquired(context)
+                return context
+
+        # Clone outside the lock so releases and other acquires are not blocked
+        try:
+            clone = await self._clone_context()
+        finally:
+            self._pending_clones -= 1
+
+        async with self._lock:
+            if clone is not None:
+                self._contexts[clone.context_id] = clone
+                context = clone
+            else:
+                context = min(
+                    self._contexts.values(),
+                    key=lambda c: (c.active_tasks, c.total_tasks),
+                )
+            self._mark_acquired(context)
+            return context
+
+    def _mark_acquired(self, context: ServiceContext) -> None:
+        """Record a task starting on a context (caller holds the lock)."""
+        context.active_tasks += 1
+        context.total_tasks += 1
+
+        self._log.debug(
+            "Context acquired",
+            context_id=context.context_id,
+            active_tasks=context.active_tasks,
+            pool_size=self.size,
+        )
+
+    async def release(self, context: ServiceContext) -> None:
+        """Release a context back to the pool."""
+        async with self._lock:
+            context.active_tasks = max(0, context.active_tasks - 1)
+            context.last_used_at = time.time()
+
+    async def shrink(self, target: int) -> int:
+        """
+        Close idle cloned contexts until the pool is at ``target`` size.
+
+        Never shrinks below ``min_contexts`` and never closes the primary context.
+
+        Args:
+            target: Desired pool size
+
+        Returns:
+            Number of contexts closed
+        """
+        target = max(target, self._min_contexts)
+        closed = 0
+
+        async with self._lock:
+            idle = sorted(
+                (c for c in self._contexts.values() if c.owned and c.active_tasks == 0),
+                key=lambda c: c.last_used_at,
+            )
+            for context in idle:
+                if self.size <= target:
+                    break
+                await self._close_context(context)
+                closed += 1
+
+        if closed:
+            self._log.info("Pool shrunk", closed=closed, pool_size=self.size)
+
+        return closed
+
+    async def close(self) -> None:
+        """Close all cloned contexts, including any still being warmed."""
+        self._closed = True
+        if self._warm_task is not None:
+            # Clones in flight are closed by the warm task once created
+            await asyncio.shield(self._warm_task)
+
+        async with self._lock:
+            for context in [c for c in self._contexts.values() if c.owned]:
+                await self._close_context(context)
+
+    async def _clone_context(self) -> ServiceContext | None:
+        """Create a new context carrying the primary context's session cookies."""
+        try:
+            result = await self._browser.browser_create_context({})
+            context_id = (result or {}).get("context_id")
+            if not context_id:
+                raise ValueError("browser_create_context returned no context_id")
+
+            cookies_result = await self._browser.browser_get_cookies({
+                "context_id": self._primary_context_id,
+            })
+            cookies = cookies_result.get("cookies", [])
+
+            # Cookies need to be set on the service domain
+            if self._service_url:
+                await self._browser.browser_navigate({
+                    "context_id": context_id,
+                    "url": self._service_url,
+                })
+                await self._browser.browser_wait_for_load({
+                    "context_id": context_id,
+                    "state": "domcontentloaded",
+                    "timeout": 30000,
+                })
+
+            if cookies:
+                await self._browser.browser_set_cookie({
+                    "context_id": context_id,
+                    "cookies": cookies,
+                })
+                if self._service_url:
+                    await self._browser.browser_reload({"context_id": context_id})
+                    await self._browser.browser_wait_for_load({
+                        "context_id": context_id,
+                        "state": "domcontentloaded",
+                        "timeout": 30000,
+                    })
+
+            context = ServiceContext(context_id=context_id)
+            self._stats["total_cloned"] += 1
+
+            self._log.info(
+                "Cloned service context",
+                context_id=context_id,
+                cookie_count=len(cookies),
+                pool_size=self.size,
+            )
+            return context
+
+        except Exception as e:
+            self._stats["total_clone_failures"] += 1
+            self._log.warning("Failed to clone service context", error=str(e))
+            return None
+
+    async def _close_context(self, context: ServiceContext) -> None:
+        """Close a cloned context and remove it from the pool."""
+        self._contexts.pop(context.context_id, None)
+        self._stats["total_closed"] += 1
+        try:
+            await self._browser.browser_close_context({"context_id": context.context_id})
+        except Exception as e:
+            self._log.debug(
+                "Error closing context",
+                context_id=context.context_id,
+                error=str(e),
+            )
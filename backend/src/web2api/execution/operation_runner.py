@@ -18,9 +18,12 @@ from web2api.execution.chat_executor import (
     ChatExecutor,
     ChatConfig,
     ChatUISelectors,
+    get_extraction_metrics,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from owl_browser import Browser
 
 logger = structlog.get_logger(__name__)
@@ -54,6 +57,7 @@ class OperationRunner:
         browser: Browser,
         context_id: str,
         websocket_handler: Any = None,
+        on_delta: Callable[[str], Awaitable[None]] | None = None,
     ) -> str:
         """
         Execute an operation on a service.
@@ -66,6 +70,8 @@ class OperationRunner:
             browser: Owl-Browser instance
             context_id: Browser context ID
             websocket_handler: Optional WebSocket for progress updates
+            on_delta: Optional callback receiving response text incrementally
+                (chat_completion only)
 
         Returns:
             Operation result/response
@@ -92,6 +98,7 @@ class OperationRunner:
                     websocket_handler=websocket_handler,
                     execution_id=execution_id,
                     start_time=start_time,
+                    on_delta=on_delta,
                 )
             
             # Legacy operation execution path for other operation types
@@ -146,6 +153,7 @@ class OperationRunner:
         websocket_handler: Any,
         execution_id: str,
         start_time: float,
+        on_delta: Callable[[str], Awaitable[None]] | None = None,
     ) -> str:
         """
         Execute chat completion using the optimized ChatExecutor.
@@ -181,12 +189,16 @@ class OperationRunner:
             output_selector=output_selector,
             stop_button=ui_selectors.get("stop_button"),
             new_chat_button=ui_selectors.get("new_chat_button"),
+            message_container=ui_selectors.get("message_container"),
         )
         
         chat_config = ChatConfig(
             url=service_config.get("url", ""),
             selectors=chat_selectors,
             timeout_ms=service_config.get("timeout_ms", 120000),
+            completion_detection=service_config.get("completion_detection", "observer"),
+            quiet_period_ms=service_config.get("quiet_period_ms", 800),
+            ai_extraction_fallback=service_config.get("ai_extraction_fallback", True),
         )
         
         # Execute chat
@@ -196,10 +208,14 @@ class OperationRunner:
             config=chat_config,
             message=message,
             websocket_handler=websocket_handler,
+            on_delta=on_delta,
         )
         
         if not result.success:
             raise Exception(f"Chat execution failed: {result.error}")
+
+        extraction_method = (result.metadata or {}).get("extraction_method", "unknown")
+        get_extraction_metrics().record(service_id, extraction_method)
         
         duration_ms = int((time.time() - start_time) * 1000)
         
@@ -208,6 +224,7 @@ class OperationRunner:
             execution_id=execution_id,
             duration_ms=duration_ms,
             response_length=len(result.response),
+            extraction_method=extraction_method,
         )
         
         return result.response
@@ -1,7 +1,8 @@
 """
 FIFO queue manager for service operation execution.
 
-Implements sequential per-service execution queue (no rate limiting).
+Implements per-service execution queues served by a scalable pool of
+workers, each running on one of the service's warm browser contexts.
 """
 
 from __future__ import annotations
@@ -13,9 +14,12 @@ from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from web2api.execution.context_pool import ServiceContextPool
 from web2api.execution.operation_runner import OperationRunner
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from owl_browser import Browser
 
 logger = structlog.get_logger(__name__)
@@ -27,16 +31,39 @@ class ExecutionQueue:
 
     Features:
     - Per-service FIFO queues
-    - Sequential processing per service (no rate limiting)
-    - Async task management
+    - Up to ``max_contexts_per_service`` concurrent tasks per service,
+      each on its own authenticated browser context
+    - Workers scale with queue depth and retire when idle
+    - Async task management with awaitable completion (no status polling)
+    - Cancellation of queued tasks before they reach the browser
+    - Incremental response streaming for chat tasks
     - WebSocket progress updates
     """
 
-    def __init__(self) -> None:
-        """Initialize execution queue manager."""
+    def __init__(
+        self,
+        max_contexts_per_service: int = 1,
+        min_contexts_per_service: int = 1,
+        worker_idle_timeout_seconds: float = 60.0,
+    ) -> None:
+        """
+        Initialize execution queue manager.
+
+        Args:
+            max_contexts_per_service: Maximum concurrent tasks (and browser
+                contexts) per service. 1 keeps strictly sequential execution.
+            min_contexts_per_service: Workers/contexts kept warm per service
+            worker_idle_timeout_seconds: Idle time before a surplus worker retires
+        """
+        self._max_contexts = max(1, max_contexts_per_service)
+        self._min_contexts = max(1, min(min_contexts_per_service, self._max_contexts))
+        self._worker_idle_timeout = worker_idle_timeout_seconds
+
         self._queues: dict[str, asyncio.Queue] = {}
-        self._processors: dict[str, asyncio.Task] = {}
-        self._running_tasks: dict[str, Any] = {}
+        self._workers: dict[str, set[asyncio.Task]] = {}
+        self._pools: dict[str, ServiceContextPool] = {}
+        self._running_tasks: dict[str, dict[str, Any]] = {}
+        self._futures: dict[str, asyncio.Future[dict[str, Any]]] = {}
         self._lock = asyncio.Lock()
         self._log = logger.bind(component="execution_queue")
 
@@ -49,6 +76,7 @@ class ExecutionQueue:
         browser: Browser,
         context_id: str,
         websocket_handler: Any = None,
+        stream: bool = False,
     ) -> str:
         """
         Add task to service queue.
@@ -61,25 +89,32 @@ class ExecutionQueue:
             browser: Owl-Browser instance
             context_id: Browser context ID
             websocket_handler: Optional WebSocket for updates
+            stream: Collect response text deltas, readable via ``stream_task``
 
         Returns:
-            Task ID for tracking
+            Task ID for tracking; pass it to ``wait_for_task`` to await the result
         """
         async with self._lock:
-            # Create queue for service if doesn't exist
+            # Create queue and context pool for service if they don't exist
             if service_id not in self._queues:
                 self._queues[service_id] = asyncio.Queue()
-
-                # Start processor task for this service
-                self._processors[service_id] = asyncio.create_task(
-                    self._process_queue(service_id, browser, websocket_handler)
+                self._workers[service_id] = set()
+                self._pools[service_id] = ServiceContextPool(
+                    service_id=service_id,
+                    browser=browser,
+                    primary_context_id=context_id,
+                    service_url=service_config.get("url"),
+                    max_contexts=self._max_contexts,
+                    min_contexts=self._min_contexts,
                 )
+                self._pools[service_id].start()
 
                 self._log.info("Queue created for service", service_id=service_id)
 
         # Create task
-        task = {
-            "task_id": str(uuid.uuid4()),
+        task_id = str(uuid.uuid4())
+        task: dict[str, Any] = {
+            "task_id": task_id,
             "service_id": service_id,
             "service_config": service_config,
             "operation_id": operation_id,
@@ -88,27 +123,228 @@ class ExecutionQueue:
             "created_at": time.time(),
             "status": "pending",
         }
+        if stream:
+            task["deltas"] = asyncio.Queue()
+            task["streamed"] = ""
+
+        # Track task before queuing so a fast worker can always resolve it
+        self._running_tasks[task_id] = task
+        self._futures[task_id] = asyncio.get_running_loop().create_future()
 
         # Add to queue
         await self._queues[service_id].put(task)
 
-        # Track task
-        self._running_tasks[task["task_id"]] = task
+        # Grow the worker pool to match queue depth
+        await self._scale_workers(service_id, browser, websocket_handler)
 
         self._log.info(
             "Task added to queue",
-            task_id=task["task_id"],
+            task_id=task_id,
             service_id=service_id,
             operation_id=operation_id,
             queue_size=self._queues[service_id].qsize(),
         )
 
-        return task["task_id"]
+        return task_id
 
     async def get_task_status(self, task_id: str) -> dict[str, Any] | None:
         """Get status of a task."""
         return self._running_tasks.get(task_id)
 
+    async def wait_for_task(
+        self,
+        task_id: str,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Wait until a task finishes, without polling.
+
+        If the wait times out or the waiting coroutine is cancelled (e.g. the
+        HTTP client disconnected), the task is cancelled so that a still-queued
+        task is dropped before it touches the browser.
+
+        Args:
+            task_id: Task identifier returned by ``add_task``
+            timeout: Maximum wait time in seconds (None waits indefinitely)
+
+        Returns:
+            The finished task dictionary
+
+        Raises:
+            KeyError: If the task is unknown
+            TimeoutError: If the task did not finish within ``timeout``
+        """
+        task = self._running_tasks.get(task_id)
+        if task is None:
+            raise KeyError(f"Task {task_id} not found")
+
+        future = self._futures.get(task_id)
+        if future is None:
+            # Already finished
+            return task
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except (TimeoutError, asyncio.CancelledError):
+            await self.cancel_task(task_id)
+            raise
+
+    async def stream_task(
+        self,
+        task_id: str,
+        timeout: float | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Yield response text deltas of a streaming task as they are produced.
+
+        The iterator ends when the task finishes; check ``get_task_status``
+        afterwards for the final status. Abandoning the iterator (or timing
+        out) cancels the task if it has not started yet.
+
+        Args:
+            task_id: Task identifier returned by ``add_task(..., stream=True)``
+            timeout: Maximum total streaming time in seconds
+
+        Raises:
+            KeyError: If the task is unknown
+            ValueError: If the task was not added with ``stream=True``
+            TimeoutError: If the task did not finish within ``timeout``
+        """
+        task = self._running_tasks.get(task_id)
+        if task is None:
+            raise KeyError(f"Task {task_id} not found")
+
+        deltas: asyncio.Queue[str | None] | None = task.get("deltas")
+        if deltas is None:
+            raise ValueError(f"Task {task_id} was not added with stream=True")
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        finished = False
+
+        try:
+            while True:
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError()
+
+                delta = await asyncio.wait_for(deltas.get(), timeout=remaining)
+                if delta is None:
+                    finished = True
+                    return
+                yield delta
+        finally:
+            if not finished:
+                await self.cancel_task(task_id)
+
+    async def cancel_task(self, task_id: str) -> bool:
+        """
+        Cancel a queued task.
+
+        Pending tasks are marked cancelled and skipped by the workers. Tasks
+        that are already running on a browser context are left to finish.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            True if the task was cancelled before execution
+        """
+        task = self._running_tasks.get(task_id)
+        if task is None or task["status"] != "pending":
+            return False
+
+        task["status"] = "cancelled"
+        task["completed_at"] = time.time()
+        self._resolve_task(task)
+
+        self._log.info("Task cancelled", task_id=task_id, service_id=task["service_id"])
+        return True
+
+    def _resolve_task(self, task: dict[str, Any]) -> None:
+        """Wake up anyone waiting on a finished task."""
+        future = self._futures.pop(task["task_id"], None)
+        if future is not None and not future.done():
+            future.set_result(task)
+
+        deltas = task.get("deltas")
+        if deltas is not None:
+            # End-of-stream sentinel
+            deltas.put_nowait(None)
+
+    @staticmethod
+    def _delta_sink(task: dict[str, Any]) -> Any:
+        """Build the on_delta callback for a streaming task."""
+        deltas = task.get("deltas")
+        if deltas is None:
+            return None
+
+        async def on_delta(delta: str) -> None:
+            task["streamed"] += delta
+            deltas.put_nowait(delta)
+
+        return on_delta
+
+    async def _scale_workers(
+        self,
+        service_id: str,
+        browser: Browser,
+        websocket_handler: Any = None,
+    ) -> None:
+        """
+        Start workers until they cover queued plus running tasks.
+
+        Args:
+            service_id: Service identifier
+            browser: Owl-Browser instance
+            websocket_handler: Optional WebSocket handler
+        """
+        async with self._lock:
+            workers = self._workers.get(service_id)
+            if workers is None:
+                return
+
+            demand = self._queues[service_id].qsize() + self._pools[service_id].busy_count
+            desired = min(self._max_contexts, max(self._min_contexts, demand))
+
+            while len(workers) < desired:
+                worker = asyncio.create_task(
+                    self._process_queue(service_id, browser, websocket_handler)
+                )
+                workers.add(worker)
+
+                self._log.debug(
+                    "Worker started",
+                    service_id=service_id,
+                    workers=len(workers),
+                    demand=demand,
+                )
+
+    async def _retire_worker(self, service_id: str) -> bool:
+        """
+        Retire the calling worker if it is surplus and no work is queued.
+
+        Returns:
+            True if the worker should exit
+        """
+        async with self._lock:
+            workers = self._workers.get(service_id)
+            pool = self._pools.get(service_id)
+            worker = asyncio.current_task()
+            if workers is None or pool is None or worker not in workers:
+                # Queue stopped meanwhile
+                return True
+
+            if len(workers) <= self._min_contexts or not self._queues[service_id].empty():
+                return False
+
+            workers.discard(worker)
+            remaining = len(workers)
+
+        await pool.shrink(remaining)
+        self._log.debug("Worker retired", service_id=service_id, workers=remaining)
+        return True
+
     async def _process_queue(
         self,
         service_id: str,
@@ -116,7 +352,10 @@ class ExecutionQueue:
         websocket_handler: Any = None,
     ) -> None:
         """
-        Process tasks from service queue (sequential execution).
+        Worker loop: process tasks from service queue one at a time.
+
+        Several workers may serve the same queue; each acquires the
+        least-busy context from the service pool for every task.
 
         Args:
             service_id: Service identifier
@@ -126,17 +365,31 @@ class ExecutionQueue:
         self._log.info("Starting queue processor", service_id=service_id)
 
         runner = OperationRunner()
+        pool = self._pools[service_id]
 
         while True:
             try:
-                # Get next task from queue
-                task = await self._queues[service_id].get()
+                # Get next task from queue, retiring if idle for too long
+                try:
+                    task = await asyncio.wait_for(
+                        self._queues[service_id].get(),
+                        timeout=self._worker_idle_timeout,
+                    )
+                except TimeoutError:
+                    if await self._retire_worker(service_id):
+                        break
+                    continue
 
                 if task is None:
                     # Poison pill - stop processor
                     self._log.info("Stopping queue processor", service_id=service_id)
                     break
 
+                if task["status"] == "cancelled":
+                    # Abandoned by its caller - drop without touching the browser
+                    self._queues[service_id].task_done()
+                    continue
+
                 task_id = task["task_id"]
                 operation_id = task["operation_id"]
 
@@ -159,6 +412,9 @@ class ExecutionQueue:
                         f"Starting execution: {operation_id}",
                     )
 
+                context = await pool.acquire()
+                task["executed_context_id"] = context.context_id
+
                 try:
                     # Execute operation
                     result = await runner.execute_operation(
@@ -167,10 +423,16 @@ class ExecutionQueue:
                         operation_id=task["operation_id"],
                         parameters=task["parameters"],
                         browser=browser,
-                        context_id=task["context_id"],
+                        context_id=context.context_id,
                         websocket_handler=websocket_handler,
+                        on_delta=self._delta_sink(task),
                     )
 
+                    # Operations that cannot stream deliver their result in one delta
+                    if "deltas" in task and not task["streamed"] and result:
+                        task["streamed"] = result
+                        task["deltas"].put_nowait(result)
+
                     # Task completed successfully
                     task["status"] = "completed"
                     task["result"] = result
@@ -214,6 +476,13 @@ class ExecutionQueue:
                         )
 
                 finally:
+                    if task["status"] == "running":
+                        # Worker was cancelled mid-execution
+                        task["status"] = "failed"
+                        task["error"] = "Execution cancelled"
+                        task["completed_at"] = time.time()
+                    self._resolve_task(task)
+                    await pool.release(context)
                     # Mark queue task as done
                     self._queues[service_id].task_done()
 
@@ -228,21 +497,35 @@ class ExecutionQueue:
                 )
 
     async def stop_queue(self, service_id: str) -> None:
-        """Stop queue processor for a service."""
+        """Stop all queue processors for a service and close its cloned contexts."""
         async with self._lock:
             if service_id in self._queues:
-                # Send poison pill to stop processor
-                await self._queues[service_id].put(None)
+                workers = self._workers.pop(service_id, set())
 
-                # Wait for processor to finish
-                if service_id in self._processors:
-                    self._processors[service_id].cancel()
+                # Send one poison pill per worker to stop processors
+                for _ in workers:
+                    await self._queues[service_id].put(None)
+
+                # Wait for processors to finish
+                for worker in workers:
+                    worker.cancel()
                     try:
-                        await self._processors[service_id]
+                        await worker
                     except asyncio.CancelledError:
                         pass
 
-                    del self._processors[service_id]
+                pool = self._pools.pop(service_id, None)
+                if pool is not None:
+                    await pool.close()
+
+                # Fail anything still queued so waiters are released
+                queue = self._queues.pop(service_id)
+                while not queue.empty():
+                    task = queue.get_nowait()
+                    if task is not None and task["status"] == "pending":
+                        task["status"] = "cancelled"
+                        task["completed_at"] = time.time()
+                        self._resolve_task(task)
 
                 self._log.info("Queue stopped", service_id=service_id)
 
@@ -252,6 +535,17 @@ class ExecutionQueue:
             return self._queues[service_id].qsize()
         return 0
 
+    def get_pool_statistics(self, service_id: str) -> dict[str, Any] | None:
+        """Get context pool statistics for a service."""
+        pool = self._pools.get(service_id)
+        if pool is None:
+            return None
+        return {
+            **pool.statistics,
+            "workers": len(self._workers.get(service_id, ())),
+            "queue_size": self.get_queue_size(service_id),
+        }
+
     async def shutdown(self) -> None:
         """Shutdown all queue processors."""
         self._log.info("Shutting down all queue processors")
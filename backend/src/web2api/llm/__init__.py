@@ -15,6 +15,7 @@ from web2api.llm.assertions import (
     LLMAssertionError,
     LLMAssertionResult,
 )
+from web2api.llm.batching import MicroBatcher
 from web2api.llm.client import (
     ChatCompletion,
     ChatMessage,
@@ -27,11 +28,13 @@ from web2api.llm.client import (
     create_llm_client,
 )
 from web2api.llm.config import (
+    BatchingConfig,
     LLMConfig,
     LLMEndpointConfig,
     LLMProvider,
     LLMSettings,
     RateLimitConfig,
+    ResponseCacheConfig,
     RetryConfig,
     ToolLLMConfig,
     ToolName,
@@ -44,6 +47,7 @@ from web2api.llm.prompts import (
     get_prompt,
     get_prompt_config,
 )
+from web2api.llm.response_cache import CachedResponse, ResponseCache
 from web2api.llm.service import (
     LLMResult,
     LLMService,
@@ -54,11 +58,13 @@ from web2api.llm.service import (
 
 __all__ = [
     # Config
+    "BatchingConfig",
     "LLMConfig",
     "LLMEndpointConfig",
     "LLMProvider",
     "LLMSettings",
     "RateLimitConfig",
+    "ResponseCacheConfig",
     "RetryConfig",
     "ToolLLMConfig",
     "ToolName",
@@ -73,6 +79,11 @@ __all__ = [
     "LLMClientFactory",
     "LLMRateLimitError",
     "create_llm_client",
+    # Batching
+    "MicroBatcher",
+    # Response cache
+    "CachedResponse",
+    "ResponseCache",
     # Prompts
     "PromptTemplate",
     "PromptType",
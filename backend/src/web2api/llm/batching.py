@@ -0,0 +1,213 @@
+"""
+Micro-batching of concurrent LLM prompts.
+
+Most prompts carry a long system prompt and a short per-item request, so
+token spend and latency are dominated by the repeated preamble. Concurrent
+prompts of the same type that arrive within a short window are merged into
+one numbered multi-item prompt, and the per-item answers are split back
+out of a JSON object keyed by item number.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from web2api.llm.config import ToolName
+    from web2api.llm.prompts import PromptType
+
+logger = structlog.get_logger(__name__)
+
+BATCH_INSTRUCTIONS = (
+    "\n\n"
+    "You will receive several numbered requests. Answer each one independently, exactly as "
+    "you would if it were the only request. Respond with only a JSON object that maps each "
+    'request number (as a string, e.g. "1") to its answer. Each answer is the output '
+    "requested for that item: a string for text output, or the JSON value itself when JSON "
+    "output is requested."
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BatchKey:
+    """Prompts are only batched together when their keys are equal."""
+
+    loop_id: int
+    """id() of the event loop the prompts are awaited on."""
+
+    tool: ToolName
+    prompt_type: PromptType
+    system_prompt: str
+    temperature: float
+
+
+@dataclass(slots=True)
+class BatchItem:
+    """One prompt waiting to be sent in a batch."""
+
+    user_prompt: str
+    max_tokens: int
+    future: asyncio.Future[tuple[str, int]]
+    """Resolves to (answer content, tokens attributed to the item)."""
+
+
+def format_batch_prompt(user_prompts: list[str]) -> str:
+    """Combine user prompts into one numbered multi-item prompt."""
+    return "\n\n".join(
+        f"### Request {i}\n{prompt.strip()}" for i, prompt in enumerate(user_prompts, start=1)
+    )
+
+
+def split_batch_response(content: str, count: int, expects_json: bool) -> list[str | None]:
+    """
+    Split a batched response into per-item answers.
+
+    Args:
+        content: Model response to a ``format_batch_prompt`` prompt
+        count: Number of items in the batch
+        expects_json: Whether each item's answer is JSON
+
+    Returns:
+        One answer per item, as the item would have been answered on its
+        own, or None where the item's answer is missing
+    """
+    text = content.strip()
+    if text.startswith("```"):
+        lines = text.split("\n")[1:]
+        if lines and lines[-1].strip() == "```":
+            lines = lines[:-1]
+        text = "\n".join(lines)
+
+    try:
+        answers = json.loads(text)
+    except json.JSONDecodeError:
+        return [None] * count
+    if not isinstance(answers, dict):
+        return [None] * count
+
+    results: list[str | None] = []
+    for i in range(1, count + 1):
+        answer = answers.get(str(i))
+        if isinstance(answer, str):
+            # JSON answers sometimes come back encoded as strings
+            results.append(answer)
+        elif answer is not None and expects_json:
+            results.append(json.dumps(answer))
+        else:
+            results.append(None)
+    return results
+
+
+class MicroBatcher:
+    """
+    Collects concurrent prompts that share a batch key into batches.
+
+    A batch is sent when it reaches ``max_batch_size`` items or when
+    ``max_wait_ms`` passed since its first item arrived, whichever comes
+    first. A single item that waited alone is sent as a normal prompt.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[BatchKey, list[BatchItem]], Awaitable[None]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 20.0,
+    ) -> None:
+        """
+        Initialize batcher.
+
+        Args:
+            send: Sends a batch and resolves its items' futures
+            max_batch_size: Maximum prompts per batch
+            max_wait_ms: Maximum time the first prompt of a batch waits
+        """
+        self._send = send
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max_wait_ms / 1000
+        self._pending: dict[BatchKey, list[BatchItem]] = {}
+        self._timers: dict[BatchKey, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._log = logger.bind(component="micro_batcher")
+
+        self._stats = {
+            "items": 0,
+            "batches": 0,
+            "batched_items": 0,
+        }
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Get batching statistics."""
+        batches = self._stats["batches"]
+        return {
+            **self._stats,
+            "avg_batch_size": self._stats["items"] / batches if batches else 0.0,
+        }
+
+    async def submit(self, key: BatchKey, user_prompt: str, max_tokens: int) -> tuple[str, int]:
+        """
+        Queue a prompt and wait for its answer.
+
+        Args:
+            key: Batch key; only prompts with equal keys are batched together
+            user_prompt: Formatted user prompt
+            max_tokens: Output budget for this item alone
+
+        Returns:
+            Tuple of (answer content, tokens attributed to this item)
+        """
+        loop = asyncio.get_running_loop()
+        item = BatchItem(
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            future=loop.create_future(),
+        )
+        self._stats["items"] += 1
+
+        items = self._pending.setdefault(key, [])
+        items.append(item)
+        if len(items) >= self._max_batch_size:
+            self._dispatch(key)
+        elif len(items) == 1:
+            self._timers[key] = loop.call_later(self._max_wait, self._dispatch, key)
+
+        return await item.future
+
+    def _dispatch(self, key: BatchKey) -> None:
+        """Send the pending batch for a key."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        items = self._pending.pop(key, [])
+        if not items:
+            return
+
+        self._stats["batches"] += 1
+        if len(items) > 1:
+            self._stats["batched_items"] += len(items)
+
+        task = asyncio.ensure_future(self._run(key, items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: BatchKey, items: list[BatchItem]) -> None:
+        """Send a batch, failing any items it did not resolve."""
+        try:
+            await self._send(key, items)
+        except Exception as e:
+            self._log.warning("Batch failed", items=len(items), error=str(e))
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+        else:
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(RuntimeError("Batch item was not answered"))
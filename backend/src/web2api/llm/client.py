@@ -3,7 +3,7 @@ Async HTTP client for OpenAI-compatible LLM APIs.
 
 Provides:
 - Async httpx-based HTTP client
-- Rate limiting with token bucket algorithm
+- Rate limiting with a reservation-based token bucket
 - Retry logic with exponential backoff
 - Support for OpenAI, Azure, and custom endpoints
 """
@@ -86,75 +86,135 @@ class ChatCompletion:
 
 
 class TokenBucket:
-    """Token bucket rate limiter for API calls."""
+    """
+    Reservation-based token bucket rate limiter for API calls.
+
+    Each caller reserves one request and its estimated tokens up front,
+    letting the buckets go into debt, and then sleeps only for its own
+    computed wait. No lock is held while waiting, so callers never queue
+    behind another caller's sleep, and the concurrency slot is only taken
+    once the reservation is due. Reported usage settles the estimate in
+    both directions.
+    """
 
     def __init__(self, config: RateLimitConfig) -> None:
         self._requests_per_minute = config.requests_per_minute
         self._tokens_per_minute = config.tokens_per_minute
         self._max_concurrent = config.concurrent_requests
 
-        # Request rate limiting
+        # Bucket levels (negative while reservations are outstanding)
         self._request_tokens = float(config.requests_per_minute)
-        self._request_last_update = time.monotonic()
-
-        # Token rate limiting
         self._token_tokens = float(config.tokens_per_minute)
-        self._token_last_update = time.monotonic()
+        self._last_update = time.monotonic()
 
         # Concurrency limiting
         self._semaphore = asyncio.Semaphore(config.concurrent_requests)
-        self._lock = asyncio.Lock()
+        self._waiting = 0
+        self._active = 0
+
+        self._stats = {
+            "acquired": 0,
+            "delayed": 0,
+            "cancelled": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "credited_tokens": 0,
+            "debited_tokens": 0,
+        }
 
-    async def acquire(self, estimated_tokens: int = 1000) -> None:
-        """Acquire permission to make a request."""
-        await self._semaphore.acquire()
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Get bucket occupancy and queue wait metrics."""
+        self._refill(time.monotonic())
+        acquired = self._stats["acquired"]
+        return {
+            **self._stats,
+            "request_tokens": self._request_tokens,
+            "token_tokens": self._token_tokens,
+            "request_occupancy": 1 - self._request_tokens / self._requests_per_minute,
+            "token_occupancy": 1 - self._token_tokens / self._tokens_per_minute,
+            "waiting": self._waiting,
+            "active": self._active,
+            "avg_wait_seconds": self._stats["total_wait_seconds"] / acquired if acquired else 0.0,
+        }
 
-        async with self._lock:
-            now = time.monotonic()
+    def _refill(self, now: float) -> None:
+        """Add the budget accrued since the last update."""
+        elapsed = now - self._last_update
+        self._request_tokens = min(
+            self._requests_per_minute,
+            self._request_tokens + elapsed * (self._requests_per_minute / 60),
+        )
+        self._token_tokens = min(
+            self._tokens_per_minute,
+            self._token_tokens + elapsed * (self._tokens_per_minute / 60),
+        )
+        self._last_update = now
 
-            # Refill request bucket
-            elapsed = now - self._request_last_update
-            self._request_tokens = min(
-                self._requests_per_minute,
-                self._request_tokens + elapsed * (self._requests_per_minute / 60),
-            )
-            self._request_last_update = now
+    def reserve(self, estimated_tokens: int = 1000) -> float:
+        """
+        Reserve budget for one request.
 
-            # Refill token bucket
-            elapsed = now - self._token_last_update
-            self._token_tokens = min(
-                self._tokens_per_minute,
-                self._token_tokens + elapsed * (self._tokens_per_minute / 60),
-            )
-            self._token_last_update = now
+        Returns:
+            Seconds until the reservation is covered by the buckets
+        """
+        self._refill(time.monotonic())
 
-            # Wait if not enough request tokens
-            if self._request_tokens < 1:
-                wait_time = (1 - self._request_tokens) / (self._requests_per_minute / 60)
-                await asyncio.sleep(wait_time)
-                self._request_tokens = 1
+        self._request_tokens -= 1
+        self._token_tokens -= estimated_tokens
 
-            # Wait if not enough token budget
-            if self._token_tokens < estimated_tokens:
-                wait_time = (estimated_tokens - self._token_tokens) / (
-                    self._tokens_per_minute / 60
-                )
-                await asyncio.sleep(wait_time)
-                self._token_tokens = estimated_tokens
+        return max(
+            0.0,
+            -self._request_tokens / (self._requests_per_minute / 60),
+            -self._token_tokens / (self._tokens_per_minute / 60),
+        )
+
+    def _refund(self, estimated_tokens: int) -> None:
+        """Return an unused reservation to the buckets."""
+        self._refill(time.monotonic())
+        self._request_tokens = min(self._requests_per_minute, self._request_tokens + 1)
+        self._token_tokens = min(self._tokens_per_minute, self._token_tokens + estimated_tokens)
+
+    async def acquire(self, estimated_tokens: int = 1000) -> None:
+        """Acquire permission to make a request."""
+        start = time.monotonic()
+        wait_time = self.reserve(estimated_tokens)
 
-            # Consume tokens
-            self._request_tokens -= 1
-            self._token_tokens -= estimated_tokens
+        self._waiting += 1
+        try:
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+            await self._semaphore.acquire()
+        except asyncio.CancelledError:
+            self._refund(estimated_tokens)
+            self._stats["cancelled"] += 1
+            raise
+        finally:
+            self._waiting -= 1
+
+        self._active += 1
+        waited = time.monotonic() - start
+        self._stats["acquired"] += 1
+        self._stats["total_wait_seconds"] += waited
+        self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+        if wait_time > 0:
+            self._stats["delayed"] += 1
 
     def release(self) -> None:
         """Release the semaphore after request completes."""
+        self._active -= 1
         self._semaphore.release()
 
     def report_usage(self, actual_tokens: int, estimated_tokens: int) -> None:
-        """Report actual token usage to adjust the budget."""
-        # If we underestimated, deduct the difference
-        if actual_tokens > estimated_tokens:
-            self._token_tokens -= actual_tokens - estimated_tokens
+        """Report actual token usage, settling the difference to the estimate."""
+        self._refill(time.monotonic())
+        difference = estimated_tokens - actual_tokens
+        self._token_tokens = min(self._tokens_per_minute, self._token_tokens + difference)
+
+        if difference > 0:
+            self._stats["credited_tokens"] += difference
+        else:
+            self._stats["debited_tokens"] -= difference
 
 
 class LLMClient:
@@ -189,6 +249,11 @@ class LLMClient:
             timeout=httpx.Timeout(endpoint.timeout_ms / 1000),
         )
 
+    @property
+    def rate_limit_statistics(self) -> dict[str, Any]:
+        """Get rate limiter occupancy and wait metrics."""
+        return self._rate_limiter.statistics
+
     async def close(self) -> None:
         """Close the HTTP client if we own it."""
         if self._owns_client:
@@ -200,15 +265,19 @@ class LLMClient:
     async def __aexit__(self, *args: object) -> None:
         await self.close()
 
-    def _build_url(self) -> str:
-        """Build the chat completions URL based on provider."""
+    def _build_url(
+        self,
+        operation: str = "chat/completions",
+        deployment: str | None = None,
+    ) -> str:
+        """Build the URL of an API operation based on provider."""
         if self._endpoint.provider == LLMProvider.AZURE:
             return (
                 f"{self._endpoint.base_url}/openai/deployments/"
-                f"{self._endpoint.azure_deployment}/chat/completions"
+                f"{deployment or self._endpoint.azure_deployment}/{operation}"
                 f"?api-version={self._endpoint.azure_api_version}"
             )
-        return f"{self._endpoint.base_url}/chat/completions"
+        return f"{self._endpoint.base_url}/{operation}"
 
     def _build_headers(self) -> dict[str, str]:
         """Build request headers based on provider."""
@@ -442,6 +511,47 @@ class LLMClient:
 
         return result
 
+    async def embed(self, texts: list[str], model: str) -> list[list[float]]:
+        """
+        Get embedding vectors for texts.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model (deployment name on Azure)
+
+        Returns:
+            One embedding per text, in order
+
+        Raises:
+            LLMClientError: On API errors
+        """
+        body: dict[str, Any] = {"input": texts}
+        if self._endpoint.provider != LLMProvider.AZURE:
+            body["model"] = model
+        estimated_tokens = max(1, sum(len(t) for t in texts) // 4)
+
+        await self._rate_limiter.acquire(estimated_tokens)
+        try:
+            response = await self._client.post(
+                self._build_url("embeddings", deployment=model),
+                json=body,
+                headers=self._build_headers(),
+            )
+        except httpx.HTTPError as e:
+            raise LLMClientError(f"Embedding request failed: {e}") from e
+        finally:
+            self._rate_limiter.release()
+
+        if response.status_code != 200:
+            raise LLMAPIError(
+                f"API error: {response.status_code}",
+                status_code=response.status_code,
+                response_body={"error": response.text},
+            )
+
+        data = sorted(response.json().get("data", []), key=lambda d: d.get("index", 0))
+        return [item["embedding"] for item in data]
+
     async def complete(
         self,
         prompt: str,
@@ -66,6 +66,76 @@ class RateLimitConfig(BaseModel):
     concurrent_requests: int = Field(default=5, ge=1, le=100)
 
 
+class ResponseCacheConfig(BaseModel):
+    """Configuration for caching LLM responses to repeated prompts."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    enabled: bool = Field(
+        default=False,
+        description=(
+            "Whether completions are cached and reused (sampled completions, "
+            "temperature > 0, are replayed as well)"
+        ),
+    )
+    ttl_seconds: float = Field(
+        default=7 * 24 * 3600,
+        gt=0,
+        description="Lifetime of a cached response",
+    )
+    max_entries: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum number of cached responses (least recently used evicted)",
+    )
+    path: Path | None = Field(
+        default=None,
+        description="SQLite file that persists the cache across runs (None = memory only)",
+    )
+    similarity_threshold: float | None = Field(
+        default=None,
+        gt=0.0,
+        le=1.0,
+        description="Cosine similarity for reusing near-duplicate prompts (None = exact only)",
+    )
+    embedding_model: str = Field(
+        default="text-embedding-3-small",
+        description="Embedding model used for near-duplicate lookup",
+    )
+
+
+class BatchingConfig(BaseModel):
+    """Configuration for coalescing and micro-batching concurrent prompts."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    enabled: bool = Field(
+        default=False,
+        description=(
+            "Whether concurrent prompts of one type are merged into batches "
+            "(each prompt then waits up to max_wait_ms for others)"
+        ),
+    )
+    max_batch_size: int = Field(
+        default=8,
+        ge=1,
+        le=50,
+        description="Maximum prompts merged into one request",
+    )
+    max_wait_ms: float = Field(
+        default=20.0,
+        ge=0.0,
+        le=1000.0,
+        description="Maximum time a prompt waits for others to batch with",
+    )
+    max_batch_tokens: int = Field(
+        default=4096,
+        ge=256,
+        le=128000,
+        description="Output token cap of a batched request",
+    )
+
+
 class LLMEndpointConfig(BaseModel):
     """Configuration for an LLM API endpoint."""
 
@@ -199,6 +269,18 @@ class LLMConfig(BaseModel):
         description="LLM configuration for chaos/generative testing",
     )
 
+    # Response caching
+    response_cache: ResponseCacheConfig = Field(
+        default_factory=ResponseCacheConfig,
+        description="Cache of responses to repeated prompts",
+    )
+
+    # Request batching
+    batching: BatchingConfig = Field(
+        default_factory=BatchingConfig,
+        description="Coalescing and micro-batching of concurrent prompts",
+    )
+
     def is_tool_enabled(self, tool: ToolName) -> bool:
         """Check if LLM is enabled for a specific tool."""
         if not self.enabled:
@@ -279,6 +361,10 @@ class LLMSettings(BaseSettings):
     self_healing_enabled: bool = False
     chaos_agents_enabled: bool = False
 
+    # Response cache
+    response_cache_enabled: bool = False
+    response_cache_path: Path | None = None
+
     # Config file path
     config_file: Path | None = None
 
@@ -336,6 +422,12 @@ class LLMSettings(BaseSettings):
             chaos_agents=build_tool_config(
                 "chaos_agents", self.chaos_agents_enabled
             ),
+            response_cache=ResponseCacheConfig(**{
+                "enabled": self.response_cache_enabled,
+                "path": self.response_cache_path,
+                **file_config.get("response_cache", {}),
+            }),
+            batching=BatchingConfig(**file_config.get("batching", {})),
         )
 
 
@@ -421,4 +513,6 @@ def _build_config_from_dict(data: dict[str, Any]) -> LLMConfig:
         assertions=parse_tool_config(data.get("assertions")),
         self_healing=parse_tool_config(data.get("self_healing")),
         chaos_agents=parse_tool_config(data.get("chaos_agents")),
+        response_cache=ResponseCacheConfig(**data.get("response_cache", {})),
+        batching=BatchingConfig(**data.get("batching", {})),
     )
@@ -0,0 +1,412 @@
+"""
+Cache of LLM responses to repeated prompts.
+
+Building tests for similar pages sends nearly identical prompts over and
+over. Responses are cached by prompt type, prompt templates, rendered prompt,
+normalised prompt variables, model, temperature and max tokens:
+- Exact lookup by a hash of the normalised request
+- Optional near-duplicate lookup by embedding similarity, within requests
+  that differ only in their variables
+- TTL expiry and a least-recently-used size budget
+- Optional SQLite persistence, so rebuilding an unchanged site reuses the
+  previous run's responses
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import structlog
+
+if TYPE_CHECKING:
+    from web2api.llm.config import ResponseCacheConfig
+
+logger = structlog.get_logger(__name__)
+
+# SQLite rows are pruned to the TTL and size budget every this many stores
+PRUNE_INTERVAL = 64
+
+
+def normalize_variables(value: Any) -> Any:
+    """Normalise prompt variables so insignificant differences share a key."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {str(k): normalize_variables(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [normalize_variables(v) for v in value]
+    return value
+
+
+def _unit(embedding: Any) -> np.ndarray:
+    """Embedding as a unit-length float32 vector."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+
+@dataclass
+class CachedResponse:
+    """A cached completion."""
+
+    content: str
+    """Completion text."""
+
+    tokens_used: int = 0
+    """Tokens spent producing the response originally."""
+
+    partition: str = ""
+    """Hash of everything in the request except its variables."""
+
+    created_at: float = field(default_factory=time.time)
+    """Unix timestamp when the response was cached."""
+
+    embedding: np.ndarray | None = None
+    """Unit embedding of the prompt, for near-duplicate lookup."""
+
+
+class ResponseCache:
+    """
+    TTL- and size-bounded cache of LLM responses.
+
+    Features:
+    - Entries expire after ``ttl_seconds``
+    - Least recently used entries are evicted past ``max_entries``
+    - Near-duplicate lookup by cosine similarity of prompt embeddings
+    - Optional SQLite file shared across runs and processes
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_entries: int = 10000,
+        path: str | Path | None = None,
+    ) -> None:
+        """
+        Initialize response cache.
+
+        Args:
+            ttl_seconds: Lifetime of a cached response
+            max_entries: Maximum number of cached responses
+            path: SQLite file for persistence (None keeps the cache in memory)
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._log = logger.bind(component="response_cache")
+
+        self._stats = {
+            "hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "expired": 0,
+            "evictions": 0,
+            "tokens_saved": 0,
+        }
+
+        if path is not None:
+            self._open(Path(path))
+
+    @classmethod
+    def from_config(cls, config: ResponseCacheConfig) -> ResponseCache:
+        """Create a cache from its configuration."""
+        return cls(
+            ttl_seconds=config.ttl_seconds,
+            max_entries=config.max_entries,
+            path=config.path,
+        )
+
+    def _open(self, path: Path) -> None:
+        """Open (and create if needed) the SQLite backend."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                partition TEXT NOT NULL,
+                content TEXT NOT NULL,
+                tokens_used INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                embedding BLOB
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS llm_responses_partition ON llm_responses (partition)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS llm_responses_last_used ON llm_responses (last_used)"
+        )
+        self._prune()
+        self._log.info("Opened response cache", path=str(path))
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        ``misses`` counts exact-key misses; ``semantic_hits`` are the misses
+        then answered by a near-duplicate, so both count towards the hit rate.
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        hits = self._stats["hits"] + self._stats["semantic_hits"]
+        return {
+            **self._stats,
+            "size": self._size(),
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    @staticmethod
+    def make_key(
+        prompt_type: str,
+        variables: dict[str, Any],
+        system_prompt: str,
+        user_prompt: str,
+        user_template: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str, str]:
+        """
+        Build the cache key of a request.
+
+        Args:
+            prompt_type: Prompt type
+            variables: Variables the user prompt was rendered with
+            system_prompt: System prompt sent
+            user_prompt: Rendered user prompt sent
+            user_template: Template the user prompt was rendered from, so
+                edited templates get a new partition
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Output budget
+
+        Returns:
+            Tuple of (exact key, partition for near-duplicate lookup)
+        """
+        request = {
+            "prompt_type": str(prompt_type),
+            "system_prompt": " ".join(system_prompt.split()),
+            "user_template": user_template,
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        partition = hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+        request["user_prompt"] = " ".join(user_prompt.split())
+        request["variables"] = normalize_variables(variables)
+        key = hashlib.sha256(
+            json.dumps(request, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return key, partition[:32]
+
+    def _expired(self, created_at: float) -> bool:
+        return time.time() - created_at > self._ttl
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Get a cached response by exact key.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry.created_at):
+                del self._entries[key]
+                self._stats["expired"] += 1
+                entry = None
+
+            if entry is None and self._conn is not None:
+                entry = self._load(key)
+
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            self._remember(key, entry)
+            self._stats["hits"] += 1
+            self._stats["tokens_saved"] += entry.tokens_used
+            return entry
+
+    def find_similar(
+        self,
+        partition: str,
+        embedding: Any,
+        threshold: float,
+    ) -> CachedResponse | None:
+        """
+        Get the cached response to the most similar prompt in a partition.
+
+        Args:
+            partition: Partition from ``make_key``
+            embedding: Embedding of the prompt being looked up
+            threshold: Minimum cosine similarity for a hit
+
+        Returns:
+            Cached response, or None if no prompt is similar enough
+        """
+        query = _unit(embedding)
+
+        with self._lock:
+            if self._conn is not None:
+                rows = self._conn.execute(
+                    "SELECT key, embedding FROM llm_responses "
+                    "WHERE partition = ? AND embedding IS NOT NULL AND created_at >= ?",
+                    (partition, time.time() - self._ttl),
+                ).fetchall()
+                candidates = [(row[0], np.frombuffer(row[1], dtype=np.float32)) for row in rows]
+            else:
+                candidates = [
+                    (key, entry.embedding)
+                    for key, entry in self._entries.items()
+                    if entry.partition == partition
+                    and entry.embedding is not None
+                    and not self._expired(entry.created_at)
+                ]
+
+            # Embeddings of another dimension come from another model
+            candidates = [(k, v) for k, v in candidates if v.shape == query.shape]
+            if not candidates:
+                return None
+
+            keys = [key for key, _ in candidates]
+            similarities = np.stack([vector for _, vector in candidates]) @ query
+            best = int(np.argmax(similarities))
+            if float(similarities[best]) < threshold:
+                return None
+
+            key = keys[best]
+            entry = self._entries.get(key)
+            if entry is None and self._conn is not None:
+                entry = self._load(key)
+            if entry is None:
+                return None
+
+            self._remember(key, entry)
+            self._stats["semantic_hits"] += 1
+            self._stats["tokens_saved"] += entry.tokens_used
+            return entry
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: Key from ``make_key``
+            response: Response to cache
+        """
+        if response.embedding is not None:
+            response.embedding = _unit(response.embedding)
+
+        with self._lock:
+            self._remember(key, response)
+            self._stats["stores"] += 1
+
+            if self._conn is not None:
+                embedding = response.embedding.tobytes() if response.embedding is not None else None
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses "
+                    "(key, partition, content, tokens_used, created_at, last_used, embedding) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        response.partition,
+                        response.content,
+                        response.tokens_used,
+                        response.created_at,
+                        time.time(),
+                        embedding,
+                    ),
+                )
+                if self._stats["stores"] % PRUNE_INTERVAL == 0:
+                    self._prune()
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        """Put an entry in the in-memory LRU (caller holds the lock)."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            if self._conn is None:
+                self._stats["evictions"] += 1
+
+    def _load(self, key: str) -> CachedResponse | None:
+        """Load an entry from SQLite, dropping it if expired (caller holds the lock)."""
+        assert self._conn is not None
+        row = self._conn.execute(
+            "SELECT partition, content, tokens_used, created_at, embedding "
+            "FROM llm_responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        partition, content, tokens_used, created_at, embedding = row
+        if self._expired(created_at):
+            self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+            self._stats["expired"] += 1
+            return None
+
+        self._conn.execute(
+            "UPDATE llm_responses SET last_used = ? WHERE key = ?", (time.time(), key)
+        )
+        return CachedResponse(
+            content=content,
+            tokens_used=tokens_used,
+            partition=partition,
+            created_at=created_at,
+            embedding=np.frombuffer(embedding, dtype=np.float32) if embedding else None,
+        )
+
+    def _prune(self) -> None:
+        """Drop expired rows and least recently used rows over budget."""
+        assert self._conn is not None
+        expired = self._conn.execute(
+            "DELETE FROM llm_responses WHERE created_at < ?", (time.time() - self._ttl,)
+        ).rowcount
+        evicted = self._conn.execute(
+            "DELETE FROM llm_responses WHERE key IN ("
+            "SELECT key FROM llm_responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self._max_entries,),
+        ).rowcount
+        self._stats["expired"] += max(expired, 0)
+        self._stats["evictions"] += max(evicted, 0)
+
+    def _size(self) -> int:
+        if self._conn is not None:
+            with self._lock:
+                return int(self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0])
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_responses")
+
+    def close(self) -> None:
+        """Close the SQLite backend, if any."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -7,12 +7,22 @@ with clean fallback behavior when LLM is disabled.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import structlog
 
+from web2api.llm.batching import (
+    BATCH_INSTRUCTIONS,
+    BatchItem,
+    BatchKey,
+    MicroBatcher,
+    format_batch_prompt,
+    split_batch_response,
+)
 from web2api.llm.client import (
     ChatMessage,
     LLMClient,
@@ -27,9 +37,10 @@ from web2api.llm.prompts import (
     get_prompt,
     get_prompt_config,
 )
+from web2api.llm.response_cache import CachedResponse, ResponseCache
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Awaitable
 
 logger = structlog.get_logger(__name__)
 
@@ -44,6 +55,7 @@ class LLMResult:
     error: str | None = None
     tokens_used: int = 0
     fallback_used: bool = False
+    cached: bool = False
 
 
 class LLMServiceError(Exception):
@@ -60,11 +72,40 @@ class LLMService:
     when LLM is disabled or fails.
     """
 
-    def __init__(self, config: LLMConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: LLMConfig | None = None,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
+        """
+        Initialize LLM service.
+
+        Args:
+            config: LLM configuration (default: loaded from file/environment)
+            response_cache: Cache of responses to repeated prompts (default:
+                built from ``config.response_cache`` when enabled)
+        """
         self._config = config or load_llm_config()
         self._log = logger.bind(component="llm_service")
         self._clients: dict[ToolName, LLMClient] = {}
 
+        cache_config = self._config.response_cache
+        if response_cache is None and cache_config.enabled:
+            response_cache = ResponseCache.from_config(cache_config)
+        self._response_cache = response_cache
+
+        # Identical prompts in flight (request task, waiting callers), and
+        # micro-batching of concurrent ones
+        self._in_flight: dict[tuple[Any, ...], asyncio.Task[tuple[str, int]]] = {}
+        self._in_flight_waiters: dict[tuple[Any, ...], int] = {}
+        batching = self._config.batching
+        self._batcher = (
+            MicroBatcher(self._send_batch, batching.max_batch_size, batching.max_wait_ms)
+            if batching.enabled
+            else None
+        )
+        self._batch_stats = {"coalesced": 0, "split_fallbacks": 0, "batch_fallbacks": 0}
+
     @property
     def config(self) -> LLMConfig:
         """Get the current LLM configuration."""
@@ -115,47 +156,66 @@ class LLMService:
             if custom_system_prompt:
                 system_prompt = custom_system_prompt
 
-            # Execute the request
-            messages = [
-                ChatMessage(role="system", content=system_prompt),
-                ChatMessage(role="user", content=user_prompt),
-            ]
+            temperature = self._config.get_effective_temperature(tool)
+            max_tokens = prompt_config.get("max_tokens", 512)
+
+            # Reuse the response to an identical (or near-identical) prompt
+            cache_key: str | None = None
+            partition = ""
+            embedding: list[float] | None = None
+            if self._response_cache is not None:
+                cache_key, partition = self._response_cache.make_key(
+                    prompt_type,
+                    variables,
+                    system_prompt,
+                    user_prompt,
+                    get_prompt(prompt_type).user_prompt_template,
+                    self._config.get_effective_endpoint(tool).model,
+                    temperature,
+                    max_tokens,
+                )
+                cached = self._response_cache.get(cache_key)
+
+                threshold = self._config.response_cache.similarity_threshold
+                if cached is None and threshold is not None:
+                    embedding = await self._embed_prompt(client, user_prompt)
+                    if embedding is not None:
+                        cached = self._response_cache.find_similar(partition, embedding, threshold)
+
+                if cached is not None:
+                    return self._build_result(prompt_config, cached.content, cached=True)
 
-            result = await client.chat(
-                messages,
-                temperature=self._config.get_effective_temperature(tool),
-                max_tokens=prompt_config.get("max_tokens", 512),
+            # Execute the request
+            content, tokens_used = await self._complete(
+                tool,
+                client,
+                prompt_type,
+                system_prompt,
+                user_prompt,
+                temperature,
+                max_tokens,
             )
 
-            # Parse JSON if expected
-            parsed_data = None
-            if prompt_config.get("expected_format") == "json":
-                try:
-                    # Handle potential markdown code blocks
-                    content = result.content.strip()
-                    if content.startswith("```"):
-                        # Remove code block markers
-                        lines = content.split("\n")
-                        if lines[0].startswith("```"):
-                            lines = lines[1:]
-                        if lines and lines[-1].strip() == "```":
-                            lines = lines[:-1]
-                        content = "\n".join(lines)
-
-                    parsed_data = json.loads(content)
-                except json.JSONDecodeError as e:
-                    self._log.warning(
-                        "Failed to parse JSON response",
-                        error=str(e),
-                        content=result.content[:200],
-                    )
-
-            return LLMResult(
-                success=True,
-                content=result.content,
-                parsed_data=parsed_data,
-                tokens_used=result.usage.get("total_tokens", 0),
-            )
+            llm_result = self._build_result(prompt_config, content, tokens_used=tokens_used)
+
+            # Only cache responses that parsed as expected
+            expects_json = prompt_config.get("expected_format") == "json"
+            if (
+                self._response_cache is not None
+                and cache_key is not None
+                and (llm_result.parsed_data is not None or not expects_json)
+            ):
+                self._response_cache.put(
+                    cache_key,
+                    CachedResponse(
+                        content=content,
+                        tokens_used=llm_result.tokens_used,
+                        partition=partition,
+                        embedding=np.asarray(embedding) if embedding is not None else None,
+                    ),
+                )
+
+            return llm_result
 
         except LLMClientError as e:
             self._log.error(
@@ -171,6 +231,218 @@ class LLMService:
                 fallback_used=True,
             )
 
+    async def _complete(
+        self,
+        tool: ToolName,
+        client: LLMClient,
+        prompt_type: PromptType,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str, int]:
+        """
+        Get a completion, coalescing identical in-flight prompts.
+
+        Prompts are sent through the micro-batcher when batching is enabled,
+        so concurrent prompts of the same type share one request.
+
+        Returns:
+            Tuple of (content, tokens used)
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), tool, system_prompt, user_prompt, temperature, max_tokens)
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._request(
+                    tool, client, prompt_type, system_prompt, user_prompt, temperature, max_tokens
+                )
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self._batch_stats["coalesced"] += 1
+
+        # The request runs as its own task, so a cancelled caller only stops
+        # waiting; the request is cancelled once no caller is left waiting
+        self._in_flight_waiters[key] = self._in_flight_waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._in_flight_waiters[key] -= 1
+            if not self._in_flight_waiters[key]:
+                del self._in_flight_waiters[key]
+                if not task.done():
+                    task.cancel()
+
+    async def _request(
+        self,
+        tool: ToolName,
+        client: LLMClient,
+        prompt_type: PromptType,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str, int]:
+        """Send a prompt, through the micro-batcher when batching is enabled."""
+        if self._batcher is not None:
+            loop = asyncio.get_running_loop()
+            batch_key = BatchKey(id(loop), tool, prompt_type, system_prompt, temperature)
+            return await self._batcher.submit(batch_key, user_prompt, max_tokens)
+        return await self._chat(client, system_prompt, user_prompt, temperature, max_tokens)
+
+    @staticmethod
+    async def _chat(
+        client: LLMClient,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str, int]:
+        """Send one prompt, returning (content, tokens used)."""
+        result = await client.chat(
+            [
+                ChatMessage(role="system", content=system_prompt),
+                ChatMessage(role="user", content=user_prompt),
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return result.content, result.usage.get("total_tokens", 0)
+
+    async def _send_batch(self, key: BatchKey, items: list[BatchItem]) -> None:
+        """Send a micro-batch as one multi-item prompt and resolve its items."""
+        client = self._clients[key.tool]
+
+        def resolve(item: BatchItem, result: tuple[str, int] | BaseException) -> None:
+            if item.future.done():
+                return
+            if isinstance(result, BaseException):
+                item.future.set_exception(result)
+            else:
+                item.future.set_result(result)
+
+        def send_one(item: BatchItem) -> Awaitable[tuple[str, int]]:
+            return self._chat(
+                client, key.system_prompt, item.user_prompt, key.temperature, item.max_tokens
+            )
+
+        if len(items) == 1:
+            resolve(items[0], await send_one(items[0]))
+            return
+
+        try:
+            completion = await client.chat(
+                [
+                    ChatMessage(role="system", content=key.system_prompt + BATCH_INSTRUCTIONS),
+                    ChatMessage(
+                        role="user",
+                        content=format_batch_prompt([item.user_prompt for item in items]),
+                    ),
+                ],
+                temperature=key.temperature,
+                max_tokens=min(
+                    sum(item.max_tokens for item in items),
+                    self._config.batching.max_batch_tokens,
+                ),
+            )
+        except LLMClientError as e:
+            # One failed request must not fail every prompt batched into it
+            self._batch_stats["batch_fallbacks"] += 1
+            self._log.warning(
+                "Batched request failed, retrying items individually",
+                prompt_type=key.prompt_type,
+                batch_size=len(items),
+                error=str(e),
+            )
+            results = await asyncio.gather(
+                *(send_one(item) for item in items),
+                return_exceptions=True,
+            )
+            for item, result in zip(items, results, strict=True):
+                resolve(item, result)
+            return
+
+        expects_json = get_prompt_config(key.prompt_type).get("expected_format") == "json"
+        answers = split_batch_response(completion.content, len(items), expects_json)
+        tokens_per_item = completion.usage.get("total_tokens", 0) // len(items)
+
+        missing: list[BatchItem] = []
+        for item, answer in zip(items, answers, strict=True):
+            if answer is None:
+                missing.append(item)
+            else:
+                resolve(item, (answer, tokens_per_item))
+
+        if missing:
+            # Items the batched answer did not cover are asked individually
+            self._batch_stats["split_fallbacks"] += len(missing)
+            self._log.warning(
+                "Batched response incomplete, retrying items individually",
+                prompt_type=key.prompt_type,
+                missing=len(missing),
+                batch_size=len(items),
+            )
+            results = await asyncio.gather(
+                *(send_one(item) for item in missing),
+                return_exceptions=True,
+            )
+            for item, result in zip(missing, results, strict=True):
+                resolve(item, result)
+
+    def _build_result(
+        self,
+        prompt_config: dict[str, Any],
+        content: str,
+        tokens_used: int = 0,
+        cached: bool = False,
+    ) -> LLMResult:
+        """Build the result of a completion, parsing JSON if expected."""
+        parsed_data = None
+        if prompt_config.get("expected_format") == "json":
+            try:
+                # Handle potential markdown code blocks
+                text = content.strip()
+                if text.startswith("```"):
+                    # Remove code block markers
+                    lines = text.split("\n")
+                    if lines[0].startswith("```"):
+                        lines = lines[1:]
+                    if lines and lines[-1].strip() == "```":
+                        lines = lines[:-1]
+                    text = "\n".join(lines)
+
+                parsed_data = json.loads(text)
+            except json.JSONDecodeError as e:
+                self._log.warning(
+                    "Failed to parse JSON response",
+                    error=str(e),
+                    content=content[:200],
+                )
+
+        return LLMResult(
+            success=True,
+            content=content,
+            parsed_data=parsed_data,
+            tokens_used=tokens_used,
+            cached=cached,
+        )
+
+    async def _embed_prompt(self, client: LLMClient, prompt: str) -> list[float] | None:
+        """Embed a prompt for near-duplicate cache lookup (None on failure)."""
+        try:
+            embeddings = await client.embed(
+                [" ".join(prompt.split())],
+                model=self._config.response_cache.embedding_model,
+            )
+        except LLMClientError as e:
+            self._log.warning("Prompt embedding failed", error=str(e))
+            return None
+        return embeddings[0] if embeddings else None
+
     # =========================================================================
     # Test Builder Methods
     # =========================================================================
@@ -538,10 +810,25 @@ class LLMService:
     # Lifecycle Methods
     # =========================================================================
 
+    def batch_statistics(self) -> dict[str, Any]:
+        """Get request coalescing and micro-batching metrics."""
+        batcher_stats = self._batcher.statistics if self._batcher else {}
+        return {**batcher_stats, **self._batch_stats}
+
+    def cache_statistics(self) -> dict[str, Any]:
+        """Get response cache metrics (empty when caching is disabled)."""
+        return self._response_cache.statistics if self._response_cache else {}
+
+    def rate_limit_statistics(self) -> dict[ToolName, dict[str, Any]]:
+        """Get rate limiter metrics for each tool with an active client."""
+        return {tool: client.rate_limit_statistics for tool, client in self._clients.items()}
+
     async def close(self) -> None:
         """Close all LLM clients."""
         await LLMClientFactory.close_all()
         self._clients.clear()
+        if self._response_cache is not None:
+            self._response_cache.close()
 
 
 # =============================================================================
@@ -8,11 +8,19 @@ Executes tests using owl-browser with:
 - Screenshot/network log capture on failure
 """
 
+from web2api.runner.healing_store import (
+    HealingStore,
+    RedisHealingStore,
+    SQLiteHealingStore,
+    create_healing_store,
+    healing_namespace,
+)
 from web2api.runner.self_healing import (
     HealingResult,
     HealingStrategy,
     SelectorCandidate,
     SelectorHistory,
+    SelectorProbe,
     SelfHealingEngine,
 )
 from web2api.runner.test_runner import (
@@ -41,4 +49,11 @@ __all__ = [
     "HealingResult",
     "SelectorCandidate",
     "SelectorHistory",
+    "SelectorProbe",
+    # Shared healing store
+    "HealingStore",
+    "SQLiteHealingStore",
+    "RedisHealingStore",
+    "create_healing_store",
+    "healing_namespace",
 ]
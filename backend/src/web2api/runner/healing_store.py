@@ -0,0 +1,387 @@
+"""
+Shared selector-healing knowledge base.
+
+Lets every runner and worker process reuse selectors healed by any other
+one. Records are grouped into namespaces (target domain and test spec) and
+updated atomically, so concurrent heals of the same selector never lose
+each other's data.
+
+Backends:
+- SQLite file for a single host (several processes can share it)
+- Redis, the same instance the orchestrator schedules jobs on
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+import structlog
+
+from web2api.runner.self_healing import DEFAULT_HEALING_NAMESPACE, SelectorHistory
+
+logger = structlog.get_logger(__name__)
+
+
+def healing_namespace(url: str | None = None, spec_name: str | None = None) -> str:
+    """
+    Build a healing namespace from the target domain and test spec.
+
+    Args:
+        url: URL of the page under test
+        spec_name: Name of the test spec
+
+    Returns:
+        Namespace such as ``example.com/Login flow``
+    """
+    parts: list[str] = []
+    if url:
+        domain = urlparse(url).netloc.lower()
+        if domain:
+            parts.append(domain)
+    if spec_name:
+        parts.append(spec_name)
+    return "/".join(parts) or DEFAULT_HEALING_NAMESPACE
+
+
+class HealingStore(ABC):
+    """Storage backend for selector histories shared across engines."""
+
+    @abstractmethod
+    def get(self, namespace: str, original_selector: str) -> SelectorHistory | None:
+        """Get the history of a selector, or None if it was never healed."""
+
+    @abstractmethod
+    def record_heal(
+        self,
+        namespace: str,
+        original_selector: str,
+        healed_selector: str,
+        element_signature: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Atomically record a successful heal.
+
+        Sets the last working selector, appends the healed selector to the
+        history if new, and replaces the element signature when given.
+        """
+
+    @abstractmethod
+    def record_failure(self, namespace: str, original_selector: str) -> None:
+        """Atomically increment the failure count of a known selector."""
+
+    @abstractmethod
+    def record_signature(
+        self, namespace: str, selector: str, element_signature: dict[str, Any]
+    ) -> None:
+        """Store the element signature of a working selector."""
+
+    @abstractmethod
+    def histories(self, namespace: str | None = None) -> list[SelectorHistory]:
+        """All histories in a namespace, or in every namespace if None."""
+
+    def close(self) -> None:
+        """Release backend resources (stores without any need not override this)."""
+        return None
+
+
+class SQLiteHealingStore(HealingStore):
+    """
+    Healing store in a SQLite database file.
+
+    Uses WAL mode so readers never block the writer, and performs every
+    update as a single upsert statement, so processes sharing the file
+    stay consistent without explicit locking.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30.0) -> None:
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            path: Database file path
+            timeout: Seconds to wait for a write lock held by another process
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self._path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS selector_history (
+                namespace TEXT NOT NULL,
+                original_selector TEXT NOT NULL,
+                last_working_selector TEXT NOT NULL,
+                healed_selectors TEXT NOT NULL DEFAULT '[]',
+                failure_count INTEGER NOT NULL DEFAULT 0,
+                last_healed_at REAL,
+                element_signature TEXT,
+                PRIMARY KEY (namespace, original_selector)
+            )
+            """
+        )
+        self._log = logger.bind(component="healing_store", backend="sqlite")
+        self._log.info("Opened healing store", path=str(self._path))
+
+    @staticmethod
+    def _row_to_history(row: sqlite3.Row) -> SelectorHistory:
+        return SelectorHistory(
+            original_selector=row["original_selector"],
+            last_working_selector=row["last_working_selector"],
+            healed_selectors=json.loads(row["healed_selectors"]),
+            failure_count=row["failure_count"],
+            last_healed_at=row["last_healed_at"],
+            element_signature=(
+                json.loads(row["element_signature"]) if row["element_signature"] else None
+            ),
+        )
+
+    def get(self, namespace: str, original_selector: str) -> SelectorHistory | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM selector_history WHERE namespace = ? AND original_selector = ?",
+                (namespace, original_selector),
+            ).fetchone()
+        return self._row_to_history(row) if row else None
+
+    def record_heal(
+        self,
+        namespace: str,
+        original_selector: str,
+        healed_selector: str,
+        element_signature: dict[str, Any] | None = None,
+    ) -> None:
+        signature = json.dumps(element_signature) if element_signature else None
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO selector_history (
+                    namespace, original_selector, last_working_selector,
+                    healed_selectors, last_healed_at, element_signature
+                )
+                VALUES (?, ?, ?, json_array(?), ?, ?)
+                ON CONFLICT (namespace, original_selector) DO UPDATE SET
+                    last_working_selector = excluded.last_working_selector,
+                    healed_selectors = CASE
+                        WHEN EXISTS (
+                            SELECT 1 FROM json_each(selector_history.healed_selectors)
+                            WHERE value = excluded.last_working_selector
+                        ) THEN selector_history.healed_selectors
+                        ELSE json_insert(
+                            selector_history.healed_selectors, '$[#]',
+                            excluded.last_working_selector
+                        )
+                    END,
+                    last_healed_at = excluded.last_healed_at,
+                    element_signature = COALESCE(
+                        excluded.element_signature, selector_history.element_signature
+                    )
+                """,
+                (namespace, original_selector, healed_selector, healed_selector, time.time(), signature),
+            )
+
+    def record_failure(self, namespace: str, original_selector: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE selector_history SET failure_count = failure_count + 1
+                WHERE namespace = ? AND original_selector = ?
+                """,
+                (namespace, original_selector),
+            )
+
+    def record_signature(
+        self, namespace: str, selector: str, element_signature: dict[str, Any]
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO selector_history (
+                    namespace, original_selector, last_working_selector, element_signature
+                )
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (namespace, original_selector) DO UPDATE SET
+                    element_signature = excluded.element_signature
+                """,
+                (namespace, selector, selector, json.dumps(element_signature)),
+            )
+
+    def histories(self, namespace: str | None = None) -> list[SelectorHistory]:
+        with self._lock:
+            if namespace is None:
+                rows = self._conn.execute("SELECT * FROM selector_history").fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT * FROM selector_history WHERE namespace = ?", (namespace,)
+                ).fetchall()
+        return [self._row_to_history(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisHealingStore(HealingStore):
+    """
+    Healing store in Redis.
+
+    Each selector is a hash plus a sorted set of healed selectors (scored
+    by first-seen time, so insertion order survives deduplication). Heals
+    are written in a MULTI transaction and failure counts with a script
+    that only increments existing records.
+    """
+
+    KEY_PREFIX = "web2api:healing"
+
+    _INCREMENT_IF_EXISTS = """
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        return redis.call('HINCRBY', KEYS[1], 'failure_count', 1)
+    end
+    return 0
+    """
+
+    def __init__(self, url: str) -> None:
+        """
+        Connect to Redis.
+
+        Args:
+            url: Redis URL (e.g. ``redis://localhost:6379/0``)
+        """
+        from redis import Redis
+
+        self._url = url
+        self._client = Redis.from_url(url, encoding="utf-8", decode_responses=True)
+        self._increment_failure = self._client.register_script(self._INCREMENT_IF_EXISTS)
+        self._log = logger.bind(component="healing_store", backend="redis")
+        self._log.info("Connected to Redis", url=self._url)
+
+    def _namespaces_key(self) -> str:
+        return f"{self.KEY_PREFIX}:namespaces"
+
+    def _index_key(self, namespace: str) -> str:
+        return f"{self.KEY_PREFIX}:{namespace}:index"
+
+    def _selector_key(self, namespace: str, selector: str) -> str:
+        digest = hashlib.sha1(selector.encode()).hexdigest()
+        return f"{self.KEY_PREFIX}:{namespace}:selector:{digest}"
+
+    def _healed_key(self, namespace: str, selector: str) -> str:
+        digest = hashlib.sha1(selector.encode()).hexdigest()
+        return f"{self.KEY_PREFIX}:{namespace}:healed:{digest}"
+
+    @staticmethod
+    def _to_history(data: dict[str, str], healed: list[str]) -> SelectorHistory:
+        return SelectorHistory(
+            original_selector=data["original_selector"],
+            last_working_selector=data["last_working_selector"],
+            healed_selectors=healed,
+            failure_count=int(data.get("failure_count", 0)),
+            last_healed_at=float(data["last_healed_at"]) if data.get("last_healed_at") else None,
+            element_signature=(
+                json.loads(data["element_signature"]) if data.get("element_signature") else None
+            ),
+        )
+
+    def _fetch(self, namespace: str, selectors: list[str]) -> list[SelectorHistory]:
+        pipe = self._client.pipeline(transaction=False)
+        for selector in selectors:
+            pipe.hgetall(self._selector_key(namespace, selector))
+            pipe.zrange(self._healed_key(namespace, selector), 0, -1)
+        replies = pipe.execute()
+
+        histories: list[SelectorHistory] = []
+        for data, healed in zip(replies[::2], replies[1::2], strict=True):
+            if data:
+                histories.append(self._to_history(data, healed))
+        return histories
+
+    def get(self, namespace: str, original_selector: str) -> SelectorHistory | None:
+        histories = self._fetch(namespace, [original_selector])
+        return histories[0] if histories else None
+
+    def record_heal(
+        self,
+        namespace: str,
+        original_selector: str,
+        healed_selector: str,
+        element_signature: dict[str, Any] | None = None,
+    ) -> None:
+        now = time.time()
+        mapping: dict[str | bytes, str] = {
+            "original_selector": original_selector,
+            "last_working_selector": healed_selector,
+            "last_healed_at": str(now),
+        }
+        if element_signature:
+            mapping["element_signature"] = json.dumps(element_signature)
+
+        pipe = self._client.pipeline(transaction=True)
+        pipe.hset(self._selector_key(namespace, original_selector), mapping=mapping)
+        pipe.zadd(self._healed_key(namespace, original_selector), {healed_selector: now}, nx=True)
+        pipe.sadd(self._index_key(namespace), original_selector)
+        pipe.sadd(self._namespaces_key(), namespace)
+        pipe.execute()
+
+    def record_failure(self, namespace: str, original_selector: str) -> None:
+        self._increment_failure(keys=[self._selector_key(namespace, original_selector)])
+
+    def record_signature(
+        self, namespace: str, selector: str, element_signature: dict[str, Any]
+    ) -> None:
+        key = self._selector_key(namespace, selector)
+        pipe = self._client.pipeline(transaction=True)
+        pipe.hsetnx(key, "original_selector", selector)
+        pipe.hsetnx(key, "last_working_selector", selector)
+        pipe.hset(key, "element_signature", json.dumps(element_signature))
+        pipe.sadd(self._index_key(namespace), selector)
+        pipe.sadd(self._namespaces_key(), namespace)
+        pipe.execute()
+
+    def histories(self, namespace: str | None = None) -> list[SelectorHistory]:
+        namespaces = (
+            [namespace] if namespace is not None
+            else sorted(self._client.smembers(self._namespaces_key()))
+        )
+        histories: list[SelectorHistory] = []
+        for ns in namespaces:
+            selectors = sorted(self._client.smembers(self._index_key(ns)))
+            if selectors:
+                histories.extend(self._fetch(ns, selectors))
+        return histories
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def create_healing_store(url: str) -> HealingStore:
+    """
+    Create a healing store from a URL.
+
+    Args:
+        url: ``redis://``/``rediss://`` URL, ``sqlite:///path/to/file.db``,
+            or a plain file path for SQLite
+
+    Returns:
+        Healing store for the URL
+    """
+    scheme = urlparse(url).scheme
+    if scheme in ("redis", "rediss", "unix"):
+        return RedisHealingStore(url)
+    if scheme == "sqlite":
+        # sqlite:///relative.db or sqlite:////absolute/path.db
+        return SQLiteHealingStore(url.removeprefix("sqlite:///"))
+    return SQLiteHealingStore(url)
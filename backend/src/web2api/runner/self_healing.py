@@ -3,14 +3,18 @@ Self-healing test engine for automatic recovery from UI changes.
 
 Uses deterministic strategies (no AI/LLM dependency) to find alternative selectors.
 Strategies: text matching, fuzzy attributes, XPath fallbacks, DOM structure analysis.
+
+Candidates are probed in a single page script evaluation by default, so
+healing a step costs one browser round-trip instead of one per selector.
 """
 
 from __future__ import annotations
 
+import contextlib
 import json
 import re
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, is_dataclass
 from enum import StrEnum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -20,8 +24,13 @@ import structlog
 if TYPE_CHECKING:
     from owl_browser import BrowserContext
 
+    from web2api.runner.healing_store import HealingStore
+
 logger = structlog.get_logger(__name__)
 
+# Namespace used for shared-store records when the caller gives none
+DEFAULT_HEALING_NAMESPACE = "default"
+
 
 class HealingStrategy(StrEnum):
     """Strategies for healing broken selectors (deterministic, no AI)."""
@@ -50,6 +59,19 @@ class SelectorCandidate:
     bounding_box: dict[str, float] | None = None
 
 
+@dataclass
+class SelectorProbe:
+    """Result of probing a selector in the page."""
+
+    selector: str
+    count: int = 0
+    visible: bool = False
+    element_tag: str | None = None
+    element_text: str | None = None
+    bounding_box: dict[str, float] | None = None
+    error: str | None = None
+
+
 @dataclass
 class HealingResult:
     """Result of a healing attempt."""
@@ -92,28 +114,81 @@ class SelfHealingEngine:
     MIN_CONFIDENCE_THRESHOLD = 0.6
     MAX_CANDIDATES = 15
 
+    # Ranking bonuses applied to probed candidates in batched mode
+    UNIQUE_MATCH_BONUS = 0.05
+    SIGNATURE_MATCH_BONUS = 0.05
+
     def __init__(
         self,
         history_path: str | Path | None = None,
         min_confidence: float = 0.6,
         enable_learning: bool = True,
+        batch_probing: bool = True,
+        store: HealingStore | None = None,
     ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            history_path: JSON file for this engine's selector history
+            min_confidence: Minimum candidate confidence to accept
+            enable_learning: Record successful heals for later runs
+            batch_probing: Probe all candidates in one page evaluation
+            store: Shared healing store; replaces the history file so heals
+                are visible to every engine using the same store
+        """
         self._history_path = Path(history_path) if history_path else None
         self._min_confidence = min_confidence
         self._enable_learning = enable_learning
+        self._batch_probing = batch_probing
+        self._store = store
         self._selector_history: dict[str, SelectorHistory] = {}
         self._selector_cache: dict[str, str] = {}
+        self._probe_stats = {
+            "batched_probes": 0,
+            "selectors_probed": 0,
+            "single_probes": 0,
+            "pipelined_probes": 0,
+        }
         self._log = logger.bind(component="self_healing")
 
-        if self._history_path and self._history_path.exists():
+        if self._store is None and self._history_path and self._history_path.exists():
             self._load_history()
 
+    def _history_key(self, namespace: str | None, selector: str) -> str:
+        """
+        Key into the local history and cache.
+
+        Namespaces only partition shared-store records; without a store
+        keys stay plain selectors, matching the history file format.
+        """
+        if namespace is None or self._store is None:
+            return selector
+        return f"{namespace}::{selector}"
+
+    def _get_history(self, namespace: str | None, selector: str) -> SelectorHistory | None:
+        """Get selector history, reading through to the shared store if configured."""
+        key = self._history_key(namespace, selector)
+        if self._store is None:
+            return self._selector_history.get(key)
+
+        try:
+            history = self._store.get(namespace or DEFAULT_HEALING_NAMESPACE, selector)
+        except Exception as e:
+            self._log.warning("Failed to read healing store", error=str(e))
+            return self._selector_history.get(key)
+
+        if history is not None:
+            self._selector_history[key] = history
+        return history
+
     def heal_selector(
         self,
         page: BrowserContext,
         original_selector: str,
         action_context: str | None = None,
         element_description: str | None = None,
+        namespace: str | None = None,
     ) -> HealingResult:
         """
         Attempt to heal a broken selector using deterministic strategies.
@@ -123,6 +198,7 @@ class SelfHealingEngine:
             original_selector: The selector that failed
             action_context: Context about what action was being performed
             element_description: Text hint for the element (not AI-based)
+            namespace: Knowledge-base namespace (see ``healing_namespace``)
 
         Returns:
             HealingResult with success status and healed selector if found
@@ -132,119 +208,416 @@ class SelfHealingEngine:
             "Starting selector healing (deterministic)",
             original=original_selector,
             context=action_context,
+            namespace=namespace,
+            batched=self._batch_probing,
         )
 
-        # Strategy 1: Check cached successful selector
-        if original_selector in self._selector_cache:
-            cached = self._selector_cache[original_selector]
-            if self._try_selector(page, cached):
-                return HealingResult(
-                    success=True,
-                    original_selector=original_selector,
-                    healed_selector=cached,
-                    strategy_used=HealingStrategy.CACHED_HISTORY,
-                    confidence=0.98,
-                    healing_time_ms=int((time.monotonic() - start_time) * 1000),
-                )
+        history = self._get_history(namespace, original_selector)
+        candidates = self._collect_candidates(original_selector, element_description)
 
-        # Strategy 2: Check history for last working selector
-        history = self._selector_history.get(original_selector)
-        if history and history.last_working_selector != original_selector:
-            if self._try_selector(page, history.last_working_selector):
-                self._selector_cache[original_selector] = history.last_working_selector
-                return HealingResult(
-                    success=True,
-                    original_selector=original_selector,
-                    healed_selector=history.last_working_selector,
-                    strategy_used=HealingStrategy.DOM_STRUCTURE,
-                    confidence=0.95,
-                    healing_time_ms=int((time.monotonic() - start_time) * 1000),
-                )
+        if self._batch_probing:
+            result = self._heal_batched(page, original_selector, history, candidates, namespace)
+        else:
+            result = self._heal_sequential(page, original_selector, history, candidates, namespace)
 
+        result.healing_time_ms = int((time.monotonic() - start_time) * 1000)
+
+        if result.success:
+            self._log.info(
+                "Selector healed successfully",
+                original=original_selector,
+                healed=result.healed_selector,
+                strategy=result.strategy_used,
+                confidence=result.confidence,
+                time_ms=result.healing_time_ms,
+            )
+            return result
+
+        self._log.warning(
+            "Selector healing failed",
+            original=original_selector,
+            candidates_tried=result.candidates_evaluated,
+            time_ms=result.healing_time_ms,
+        )
+
+        if history:
+            history.failure_count += 1
+            if self._store is not None:
+                try:
+                    self._store.record_failure(
+                        namespace or DEFAULT_HEALING_NAMESPACE, original_selector
+                    )
+                except Exception as e:
+                    self._log.warning("Failed to update healing store", error=str(e))
+
+        return result
+
+    def _known_selectors(
+        self,
+        original_selector: str,
+        history: SelectorHistory | None,
+        namespace: str | None,
+    ) -> list[tuple[str, HealingStrategy, float]]:
+        """Previously working selectors, tried before any generated candidate."""
+        known: list[tuple[str, HealingStrategy, float]] = []
+
+        # Strategy 1: Cached successful selector
+        cached = self._selector_cache.get(self._history_key(namespace, original_selector))
+        if cached is not None:
+            known.append((cached, HealingStrategy.CACHED_HISTORY, 0.98))
+
+        # Strategy 2: Last working selector from history
+        if (
+            history
+            and history.last_working_selector != original_selector
+            and history.last_working_selector != cached
+        ):
+            known.append((history.last_working_selector, HealingStrategy.DOM_STRUCTURE, 0.95))
+
+        return known
+
+    def _collect_candidates(
+        self, original_selector: str, element_description: str | None
+    ) -> list[SelectorCandidate]:
+        """
+        Generate candidate selectors from all strategies without probing them.
+
+        Duplicate selectors keep their highest-confidence entry.
+        """
         candidates: list[SelectorCandidate] = []
 
         # Strategy 3: Common ID/name/data-testid fallbacks from selector parsing
-        common_fallbacks = self._find_by_common_patterns(page, original_selector)
-        candidates.extend(common_fallbacks)
+        candidates.extend(self._find_by_common_patterns(original_selector))
 
         # Strategy 4: Text content matching (from selector or description)
         text_hint = element_description or self._extract_text_hint(original_selector)
         if text_hint:
-            text_candidates = self._find_by_text_match(page, text_hint)
-            candidates.extend(text_candidates)
+            candidates.extend(self._find_by_text_match(text_hint))
 
         # Strategy 5: Fuzzy attribute matching
-        attr_candidates = self._find_by_attribute_fuzzy(page, original_selector)
-        candidates.extend(attr_candidates)
+        candidates.extend(self._find_by_attribute_fuzzy(original_selector))
 
         # Strategy 6: XPath alternatives
-        xpath_candidates = self._find_by_xpath_fallback(page, original_selector)
-        candidates.extend(xpath_candidates)
+        candidates.extend(self._find_by_xpath_fallback(original_selector))
 
         # Strategy 7: CSS selector variations
-        css_candidates = self._find_by_css_variations(page, original_selector)
-        candidates.extend(css_candidates)
-
-        # Sort by confidence and limit
-        candidates.sort(key=lambda c: c.confidence, reverse=True)
-        candidates = candidates[: self.MAX_CANDIDATES]
+        candidates.extend(self._find_by_css_variations(original_selector))
 
+        unique: dict[str, SelectorCandidate] = {}
         for candidate in candidates:
-            if candidate.confidence < self._min_confidence:
+            if candidate.selector == original_selector:
                 continue
+            existing = unique.get(candidate.selector)
+            if existing is None or candidate.confidence > existing.confidence:
+                unique[candidate.selector] = candidate
+
+        return list(unique.values())
+
+    def _heal_sequential(
+        self,
+        page: BrowserContext,
+        original_selector: str,
+        history: SelectorHistory | None,
+        candidates: list[SelectorCandidate],
+        namespace: str | None = None,
+    ) -> HealingResult:
+        """
+        Probe candidates with the browser's own selector engine.
 
-            if self._try_selector(page, candidate.selector):
-                self._update_history(
-                    original_selector,
-                    candidate.selector,
-                    candidate,
+        All known selectors and candidates are checked in one pipelined
+        batch of visibility commands.
+        """
+        known = self._known_selectors(original_selector, history, namespace)
+        visible = self._try_selectors(
+            page, [selector for selector, _, _ in known] + [c.selector for c in candidates]
+        )
+        for selector, strategy, confidence in known:
+            if visible[selector]:
+                self._selector_cache[self._history_key(namespace, original_selector)] = selector
+                return HealingResult(
+                    success=True,
+                    original_selector=original_selector,
+                    healed_selector=selector,
+                    strategy_used=strategy,
+                    confidence=confidence,
                 )
-                self._selector_cache[original_selector] = candidate.selector
-
-                healing_time = int((time.monotonic() - start_time) * 1000)
-                self._log.info(
-                    "Selector healed successfully",
-                    original=original_selector,
-                    healed=candidate.selector,
-                    strategy=candidate.strategy,
-                    confidence=candidate.confidence,
-                    time_ms=healing_time,
+
+        matching = [c for c in candidates if visible[c.selector]]
+
+        # Sort by confidence and limit
+        matching.sort(key=lambda c: c.confidence, reverse=True)
+        matching = matching[: self.MAX_CANDIDATES]
+
+        for candidate in matching:
+            if candidate.confidence >= self._min_confidence:
+                return self._accept_candidate(
+                    original_selector, candidate, len(matching), namespace
                 )
 
+        return HealingResult(
+            success=False,
+            original_selector=original_selector,
+            candidates_evaluated=len(matching),
+            error="No suitable replacement selector found",
+        )
+
+    def _heal_batched(
+        self,
+        page: BrowserContext,
+        original_selector: str,
+        history: SelectorHistory | None,
+        candidates: list[SelectorCandidate],
+        namespace: str | None = None,
+    ) -> HealingResult:
+        """
+        Probe all candidates in one script evaluation and pick the best locally.
+
+        Selectors the in-page probe cannot evaluate (e.g. non-standard
+        pseudo-classes) are checked with the browser's own selector engine,
+        all in one pipelined batch, only once no better match exists.
+        """
+        known = self._known_selectors(original_selector, history, namespace)
+        selectors = [selector for selector, _, _ in known]
+        selectors.extend(c.selector for c in candidates if c.selector not in selectors)
+
+        probes = self._probe_selectors(page, selectors)
+        if probes is None:
+            return self._heal_sequential(page, original_selector, history, candidates, namespace)
+
+        browser_checks: dict[str, bool] = {}
+        for selector, strategy, confidence in known:
+            if self._probe_matches(page, probes[selector], probes, browser_checks):
+                self._selector_cache[self._history_key(namespace, original_selector)] = selector
                 return HealingResult(
                     success=True,
                     original_selector=original_selector,
-                    healed_selector=candidate.selector,
-                    strategy_used=candidate.strategy,
-                    confidence=candidate.confidence,
-                    candidates_evaluated=len(candidates),
-                    healing_time_ms=healing_time,
+                    healed_selector=selector,
+                    strategy_used=strategy,
+                    confidence=confidence,
+                    candidates_evaluated=len(probes),
                 )
 
-        healing_time = int((time.monotonic() - start_time) * 1000)
-        self._log.warning(
-            "Selector healing failed",
-            original=original_selector,
-            candidates_tried=len(candidates),
-            time_ms=healing_time,
-        )
+        signature = history.element_signature if history else None
+        ranked: list[tuple[float, SelectorCandidate, SelectorProbe]] = []
+        for candidate in candidates:
+            probe = probes[candidate.selector]
+            if candidate.confidence < self._min_confidence:
+                continue
+            if probe.error is None and not probe.visible:
+                continue
+            ranked.append((self._rank_candidate(candidate, probe, signature), candidate, probe))
 
-        if history:
-            history.failure_count += 1
+        ranked.sort(key=lambda item: item[0], reverse=True)
+
+        for _, candidate, probe in ranked:
+            if not self._probe_matches(page, probe, probes, browser_checks):
+                continue
+            candidate.element_tag = probe.element_tag
+            candidate.element_text = probe.element_text or candidate.element_text
+            candidate.bounding_box = probe.bounding_box
+            return self._accept_candidate(original_selector, candidate, len(probes), namespace)
 
         return HealingResult(
             success=False,
             original_selector=original_selector,
-            candidates_evaluated=len(candidates),
-            healing_time_ms=healing_time,
+            candidates_evaluated=len(probes),
             error="No suitable replacement selector found",
         )
 
-    def _find_by_common_patterns(
-        self, page: BrowserContext, original_selector: str
-    ) -> list[SelectorCandidate]:
-        """Find elements using common selector patterns (no AI)."""
-        candidates: list[SelectorCandidate] = []
+    def _accept_candidate(
+        self,
+        original_selector: str,
+        candidate: SelectorCandidate,
+        candidates_evaluated: int,
+        namespace: str | None = None,
+    ) -> HealingResult:
+        """Record a successful candidate and build the healing result."""
+        self._update_history(original_selector, candidate.selector, candidate, namespace)
+        self._selector_cache[self._history_key(namespace, original_selector)] = candidate.selector
+
+        return HealingResult(
+            success=True,
+            original_selector=original_selector,
+            healed_selector=candidate.selector,
+            strategy_used=candidate.strategy,
+            confidence=candidate.confidence,
+            candidates_evaluated=candidates_evaluated,
+        )
+
+    def _rank_candidate(
+        self,
+        candidate: SelectorCandidate,
+        probe: SelectorProbe,
+        signature: dict[str, Any] | None,
+    ) -> float:
+        """
+        Score a probed candidate: its strategy confidence, plus a bonus
+        for matching exactly one element and for resembling the element
+        signature recorded from earlier runs.
+        """
+        score = candidate.confidence
+        if probe.error is not None:
+            return score
+        if probe.count == 1:
+            score += self.UNIQUE_MATCH_BONUS
+        if signature:
+            score += self.SIGNATURE_MATCH_BONUS * self._signature_similarity(probe, signature)
+        return score
+
+    @staticmethod
+    def _signature_similarity(probe: SelectorProbe, signature: dict[str, Any]) -> float:
+        """Fraction of recorded signature fields (tag, text, position) the probe matches."""
+        checks: list[bool] = []
+
+        if signature.get("tag") and probe.element_tag:
+            checks.append(str(signature["tag"]).lower() == probe.element_tag)
+
+        if signature.get("text") and probe.element_text is not None:
+            expected = str(signature["text"]).strip().lower()
+            checks.append(expected == probe.element_text.strip().lower()[: len(expected)])
+
+        bbox = signature.get("bounding_box")
+        if bbox and probe.bounding_box:
+            # Accept both dicts and BoundingBox objects
+            def coord(box: Any, key: str) -> float:
+                return float(box[key] if isinstance(box, dict) else getattr(box, key))
+
+            try:
+                dx = (coord(bbox, "x") + coord(bbox, "width") / 2) - (
+                    probe.bounding_box["x"] + probe.bounding_box["width"] / 2
+                )
+                dy = (coord(bbox, "y") + coord(bbox, "height") / 2) - (
+                    probe.bounding_box["y"] + probe.bounding_box["height"] / 2
+                )
+                checks.append(dx * dx + dy * dy <= 50 * 50)
+            except (AttributeError, KeyError, TypeError, ValueError):
+                pass
+
+        return sum(checks) / len(checks) if checks else 0.0
+
+    def _probe_matches(
+        self,
+        page: BrowserContext,
+        probe: SelectorProbe,
+        probes: dict[str, SelectorProbe],
+        browser_checks: dict[str, bool],
+    ) -> bool:
+        """
+        Whether a probed selector finds a visible element.
+
+        Selectors the in-page probe could not evaluate are deferred to the
+        browser; on first need, all of them are checked in one batch and
+        the answers kept in ``browser_checks``.
+        """
+        if probe.error is None:
+            return probe.visible
+        if not browser_checks:
+            browser_checks.update(self._try_selectors(
+                page, [p.selector for p in probes.values() if p.error is not None]
+            ))
+        return browser_checks[probe.selector]
+
+    def _probe_selectors(
+        self, page: BrowserContext, selectors: list[str]
+    ) -> dict[str, SelectorProbe] | None:
+        """
+        Probe many selectors with a single script evaluation.
+
+        CSS selectors are resolved with ``querySelectorAll`` and selectors
+        starting with ``/`` or ``(`` as XPath. Each result carries the
+        match count, whether any match is visible, and a signature (tag,
+        text, bounding box) of the first visible match.
+
+        Returns:
+            Probe per selector, or None if the script could not run
+        """
+        if not selectors:
+            return {}
+
+        script = f"""
+        (() => {{
+            const selectors = {json.dumps(selectors)};
+
+            const isVisible = (el) => {{
+                const style = window.getComputedStyle(el);
+                if (style.display === 'none' || style.visibility === 'hidden') return false;
+                if (parseFloat(style.opacity) === 0) return false;
+                const rect = el.getBoundingClientRect();
+                return rect.width > 0 && rect.height > 0;
+            }};
+
+            const query = (selector) => {{
+                if (selector.startsWith('/') || selector.startsWith('(')) {{
+                    const snapshot = document.evaluate(
+                        selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                    );
+                    const nodes = [];
+                    for (let i = 0; i < snapshot.snapshotLength; i++) {{
+                        const node = snapshot.snapshotItem(i);
+                        if (node.nodeType === Node.ELEMENT_NODE) nodes.push(node);
+                    }}
+                    return nodes;
+                }}
+                return Array.from(document.querySelectorAll(selector));
+            }};
+
+            return selectors.map((selector) => {{
+                let nodes;
+                try {{
+                    nodes = query(selector);
+                }} catch (e) {{
+                    return {{error: String((e && e.message) || e)}};
+                }}
+
+                const limit = Math.min(nodes.length, 50);
+                let element = null;
+                for (let i = 0; i < limit; i++) {{
+                    if (isVisible(nodes[i])) {{ element = nodes[i]; break; }}
+                }}
+                if (!element) return {{count: nodes.length, visible: false}};
+
+                const rect = element.getBoundingClientRect();
+                const text = (element.innerText || element.value || '').trim();
+                return {{
+                    count: nodes.length,
+                    visible: true,
+                    tag: element.tagName.toLowerCase(),
+                    text: text.slice(0, 100),
+                    box: {{x: rect.x, y: rect.y, width: rect.width, height: rect.height}},
+                }};
+            }});
+        }})()
+        """
+
+        try:
+            raw = page.expression(script)
+        except Exception as e:
+            self._log.debug("Batched selector probe failed", error=str(e))
+            return None
+
+        if not isinstance(raw, list) or len(raw) != len(selectors):
+            self._log.debug("Unexpected batched selector probe result")
+            return None
+
+        self._probe_stats["batched_probes"] += 1
+        self._probe_stats["selectors_probed"] += len(selectors)
+
+        probes: dict[str, SelectorProbe] = {}
+        for selector, item in zip(selectors, raw, strict=True):
+            item = item if isinstance(item, dict) else {"error": "invalid probe result"}
+            probes[selector] = SelectorProbe(
+                selector=selector,
+                count=int(item.get("count") or 0),
+                visible=bool(item.get("visible")),
+                element_tag=item.get("tag"),
+                element_text=item.get("text"),
+                bounding_box=item.get("box"),
+                error=item.get("error"),
+            )
+        return probes
+
+    def _find_by_common_patterns(self, original_selector: str) -> list[SelectorCandidate]:
+        """Generate selectors from common attribute patterns (no AI)."""
         attrs = self._parse_selector_attributes(original_selector)
 
         # Try variations based on extracted attributes
@@ -291,24 +664,13 @@ class SelfHealingEngine:
                 (f"[placeholder*='{placeholder}']", HealingStrategy.PLACEHOLDER_FALLBACK, 0.70),
             ])
 
-        # Try each pattern
-        for selector, strategy, confidence in patterns_to_try:
-            if selector != original_selector and self._try_selector(page, selector):
-                candidates.append(
-                    SelectorCandidate(
-                        selector=selector,
-                        strategy=strategy,
-                        confidence=confidence,
-                    )
-                )
-
-        return candidates
+        return [
+            SelectorCandidate(selector=selector, strategy=strategy, confidence=confidence)
+            for selector, strategy, confidence in patterns_to_try
+        ]
 
-    def _find_by_css_variations(
-        self, page: BrowserContext, original_selector: str
-    ) -> list[SelectorCandidate]:
+    def _find_by_css_variations(self, original_selector: str) -> list[SelectorCandidate]:
         """Generate CSS selector variations."""
-        candidates: list[SelectorCandidate] = []
         attrs = self._parse_selector_attributes(original_selector)
 
         # Extract tag name if present
@@ -340,24 +702,17 @@ class SelfHealingEngine:
             if attr in attrs:
                 variations.append((f"{tag}[{attr}='{attrs[attr]}']", 0.68))
 
-        for selector, confidence in variations:
-            if selector != original_selector and self._try_selector(page, selector):
-                candidates.append(
-                    SelectorCandidate(
-                        selector=selector,
-                        strategy=HealingStrategy.ATTRIBUTE_FUZZY,
-                        confidence=confidence,
-                    )
-                )
-
-        return candidates
-
-    def _find_by_text_match(
-        self, page: BrowserContext, text_hint: str
-    ) -> list[SelectorCandidate]:
-        """Find elements by text content matching (deterministic)."""
-        candidates: list[SelectorCandidate] = []
+        return [
+            SelectorCandidate(
+                selector=selector,
+                strategy=HealingStrategy.ATTRIBUTE_FUZZY,
+                confidence=confidence,
+            )
+            for selector, confidence in variations
+        ]
 
+    def _find_by_text_match(self, text_hint: str) -> list[SelectorCandidate]:
+        """Generate selectors matching text content (deterministic)."""
         # Escape special characters for XPath
         safe_hint = text_hint.replace("'", "\\'")
         normalized_hint = text_hint.lower().replace(" ", "-").replace("_", "-")
@@ -381,23 +736,18 @@ class SelfHealingEngine:
             (f"label:contains('{text_hint}') + select", 0.76),
         ]
 
-        for selector, confidence in selectors_to_try:
-            if self._try_selector(page, selector):
-                candidates.append(
-                    SelectorCandidate(
-                        selector=selector,
-                        strategy=HealingStrategy.TEXT_MATCH,
-                        confidence=confidence,
-                        element_text=text_hint,
-                    )
-                )
-
-        return candidates
+        return [
+            SelectorCandidate(
+                selector=selector,
+                strategy=HealingStrategy.TEXT_MATCH,
+                confidence=confidence,
+                element_text=text_hint,
+            )
+            for selector, confidence in selectors_to_try
+        ]
 
-    def _find_by_attribute_fuzzy(
-        self, page: BrowserContext, original_selector: str
-    ) -> list[SelectorCandidate]:
-        """Find elements by fuzzy attribute matching."""
+    def _find_by_attribute_fuzzy(self, original_selector: str) -> list[SelectorCandidate]:
+        """Generate fuzzy attribute-matching selectors."""
         candidates: list[SelectorCandidate] = []
 
         attributes = self._parse_selector_attributes(original_selector)
@@ -412,21 +762,18 @@ class SelfHealingEngine:
             ]
 
             for selector in filter(None, fuzzy_selectors):
-                if selector != original_selector and self._try_selector(page, selector):
-                    confidence = 0.75 if "*=" in selector else 0.85
-                    candidates.append(
-                        SelectorCandidate(
-                            selector=selector,
-                            strategy=HealingStrategy.ATTRIBUTE_FUZZY,
-                            confidence=confidence,
-                        )
+                confidence = 0.75 if "*=" in selector else 0.85
+                candidates.append(
+                    SelectorCandidate(
+                        selector=selector,
+                        strategy=HealingStrategy.ATTRIBUTE_FUZZY,
+                        confidence=confidence,
                     )
+                )
 
         return candidates
 
-    def _find_by_xpath_fallback(
-        self, page: BrowserContext, original_selector: str
-    ) -> list[SelectorCandidate]:
+    def _find_by_xpath_fallback(self, original_selector: str) -> list[SelectorCandidate]:
         """Generate XPath fallback selectors."""
         candidates: list[SelectorCandidate] = []
 
@@ -435,34 +782,53 @@ class SelfHealingEngine:
 
         if original_selector.startswith("#"):
             element_id = original_selector[1:].split("[")[0].split(".")[0]
-            xpath = f"//*[@id='{element_id}']"
-            if self._try_selector(page, xpath):
-                candidates.append(
-                    SelectorCandidate(
-                        selector=xpath,
-                        strategy=HealingStrategy.XPATH_FALLBACK,
-                        confidence=0.9,
-                    )
+            candidates.append(
+                SelectorCandidate(
+                    selector=f"//*[@id='{element_id}']",
+                    strategy=HealingStrategy.XPATH_FALLBACK,
+                    confidence=0.9,
                 )
+            )
 
         if "." in original_selector:
             classes = original_selector.replace("#", " ").replace("[", " ").split(".")
             classes = [c.strip() for c in classes if c.strip() and not c.startswith("=")]
             if classes:
-                xpath = f"//*[contains(@class, '{classes[0]}')]"
-                if self._try_selector(page, xpath):
-                    candidates.append(
-                        SelectorCandidate(
-                            selector=xpath,
-                            strategy=HealingStrategy.XPATH_FALLBACK,
-                            confidence=0.7,
-                        )
+                candidates.append(
+                    SelectorCandidate(
+                        selector=f"//*[contains(@class, '{classes[0]}')]",
+                        strategy=HealingStrategy.XPATH_FALLBACK,
+                        confidence=0.7,
                     )
+                )
 
         return candidates
 
+    def _try_selectors(self, page: BrowserContext, selectors: list[str]) -> dict[str, bool]:
+        """
+        Test many selectors in one pipelined batch of visibility checks.
+
+        Falls back to one round-trip per selector if the page cannot batch.
+        """
+        unique = list(dict.fromkeys(selectors))
+        if not unique:
+            return {}
+
+        try:
+            results = page.batch([("isVisible", {"selector": selector}) for selector in unique])
+        except Exception as e:
+            self._log.debug("Pipelined selector probe failed", error=str(e))
+            return {selector: self._try_selector(page, selector) for selector in unique}
+
+        self._probe_stats["pipelined_probes"] += 1
+        return {
+            selector: result.success and bool(result.result)
+            for selector, result in zip(unique, results, strict=True)
+        }
+
     def _try_selector(self, page: BrowserContext, selector: str) -> bool:
         """Test if a selector finds an element."""
+        self._probe_stats["single_probes"] += 1
         try:
             visible = page.is_visible(selector)
             return visible
@@ -515,18 +881,20 @@ class SelfHealingEngine:
         original_selector: str,
         healed_selector: str,
         candidate: SelectorCandidate,
+        namespace: str | None = None,
     ) -> None:
         """Update selector history after successful healing."""
         if not self._enable_learning:
             return
 
-        if original_selector not in self._selector_history:
-            self._selector_history[original_selector] = SelectorHistory(
+        key = self._history_key(namespace, original_selector)
+        if key not in self._selector_history:
+            self._selector_history[key] = SelectorHistory(
                 original_selector=original_selector,
                 last_working_selector=healed_selector,
             )
 
-        history = self._selector_history[original_selector]
+        history = self._selector_history[key]
         history.last_working_selector = healed_selector
         history.last_healed_at = time.time()
 
@@ -540,40 +908,63 @@ class SelfHealingEngine:
                 "text": candidate.element_text,
             }
 
-        self._save_history()
+        if self._store is None:
+            self._save_history()
+            return
+
+        try:
+            self._store.record_heal(
+                namespace or DEFAULT_HEALING_NAMESPACE,
+                original_selector,
+                healed_selector,
+                history.element_signature if candidate.bounding_box else None,
+            )
+        except Exception as e:
+            self._log.warning("Failed to update healing store", error=str(e))
 
     def capture_element_signature(
-        self, page: BrowserContext, selector: str
+        self, page: BrowserContext, selector: str, namespace: str | None = None
     ) -> dict[str, Any] | None:
         """Capture element signature for future healing."""
         try:
             bbox = page.get_bounding_box(selector)
+            bbox_dict = (
+                asdict(bbox) if is_dataclass(bbox) and not isinstance(bbox, type) else bbox
+            )
             text = None
-            try:
+            with contextlib.suppress(Exception):
                 text = page.extract_text(selector)
-            except Exception:
-                pass
 
             signature = {
                 "selector": selector,
-                "bounding_box": bbox,
+                "bounding_box": bbox_dict,
                 "text": text[:100] if text else None,
                 "captured_at": time.time(),
             }
 
-            if selector not in self._selector_history:
-                self._selector_history[selector] = SelectorHistory(
+            key = self._history_key(namespace, selector)
+            if key not in self._selector_history:
+                self._selector_history[key] = SelectorHistory(
                     original_selector=selector,
                     last_working_selector=selector,
                 )
 
-            self._selector_history[selector].element_signature = signature
-            return signature
+            self._selector_history[key].element_signature = signature
 
         except Exception as e:
             self._log.debug("Failed to capture element signature", error=str(e))
             return None
 
+        if self._store is not None:
+            # The signature was captured; a store failure only loses sharing
+            try:
+                self._store.record_signature(
+                    namespace or DEFAULT_HEALING_NAMESPACE, selector, signature
+                )
+            except Exception as e:
+                self._log.warning("Failed to update healing store", error=str(e))
+        return signature
+
     def _load_history(self) -> None:
         """Load selector history from file."""
         if not self._history_path or not self._history_path.exists():
@@ -616,20 +1007,25 @@ class SelfHealingEngine:
         except Exception as e:
             self._log.warning("Failed to save selector history", error=str(e))
 
+    def close(self) -> None:
+        """Close the shared healing store, if any."""
+        if self._store is not None:
+            self._store.close()
+
     def get_healing_stats(self) -> dict[str, Any]:
-        """Get statistics about healing operations."""
-        total_selectors = len(self._selector_history)
-        healed_count = sum(
-            1 for h in self._selector_history.values() if h.healed_selectors
-        )
-        total_healings = sum(
-            len(h.healed_selectors) for h in self._selector_history.values()
-        )
-        failure_count = sum(
-            h.failure_count for h in self._selector_history.values()
+        """Get statistics about healing operations (across all workers if a store is shared)."""
+        histories = (
+            self._store.histories()
+            if self._store is not None
+            else list(self._selector_history.values())
         )
+        total_selectors = len(histories)
+        healed_count = sum(1 for h in histories if h.healed_selectors)
+        total_healings = sum(len(h.healed_selectors) for h in histories)
+        failure_count = sum(h.failure_count for h in histories)
 
         return {
+            **self._probe_stats,
             "total_tracked_selectors": total_selectors,
             "selectors_healed": healed_count,
             "total_healing_operations": total_healings,
@@ -31,6 +31,7 @@ from web2api.dsl.models import (
     TestSuite,
 )
 from web2api.dsl.transformer import StepTransformer
+from web2api.runner.healing_store import healing_namespace
 from web2api.runner.self_healing import HealingResult, SelfHealingEngine
 from web2api.versioning.history_tracker import TestRunHistory
 from web2api.versioning.models import VersioningConfig
@@ -186,6 +187,7 @@ class TestRunner:
         # URL recovery tracking - stores the expected URL from navigate actions
         # and step-level _expected_url metadata
         self._current_expected_url: str | None = None
+        self._current_spec_name: str | None = None
 
         # Versioning support
         self._enable_versioning = enable_versioning
@@ -226,6 +228,7 @@ class TestRunner:
         if own_page:
             page = self._browser.new_page()
 
+        self._current_spec_name = spec.name
         self._log.info("Starting test run", test=spec.name, steps=len(spec.steps))
 
         try:
@@ -624,6 +627,9 @@ class TestRunner:
                         step.selector,
                         action_context=step.action,
                         element_description=step.description,
+                        namespace=healing_namespace(
+                            self._current_expected_url, self._current_spec_name
+                        ),
                     )
 
                     if healing_result.success and healing_result.healed_selector:
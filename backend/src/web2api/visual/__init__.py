@@ -4,6 +4,11 @@ Visual regression testing module.
 Provides semantic and pixel-based image comparison capabilities.
 """
 
+from web2api.visual.baseline_cache import (
+    BaselineCache,
+    CachedBaseline,
+    get_baseline_cache,
+)
 from web2api.visual.regression_engine import (
     ComparisonMode,
     ComparisonResult,
@@ -11,7 +16,10 @@ from web2api.visual.regression_engine import (
 )
 
 __all__ = [
+    "BaselineCache",
+    "CachedBaseline",
     "ComparisonMode",
     "ComparisonResult",
     "VisualRegressionEngine",
+    "get_baseline_cache",
 ]
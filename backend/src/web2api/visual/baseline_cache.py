@@ -0,0 +1,276 @@
+"""
+In-process cache of decoded baseline images.
+
+Visual assertions compare the same baselines many times across viewports,
+retries and tests. Entries are keyed by the baseline's content hash and hold
+the decoded pixels plus digests and perceptual hashes computed on first
+use, so repeat comparisons skip PNG decoding and baseline hashing. Decoded
+pixels can also be kept in ``.npy`` sidecar files, loaded memory-mapped by
+other processes and later runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import structlog
+from PIL import Image
+
+logger = structlog.get_logger(__name__)
+
+# Tile bounds (x1, y1, x2, y2), or None for the whole image
+TileBox = tuple[int, int, int, int] | None
+
+
+def _file_content_hash(path: str | Path) -> str:
+    """Short SHA-256 content hash of a file, as used for baseline versioning."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class CachedBaseline:
+    """Decoded baseline image and values derived from it."""
+
+    key: str
+    """Content hash of the baseline file."""
+
+    pixels: np.ndarray
+    """Decoded pixels (possibly a read-only memory map)."""
+
+    image_digest: bytes | None = None
+    """Digest of the decoded pixels, for the identical-image fast path."""
+
+    tile_digests: dict[int, list[bytes]] = field(default_factory=dict)
+    """Row-major tile digests by tile size."""
+
+    perceptual_hashes: dict[TileBox, Any] = field(default_factory=dict)
+    """Perceptual hashes of the whole image (None) or of tiles."""
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the decoded pixels."""
+        return int(self.pixels.nbytes)
+
+    def image(self) -> Image.Image:
+        """Get the baseline as a new PIL image."""
+        return Image.fromarray(np.asarray(self.pixels))
+
+    def perceptual_hash(self, image: Image.Image, box: TileBox = None) -> Any | None:
+        """
+        Get the perceptual hash of the baseline or one of its tiles.
+
+        Args:
+            image: The baseline (or tile) image to hash on a miss
+            box: Tile bounds, or None for the whole image
+
+        Returns:
+            imagehash hash, or None if imagehash is not installed
+        """
+        if box not in self.perceptual_hashes:
+            try:
+                import imagehash
+            except ImportError:
+                return None
+            self.perceptual_hashes[box] = imagehash.phash(image)
+        return self.perceptual_hashes[box]
+
+
+class BaselineCache:
+    """
+    Memory-bounded LRU cache of decoded baselines.
+
+    Features:
+    - Entries keyed by baseline content hash, so updated baselines never
+      return stale pixels
+    - File hashes memoised by modification time and size
+    - Least recently used entries are evicted past ``max_memory_mb``
+    - Optional ``.npy`` sidecars, loaded memory-mapped, that survive the
+      process and are shared between workers
+    """
+
+    def __init__(
+        self,
+        max_memory_mb: float = 512.0,
+        sidecar_dir: str | Path | None = None,
+        mmap_sidecars: bool = True,
+    ) -> None:
+        """
+        Initialize baseline cache.
+
+        Args:
+            max_memory_mb: Memory budget for decoded pixels
+            sidecar_dir: Directory for ``.npy`` sidecars (None disables them)
+            mmap_sidecars: Memory-map sidecars instead of reading them in
+        """
+        self._max_bytes = int(max_memory_mb * 1024 * 1024)
+        self._sidecar_dir = Path(sidecar_dir) if sidecar_dir else None
+        self._mmap_sidecars = mmap_sidecars
+        self._entries: OrderedDict[str, CachedBaseline] = OrderedDict()
+        self._file_hashes: dict[Path, tuple[int, int, str]] = {}
+        self._memory = 0
+        self._lock = threading.Lock()
+        self._log = logger.bind(component="baseline_cache")
+
+        if self._sidecar_dir:
+            self._sidecar_dir.mkdir(parents=True, exist_ok=True)
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "sidecar_hits": 0,
+            "evictions": 0,
+        }
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {**self._stats, "size": len(self._entries), "memory_bytes": self._memory}
+
+    def key_for(self, path: str | Path) -> str:
+        """
+        Get the content hash of a baseline file.
+
+        The file is only re-read when its modification time or size changed.
+        """
+        path = Path(path)
+        stat = path.stat()
+        memo = self._file_hashes.get(path)
+        if memo is not None and memo[:2] == (stat.st_mtime_ns, stat.st_size):
+            return memo[2]
+
+        key = _file_content_hash(path)
+        self._file_hashes[path] = (stat.st_mtime_ns, stat.st_size, key)
+        return key
+
+    def load(self, path: str | Path) -> CachedBaseline:
+        """
+        Get a decoded baseline, decoding the file only on a cache miss.
+
+        Args:
+            path: Baseline image file
+
+        Returns:
+            Cached baseline entry
+        """
+        key = self.key_for(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry
+            self._stats["misses"] += 1
+
+        pixels = self._load_sidecar(key)
+        if pixels is None:
+            pixels = self._decode(path)
+            self._save_sidecar(key, pixels)
+
+        return self._put(CachedBaseline(key=key, pixels=pixels))
+
+    def _put(self, entry: CachedBaseline) -> CachedBaseline:
+        """Insert an entry and evict least recently used ones over budget."""
+        with self._lock:
+            existing = self._entries.get(entry.key)
+            if existing is not None:
+                return existing
+
+            self._entries[entry.key] = entry
+            self._memory += entry.nbytes
+
+            # Always keep the newest entry, even if it alone exceeds the budget
+            while self._memory > self._max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._memory -= evicted.nbytes
+                self._stats["evictions"] += 1
+
+        return entry
+
+    @staticmethod
+    def _decode(path: str | Path) -> np.ndarray:
+        """Decode a baseline image file into an array."""
+        with Image.open(path) as image:
+            if image.mode not in ("RGB", "RGBA", "L"):
+                return np.asarray(image.convert("RGB"))
+            return np.asarray(image)
+
+    def _sidecar_path(self, key: str) -> Path | None:
+        return self._sidecar_dir / f"{key}.npy" if self._sidecar_dir else None
+
+    def _load_sidecar(self, key: str) -> np.ndarray | None:
+        """Load decoded pixels from a sidecar file, if one exists."""
+        path = self._sidecar_path(key)
+        if path is None or not path.exists():
+            return None
+
+        try:
+            pixels: np.ndarray = np.load(path, mmap_mode="r" if self._mmap_sidecars else None)
+        except (OSError, ValueError) as e:
+            self._log.warning("Failed to load baseline sidecar", path=str(path), error=str(e))
+            return None
+
+        self._stats["sidecar_hits"] += 1
+        return pixels
+
+    def _save_sidecar(self, key: str, pixels: np.ndarray) -> None:
+        """Write decoded pixels to a sidecar file (atomically)."""
+        path = self._sidecar_path(key)
+        if path is None:
+            return
+
+        tmp_path: str | None = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".npy.tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, pixels)
+            Path(tmp_path).replace(path)
+        except OSError as e:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            self._log.warning("Failed to write baseline sidecar", path=str(path), error=str(e))
+
+    def clear(self) -> None:
+        """Drop all cached baselines (sidecar files are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._file_hashes.clear()
+            self._memory = 0
+
+
+# =============================================================================
+# Global Cache Instance
+# =============================================================================
+
+_global_cache: BaselineCache | None = None
+
+
+def get_baseline_cache() -> BaselineCache:
+    """
+    Get the process-wide baseline cache, creating it on first use.
+
+    Configured from the environment:
+    - AUTOQA_BASELINE_CACHE_MB: Memory budget (default 512)
+    - AUTOQA_BASELINE_CACHE_DIR: Sidecar directory (default: no sidecars)
+    """
+    global _global_cache
+
+    if _global_cache is None:
+        _global_cache = BaselineCache(
+            max_memory_mb=float(os.environ.get("AUTOQA_BASELINE_CACHE_MB", "512")),
+            sidecar_dir=os.environ.get("AUTOQA_BASELINE_CACHE_DIR") or None,
+        )
+
+    return _global_cache
@@ -21,7 +21,7 @@ from base64 import b64encode
 from dataclasses import dataclass, field
 from enum import StrEnum
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 import structlog
@@ -29,6 +29,14 @@ from PIL import Image, ImageFilter
 from scipy import ndimage
 
 from web2api.dsl.models import VisualComparisonMode
+from web2api.visual.baseline_cache import (
+    BaselineCache,
+    CachedBaseline,
+    get_baseline_cache,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 logger = structlog.get_logger(__name__)
 
@@ -58,6 +66,85 @@ THRESHOLD_VALUES: dict[ThresholdMode, float] = {
     ThresholdMode.CUSTOM: 0.05,  # Default for custom
 }
 
+# Approximate pixel count processed at once by grid cell statistics
+GRID_BAND_PIXELS = 4_000_000
+
+# Tiled comparison defaults
+DEFAULT_TILE_SIZE = 256
+
+# Modes whose score over tiles, weighted by area, equals the whole-image score.
+# SSIM windows and perceptual hashes span tile borders, so those modes always
+# compare the whole image once any pixel changed.
+TILED_MODES = frozenset({ComparisonMode.PIXEL})
+DEFAULT_MEMORY_BUDGET_MB = 256.0
+
+# Working memory per pixel while comparing a band (two RGB copies plus diffs)
+BAND_BYTES_PER_PIXEL = 16
+
+
+def _block_stats(
+    pixels: np.ndarray, block_h: int, block_w: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Grayscale entropy and color variance of every block of an image part.
+
+    Works on exact integer sums, so results match per-cell ``np.histogram``
+    and ``np.var`` up to floating point rounding.
+
+    Args:
+        pixels: Color (uint8) image part, dimensions a multiple of the block size
+        block_h: Block height
+        block_w: Block width
+
+    Returns:
+        Tuple of (entropy, variance) arrays with one value per block
+    """
+    rows = pixels.shape[0] // block_h
+    cols = pixels.shape[1] // block_w
+    channels = pixels.shape[2]
+    cells = rows * cols
+
+    # Per-pixel channel sums, shared by the grayscale and variance passes
+    channel_sum = np.zeros(pixels.shape[:2], dtype=np.uint16)
+    square_sum = np.zeros(pixels.shape[:2], dtype=np.uint32)
+    for channel in range(channels):
+        values = pixels[..., channel].astype(np.uint16)
+        channel_sum += values
+        values *= values  # 255**2 still fits in uint16
+        square_sum += values
+
+    # Truncated channel mean, as np.mean(...).astype(np.uint8) would give
+    gray = channel_sum // channels
+
+    # One 256-bin histogram per block from a single bincount over offset values
+    blocks = gray.reshape(rows, block_h, cols, block_w).swapaxes(1, 2).reshape(cells, -1)
+    offsets = np.arange(cells, dtype=np.int64)[:, None] * 256
+    hist = np.bincount((blocks + offsets).ravel(), minlength=cells * 256).reshape(cells, 256)
+    probs = hist / (block_h * block_w)
+    log_probs = np.log2(probs, out=np.zeros_like(probs), where=hist > 0)
+    entropy = -np.sum(probs * log_probs, axis=1)
+
+    count = block_h * block_w * channels
+    total = channel_sum.reshape(rows, block_h, cols, block_w).sum(axis=(1, 3), dtype=np.int64)
+    squares = square_sum.reshape(rows, block_h, cols, block_w).sum(axis=(1, 3), dtype=np.int64)
+    variance = (count * squares - total * total) / (count * count)
+
+    return entropy.reshape(rows, cols), variance
+
+
+def _tile_edges(length: int, tile_size: int) -> list[tuple[int, int]]:
+    """
+    Split one image dimension into tile spans.
+
+    A remainder shorter than half a tile is merged into the last tile, so no
+    tile is too small for windowed comparisons such as SSIM.
+    """
+    starts = list(range(0, length, tile_size))
+    if len(starts) > 1 and length - starts[-1] < tile_size // 2:
+        starts.pop()
+    ends = [*starts[1:], length]
+    return list(zip(starts, ends, strict=True))
+
 
 @dataclass
 class Region:
@@ -143,6 +230,9 @@ class VisualRegressionEngine:
     - Scroll position normalization
     - Multi-threshold modes (strict, normal, loose, custom)
     - Enhanced diff reporting with HTML reports
+    - Tiled comparison: identical images short-circuit on a digest, and pixel
+      comparisons only run on changed tiles, within a memory budget
+    - Decoded baselines and their digests cached by content hash
     """
 
     def __init__(
@@ -150,10 +240,16 @@ class VisualRegressionEngine:
         baseline_dir: str | Path,
         diff_dir: str | Path | None = None,
         auto_update_baselines: bool = False,
+        tile_size: int | None = DEFAULT_TILE_SIZE,
+        memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+        baseline_cache: BaselineCache | None = None,
     ) -> None:
         self._baseline_dir = Path(baseline_dir)
         self._diff_dir = Path(diff_dir) if diff_dir else self._baseline_dir / "diffs"
         self._auto_update = auto_update_baselines
+        self._tile_size = tile_size
+        self._memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self._baseline_cache = baseline_cache or get_baseline_cache()
         self._log = logger.bind(component="visual_regression")
 
         self._baseline_dir.mkdir(parents=True, exist_ok=True)
@@ -274,33 +370,7 @@ class VisualRegressionEngine:
         h, w = img_array.shape[:2]
 
         dynamic_regions: list[Region] = []
-        grid_h = (h + grid_size - 1) // grid_size
-        grid_w = (w + grid_size - 1) // grid_size
-
-        # Create entropy and variance maps
-        entropy_map = np.zeros((grid_h, grid_w))
-        variance_map = np.zeros((grid_h, grid_w))
-
-        for gy in range(grid_h):
-            for gx in range(grid_w):
-                y1 = gy * grid_size
-                y2 = min((gy + 1) * grid_size, h)
-                x1 = gx * grid_size
-                x2 = min((gx + 1) * grid_size, w)
-
-                cell = img_array[y1:y2, x1:x2]
-
-                # Calculate entropy (measure of randomness/information)
-                gray_cell = np.mean(cell, axis=2).astype(np.uint8)
-                hist, _ = np.histogram(gray_cell, bins=256, range=(0, 256))
-                hist = hist[hist > 0]
-                probs = hist / hist.sum()
-                entropy = -np.sum(probs * np.log2(probs))
-                entropy_map[gy, gx] = entropy
-
-                # Calculate variance across color channels
-                variance = np.var(cell)
-                variance_map[gy, gx] = variance
+        entropy_map, variance_map = self._grid_cell_stats(img_array, grid_size)
 
         # Find high-entropy, high-variance regions
         high_entropy = entropy_map > entropy_threshold
@@ -343,6 +413,53 @@ class VisualRegressionEngine:
         self._log.info("Dynamic regions detected", count=len(dynamic_regions))
         return dynamic_regions
 
+    def _grid_cell_stats(
+        self, img_array: np.ndarray, grid_size: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute grayscale entropy and color variance for every grid cell.
+
+        The image is processed in horizontal bands of whole grid rows. Each
+        band is split into full cells and the partial cells along the right
+        and bottom edges, and every part is reshaped into blocks so all of
+        its cells are computed in a few array operations.
+
+        Returns:
+            Tuple of (entropy_map, variance_map), each of shape (grid_h, grid_w)
+        """
+        h, w = img_array.shape[:2]
+        grid_h = (h + grid_size - 1) // grid_size
+        grid_w = (w + grid_size - 1) // grid_size
+
+        entropy_map = np.zeros((grid_h, grid_w))
+        variance_map = np.zeros((grid_h, grid_w))
+
+        band_rows = max(1, GRID_BAND_PIXELS // max(1, w * grid_size)) * grid_size
+        full_w = (w // grid_size) * grid_size
+
+        for band_y in range(0, h, band_rows):
+            band_end = min(band_y + band_rows, h)
+            full_end = band_y + ((band_end - band_y) // grid_size) * grid_size
+
+            for y1, y2 in ((band_y, full_end), (full_end, band_end)):
+                if y2 <= y1:
+                    continue
+                for x1, x2 in ((0, full_w), (full_w, w)):
+                    if x2 <= x1:
+                        continue
+
+                    entropy, variance = _block_stats(
+                        img_array[y1:y2, x1:x2],
+                        min(grid_size, y2 - y1),
+                        min(grid_size, x2 - x1),
+                    )
+                    gy, gx = y1 // grid_size, x1 // grid_size
+                    rows, cols = entropy.shape
+                    entropy_map[gy:gy + rows, gx:gx + cols] = entropy
+                    variance_map[gy:gy + rows, gx:gx + cols] = variance
+
+        return entropy_map, variance_map
+
     # =========================================================================
     # Enterprise Feature: Anti-Aliasing Tolerance
     # =========================================================================
@@ -413,13 +530,14 @@ class VisualRegressionEngine:
         if not crop_browser_chrome:
             return image
 
-        img_array = np.array(image)
-        h, w = img_array.shape[:2]
+        w, h = image.size
 
         if chrome_height_estimate > 0:
             crop_top = min(chrome_height_estimate, h // 4)
         else:
-            # Auto-detect browser chrome by looking for uniform color bands at top
+            # Auto-detect browser chrome by looking for uniform color bands at top;
+            # only those rows are converted, not the whole (possibly tall) page
+            img_array = np.asarray(image.crop((0, 0, w, min(150, h // 4))))
             crop_top = 0
             for y in range(min(150, h // 4)):
                 row = img_array[y]
@@ -432,7 +550,7 @@ class VisualRegressionEngine:
 
         if crop_top > 0:
             self._log.debug("Cropping browser chrome", pixels=crop_top)
-            return Image.fromarray(img_array[crop_top:])
+            return image.crop((0, crop_top, w, h))
 
         return image
 
@@ -702,7 +820,8 @@ class VisualRegressionEngine:
                     dynamic_regions_detected=detected_dynamic_regions,
                 )
 
-        baseline_img = Image.open(baseline_path)
+        baseline_entry = self._baseline_cache.load(baseline_path)
+        baseline_img = cached_baseline_img = baseline_entry.image()
 
         # Enterprise: Normalize scroll on baseline too
         if normalize_scroll:
@@ -736,31 +855,45 @@ class VisualRegressionEngine:
 
         comparison_mode = ComparisonMode(mode.value) if isinstance(mode, VisualComparisonMode) else mode
 
-        match comparison_mode:
-            case ComparisonMode.PIXEL:
-                result = self._compare_pixel(baseline_img, current_img, effective_threshold)
-            case ComparisonMode.PERCEPTUAL:
-                result = self._compare_perceptual(baseline_img, current_img, effective_threshold)
-            case ComparisonMode.STRUCTURAL:
-                result = self._compare_structural(baseline_img, current_img, effective_threshold)
-            case ComparisonMode.SEMANTIC:
-                result = self._compare_semantic(baseline_img, current_img, effective_threshold)
-            case _:
-                raise ValueError(f"Unknown comparison mode: {mode}")
+        compare_fn = self._comparison_method(comparison_mode)
+        diff_mask: np.ndarray | None
+
+        # Values cached for the baseline only apply if preprocessing left it as is
+        entry = baseline_entry if baseline_img is cached_baseline_img else None
+        if entry is not None and entry.image_digest is None:
+            entry.image_digest = self._image_digest(baseline_img)
+        baseline_digest = entry.image_digest if entry else self._image_digest(baseline_img)
+
+        if baseline_digest == self._image_digest(current_img):
+            # Fast path: byte-identical images need no comparison at all
+            result = ComparisonResult(
+                passed=True,
+                message=f"{comparison_mode.value.capitalize()} comparison passed (identical)",
+                details={"method": comparison_mode.value, "identical": True},
+            )
+            diff_mask = None
+        elif self._tile_size and comparison_mode in TILED_MODES:
+            result, diff_mask = self._compare_tiled(
+                baseline_img, current_img, comparison_mode, effective_threshold, entry
+            )
+        else:
+            result = compare_fn(
+                baseline_img,
+                current_img,
+                effective_threshold,
+                **self._cached_hash_kwargs(comparison_mode, entry, baseline_img, None),
+            )
+            diff_mask = self._banded_diff_mask(baseline_img, current_img)
 
         result.baseline_path = str(baseline_path)
         result.dynamic_regions_detected = detected_dynamic_regions
 
         # Enterprise: Enhanced diff reporting - calculate changed regions
-        baseline_arr = np.array(baseline_img)
-        current_arr = np.array(current_img)
-        diff_arr = np.abs(baseline_arr.astype(int) - current_arr.astype(int))
-        diff_gray = np.mean(diff_arr, axis=2)
-        diff_mask = diff_gray > 10
-
-        result.total_pixel_count = baseline_arr.shape[0] * baseline_arr.shape[1]
-        result.changed_pixel_count = int(np.sum(diff_mask))
-        result.changed_regions = self._identify_changed_regions(diff_mask)
+        width, height = baseline_img.size
+        result.total_pixel_count = width * height
+        if diff_mask is not None:
+            result.changed_pixel_count = int(np.sum(diff_mask))
+            result.changed_regions = self._identify_changed_regions(diff_mask)
 
         if not result.passed:
             current_path = self._diff_dir / f"{baseline_name}_current.png"
@@ -825,6 +958,189 @@ class VisualRegressionEngine:
 
         return masked
 
+    def _comparison_method(
+        self, mode: ComparisonMode
+    ) -> Callable[..., ComparisonResult]:
+        """Get the comparison algorithm for a mode."""
+        match mode:
+            case ComparisonMode.PIXEL:
+                return self._compare_pixel
+            case ComparisonMode.PERCEPTUAL:
+                return self._compare_perceptual
+            case ComparisonMode.STRUCTURAL:
+                return self._compare_structural
+            case ComparisonMode.SEMANTIC:
+                return self._compare_semantic
+            case _:
+                raise ValueError(f"Unknown comparison mode: {mode}")
+
+    def _band_height(self, width: int) -> int:
+        """Rows of a ``width`` pixel wide image that fit in the memory budget."""
+        return max(1, self._memory_budget // (max(1, width) * BAND_BYTES_PER_PIXEL))
+
+    def _image_digest(self, image: Image.Image) -> bytes:
+        """Digest of the decoded pixels, hashed one band at a time."""
+        width, height = image.size
+        digest = hashlib.blake2b(f"{image.mode}:{width}x{height}".encode(), digest_size=16)
+        band_height = self._band_height(width)
+
+        for y in range(0, height, band_height):
+            digest.update(image.crop((0, y, width, min(y + band_height, height))).tobytes())
+
+        return digest.digest()
+
+    def _tile_digests(
+        self,
+        image: Image.Image,
+        rows: list[tuple[int, int]],
+        cols: list[tuple[int, int]],
+    ) -> list[bytes]:
+        """
+        Digest every tile, in row-major order.
+
+        Only one band of tile rows is converted to an array at a time.
+        """
+        width, height = image.size
+        band_height = self._band_height(width)
+        band = np.empty((0, width))
+        band_top = band_bottom = 0
+        digests: list[bytes] = []
+
+        for y1, y2 in rows:
+            if y2 > band_bottom:
+                band_top = y1
+                band_bottom = min(height, max(y2, y1 + band_height))
+                band = np.asarray(image.crop((0, band_top, width, band_bottom)))
+
+            for x1, x2 in cols:
+                tile = np.ascontiguousarray(band[y1 - band_top:y2 - band_top, x1:x2])
+                digests.append(hashlib.blake2b(tile.tobytes(), digest_size=16).digest())
+
+        return digests
+
+    def _compare_tiled(
+        self,
+        baseline: Image.Image,
+        current: Image.Image,
+        mode: ComparisonMode,
+        threshold: float,
+        entry: CachedBaseline | None = None,
+    ) -> tuple[ComparisonResult, np.ndarray]:
+        """
+        Compare only the tiles whose digests differ.
+
+        Unchanged tiles count as fully similar. Each changed tile runs the
+        mode's algorithm on its own and the scores are weighted by tile area,
+        so for ``TILED_MODES`` the result equals the whole-image one.
+        Baseline tile digests and perceptual hashes are reused from ``entry``.
+
+        Returns:
+            Tuple of (comparison result, changed-pixel mask)
+        """
+        width, height = baseline.size
+        tile_size = self._tile_size or DEFAULT_TILE_SIZE
+        rows = _tile_edges(height, tile_size)
+        cols = _tile_edges(width, tile_size)
+        boxes = [(x1, y1, x2, y2) for y1, y2 in rows for x1, x2 in cols]
+
+        if entry is None:
+            baseline_digests = self._tile_digests(baseline, rows, cols)
+        else:
+            if tile_size not in entry.tile_digests:
+                entry.tile_digests[tile_size] = self._tile_digests(baseline, rows, cols)
+            baseline_digests = entry.tile_digests[tile_size]
+        current_digests = self._tile_digests(current, rows, cols)
+        changed = [
+            box
+            for box, baseline_digest, current_digest in zip(
+                boxes, baseline_digests, current_digests, strict=True
+            )
+            if baseline_digest != current_digest
+        ]
+
+        compare_fn = self._comparison_method(mode)
+        diff_mask = np.zeros((height, width), dtype=bool)
+        weighted_diff = 0.0
+        diff_pixels = 0
+
+        for box in changed:
+            x1, y1, x2, y2 = box
+            baseline_tile = baseline.crop(box)
+            current_tile = current.crop(box)
+
+            tile_result = compare_fn(
+                baseline_tile,
+                current_tile,
+                threshold,
+                **self._cached_hash_kwargs(mode, entry, baseline_tile, box),
+            )
+            weighted_diff += (1.0 - float(tile_result.similarity_score)) * (x2 - x1) * (y2 - y1)
+            if tile_result.details:
+                diff_pixels += int(tile_result.details.get("diff_pixels", 0))
+
+            diff_mask[y1:y2, x1:x2] = self._diff_mask(baseline_tile, current_tile)
+
+        diff_percentage = weighted_diff / (width * height)
+        passed = diff_percentage <= threshold
+
+        details: dict[str, Any] = {
+            "method": mode.value,
+            "tile_size": tile_size,
+            "tiles_total": len(boxes),
+            "tiles_changed": len(changed),
+        }
+        if mode == ComparisonMode.PIXEL:
+            details["diff_pixels"] = diff_pixels
+            details["total_pixels"] = width * height * len(baseline.getbands())
+
+        self._log.debug(
+            "Tiled comparison",
+            mode=mode.value,
+            tiles=len(boxes),
+            changed=len(changed),
+        )
+
+        return ComparisonResult(
+            passed=passed,
+            message=f"{mode.value.capitalize()} comparison " + ("passed" if passed else "failed"),
+            diff_percentage=diff_percentage,
+            similarity_score=1.0 - diff_percentage,
+            details=details,
+        ), diff_mask
+
+    def _cached_hash_kwargs(
+        self,
+        mode: ComparisonMode,
+        entry: CachedBaseline | None,
+        baseline: Image.Image,
+        box: tuple[int, int, int, int] | None,
+    ) -> dict[str, Any]:
+        """Pass the cached baseline perceptual hash to algorithms that use one."""
+        if entry is None or mode not in (ComparisonMode.PERCEPTUAL, ComparisonMode.SEMANTIC):
+            return {}
+        baseline_hash = entry.perceptual_hash(baseline, box)
+        return {"baseline_hash": baseline_hash} if baseline_hash is not None else {}
+
+    def _diff_mask(self, baseline: Image.Image, current: Image.Image) -> np.ndarray:
+        """Pixels whose mean channel difference is above the noise level."""
+        diff = np.abs(
+            np.asarray(baseline).astype(np.int16) - np.asarray(current).astype(np.int16)
+        )
+        return np.mean(diff, axis=2) > 10
+
+    def _banded_diff_mask(self, baseline: Image.Image, current: Image.Image) -> np.ndarray:
+        """Changed-pixel mask of the whole image, diffed one band of rows at a time."""
+        width, height = baseline.size
+        band_height = self._band_height(width)
+        diff_mask = np.zeros((height, width), dtype=bool)
+
+        for y1 in range(0, height, band_height):
+            y2 = min(y1 + band_height, height)
+            box = (0, y1, width, y2)
+            diff_mask[y1:y2] = self._diff_mask(baseline.crop(box), current.crop(box))
+
+        return diff_mask
+
     def _compare_pixel(
         self, baseline: Image.Image, current: Image.Image, threshold: float
     ) -> ComparisonResult:
@@ -853,13 +1169,18 @@ class VisualRegressionEngine:
         )
 
     def _compare_perceptual(
-        self, baseline: Image.Image, current: Image.Image, threshold: float
+        self,
+        baseline: Image.Image,
+        current: Image.Image,
+        threshold: float,
+        baseline_hash: Any | None = None,
     ) -> ComparisonResult:
         """Perceptual hash based comparison."""
         try:
             import imagehash
 
-            baseline_hash = imagehash.phash(baseline)
+            if baseline_hash is None:
+                baseline_hash = imagehash.phash(baseline)
             current_hash = imagehash.phash(current)
 
             hash_diff = baseline_hash - current_hash
@@ -919,7 +1240,11 @@ class VisualRegressionEngine:
             return self._compare_perceptual(baseline, current, threshold)
 
     def _compare_semantic(
-        self, baseline: Image.Image, current: Image.Image, threshold: float
+        self,
+        baseline: Image.Image,
+        current: Image.Image,
+        threshold: float,
+        baseline_hash: Any | None = None,
     ) -> ComparisonResult:
         """
         Semantic comparison using multiple algorithms.
@@ -928,7 +1253,7 @@ class VisualRegressionEngine:
         more intelligent comparison that tolerates minor UI changes.
         """
         struct_result = self._compare_structural(baseline, current, threshold)
-        percept_result = self._compare_perceptual(baseline, current, threshold)
+        percept_result = self._compare_perceptual(baseline, current, threshold, baseline_hash)
 
         combined_score = (struct_result.similarity_score * 0.6 +
                          percept_result.similarity_score * 0.4)
@@ -952,24 +1277,46 @@ class VisualRegressionEngine:
     def _generate_diff_image(
         self, baseline: Image.Image, current: Image.Image
     ) -> Image.Image:
-        """Generate a visual diff image highlighting differences."""
-        baseline_arr = np.array(baseline).astype(float)
-        current_arr = np.array(current).astype(float)
+        """
+        Generate a visual diff image highlighting differences.
+
+        Built one band of rows at a time; differences are normalised by the
+        maximum over the whole image, found in a first pass.
+        """
+        width, height = baseline.size
+        band_height = self._band_height(width)
+        bands = [(y, min(y + band_height, height)) for y in range(0, height, band_height)]
+
+        def band_arrays(y1: int, y2: int) -> tuple[np.ndarray, np.ndarray]:
+            box = (0, y1, width, y2)
+            return (
+                np.asarray(baseline.crop(box)).astype(float),
+                np.asarray(current.crop(box)).astype(float),
+            )
+
+        diff_max = 0.0
+        for y1, y2 in bands:
+            baseline_arr, current_arr = band_arrays(y1, y2)
+            diff_max = max(diff_max, float(np.abs(baseline_arr - current_arr).max()))
 
-        diff = np.abs(baseline_arr - current_arr)
+        diff_image = Image.new("RGB", (width, height))
+        for y1, y2 in bands:
+            baseline_arr, current_arr = band_arrays(y1, y2)
+            diff = np.abs(baseline_arr - current_arr)
 
-        diff_normalized = (diff / diff.max() * 255).astype(np.uint8) if diff.max() > 0 else diff.astype(np.uint8)
+            diff_normalized = (diff / diff_max * 255).astype(np.uint8) if diff_max > 0 else diff.astype(np.uint8)
 
-        diff_gray = np.mean(diff_normalized, axis=2)
+            diff_gray = np.mean(diff_normalized, axis=2)
 
-        diff_mask = diff_gray > 10
+            diff_mask = diff_gray > 10
 
-        result = current_arr.copy()
-        result[diff_mask] = [255, 0, 0]
+            result = current_arr.copy()
+            result[diff_mask] = [255, 0, 0]
 
-        blended = (baseline_arr * 0.3 + result * 0.7).astype(np.uint8)
+            blended = (baseline_arr * 0.3 + result * 0.7).astype(np.uint8)
+            diff_image.paste(Image.fromarray(blended), (0, y1))
 
-        return Image.fromarray(blended)
+        return diff_image
 
     def update_baseline(
         self,
@@ -999,5 +1346,4 @@ class VisualRegressionEngine:
         if not path.exists():
             return None
 
-        with open(path, "rb") as f:
-            return hashlib.sha256(f.read()).hexdigest()[:16]
+        return self._baseline_cache.key_for(path)
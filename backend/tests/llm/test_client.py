@@ -0,0 +1,75 @@
+"""Tests for LLM client rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from web2api.llm.client import TokenBucket
+from web2api.llm.config import RateLimitConfig
+
+
+class TestTokenBucket:
+    """Tests for the reservation-based TokenBucket."""
+
+    @pytest.fixture
+    def drained(self) -> TokenBucket:
+        """A bucket at 10 requests/second with no request budget left."""
+        bucket = TokenBucket(
+            RateLimitConfig(requests_per_minute=600, tokens_per_minute=600_000)
+        )
+        bucket._request_tokens = 0.0
+        return bucket
+
+    def test_reservations_queue_in_order(self, drained: TokenBucket) -> None:
+        """Each reservation waits one refill interval longer than the last."""
+        waits = [drained.reserve(10) for _ in range(3)]
+
+        assert waits == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+
+    def test_no_wait_within_budget(self) -> None:
+        """Requests that fit the remaining budget are not delayed."""
+        bucket = TokenBucket(RateLimitConfig())
+
+        assert bucket.reserve(1000) == 0.0
+
+    async def test_waits_overlap(self, drained: TokenBucket) -> None:
+        """Waiting callers sleep concurrently instead of one after another."""
+        start = time.monotonic()
+        await asyncio.gather(*(drained.acquire(10) for _ in range(4)))
+        elapsed = time.monotonic() - start
+
+        # Serialised sleeps would take 0.1 + 0.2 + 0.3 + 0.4 seconds
+        assert elapsed < 0.6
+        stats = drained.statistics
+        assert stats["acquired"] == 4
+        assert stats["delayed"] == 4
+        assert stats["waiting"] == 0
+        assert stats["active"] == 4
+
+    async def test_cancelled_wait_is_refunded(self, drained: TokenBucket) -> None:
+        """A caller cancelled while waiting returns its reservation."""
+        task = asyncio.create_task(drained.acquire(10))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert drained.reserve(10) == pytest.approx(0.1, abs=0.02)
+        assert drained.statistics["cancelled"] == 1
+
+    def test_report_usage_settles_both_ways(self) -> None:
+        """Overestimates are credited back and underestimates deducted."""
+        bucket = TokenBucket(RateLimitConfig(tokens_per_minute=10_000))
+        bucket.reserve(5000)
+        bucket.report_usage(actual_tokens=1000, estimated_tokens=5000)
+        assert bucket.statistics["token_tokens"] == pytest.approx(9000, abs=5)
+
+        bucket.report_usage(actual_tokens=3000, estimated_tokens=1000)
+        stats = bucket.statistics
+        assert stats["token_tokens"] == pytest.approx(7000, abs=5)
+        assert stats["credited_tokens"] == 4000
+        assert stats["debited_tokens"] == 2000
+        assert stats["token_occupancy"] == pytest.approx(0.3, abs=0.01)
@@ -2,17 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import json
+import re
+import time
+from typing import TYPE_CHECKING
+
 import pytest
 from pydantic import SecretStr
 
+from web2api.llm.batching import split_batch_response
+from web2api.llm.client import ChatCompletion, ChatMessage, LLMClientError
 from web2api.llm.config import (
+    BatchingConfig,
     LLMConfig,
     LLMEndpointConfig,
+    ResponseCacheConfig,
     ToolLLMConfig,
     ToolName,
 )
+from web2api.llm.prompts import PROMPT_REGISTRY, PromptType
+from web2api.llm.response_cache import CachedResponse, ResponseCache
 from web2api.llm.service import LLMResult, LLMService
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
 
 class TestLLMService:
     """Tests for LLMService."""
@@ -174,3 +191,307 @@ class TestLLMResult:
             parsed_data={"key": "value"},
         )
         assert result.parsed_data == {"key": "value"}
+
+
+class _FakeClient:
+    """LLM client stand-in that records chat and embedding calls."""
+
+    def __init__(self, content: str = "Submit the login form") -> None:
+        self.content = content
+        self.drop = 0
+        self.fail_batches = False
+        self.gate: asyncio.Event | None = None
+        self.chats: list[list[ChatMessage]] = []
+        self.embeds: list[str] = []
+
+    async def chat(self, messages: list[ChatMessage], **_kwargs: object) -> ChatCompletion:
+        self.chats.append(messages)
+        await asyncio.sleep(0)
+        if self.gate is not None:
+            await self.gate.wait()
+        items = re.findall(r"^### Request (\d+)$", messages[1].content, flags=re.MULTILINE)
+        if items:
+            if self.fail_batches:
+                raise LLMClientError("Batched request failed")
+            # Batched prompt: answer every item but the last dropped ones
+            answers = {i: f"{self.content} {i}" for i in items[: len(items) - self.drop]}
+            return ChatCompletion(
+                content=json.dumps(answers), model="test", usage={"total_tokens": 90}
+            )
+        return ChatCompletion(content=self.content, model="test", usage={"total_tokens": 50})
+
+    async def embed(self, texts: list[str], **_kwargs: object) -> list[list[float]]:
+        self.embeds.extend(texts)
+        return [[1.0, 0.1] if "login" in t else [0.0, 1.0] for t in texts]
+
+
+def _service(
+    client: _FakeClient,
+    batching: BatchingConfig | None = None,
+    **cache: object,
+) -> LLMService:
+    config = LLMConfig(
+        enabled=True,
+        default_endpoint=LLMEndpointConfig(api_key=SecretStr("test-key")),
+        test_builder=ToolLLMConfig(enabled=True),
+        response_cache=ResponseCacheConfig(**{"enabled": True, **cache}),
+        batching=batching or BatchingConfig(),
+    )
+    service = LLMService(config)
+    service._clients[ToolName.TEST_BUILDER] = client  # type: ignore[assignment]
+    return service
+
+
+class TestResponseCache:
+    """Tests for cached LLM responses."""
+
+    async def test_repeated_prompt_is_cached(self) -> None:
+        """Prompts differing only in whitespace reuse one completion."""
+        client = _FakeClient()
+        service = _service(client)
+
+        first = await service.generate_step_name("click", selector="#login", text="Log in")
+        second = await service.generate_step_name("click", selector="#login", text="Log  in ")
+
+        assert first == second == "Submit the login form"
+        assert len(client.chats) == 1
+        stats = service.cache_statistics()
+        assert stats["hits"] == 1
+        assert stats["tokens_saved"] == 50
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    async def test_different_prompt_misses(self) -> None:
+        """Different variables are separate cache entries."""
+        client = _FakeClient()
+        service = _service(client)
+
+        await service.generate_step_name("click", selector="#login")
+        await service.generate_step_name("click", selector="#logout")
+
+        assert len(client.chats) == 2
+
+    async def test_unparseable_json_not_cached(self) -> None:
+        """Responses that fail their expected JSON format are not reused."""
+        client = _FakeClient(content="not json")
+        service = _service(client)
+
+        for _ in range(2):
+            await service.suggest_assertions("https://example.com", "Example", [], [])
+
+        assert len(client.chats) == 2
+
+    async def test_persists_across_services(self, temp_dir: Path) -> None:
+        """A rebuild with the SQLite backend makes no repeat calls."""
+        path = temp_dir / "llm-cache.db"
+        client = _FakeClient()
+        await _service(client, path=path).generate_step_name("click", selector="#go")
+
+        rebuilt = _service(client, path=path)
+        result = await rebuilt.generate_step_name("click", selector="#go")
+
+        assert result == "Submit the login form"
+        assert len(client.chats) == 1
+        assert rebuilt.cache_statistics()["size"] == 1
+
+    async def test_changed_template_misses(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Editing a prompt template invalidates responses cached for the old one."""
+        path = temp_dir / "llm-cache.db"
+        client = _FakeClient()
+        await _service(client, path=path).generate_step_name("click", selector="#go")
+
+        template = PROMPT_REGISTRY[PromptType.GENERATE_STEP_NAME]
+        monkeypatch.setitem(
+            PROMPT_REGISTRY,
+            PromptType.GENERATE_STEP_NAME,
+            dataclasses.replace(
+                template,
+                user_prompt_template="Name this step briefly.\n"
+                + template.user_prompt_template,
+            ),
+        )
+        await _service(client, path=path).generate_step_name("click", selector="#go")
+
+        assert len(client.chats) == 2
+        assert "Name this step briefly." in client.chats[1][1].content
+
+    async def test_near_duplicate_prompt_hits(self) -> None:
+        """Prompts with similar embeddings reuse a response."""
+        client = _FakeClient()
+        service = _service(client, similarity_threshold=0.95)
+
+        await service.generate_step_name("click", selector="#login-button")
+        await service.generate_step_name("click", selector="#login-btn")
+        await service.generate_step_name("click", selector="#search")
+
+        assert len(client.chats) == 2
+        assert service.cache_statistics()["semantic_hits"] == 1
+
+    async def test_disabled_cache(self) -> None:
+        """With caching disabled every call reaches the model."""
+        client = _FakeClient()
+        service = _service(client, enabled=False)
+
+        for _ in range(2):
+            await service.generate_step_name("click", selector="#go")
+
+        assert len(client.chats) == 2
+        assert service.cache_statistics() == {}
+
+    def test_disabled_by_default(self) -> None:
+        """Sampled completions are only replayed once caching is opted into."""
+        assert not LLMConfig().response_cache.enabled
+
+    def test_ttl_and_size_budget(self) -> None:
+        """Expired entries miss and the least recently used are evicted."""
+        cache = ResponseCache(ttl_seconds=60, max_entries=2)
+        cache.put("old", CachedResponse(content="a", created_at=time.time() - 120))
+        cache.put("b", CachedResponse(content="b"))
+        cache.put("c", CachedResponse(content="c"))
+        cache.get("b")
+        cache.put("d", CachedResponse(content="d"))
+
+        assert cache.get("old") is None
+        assert cache.get("c") is None
+        assert [cache.get(k).content for k in ("b", "d")] == ["b", "d"]
+        assert cache.statistics["evictions"] == 2
+
+
+class TestPromptBatching:
+    """Tests for request coalescing and micro-batching."""
+
+    BATCHED = BatchingConfig(enabled=True)
+
+    @staticmethod
+    async def _names(service: LLMService, selectors: list[str]) -> list[str]:
+        return await asyncio.gather(
+            *(service.generate_step_name("click", selector=sel) for sel in selectors)
+        )
+
+    @staticmethod
+    async def _until(condition: Callable[[], bool]) -> None:
+        for _ in range(100):
+            if condition():
+                return
+            await asyncio.sleep(0)
+        raise AssertionError("Condition not reached")
+
+    async def test_concurrent_prompts_share_one_call(self) -> None:
+        """Concurrent prompts of one type are answered by one batched call."""
+        client = _FakeClient(content="Click")
+        service = _service(client, self.BATCHED, enabled=False)
+
+        names = await self._names(service, ["#a", "#b", "#c"])
+
+        assert names == ["Click 1", "Click 2", "Click 3"]
+        assert len(client.chats) == 1
+        assert service.batch_statistics()["batched_items"] == 3
+
+    async def test_batch_size_limit(self) -> None:
+        """Batches are split at max_batch_size."""
+        client = _FakeClient(content="Click")
+        batching = BatchingConfig(enabled=True, max_batch_size=2)
+        service = _service(client, batching, enabled=False)
+
+        names = await self._names(service, ["#a", "#b", "#c"])
+
+        assert names == ["Click 1", "Click 2", "Click"]
+        assert len(client.chats) == 2
+
+    async def test_identical_prompts_coalesced(self) -> None:
+        """Identical in-flight prompts make a single call."""
+        client = _FakeClient()
+        service = _service(client, enabled=False)
+
+        names = await self._names(service, ["#go"] * 3)
+
+        assert names == ["Submit the login form"] * 3
+        assert len(client.chats) == 1
+        assert service.batch_statistics()["coalesced"] == 2
+
+    async def test_cancelled_owner_does_not_cancel_waiters(self) -> None:
+        """A coalesced waiter gets its result when the first caller is cancelled."""
+        client = _FakeClient()
+        client.gate = asyncio.Event()
+        service = _service(client, enabled=False)
+
+        owner = asyncio.create_task(service.generate_step_name("click", selector="#go"))
+        await self._until(lambda: bool(client.chats))
+        waiter = asyncio.create_task(service.generate_step_name("click", selector="#go"))
+        await self._until(lambda: service.batch_statistics()["coalesced"] == 1)
+
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        client.gate.set()
+
+        assert await waiter == "Submit the login form"
+        assert len(client.chats) == 1
+
+    async def test_request_cancelled_with_last_waiter(self) -> None:
+        """The shared request is cancelled once every caller was cancelled."""
+        client = _FakeClient()
+        client.gate = asyncio.Event()
+        service = _service(client, enabled=False)
+
+        callers = [
+            asyncio.create_task(service.generate_step_name("click", selector="#go"))
+            for _ in range(2)
+        ]
+        await self._until(lambda: service.batch_statistics()["coalesced"] == 1)
+        (request,) = service._in_flight.values()
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await self._until(request.done)
+
+        assert request.cancelled()
+        assert not service._in_flight
+
+    async def test_missing_answers_retried_individually(self) -> None:
+        """Items missing from a batched answer fall back to single prompts."""
+        client = _FakeClient(content="Click")
+        client.drop = 1
+        service = _service(client, self.BATCHED, enabled=False)
+
+        names = await self._names(service, ["#a", "#b"])
+
+        assert names == ["Click 1", "Click"]
+        assert len(client.chats) == 2
+        assert service.batch_statistics()["split_fallbacks"] == 1
+
+    async def test_failed_batch_retried_individually(self) -> None:
+        """A failed batched request falls back to one request per item."""
+        client = _FakeClient(content="Click")
+        client.fail_batches = True
+        service = _service(client, self.BATCHED, enabled=False)
+
+        names = await self._names(service, ["#a", "#b"])
+
+        assert names == ["Click", "Click"]
+        assert len(client.chats) == 3
+        assert service.batch_statistics()["batch_fallbacks"] == 1
+
+    async def test_batching_disabled_by_default(self) -> None:
+        """Without opting in, each distinct prompt is its own call."""
+        client = _FakeClient()
+        service = _service(client, enabled=False)
+
+        await self._names(service, ["#a", "#b", "#c"])
+
+        assert len(client.chats) == 3
+        assert service.batch_statistics()["coalesced"] == 0
+
+    def test_split_batch_response(self) -> None:
+        """Batched answers are split per item, decoding JSON where expected."""
+        content = '```json\n{"1": [{"type": "text"}], "2": "[]"}\n```'
+
+        assert split_batch_response(content, 3, expects_json=True) == [
+            '[{"type": "text"}]',
+            "[]",
+            None,
+        ]
+        assert split_batch_response("not json", 2, expects_json=False) == [None, None]
+        assert split_batch_response('{"1": {"a": 1}}', 1, expects_json=False) == [None]
+
@@ -0,0 +1,115 @@
+"""
+Unit tests for the Web2API auth module.
+
+Tests cover:
+- ServiceCache TTL, LRU eviction and invalidation
+- Session validity tracking
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from web2api.auth.service_cache import CachedService, ServiceCache
+
+
+def _entry(service_id: str = "svc") -> CachedService:
+    """Create a cached service entry."""
+    return CachedService(
+        service_id=service_id,
+        url="https://chat.example.com",
+        config={"ui_selectors": {"input": "#in"}},
+        credentials={"email": "user@example.com", "password": "secret"},
+    )
+
+
+class TestServiceCache:
+    """Tests for ServiceCache."""
+
+    def test_get_after_put(self) -> None:
+        """Test cached entries are returned and counted as hits."""
+        cache = ServiceCache()
+        cache.put(_entry())
+
+        entry = cache.get("svc")
+
+        assert entry is not None
+        assert entry.credentials["password"] == "secret"
+        assert cache.statistics["hits"] == 1
+
+    def test_entries_expire(self) -> None:
+        """Test entries older than the TTL are dropped."""
+        cache = ServiceCache(ttl_seconds=10.0)
+        cache.put(_entry())
+
+        with patch("web2api.auth.service_cache.time.time", return_value=1e12):
+            assert cache.get("svc") is None
+
+        assert cache.statistics["misses"] == 1
+        assert cache.statistics["size"] == 0
+
+    def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted past max_entries."""
+        cache = ServiceCache(max_entries=2)
+        cache.put(_entry("a"))
+        cache.put(_entry("b"))
+        cache.get("a")
+        cache.put(_entry("c"))
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.statistics["evictions"] == 1
+
+    def test_invalidate(self) -> None:
+        """Test invalidation drops the entry."""
+        cache = ServiceCache()
+        cache.put(_entry())
+
+        cache.invalidate("svc")
+
+        assert cache.get("svc") is None
+        assert cache.statistics["invalidations"] == 1
+
+
+class TestSessionValidity:
+    """Tests for cached session validity."""
+
+    def test_session_invalid_until_marked(self) -> None:
+        """Test a new entry requires a session restore."""
+        cache = ServiceCache()
+        entry = cache.put(_entry())
+
+        assert entry.session_valid is False
+
+        cache.mark_session_valid("svc")
+
+        assert entry.session_valid is True
+
+    def test_invalidate_session(self) -> None:
+        """Test session invalidation keeps config but forces a restore."""
+        cache = ServiceCache()
+        cache.put(_entry())
+        cache.mark_session_valid("svc")
+
+        cache.invalidate_session("svc")
+
+        entry = cache.get("svc")
+        assert entry is not None
+        assert entry.session_valid is False
+
+    def test_refresh_keeps_session(self) -> None:
+        """Test re-caching a service keeps a still-valid session."""
+        cache = ServiceCache()
+        cache.put(_entry())
+        cache.mark_session_valid("svc")
+
+        refreshed = cache.put(_entry())
+
+        assert refreshed.session_valid is True
+
+    def test_session_lock_is_per_service(self) -> None:
+        """Test each service gets its own session lock."""
+        cache = ServiceCache()
+
+        assert cache.session_lock("a") is cache.session_lock("a")
+        assert cache.session_lock("a") is not cache.session_lock("b")
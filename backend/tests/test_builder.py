@@ -4,10 +4,29 @@ Tests for the Auto Test Builder module.
 
 from __future__ import annotations
 
+import gc
+import re
+import threading
+import time
+from datetime import UTC, datetime
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
-
+from owl_browser import BatchResult, Cookie
+
+from web2api.builder.analyzer import PageAnalyzer
+from web2api.builder.analyzer.page_analyzer import ComponentType
+from web2api.builder.crawler import (
+    ApplicationState,
+    CrawlConfig,
+    IntelligentCrawler,
+    PageTemplateIndex,
+    StateGraph,
+    StateTransition,
+)
+from web2api.builder.crawler.state_manager import DOMState, StateChangeType, StorageState
+from web2api.builder.crawler.template_index import skeleton_fingerprint, url_shape
 from web2api.builder.test_builder import (
     AutoTestBuilder,
     BuilderConfig,
@@ -246,5 +265,452 @@ class TestSemanticSelectorGeneration:
         assert selector == "user name input"
 
 
+# Site graph for crawler tests: path -> (links, body text). "/mirror"
+# duplicates "/products" content and "/broken" always fails to load.
+_SITE: dict[str, tuple[list[str], str]] = {
+    "/": (["/products", "/about", "/blog", "/login", "/broken"], "home"),
+    "/products": (["/product/1", "/product/2", "/mirror", "/checkout"], "catalog"),
+    "/mirror": (["/product/3"], "catalog"),
+    "/product/1": (["/product/2", "/product/3", "/terms"], "p1"),
+    "/product/2": (["/product/1", "/account"], "p2"),
+    "/product/3": (["/help"], "p3"),
+    "/about": (["/contact", "/privacy"], "about"),
+    "/blog": ([f"/blog/{i}" for i in range(6)], "blog"),
+    **{f"/blog/{i}": (["/blog", f"/blog/{(i + 1) % 6}"], f"post {i}") for i in range(6)},
+    "/login": (["/"], "login"),
+    "/checkout": (["/account"], "checkout"),
+    "/account": (["/dashboard"], "account"),
+    "/dashboard": ([], "dashboard"),
+    "/terms": ([], "terms"),
+    "/privacy": ([], "privacy"),
+    "/contact": ([], "contact"),
+    "/help": ([], "help"),
+}
+
+
+class _FakeSitePage:
+    """Blocking page stand-in that serves _SITE."""
+
+    def __init__(self, site: _FakeSite) -> None:
+        self._site = site
+        self._path = "/"
+
+    def goto(self, url: str, **_options: Any) -> None:
+        with self._site.lock:
+            self._site.active += 1
+            self._site.peak = max(self._site.peak, self._site.active)
+        try:
+            time.sleep(0.02)
+        finally:
+            with self._site.lock:
+                self._site.active -= 1
+        path = url.removeprefix("https://site.test")
+        if path == "/broken":
+            raise RuntimeError("navigation failed")
+        self._path = path
+
+    def get_current_url(self) -> str:
+        return "https://site.test" + self._path
+
+    def expression(self, script: str) -> Any:
+        links, text = _SITE[self._path]
+        if "a[href]" in script:
+            return ["https://site.test" + link for link in links]
+        if "forms.push" in script:
+            return []
+        # Page signature: product pages share one skeleton, others differ
+        if self._path.startswith("/product/"):
+            skeleton = {"DIV>SECTION.product": 1, "SECTION>H1": 1, "SECTION>IMG": 4}
+        else:
+            skeleton = {f"BODY>MAIN.{self._path}": 1}
+        return {"content": text, "skeleton": skeleton}
+
+    def get_title(self) -> str:
+        return self._path
+
+    def get_html(self) -> str:
+        return f"<html>{self._path}</html>"
+
+    def screenshot(self) -> bytes:
+        return b""
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeSite:
+    """Browser stand-in tracking how many navigations overlap."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def new_page(self) -> _FakeSitePage:
+        return _FakeSitePage(self)
+
+
+# Site graph for authenticated crawls: pages other than "/" and "/login"
+# show a guest view without links until the context holds a session cookie.
+_AUTH_SITE: dict[str, tuple[list[str], str]] = {
+    "/": (["/login", "/a", "/b"], "home"),
+    "/login": (["/"], "login"),
+    "/a": (["/members/a"], "a"),
+    "/b": (["/members/b"], "b"),
+    "/members/a": ([], "members a"),
+    "/members/b": ([], "members b"),
+}
+
+
+class _FakeAuthPage(_FakeSitePage):
+    """Blocking page stand-in that serves _AUTH_SITE and logs in on submit."""
+
+    def __init__(self, site: _FakeSite) -> None:
+        super().__init__(site)
+        self.cookies: list[Cookie] = []
+
+    def expression(self, script: str) -> Any:
+        links, text = _AUTH_SITE[self._path]
+        if self._path not in ("/", "/login") and not self.cookies:
+            links, text = [], f"guest {self._path}"
+        if "a[href]" in script:
+            return ["https://site.test" + link for link in links]
+        if "forms.push" in script:
+            return [{"hasPassword": True}] if self._path == "/login" else []
+        return {"content": text, "skeleton": {f"BODY>MAIN.{self._path}": 1}}
+
+    def type(self, _selector: str, _text: str) -> None:
+        pass
+
+    def click(self, _selector: str) -> None:
+        self.cookies = [Cookie(name="session", value="s3cret", domain="site.test", path="/")]
+
+    def get_cookies(self, _url: str | None = None) -> list[Cookie]:
+        return list(self.cookies)
+
+    def set_cookie(self, _url: str, name: str, value: str, **options: Any) -> bool:
+        self.cookies.append(Cookie(
+            name=name, value=value, domain=options["domain"], path=options["path"]
+        ))
+        return True
+
+
+class _FakeAuthSite(_FakeSite):
+    """Browser stand-in for _AUTH_SITE."""
+
+    def new_page(self) -> _FakeAuthPage:
+        return _FakeAuthPage(self)
+
+
+class TestIntelligentCrawlerConcurrency:
+    """Tests for concurrent crawling over a BrowserPool."""
+
+    @staticmethod
+    def _config(**overrides: Any) -> CrawlConfig:
+        settings: dict[str, Any] = {
+            "start_url": "https://site.test/",
+            "max_pages": 12,
+            "max_depth": 4,
+            "rate_limit_ms": 0,
+            "wait_after_navigation_ms": 0,
+            "max_retries": 1,
+        }
+        return CrawlConfig(**{**settings, **overrides})
+
+    @staticmethod
+    def _summary(crawler: IntelligentCrawler, result: Any) -> dict[str, Any]:
+        return {
+            "crawled": [page.url for page in result.pages_crawled],
+            "failed": [page.url for page in result.pages_failed],
+            "skipped": result.pages_skipped,
+            "urls_discovered": result.urls_discovered,
+            "visited": crawler._visited_urls,
+        }
+
+    @pytest.mark.parametrize("max_pages", [1, 5, 12, 40])
+    async def test_concurrent_crawl_matches_serial(self, max_pages: int) -> None:
+        """Test concurrent crawl commits the same pages as the serial crawl."""
+        serial = IntelligentCrawler(_FakeSite(), self._config(max_pages=max_pages))
+        serial_result = await serial.crawl()
+
+        site = _FakeSite()
+        concurrent = IntelligentCrawler(site, self._config(max_pages=max_pages, concurrency=4))
+        concurrent_result = await concurrent.crawl()
+
+        assert self._summary(concurrent, concurrent_result) == self._summary(serial, serial_result)
+        if max_pages > 1:
+            assert site.peak > 1
+        if max_pages == 40:
+            assert [page.url for page in concurrent_result.pages_failed] == ["https://site.test/broken"]
+            assert concurrent_result.pages_skipped == ["https://site.test/mirror"]
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    async def test_template_sampling_limits_product_pages(self, concurrency: int) -> None:
+        """Test only max_pages_per_template pages of one template are crawled."""
+        crawler = IntelligentCrawler(
+            _FakeSite(),
+            self._config(max_pages=40, max_pages_per_template=2, concurrency=concurrency),
+        )
+        result = await crawler.crawl()
+
+        products = [page.url for page in result.pages_crawled if "/product/" in page.url]
+        assert len(products) == 2
+        assert len({page.template_id for page in result.pages_crawled}) == len(result.pages_crawled) - 1
+        assert result.template_pages_skipped == 1
+        assert any("/product/" in url for url in result.pages_skipped)
+
+    async def test_authenticated_crawl_matches_serial(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test pool contexts share the login session of a concurrent crawl."""
+        # Skip the fixed wait after submitting the login form
+        monkeypatch.setattr(
+            "web2api.builder.crawler.intelligent_crawler.time.sleep", lambda _: None
+        )
+        credentials = {"username": "user@site.test", "password": "hunter2"}
+
+        serial = IntelligentCrawler(_FakeAuthSite(), self._config(authentication=credentials))
+        serial_result = await serial.crawl()
+
+        concurrent = IntelligentCrawler(
+            _FakeAuthSite(), self._config(authentication=credentials, concurrency=4)
+        )
+        concurrent_result = await concurrent.crawl()
+
+        assert self._summary(concurrent, concurrent_result) == self._summary(serial, serial_result)
+        assert concurrent_result.authentication_completed
+        assert {
+            "https://site.test/members/a", "https://site.test/members/b"
+        } <= {page.url for page in concurrent_result.pages_crawled}
+
+    def test_closed_context_does_not_vouch_for_its_successor(self) -> None:
+        """Test a context created after a shared one is closed still gets the session."""
+        site = _FakeAuthSite()
+        crawler = IntelligentCrawler(site, self._config(concurrency=4))
+        crawler._session_cookies = [
+            Cookie(name="session", value="s3cret", domain="site.test", path="/")
+        ]
+        page = site.new_page()
+        crawler._share_session(page)
+        assert page in crawler._session_pages
+
+        del page
+        gc.collect()
+        # Fresh objects often reuse the freed page's id()
+        successors = [site.new_page() for _ in range(8)]
+
+        assert not any(successor in crawler._session_pages for successor in successors)
+
+    async def test_per_host_rate_limit_spaces_requests(self) -> None:
+        """Test requests to one host start at least rate_limit_ms apart."""
+        crawler = IntelligentCrawler(_FakeSite(), self._config(rate_limit_ms=50, concurrency=4))
+        starts = []
+        for _ in range(3):
+            await crawler._wait_for_host("https://site.test/a")
+            starts.append(time.monotonic())
+        await crawler._wait_for_host("https://other.test/")
+        other_start = time.monotonic()
+
+        assert starts[1] - starts[0] >= 0.045
+        assert starts[2] - starts[1] >= 0.045
+        assert other_start - starts[2] < 0.045
+
+
+class TestPageTemplateIndex:
+    """Tests for structural template grouping."""
+
+    def test_similar_skeletons_share_template(self) -> None:
+        """Test pages differing only in list length map to one template."""
+        base = {f"DIV>SECTION.block-{i}": 1 for i in range(30)}
+        page_a = skeleton_fingerprint({**base, "UL>LI.item": 10})
+        page_b = skeleton_fingerprint({**base, "UL>LI.item": 12})
+        other = skeleton_fingerprint({f"MAIN>ARTICLE.post-{i}": 2 for i in range(30)})
+
+        index = PageTemplateIndex(max_samples=1)
+        first = index.assign("https://shop.test/product/1", page_a)
+        second = index.assign("https://shop.test/product/2", page_b)
+        third = index.assign("https://shop.test/blog", other)
+
+        assert first.is_new and first.sample
+        assert second.template is first.template
+        assert not second.sample
+        assert third.is_new and third.template is not first.template
+
+    def test_saturated_url_shape(self) -> None:
+        """Test a URL shape bound to a fully sampled template is skippable."""
+        index = PageTemplateIndex(max_samples=2)
+        fingerprint = skeleton_fingerprint({"DIV>SECTION.product": 1})
+        index.assign("https://shop.test/product/1", fingerprint)
+        assert not index.is_saturated_shape("https://shop.test/product/9")
+
+        index.assign("https://shop.test/product/2", fingerprint)
+        assert index.is_saturated_shape("https://shop.test/product/9")
+        assert not index.is_saturated_shape("https://shop.test/about")
+
+        # A shape rendering different templates is never skipped
+        index.assign("https://shop.test/product/3", skeleton_fingerprint({"MAIN>P.error": 1}))
+        assert not index.is_saturated_shape("https://shop.test/product/9")
+
+    def test_url_shape(self) -> None:
+        """Test identifier segments and query values are normalised."""
+        assert url_shape("https://a.test/product/123?ref=x&b=1") == "a.test/product/{id}?b&ref"
+        assert url_shape("https://a.test/about") == "a.test/about"
+
+
+
+def _app_state(state_id: str, authenticated: bool = False) -> ApplicationState:
+    cookies = [{"name": "session_id"}] if authenticated else []
+    return ApplicationState(
+        state_id=state_id,
+        url=f"https://site.test/{state_id}",
+        storage_state=StorageState(local_storage={}, session_storage={}, cookies=cookies),
+        dom_state=DOMState(
+            url=f"https://site.test/{state_id}",
+            title=state_id,
+            visible_text_hash="",
+            element_count=0,
+            form_count=0,
+            modal_visible=False,
+            active_element_selector=None,
+        ),
+        timestamp=datetime.now(UTC),
+    )
+
+
+def _transition(from_id: str, to_id: str, action: str = "click") -> StateTransition:
+    return StateTransition(
+        from_state_id=from_id,
+        to_state_id=to_id,
+        trigger_action=action,
+        trigger_selector=f"#{to_id}",
+        change_type=StateChangeType.NAVIGATION,
+        timestamp=datetime.now(UTC),
+    )
+
+
+class TestStateGraph:
+    """Tests for the indexed state graph."""
+
+    @staticmethod
+    def _graph(max_states: int | None = None) -> StateGraph:
+        graph = StateGraph(states={}, transitions=[], max_states=max_states)
+        for state_id in ["home", "login", "dashboard", "settings", "about"]:
+            graph.add_state(_app_state(state_id, authenticated=state_id in {"dashboard", "settings"}))
+        graph.initial_state_id = "home"
+        return graph
+
+    def test_revisited_state_and_duplicate_transition(self) -> None:
+        """Test revisiting a state or transition does not grow the graph."""
+        graph = self._graph()
+
+        assert graph.add_state(_app_state("home")) is False
+        assert graph.add_transition(_transition("home", "login")) is True
+        assert graph.add_transition(_transition("home", "login")) is False
+        assert len(graph.states) == 5
+        assert len(graph.transitions) == 1
+
+    def test_shortest_path_uses_parent_pointers(self) -> None:
+        """Test shortest path reconstruction and cache invalidation."""
+        graph = self._graph()
+        graph.add_transition(_transition("home", "about"))
+        graph.add_transition(_transition("about", "login"))
+        graph.add_transition(_transition("login", "dashboard", "submit"))
+        graph.add_transition(_transition("dashboard", "settings"))
+
+        path = graph.get_path_to_state("settings")
+        assert [(t.from_state_id, t.to_state_id) for t in path] == [
+            ("home", "about"), ("about", "login"), ("login", "dashboard"), ("dashboard", "settings"),
+        ]
+        assert graph.get_prerequisites("dashboard") == ["home", "about", "login"]
+        assert graph.get_path_to_state("home") == []
+
+        # A shortcut invalidates the cached tree
+        graph.add_transition(_transition("home", "login"))
+        assert graph.get_prerequisites("settings") == ["home", "login", "dashboard"]
+
+        entry_points = graph.get_authenticated_entry_points()
+        assert [(t.from_state_id, t.to_state_id) for t in entry_points] == [("login", "dashboard")]
+
+    def test_unreachable_state_has_no_path(self) -> None:
+        """Test states without a path from the initial state return no path."""
+        graph = self._graph()
+        graph.add_transition(_transition("about", "login"))
+
+        assert graph.get_path_to_state("login") == []
+
+    def test_max_states_evicts_least_recently_seen(self) -> None:
+        """Test the graph stays bounded and drops evicted transitions."""
+        graph = self._graph(max_states=5)
+        graph.add_transition(_transition("home", "login"))
+        graph.add_transition(_transition("login", "dashboard"))
+        graph.add_state(_app_state("login"))  # Seen again, now most recent
+
+        graph.add_state(_app_state("profile"))
+        graph.add_state(_app_state("cart"))
+
+        assert len(graph.states) == 5
+        # "home" is the initial state and is never evicted
+        assert set(graph.states) == {"home", "login", "about", "profile", "cart"}
+        assert "dashboard" not in graph.authenticated_states
+        assert [(t.from_state_id, t.to_state_id) for t in graph.transitions] == [("home", "login")]
+        assert graph.get_path_to_state("dashboard") == []
+
+
+
+class _FakeAnalyzerPage:
+    """Page stand-in answering batched component queries; None fails a query."""
+
+    def __init__(self, matches: dict[str, list[dict[str, Any]] | None]) -> None:
+        self._matches = matches
+        self.batches: list[list[tuple[str, dict[str, Any]]]] = []
+
+    def batch(self, commands: list[tuple[str, dict[str, Any]]]) -> list[BatchResult]:
+        self.batches.append(commands)
+        results = []
+        for method, params in commands:
+            selector = re.search(r'querySelectorAll\("(.*?)"\)', params["expression"])
+            assert method == "evaluate" and selector is not None
+            found = self._matches.get(selector.group(1), [])
+            if found is None:
+                results.append(BatchResult(method, success=False, error=RuntimeError("boom")))
+            else:
+                results.append(BatchResult(method, success=True, result=found))
+        return results
+
+
+def _raw_component(selector: str) -> dict[str, Any]:
+    return {
+        "selector": selector,
+        "boundingBox": {"x": 0, "y": 0, "width": 100, "height": 40},
+        "childrenCount": 3,
+        "interactiveCount": 1,
+        "attributes": {"id": None, "className": None, "ariaLabel": None, "role": None},
+    }
+
+
+class TestPageAnalyzerComponents:
+    """Tests for pipelined component detection."""
+
+    async def test_all_patterns_share_one_batch(self) -> None:
+        """Every pattern selector is queried in a single pipelined batch."""
+        page = _FakeAnalyzerPage({
+            "form": [_raw_component("#login")],
+            "nav": [_raw_component("#menu")],
+            "[role='form']": None,
+        })
+
+        components = await PageAnalyzer()._detect_components(page)
+
+        assert len(page.batches) == 1
+        queried = len(page.batches[0])
+        assert queried == sum(
+            len(pattern["selectors"]) for pattern in PageAnalyzer.COMPONENT_PATTERNS.values()
+        )
+        assert {(c.selector, c.component_type) for c in components} == {
+            ("#login", ComponentType.FORM),
+            ("#menu", ComponentType.NAVIGATION),
+        }
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
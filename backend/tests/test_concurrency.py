@@ -11,8 +11,11 @@ Tests cover:
 from __future__ import annotations
 
 import asyncio
+import sqlite3
+import threading
+import time
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -29,6 +32,9 @@ from web2api.concurrency.resource_monitor import (
     ResourceSnapshot,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestResourceLimits:
     """Tests for ResourceLimits configuration."""
@@ -339,6 +345,7 @@ class TestMockBrowserPool:
 
         pool = BrowserPool(mock_browser, config)
         await pool.start()
+        await pool.wait_until_warm()
 
         try:
             # Should create minimum contexts
@@ -415,6 +422,178 @@ class TestMockBrowserPool:
             assert stats["total_releases"] >= 1
             assert stats["total_created"] >= 1
 
+    @pytest.mark.asyncio
+    async def test_slow_context_creation_does_not_block_loop(self) -> None:
+        """Test new_page() runs off-loop and does not block releases."""
+        from web2api.concurrency.browser_pool import BrowserPool
+
+        browser = MagicMock()
+
+        def slow_new_page() -> MagicMock:
+            time.sleep(0.3)
+            return MagicMock()
+
+        browser.new_page.side_effect = slow_new_page
+        config = ConcurrencyConfig(
+            min_browser_contexts=1,
+            max_browser_contexts=3,
+            graceful_shutdown_timeout_seconds=1.0,
+        )
+
+        async with BrowserPool(browser, config) as pool:
+            await pool.wait_until_warm()
+            first = await pool._acquire_context("first", timeout=5.0)
+
+            # Starts a slow creation; the loop must stay responsive meanwhile
+            creating = asyncio.create_task(pool._acquire_context("second", timeout=5.0))
+            await asyncio.sleep(0.05)
+            assert pool.statistics["pending_creates"] == 1
+
+            ticks = 0
+            started = time.monotonic()
+            while time.monotonic() - started < 0.1:
+                await asyncio.sleep(0.01)
+                ticks += 1
+            assert ticks >= 5
+
+            # Release and re-acquire do not wait for the in-flight creation
+            await pool._release_context(first)
+            again = await asyncio.wait_for(pool._acquire_context("third", timeout=5.0), 0.2)
+            assert again is first
+            assert not creating.done()
+
+            second = await creating
+            assert second is not first
+            await pool._release_context(again)
+            await pool._release_context(second)
+
+    @pytest.mark.asyncio
+    async def test_context_created_during_stop_is_closed(self) -> None:
+        """Test a context whose creation finishes after stop() is closed, not kept."""
+        from web2api.concurrency.browser_pool import BrowserPool
+
+        unblock = threading.Event()
+        page = MagicMock()
+        browser = MagicMock()
+        config = ConcurrencyConfig(min_browser_contexts=0, max_browser_contexts=2)
+
+        pool = BrowserPool(browser, config)
+        await pool.start()
+        existing = await pool._create_context()
+        assert existing is not None
+
+        # The new context finishes creating while stop() closes the existing one
+        existing.context.close.side_effect = lambda: unblock.set() or time.sleep(0.2)
+        browser.new_page.side_effect = lambda: unblock.wait(5) and page
+        creating = asyncio.create_task(pool._create_context())
+        await asyncio.sleep(0.05)
+
+        await pool.stop()
+
+        assert await creating is None
+        assert pool.size == 0
+        page.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_prewarm_runs_in_background(self) -> None:
+        """Test start() returns before minimum contexts are created."""
+        from web2api.concurrency.browser_pool import BrowserPool
+
+        browser = MagicMock()
+        browser.new_page.side_effect = lambda: time.sleep(0.2) or MagicMock()
+        config = ConcurrencyConfig(min_browser_contexts=3, max_browser_contexts=5)
+
+        async with BrowserPool(browser, config) as pool:
+            assert pool.size == 0
+            started = time.monotonic()
+            await pool.wait_until_warm()
+
+            assert pool.size == 3
+            assert pool.available_count == 3
+            # Contexts are created concurrently, not one after another
+            assert time.monotonic() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_failed_health_check_recycles_context(self, mock_browser: MagicMock) -> None:
+        """Test an unhealthy context is replaced on acquisition."""
+        from web2api.concurrency.browser_pool import BrowserPool
+
+        config = ConcurrencyConfig(min_browser_contexts=1, max_browser_contexts=2)
+
+        async with BrowserPool(mock_browser, config) as pool:
+            await pool.wait_until_warm()
+            broken = pool._contexts[next(iter(pool._contexts))]
+            broken.context = MagicMock()
+            broken.context.get_current_url.side_effect = RuntimeError("dead")
+
+            async with pool.acquire("test") as context:
+                assert context is not broken.context
+
+            assert pool.statistics["total_recycled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_service_acquisition_prefers_warm_context(self, mock_browser: MagicMock) -> None:
+        """Test a service gets back the context holding its cookies."""
+        from web2api.concurrency.browser_pool import BrowserPool
+
+        mock_browser.new_page.side_effect = lambda: MagicMock()
+        config = ConcurrencyConfig(min_browser_contexts=1, max_browser_contexts=2)
+
+        async with BrowserPool(mock_browser, config) as pool:
+            await pool.wait_until_warm()
+            async with pool.acquire_service_context("alpha") as alpha:
+                pass
+            async with pool.acquire_service_context("beta") as beta:
+                pass
+
+            # Pool is full; both contexts are idle, beta's released last
+            async with pool.acquire_service_context("alpha") as again:
+                assert again is alpha
+            async with pool.acquire("test") as any_context:
+                assert any_context is alpha
+            assert beta is not alpha
+
+            stats = pool.statistics
+            assert stats["service_hits"] == 1
+            assert stats["service_misses"] == 2
+            assert stats["acquire_latency"]["max_ms"] >= stats["acquire_latency"]["avg_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_recycle_statistics_by_reason(self, mock_browser: MagicMock) -> None:
+        """Test recycled contexts leave the available index and are counted by reason."""
+        from web2api.concurrency.browser_pool import BrowserPool
+
+        mock_browser.new_page.side_effect = lambda: MagicMock()
+        config = ConcurrencyConfig(
+            min_browser_contexts=1,
+            max_browser_contexts=3,
+            context_max_uses=2,
+        )
+
+        async with BrowserPool(mock_browser, config) as pool:
+            await pool.wait_until_warm()
+            for _ in range(2):
+                async with pool.acquire("test"):
+                    pass
+
+            assert pool.statistics["recycled_max_uses"] == 1
+            assert pool.available_count == 0
+
+            await pool.wait_until_warm()
+            idle = [await pool._acquire_context(f"t{i}", timeout=1.0) for i in range(3)]
+            for context in idle:
+                await pool._release_context(context)
+            for context in idle[:2]:
+                context.last_used_at -= config.context_idle_timeout_seconds
+
+            pool._config.monitoring_interval_seconds = 0.01
+            pool._cleanup_task.cancel()
+            pool._cleanup_task = asyncio.create_task(pool._cleanup_loop())
+            await asyncio.sleep(0.1)
+
+            assert pool.statistics["recycled_idle"] == 2
+            assert list(pool._available) == [idle[2].id]
+
 
 class TestAsyncTestRunnerMocked:
     """Tests for AsyncTestRunner with mocked dependencies."""
@@ -478,6 +657,29 @@ class TestAsyncTestRunnerMocked:
 
         assert runner._running is False
 
+    async def test_stop_closes_owned_healing_store(
+        self, mock_browser: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test stop closes the healing store it created, but not a caller's engine."""
+        from web2api.concurrency.runner import AsyncTestRunner
+        from web2api.runner.self_healing import SelfHealingEngine
+
+        config = ConcurrencyConfig(
+            enable_resource_monitoring=False,
+            healing_store_url=str(tmp_path / "healing.db"),
+        )
+        callers_engine = MagicMock(spec=SelfHealingEngine)
+
+        async with AsyncTestRunner(mock_browser, config) as owned:
+            store = owned._healing_engine._store
+            assert store is not None
+        async with AsyncTestRunner(mock_browser, config, healing_engine=callers_engine):
+            pass
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            store.histories()
+        callers_engine.close.assert_not_called()
+
 
 class TestScalingStrategy:
     """Tests for scaling strategy enum."""
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import os
+import pickle
+import threading
+import time
 from pathlib import Path
+from typing import ClassVar
 
 import pytest
+from structlog.testing import capture_logs
 
 from web2api.dsl.models import (
     TestSpec,
@@ -14,10 +19,24 @@ from web2api.dsl.models import (
     StepAction,
     AssertionConfig,
     AssertionOperator,
+    SecretReference,
+    SecretSource,
     VisualAssertionConfig,
     VisualComparisonMode,
 )
-from web2api.dsl.parser import DSLParser, DSLParseError
+from web2api.dsl.parse_cache import ParseCache
+from web2api.dsl import parser as parser_module
+from web2api.dsl.parser import (
+    DSLParser,
+    DSLParseError,
+    SecretCache,
+    SecretFetchKey,
+    SecretPayload,
+    SecretResolutionError,
+    SecretResolver,
+    StubSecretBackend,
+    get_secret_cache,
+)
 from web2api.dsl.validator import DSLValidator
 from web2api.dsl.transformer import StepTransformer
 
@@ -148,6 +167,269 @@ steps:
         assert spec.name == "Sample Login Test"
 
 
+class TestParseCache:
+    """Tests for the compiled-spec cache and directory parsing."""
+
+    SPEC = """
+name: {name}
+steps:
+  - action: navigate
+    url: https://example.com/{name}
+"""
+
+    def test_unchanged_content_uses_cache(self, temp_dir: Path) -> None:
+        """A second parse of the same content is served from the cache."""
+        cache = ParseCache(cache_dir=temp_dir)
+        parser = DSLParser(cache=cache)
+
+        first = parser.parse_string(self.SPEC.format(name="cached"))
+        second = parser.parse_string(self.SPEC.format(name="cached"))
+
+        assert second == first
+        assert second is not first
+        assert cache.statistics["hits"] == 1
+        assert cache.statistics["stores"] == 1
+
+    def test_cache_shared_through_directory(self, temp_dir: Path) -> None:
+        """Cache files are reused by a new cache on the same directory."""
+        content = self.SPEC.format(name="disk")
+        DSLParser(cache=ParseCache(cache_dir=temp_dir)).parse_string(content)
+
+        cache = ParseCache(cache_dir=temp_dir)
+        spec = DSLParser(cache=cache).parse_string(content)
+
+        assert spec.name == "disk"
+        assert cache.statistics["disk_hits"] == 1
+
+    def test_changed_content_or_variables_miss(self) -> None:
+        """Different content or variables compile again."""
+        cache = ParseCache()
+        parser = DSLParser(cache=cache)
+        content = "name: Vars\nsteps:\n  - action: navigate\n    url: ${url}\n"
+
+        first = parser.parse_string(content, variables={"url": "https://a.com"})
+        second = parser.parse_string(content, variables={"url": "https://b.com"})
+
+        assert first.steps[0].url == "https://a.com"
+        assert second.steps[0].url == "https://b.com"
+        assert cache.statistics["hits"] == 0
+
+    def test_secrets_never_cached(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Secret references are resolved on every parse and kept off disk."""
+        cache = ParseCache(cache_dir=temp_dir)
+        content = (
+            "name: Secret\nsteps:\n  - action: type\n    selector: '#p'\n"
+            "    text: ${env:PARSE_CACHE_SECRET}\n"
+        )
+
+        monkeypatch.setenv("PARSE_CACHE_SECRET", "first-value")
+        first = DSLParser(cache=cache).parse_string(content)
+        monkeypatch.setenv("PARSE_CACHE_SECRET", "second-value")
+        second = DSLParser(cache=cache).parse_string(content)
+
+        assert first.steps[0].text == "first-value"
+        assert second.steps[0].text == "second-value"
+        assert cache.statistics["hits"] == 1
+        for path in temp_dir.glob("*.pkl"):
+            assert b"first-value" not in path.read_bytes()
+
+    @pytest.mark.parametrize(
+        "payload", [b"not a pickle", pickle.dumps({"spec": "not a CompiledSpec"})]
+    )
+    def test_corrupt_cache_file_ignored(self, temp_dir: Path, payload: bytes) -> None:
+        """Unreadable cache files are dropped and the file recompiled."""
+        content = self.SPEC.format(name="corrupt")
+        key = ParseCache.make_key(content)
+        (temp_dir / f"{key}.pkl").write_bytes(payload)
+
+        cache = ParseCache(cache_dir=temp_dir)
+        spec = DSLParser(cache=cache).parse_string(content)
+
+        assert spec.name == "corrupt"
+        assert cache.statistics["errors"] == 1
+
+    def test_parse_directory_uses_cache(self, temp_dir: Path) -> None:
+        """Directory parses keep file order and skip unchanged files."""
+        specs_dir = temp_dir / "specs"
+        specs_dir.mkdir()
+        for name in ("b", "a", "c"):
+            (specs_dir / f"{name}.yaml").write_text(self.SPEC.format(name=name))
+
+        cache = ParseCache()
+        parser = DSLParser(cache=cache)
+        assert [s.name for s in parser.parse_directory(specs_dir)] == ["a", "b", "c"]
+
+        (specs_dir / "b.yaml").write_text(self.SPEC.format(name="b2"))
+        assert [s.name for s in parser.parse_directory(specs_dir)] == ["a", "b2", "c"]
+        assert cache.statistics["hits"] == 2
+
+    def test_parse_directory_logs_each_file(self, temp_dir: Path) -> None:
+        """Cached and freshly compiled files are reported like parse_file does."""
+        for name in ("a", "b"):
+            (temp_dir / f"{name}.yaml").write_text(self.SPEC.format(name=name))
+        cache = ParseCache()
+        DSLParser(cache=cache).parse_file(temp_dir / "a.yaml")
+
+        with capture_logs() as logs:
+            DSLParser(cache=cache).parse_directory(temp_dir)
+
+        parsed = [log for log in logs if log["event"] == "Parsed test spec"]
+        assert [(log["source_file"], log["cached"]) for log in parsed] == [
+            (str(temp_dir / "a.yaml"), True),
+            (str(temp_dir / "b.yaml"), False),
+        ]
+
+    @pytest.mark.slow
+    def test_parse_directory_parallel(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Cold directory parses compile in worker processes."""
+        monkeypatch.setattr(parser_module, "PARALLEL_PARSE_THRESHOLD", 4)
+        for i in range(6):
+            (temp_dir / f"spec_{i}.yaml").write_text(self.SPEC.format(name=f"s{i}"))
+
+        cache = ParseCache()
+        specs = DSLParser(cache=cache).parse_directory(temp_dir, workers=2)
+
+        assert [s.name for s in specs] == [f"s{i}" for i in range(6)]
+        assert cache.statistics["stores"] == 6
+
+        for i in range(6):
+            (temp_dir / f"spec_{i}.yaml").write_text(self.SPEC.format(name=f"t{i}"))
+        (temp_dir / "spec_3.yaml").write_text("name: Broken\nsteps: []")
+        with pytest.raises(DSLParseError, match="Validation failed"):
+            DSLParser(cache=cache).parse_directory(temp_dir, workers=2)
+
+
+class TestSecretResolver:
+    """Tests for batched, cached secret resolution."""
+
+    SECRETS: ClassVar[dict[SecretReference, str]] = {
+        SecretReference(source=SecretSource.VAULT, key="db", path="app"): "db-pass",
+        SecretReference(source=SecretSource.AWS_SECRETS, key="api"): "api-key",
+        SecretReference(
+            source=SecretSource.K8S_SECRET, key="creds", path="qa", version="user"
+        ): "k8s-user",
+        SecretReference(
+            source=SecretSource.K8S_SECRET, key="creds", path="qa", version="pass"
+        ): "k8s-pass",
+    }
+
+    SPEC = """
+name: Secrets
+steps:
+  - action: type
+    selector: "#db"
+    text: ${vault:db:app}
+  - action: type
+    selector: "#db-again"
+    text: ${vault:db:app}
+  - action: type
+    selector: "#api"
+    text: ${aws_secrets:api}
+  - action: type
+    selector: "#login"
+    text: ${k8s_secret:creds:qa:user}/${k8s_secret:creds:qa:pass}
+"""
+
+    def test_parse_fetches_each_secret_once(self) -> None:
+        """References are deduplicated and Kubernetes keys share a read."""
+        backend = StubSecretBackend(self.SECRETS)
+        parser = DSLParser(SecretResolver(stub_backend=backend), use_cache=False)
+
+        spec = parser.parse_string(self.SPEC)
+
+        assert [step.text for step in spec.steps] == [
+            "db-pass",
+            "db-pass",
+            "api-key",
+            "k8s-user/k8s-pass",
+        ]
+        assert sorted(key[0] for key in backend.fetches) == [
+            SecretSource.AWS_SECRETS,
+            SecretSource.K8S_SECRET,
+            SecretSource.VAULT,
+        ]
+
+    def test_fetches_run_concurrently(self) -> None:
+        """Fetches of one batch overlap instead of running one after another."""
+
+        class BarrierBackend(StubSecretBackend):
+            """Fetches only complete once all three are in flight together."""
+
+            def __init__(self, secrets: dict[SecretReference, str]) -> None:
+                super().__init__(secrets)
+                self.barrier = threading.Barrier(3, timeout=10)
+
+            def fetch(self, key: SecretFetchKey) -> SecretPayload:
+                self.barrier.wait()
+                return super().fetch(key)
+
+        backend = BarrierBackend(self.SECRETS)
+        values = SecretResolver(stub_backend=backend).resolve_many(self.SECRETS)
+
+        assert values == self.SECRETS
+        assert len(backend.fetches) == 3
+        assert not backend.barrier.broken
+
+    def test_cache_shared_across_parses(self) -> None:
+        """Parses reuse fetched secrets until the TTL runs out."""
+        backend = StubSecretBackend(self.SECRETS)
+        cache = SecretCache(ttl_seconds=60)
+        resolver = SecretResolver(stub_backend=backend, cache=cache)
+
+        DSLParser(resolver, use_cache=False).parse_string(self.SPEC)
+        DSLParser(resolver, use_cache=False).parse_string(self.SPEC)
+
+        assert len(backend.fetches) == 3
+        assert cache.statistics["hits"] == 3
+
+    def test_expired_secrets_fetched_again(self) -> None:
+        """Expired secrets are fetched again."""
+        backend = StubSecretBackend(self.SECRETS)
+        resolver = SecretResolver(stub_backend=backend, cache=SecretCache(ttl_seconds=0))
+        ref = next(iter(self.SECRETS))
+
+        resolver.resolve(ref)
+        time.sleep(0.01)
+        resolver.resolve(ref)
+
+        assert len(backend.fetches) == 2
+
+    def test_missing_secret_raises(self) -> None:
+        """A missing secret fails the batch and is not cached."""
+        backend = StubSecretBackend(self.SECRETS)
+        resolver = SecretResolver(stub_backend=backend)
+        missing = SecretReference(source=SecretSource.VAULT, key="missing")
+
+        with pytest.raises(SecretResolutionError, match="not found"):
+            resolver.resolve_many([*self.SECRETS, missing])
+        with pytest.raises(SecretResolutionError):
+            resolver.resolve(missing)
+
+        # Secrets fetched alongside the failure are cached, the failure is not
+        assert backend.fetches.count((SecretSource.VAULT, "secret/data", "missing", None)) == 2
+        assert resolver.resolve_many(self.SECRETS) == self.SECRETS
+        assert len(backend.fetches) == 5
+
+    def test_missing_k8s_key_raises(self) -> None:
+        """A key absent from a fetched Kubernetes secret is reported."""
+        resolver = SecretResolver(stub_backend=StubSecretBackend(self.SECRETS))
+        ref = SecretReference(
+            source=SecretSource.K8S_SECRET, key="creds", path="qa", version="token"
+        )
+
+        with pytest.raises(SecretResolutionError, match="Key 'token' not found"):
+            resolver.resolve(ref)
+
+    def test_default_resolvers_share_cache(self) -> None:
+        """Resolvers with default clients share the process-wide cache."""
+        assert SecretResolver()._cache is get_secret_cache()
+        assert SecretResolver(stub_backend=StubSecretBackend({}))._cache is not get_secret_cache()
+
+
 class TestDSLValidator:
     """Tests for DSL validator."""
 
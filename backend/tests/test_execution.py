@@ -0,0 +1,755 @@
+"""
+Unit tests for the Web2API execution module.
+
+Tests cover:
+- ServiceContextPool context selection and scaling
+- ExecutionQueue concurrent per-service execution
+- ExecutionQueue awaitable completion and cancellation
+- Incremental response streaming
+- Observer-based completion detection
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from web2api.auth.service_cache import CachedService, ServiceCache
+from web2api.execution.chat_executor import (
+    ChatConfig,
+    ChatExecutionResult,
+    ChatExecutor,
+    ChatUISelectors,
+    ExtractionMetrics,
+)
+from web2api.execution.context_pool import ServiceContextPool
+from web2api.execution.operation_runner import OperationRunner
+from web2api.execution.queue_manager import ExecutionQueue
+
+
+@pytest.fixture
+def mock_browser() -> MagicMock:
+    """Create a mock tool-style browser."""
+    browser = MagicMock()
+    counter = itertools.count(1)
+
+    async def create_context(_: dict[str, Any]) -> dict[str, Any]:
+        return {"context_id": f"ctx_{next(counter):06d}"}
+
+    browser.browser_create_context = AsyncMock(side_effect=create_context)
+    browser.browser_get_cookies = AsyncMock(
+        return_value={"cookies": [{"name": "session", "value": "abc"}]}
+    )
+    browser.browser_set_cookie = AsyncMock(return_value={})
+    browser.browser_navigate = AsyncMock(return_value={})
+    browser.browser_wait_for_load = AsyncMock(return_value={})
+    browser.browser_reload = AsyncMock(return_value={})
+    browser.browser_close_context = AsyncMock(return_value={})
+    return browser
+
+
+class TestServiceContextPool:
+    """Tests for ServiceContextPool."""
+
+    @pytest.mark.asyncio
+    async def test_primary_context_used_first(self, mock_browser: MagicMock) -> None:
+        """Test the caller's context is used while it is idle."""
+        pool = ServiceContextPool("svc", mock_browser, "service_svc", max_contexts=3)
+
+        context = await pool.acquire()
+
+        assert context.context_id == "service_svc"
+        assert context.owned is False
+        mock_browser.browser_create_context.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_clones_when_busy(self, mock_browser: MagicMock) -> None:
+        """Test a busy pool clones a context with the primary's cookies."""
+        pool = ServiceContextPool(
+            "svc", mock_browser, "service_svc",
+            service_url="https://chat.example.com", max_contexts=3,
+        )
+
+        first = await pool.acquire()
+        second = await pool.acquire()
+
+        assert first.context_id != second.context_id
+        assert pool.size == 2
+        mock_browser.browser_get_cookies.assert_awaited_with({"context_id": "service_svc"})
+        mock_browser.browser_set_cookie.assert_awaited_once()
+        assert (
+            mock_browser.browser_set_cookie.call_args.args[0]["context_id"]
+            == second.context_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_respects_max_contexts(self, mock_browser: MagicMock) -> None:
+        """Test the pool never grows past max_contexts."""
+        pool = ServiceContextPool("svc", mock_browser, "service_svc", max_contexts=2)
+
+        contexts = [await pool.acquire() for _ in range(4)]
+
+        assert pool.size == 2
+        assert {c.active_tasks for c in contexts} == {2}
+
+    @pytest.mark.asyncio
+    async def test_least_busy_selection(self, mock_browser: MagicMock) -> None:
+        """Test the least-busy context is chosen."""
+        pool = ServiceContextPool("svc", mock_browser, "service_svc", max_contexts=2)
+
+        first = await pool.acquire()
+        second = await pool.acquire()
+        await pool.release(second)
+
+        third = await pool.acquire()
+
+        assert third is second
+        assert first.active_tasks == 1
+
+    @pytest.mark.asyncio
+    async def test_shrink_keeps_primary(self, mock_browser: MagicMock) -> None:
+        """Test shrinking closes idle clones but never the primary context."""
+        pool = ServiceContextPool("svc", mock_browser, "service_svc", max_contexts=3)
+
+        contexts = [await pool.acquire() for _ in range(3)]
+        for context in contexts:
+            await pool.release(context)
+
+        closed = await pool.shrink(0)
+
+        assert closed == 2
+        assert pool.size == 1
+        assert mock_browser.browser_close_context.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_clone_failure_falls_back(self, mock_browser: MagicMock) -> None:
+        """Test a failed clone shares an existing context instead of failing."""
+        mock_browser.browser_create_context = AsyncMock(side_effect=RuntimeError("boom"))
+        pool = ServiceContextPool("svc", mock_browser, "service_svc", max_contexts=3)
+
+        first = await pool.acquire()
+        second = await pool.acquire()
+
+        assert first is second
+        assert pool.statistics["total_clone_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_start_warms_min_contexts(self, mock_browser: MagicMock) -> None:
+        """Test start() clones contexts up to min_contexts before any acquire."""
+        pool = ServiceContextPool(
+            "svc", mock_browser, "service_svc", max_contexts=4, min_contexts=3
+        )
+
+        pool.start()
+        await pool.wait_until_warm()
+
+        assert pool.size == 3
+        assert mock_browser.browser_create_context.await_count == 2
+
+        # Warm contexts are reused rather than cloned again
+        contexts = [await pool.acquire() for _ in range(3)]
+        assert len({c.context_id for c in contexts}) == 3
+        assert mock_browser.browser_create_context.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_while_warming_closes_clones(self, mock_browser: MagicMock) -> None:
+        """Test contexts cloned while the pool closes are not left open."""
+        gate = asyncio.Event()
+        counter = itertools.count(1)
+
+        async def create_context(_: dict[str, Any]) -> dict[str, Any]:
+            await gate.wait()
+            return {"context_id": f"ctx_{next(counter):06d}"}
+
+        mock_browser.browser_create_context = AsyncMock(side_effect=create_context)
+        pool = ServiceContextPool(
+            "svc", mock_browser, "service_svc", max_contexts=3, min_contexts=3
+        )
+
+        pool.start()
+        await asyncio.sleep(0)
+        closing = asyncio.create_task(pool.close())
+        await asyncio.sleep(0)
+        gate.set()
+        await closing
+
+        assert pool.size == 1
+        assert mock_browser.browser_create_context.await_count == 2
+        assert mock_browser.browser_close_context.await_count == 2
+
+
+class TestExecutionQueue:
+    """Tests for ExecutionQueue with a mocked operation runner."""
+
+    @pytest.mark.asyncio
+    async def test_retire_worker_after_pool_removed(self) -> None:
+        """Test a worker of a stopped queue retires instead of raising KeyError."""
+        queue = ExecutionQueue(max_contexts_per_service=2)
+
+        async def worker() -> bool:
+            queue._workers["svc"] = {asyncio.current_task()}
+            queue._queues["svc"] = asyncio.Queue()
+            return await queue._retire_worker("svc")
+
+        assert await asyncio.create_task(worker()) is True
+
+    @pytest.mark.asyncio
+    async def test_runs_tasks_concurrently(self, mock_browser: MagicMock) -> None:
+        """Test tasks for one service run on separate contexts concurrently."""
+        running: set[str] = set()
+        peak = 0
+
+        async def execute_operation(**kwargs: Any) -> str:
+            nonlocal peak
+            running.add(kwargs["context_id"])
+            peak = max(peak, len(running))
+            await asyncio.sleep(0.05)
+            running.discard(kwargs["context_id"])
+            return "ok"
+
+        with patch("web2api.execution.queue_manager.OperationRunner") as runner_cls:
+            runner_cls.return_value.execute_operation = AsyncMock(
+                side_effect=execute_operation
+            )
+            queue = ExecutionQueue(max_contexts_per_service=3)
+
+            task_ids = [
+                await queue.add_task(
+                    service_id="svc",
+                    service_config={"url": "https://chat.example.com"},
+                    operation_id="chat_completion",
+                    parameters={"message": f"hi {i}"},
+                    browser=mock_browser,
+                    context_id="service_svc",
+                )
+                for i in range(3)
+            ]
+
+            for _ in range(50):
+                statuses = [await queue.get_task_status(t) for t in task_ids]
+                if all(s and s["status"] == "completed" for s in statuses):
+                    break
+                await asyncio.sleep(0.02)
+
+            stats = queue.get_pool_statistics("svc")
+            await queue.shutdown()
+
+        assert all(s["status"] == "completed" for s in statuses)
+        assert peak == 3
+        assert stats is not None
+        assert stats["current_size"] == 3
+
+    @pytest.mark.asyncio
+    async def test_wait_for_task_resolves_on_completion(
+        self, mock_browser: MagicMock
+    ) -> None:
+        """Test wait_for_task returns the finished task without polling."""
+        with patch("web2api.execution.queue_manager.OperationRunner") as runner_cls:
+            runner_cls.return_value.execute_operation = AsyncMock(return_value="answer")
+            queue = ExecutionQueue()
+
+            task_id = await queue.add_task(
+                service_id="svc",
+                service_config={},
+                operation_id="chat_completion",
+                parameters={"message": "hi"},
+                browser=mock_browser,
+                context_id="service_svc",
+            )
+            task = await queue.wait_for_task(task_id, timeout=1.0)
+            await queue.shutdown()
+
+        assert task["status"] == "completed"
+        assert task["result"] == "answer"
+
+    @pytest.mark.asyncio
+    async def test_timeout_drops_queued_task(self, mock_browser: MagicMock) -> None:
+        """Test a timed-out waiter cancels its task before it reaches the browser."""
+        release = asyncio.Event()
+
+        async def execute_operation(**kwargs: Any) -> str:
+            await release.wait()
+            return kwargs["parameters"]["message"]
+
+        with patch("web2api.execution.queue_manager.OperationRunner") as runner_cls:
+            runner_cls.return_value.execute_operation = AsyncMock(
+                side_effect=execute_operation
+            )
+            queue = ExecutionQueue(max_contexts_per_service=1)
+
+            task_ids = [
+                await queue.add_task(
+                    service_id="svc",
+                    service_config={},
+                    operation_id="chat_completion",
+                    parameters={"message": message},
+                    browser=mock_browser,
+                    context_id="service_svc",
+                )
+                for message in ("first", "second")
+            ]
+
+            with pytest.raises(TimeoutError):
+                await queue.wait_for_task(task_ids[1], timeout=0.05)
+
+            release.set()
+            first = await queue.wait_for_task(task_ids[0], timeout=1.0)
+            await asyncio.sleep(0.05)
+            second = await queue.get_task_status(task_ids[1])
+            calls = runner_cls.return_value.execute_operation.await_count
+            await queue.shutdown()
+
+        assert first["status"] == "completed"
+        assert second is not None
+        assert second["status"] == "cancelled"
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_task_is_noop(self, mock_browser: MagicMock) -> None:
+        """Test running tasks are not cancelled."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def execute_operation(**_kwargs: Any) -> str:
+            started.set()
+            await release.wait()
+            return "done"
+
+        with patch("web2api.execution.queue_manager.OperationRunner") as runner_cls:
+            runner_cls.return_value.execute_operation = AsyncMock(
+                side_effect=execute_operation
+            )
+            queue = ExecutionQueue()
+
+            task_id = await queue.add_task(
+                service_id="svc",
+                service_config={},
+                operation_id="chat_completion",
+                parameters={"message": "hi"},
+                browser=mock_browser,
+                context_id="service_svc",
+            )
+            await started.wait()
+
+            cancelled = await queue.cancel_task(task_id)
+            release.set()
+            task = await queue.wait_for_task(task_id, timeout=1.0)
+            await queue.shutdown()
+
+        assert cancelled is False
+        assert task["status"] == "completed"
+
+
+class TestStreaming:
+    """Tests for incremental response streaming."""
+
+    @staticmethod
+    def _browser(outputs: list[str]) -> MagicMock:
+        """Browser whose output area shows ``outputs`` in turn, then the last one."""
+        remaining = iter(outputs)
+        last = {"text": outputs[0]}
+
+        async def extract_text(params: dict[str, Any]) -> dict[str, Any]:
+            if params["selector"] == "#out":
+                last["text"] = next(remaining, last["text"])
+                return {"text": last["text"]}
+            return {"text": "Send"}
+
+        browser = MagicMock()
+        browser.browser_get_current_url = AsyncMock(return_value={"url": "https://chat.example.com"})
+        browser.browser_wait_for_selector = AsyncMock(return_value={})
+        browser.browser_is_enabled = AsyncMock(return_value={"enabled": True})
+        browser.browser_extract_text = AsyncMock(side_effect=extract_text)
+        browser.browser_fill = AsyncMock(return_value={})
+        browser.browser_click = AsyncMock(return_value={})
+        browser.browser_ai_extract = AsyncMock(return_value={"content": "unused"})
+        return browser
+
+    @staticmethod
+    def _config() -> ChatConfig:
+        return ChatConfig(
+            url="https://chat.example.com",
+            selectors=ChatUISelectors(
+                input_selector="#in",
+                send_button_selector="#send",
+                output_selector="#out",
+            ),
+            timeout_ms=300,
+            poll_interval_ms=50,
+            wait_after_type_ms=0,
+            initial_button_check_delay_ms=0,
+            stream_interval_ms=10,
+        )
+
+    async def _stream_chat(
+        self, browser: MagicMock, executor: ChatExecutor | None = None
+    ) -> tuple[ChatExecutionResult, list[str]]:
+        deltas: list[str] = []
+
+        async def on_delta(delta: str) -> None:
+            deltas.append(delta)
+
+        result = await (executor or ChatExecutor()).execute_chat(
+            browser, "ctx", self._config(), "hi", on_delta=on_delta
+        )
+        return result, deltas
+
+    @pytest.mark.asyncio
+    async def test_chat_executor_streams_growing_output(self) -> None:
+        """Test deltas follow the output text while it grows."""
+        browser = self._browser(
+            ["previous answer", "previous answer", "Hel", "Hello", "Hello world", "Hello world!"]
+        )
+
+        result, deltas = await self._stream_chat(browser)
+
+        assert result.success
+        assert "".join(deltas) == result.response == "Hello world!"
+        assert deltas[0] == "Hel"
+        browser.browser_ai_extract.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_last_message_selector_skips_echo(self) -> None:
+        """Test the echoed message shown by a last-message selector is not streamed."""
+        browser = self._browser(["previous answer", "hi", "hi", "Hel", "Hello world!"])
+
+        result, deltas = await self._stream_chat(browser)
+
+        assert result.success
+        assert "".join(deltas) == result.response == "Hello world!"
+        assert deltas[0] == "Hel"
+
+    @pytest.mark.asyncio
+    async def test_transcript_selector_streams_new_turn_only(self) -> None:
+        """Test a selector matching the whole transcript streams only the new answer."""
+        transcript = "Earlier question\nEarlier answer"
+        browser = self._browser([
+            transcript,
+            f"{transcript}\nhi",
+            f"{transcript}\nhi\nHel",
+            f"{transcript}\nhi\nHello world!",
+        ])
+
+        result, deltas = await self._stream_chat(browser)
+
+        assert result.success
+        assert "".join(deltas) == result.response == "Hello world!"
+        assert deltas[0] == "Hel"
+
+    @pytest.mark.asyncio
+    async def test_diverged_final_response_is_resent(self) -> None:
+        """Test a final response not extending the streamed text is sent in full."""
+        browser = self._browser(["", "Helo"])
+        executor = ChatExecutor()
+
+        with patch.object(
+            executor, "_extract_response", AsyncMock(return_value=("Hello", "structural"))
+        ):
+            result, deltas = await self._stream_chat(browser, executor)
+
+        assert result.response == "Hello"
+        assert deltas == ["Helo", "\n\nHello"]
+
+    @pytest.mark.asyncio
+    async def test_stream_task_yields_deltas(self, mock_browser: MagicMock) -> None:
+        """Test queue deltas reach the stream consumer before completion."""
+
+        async def execute_operation(**kwargs: Any) -> str:
+            for part in ("Hel", "lo"):
+                await kwargs["on_delta"](part)
+                await asyncio.sleep(0)
+            return "Hello"
+
+        with patch("web2api.execution.queue_manager.OperationRunner") as runner_cls:
+            runner_cls.return_value.execute_operation = AsyncMock(
+                side_effect=execute_operation
+            )
+            queue = ExecutionQueue()
+
+            task_id = await queue.add_task(
+                service_id="svc",
+                service_config={},
+                operation_id="chat_completion",
+                parameters={"message": "hi"},
+                browser=mock_browser,
+                context_id="service_svc",
+                stream=True,
+            )
+            deltas = [delta async for delta in queue.stream_task(task_id, timeout=1.0)]
+            task = await queue.get_task_status(task_id)
+            await queue.shutdown()
+
+        assert deltas == ["Hel", "lo"]
+        assert task is not None
+        assert task["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_stream_task_requires_stream_flag(self, mock_browser: MagicMock) -> None:
+        """Test non-streaming tasks cannot be streamed."""
+        with patch("web2api.execution.queue_manager.OperationRunner") as runner_cls:
+            runner_cls.return_value.execute_operation = AsyncMock(return_value="ok")
+            queue = ExecutionQueue()
+
+            task_id = await queue.add_task(
+                service_id="svc",
+                service_config={},
+                operation_id="chat_completion",
+                parameters={"message": "hi"},
+                browser=mock_browser,
+                context_id="service_svc",
+            )
+            with pytest.raises(ValueError, match="stream=True"):
+                async for _ in queue.stream_task(task_id):
+                    pass
+            await queue.shutdown()
+
+    async def test_failed_stream_invalidates_session(
+        self, mock_browser: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failed streaming completion re-checks the session next time."""
+        from web2api.api import openai_compat
+
+        cache = ServiceCache()
+        cache.put(
+            CachedService(
+                service_id="svc", url="https://chat.example.com", config={}, credentials={}
+            )
+        )
+        cache.mark_session_valid("svc")
+        monkeypatch.setattr(openai_compat, "get_service_cache", lambda: cache)
+
+        with patch("web2api.execution.queue_manager.OperationRunner") as runner_cls:
+            runner_cls.return_value.execute_operation = AsyncMock(
+                side_effect=RuntimeError("logged out")
+            )
+            queue = ExecutionQueue()
+            monkeypatch.setattr(openai_compat, "_container", MagicMock(
+                db=MagicMock(), browser=mock_browser, queue_manager=queue
+            ))
+
+            task_id = await queue.add_task(
+                service_id="svc",
+                service_config={},
+                operation_id="chat_completion",
+                parameters={"message": "hi"},
+                browser=mock_browser,
+                context_id="service_svc",
+                stream=True,
+            )
+            events = [
+                event
+                async for event in openai_compat.generate_stream_response(
+                    "chatcmpl-1", "svc", task_id, 1.0, "svc"
+                )
+            ]
+            await queue.shutdown()
+
+        assert "logged out" in events[-2]
+        assert events[-1] == "data: [DONE]\n\n"
+        entry = cache.get("svc")
+        assert entry is not None
+        assert not entry.session_valid
+
+
+class TestObserverCompletion:
+    """Tests for in-page observer completion detection."""
+
+    @pytest.fixture
+    def config(self) -> ChatConfig:
+        """Create a chat config with short timings."""
+        return ChatConfig(
+            url="https://chat.example.com",
+            selectors=ChatUISelectors(
+                input_selector="#in",
+                send_button_selector="#send",
+                output_selector="#out",
+            ),
+            timeout_ms=1000,
+            poll_interval_ms=10,
+        )
+
+    @pytest.mark.asyncio
+    async def test_long_poll_resolves(self, config: ChatConfig) -> None:
+        """Test completion is detected with an install call and long-poll calls."""
+        browser = MagicMock()
+        browser.browser_evaluate = AsyncMock(side_effect=[
+            {"result": True},
+            {"result": {"done": False, "saw_busy": True}},
+            {"result": {"done": True, "saw_busy": True, "text_length": 12}},
+        ])
+
+        detected = await ChatExecutor()._wait_with_observer(browser, "ctx", config)
+
+        assert detected is True
+        assert browser.browser_evaluate.await_count == 3
+        assert "MutationObserver" in browser.browser_evaluate.call_args_list[0].args[0]["expression"]
+        assert ".wait(" in browser.browser_evaluate.call_args_list[1].args[0]["expression"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_snapshot_reads(self, config: ChatConfig) -> None:
+        """Test an un-awaited promise switches to synchronous state reads."""
+        browser = MagicMock()
+        browser.browser_evaluate = AsyncMock(side_effect=[
+            {"result": True},
+            {"result": {}},
+            {"result": {"done": False, "saw_busy": True}},
+            {"result": {"done": True, "saw_busy": True}},
+        ])
+
+        detected = await ChatExecutor()._wait_with_observer(browser, "ctx", config)
+
+        assert detected is True
+        assert ".snapshot()" in browser.browser_evaluate.call_args_list[2].args[0]["expression"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_while_busy(self, config: ChatConfig) -> None:
+        """Test a timeout while generation is in progress raises."""
+        config.timeout_ms = 50
+        config.observer_long_poll_ms = 10
+        browser = MagicMock()
+
+        async def evaluate(params: dict[str, Any]) -> dict[str, Any]:
+            if "MutationObserver" in params["expression"]:
+                return {"result": True}
+            await asyncio.sleep(0.01)
+            return {"result": {"done": False, "saw_busy": True}}
+
+        browser.browser_evaluate = AsyncMock(side_effect=evaluate)
+
+        with pytest.raises(TimeoutError):
+            await ChatExecutor()._wait_with_observer(browser, "ctx", config)
+
+    @pytest.mark.asyncio
+    async def test_unsupported_evaluate_uses_polling(self, config: ChatConfig) -> None:
+        """Test detection falls back to button polling when evaluate fails."""
+        browser = MagicMock()
+        browser.browser_evaluate = AsyncMock(side_effect=RuntimeError("unsupported"))
+        executor = ChatExecutor()
+
+        with patch.object(executor, "_poll_for_response_complete", AsyncMock()) as poll:
+            await executor._wait_for_response_complete(browser, "ctx", config, {})
+
+        poll.assert_awaited_once()
+
+
+class TestResponseExtraction:
+    """Tests for the response extraction pipeline."""
+
+    @staticmethod
+    def _config(ai_fallback: bool = True) -> ChatConfig:
+        return ChatConfig(
+            url="https://chat.example.com",
+            selectors=ChatUISelectors(
+                input_selector="#in",
+                send_button_selector="#send",
+                output_selector="#out",
+            ),
+            ai_extraction_fallback=ai_fallback,
+        )
+
+    @staticmethod
+    def _browser(evaluate: Any = None, text: str = "", html: str = "") -> MagicMock:
+        browser = MagicMock()
+        browser.browser_evaluate = AsyncMock(return_value=evaluate)
+        browser.browser_extract_text = AsyncMock(return_value={"text": text})
+        browser.browser_get_html = AsyncMock(return_value={"html": html})
+        browser.browser_ai_extract = AsyncMock(return_value={"content": "from ai"})
+        return browser
+
+    @pytest.mark.asyncio
+    async def test_structural_extraction_is_single_call(self) -> None:
+        """Test markdown comes from one evaluate call without AI extraction."""
+        browser = self._browser({"text": "Title Hello", "markdown": "## Title\n\nHello"})
+
+        response, method = await ChatExecutor()._extract_response(
+            browser, "ctx", self._config(), "hi"
+        )
+
+        assert (response, method) == ("## Title\n\nHello", "structural")
+        browser.browser_evaluate.assert_awaited_once()
+        browser.browser_extract_text.assert_not_called()
+        browser.browser_ai_extract.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_prefer_text_returns_plain_text(self) -> None:
+        """Test streaming requests get the plain text flavour."""
+        browser = self._browser({"text": "Title Hello", "markdown": "## Title\n\nHello"})
+
+        response, _ = await ChatExecutor()._extract_response(
+            browser, "ctx", self._config(), "hi", prefer_text=True
+        )
+
+        assert response == "Title Hello"
+
+    @pytest.mark.asyncio
+    async def test_echoed_message_falls_through(self) -> None:
+        """Test a result equal to the sent message fails the quality check."""
+        browser = self._browser({"text": "hi", "markdown": "hi"}, text="Answer")
+
+        response, method = await ChatExecutor()._extract_response(
+            browser, "ctx", self._config(), "hi"
+        )
+
+        assert (response, method) == ("Answer", "text")
+
+    @pytest.mark.asyncio
+    async def test_message_container_reaches_extraction(self) -> None:
+        """Test ui_selectors.message_container is used by structural extraction."""
+        runner = OperationRunner()
+        service_config = {
+            "url": "https://chat.example.com",
+            "ui_selectors": {
+                "input": "#in",
+                "submit": "#send",
+                "output": "#out",
+                "message_container": "div.message",
+            },
+        }
+        result = ChatExecutionResult(success=True, response="Answer", duration_ms=1)
+
+        with patch.object(
+            runner._chat_executor, "execute_chat", AsyncMock(return_value=result)
+        ) as execute_chat:
+            await runner._execute_chat_completion(
+                "svc", service_config, {"message": "hi"}, MagicMock(), "ctx",
+                None, "exec", 0.0,
+            )
+
+        config = execute_chat.call_args.kwargs["config"]
+        assert config.selectors.message_container == "div.message"
+
+        browser = self._browser({"text": "Answer", "markdown": "Answer"})
+        await ChatExecutor()._extract_response(browser, "ctx", config, "hi")
+
+        script = browser.browser_evaluate.call_args.args[0]["expression"]
+        assert 'containerSel = "div.message"' in script
+
+    @pytest.mark.asyncio
+    async def test_ai_extraction_is_last_resort(self) -> None:
+        """Test AI extraction only runs when every other strategy fails."""
+        browser = self._browser(None, text="...", html="<div></div>")
+
+        response, method = await ChatExecutor()._extract_response(
+            browser, "ctx", self._config(), "hi"
+        )
+        assert (response, method) == ("from ai", "ai")
+
+        with pytest.raises(Exception, match="Failed to extract"):
+            await ChatExecutor()._extract_response(
+                browser, "ctx", self._config(ai_fallback=False), "hi"
+            )
+
+    def test_extraction_metrics(self) -> None:
+        """Test extraction methods are counted per service."""
+        metrics = ExtractionMetrics()
+        metrics.record("svc", "structural")
+        metrics.record("svc", "structural")
+        metrics.record("svc", "ai")
+
+        assert metrics.snapshot("svc") == {"structural": 2, "ai": 1}
+        assert metrics.snapshot() == {"svc": {"structural": 2, "ai": 1}}
+        assert metrics.snapshot("other") == {}
@@ -0,0 +1,698 @@
+"""
+Unit tests for the asyncio transports and core of the owl-browser SDK.
+
+Tests cover:
+- AsyncHttpTransport keep-alive, chunked bodies and errors against a local server
+- AsyncWebSocketTransport framing, multiplexing and close handling
+- AsyncBrowserCore.replay of synchronous SDK methods
+- Command batching and pipelining over fake transports
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from owl_browser import (
+    BatchCommand,
+    BrowserConfig,
+    BrowserCore,
+    CommandTimeoutError,
+    RemoteConfig,
+    TransportMode,
+)
+from owl_browser.async_core import (
+    AsyncBrowserCore,
+    AsyncHttpTransport,
+    AsyncWebSocketTransport,
+    _apply_ws_mask,
+)
+from owl_browser.exceptions import AuthenticationError, OwlBrowserError
+from owl_browser.http_client import HttpTransport
+from owl_browser.ws_client import WebSocketTransport
+
+Handler = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+
+
+class _LocalServer:
+    """asyncio TCP server on a free local port, counting connections."""
+
+    def __init__(self, handler: Handler) -> None:
+        self._handler = handler
+        self.connections = 0
+        self.server: asyncio.Server | None = None
+        self.port = 0
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    async def __aenter__(self) -> _LocalServer:
+        async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            self.connections += 1
+            task = asyncio.current_task()
+            assert task is not None
+            self._tasks.add(task)
+            try:
+                await self._handler(reader, writer)
+            except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+                # Cancelled on exit: end quietly so the server does not log it
+                pass
+            finally:
+                writer.close()
+
+        self.server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        assert self.server is not None
+        self.server.close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def config(self, transport: TransportMode = TransportMode.HTTP) -> RemoteConfig:
+        return RemoteConfig(
+            url=f"http://127.0.0.1:{self.port}", token="secret", transport=transport, timeout=5000
+        )
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, dict[str, str], bytes]:
+    """Read one HTTP request (request line, lower-cased headers, body)."""
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+    request_line, *header_lines = head.split("\r\n")
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        if name:
+            headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get("content-length", "0")))
+    return request_line, headers, body
+
+
+def _response(payload: Any, status: str = "200 OK", extra: str = "") -> bytes:
+    body = json.dumps(payload).encode()
+    return (
+        f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n{extra}\r\n"
+    ).encode() + body
+
+
+class TestAsyncHttpTransport:
+    """Tests for AsyncHttpTransport against a local HTTP/1.1 server."""
+
+    async def test_keep_alive_reuses_connection(self) -> None:
+        """Test sequential requests share one connection and send auth."""
+        requests: list[tuple[str, dict[str, str], bytes]] = []
+
+        async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            while True:
+                request = await _read_request(reader)
+                requests.append(request)
+                tool = request[0].split()[1].rsplit("/", 1)[-1]
+                writer.write(_response({"success": True, "result": {"tool": tool}}))
+                await writer.drain()
+
+        async with _LocalServer(handler) as server:
+            transport = AsyncHttpTransport(server.config())
+            first = await transport.execute_tool("browser_navigate", {"url": "https://a.test"})
+            second = await transport.execute_tool("browser_get_title")
+            await transport.close()
+
+        assert first == {"tool": "browser_navigate"}
+        assert second == {"tool": "browser_get_title"}
+        assert server.connections == 1
+        assert requests[0][0] == "POST /execute/browser_navigate HTTP/1.1"
+        assert requests[0][1]["authorization"] == "Bearer secret"
+        assert json.loads(requests[0][2]) == {"url": "https://a.test"}
+
+    async def test_chunked_body_with_trailer(self) -> None:
+        """Test chunked responses are reassembled and the connection kept."""
+        body = json.dumps({"success": True, "result": "x" * 5000}).encode()
+        chunks = [body[i:i + 1500] for i in range(0, len(body), 1500)]
+
+        async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            while True:
+                await _read_request(reader)
+                writer.write(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n")
+                for chunk in chunks:
+                    writer.write(f"{len(chunk):x};ext=1\r\n".encode() + chunk + b"\r\n")
+                writer.write(b"0\r\nX-Trailer: done\r\n\r\n")
+                await writer.drain()
+
+        async with _LocalServer(handler) as server:
+            transport = AsyncHttpTransport(server.config())
+            results = [await transport.execute_tool("browser_get_html") for _ in range(2)]
+            await transport.close()
+
+        assert results == ["x" * 5000] * 2
+        assert server.connections == 1
+
+    async def test_connection_close_is_not_reused(self) -> None:
+        """Test a response with Connection: close opens a new connection next time."""
+        async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await _read_request(reader)
+            writer.write(_response({"success": True, "result": 1}, extra="Connection: close\r\n"))
+            await writer.drain()
+
+        async with _LocalServer(handler) as server:
+            transport = AsyncHttpTransport(server.config())
+            await transport.execute_tool("browser_get_title")
+            await transport.execute_tool("browser_get_title")
+            await transport.close()
+
+        assert server.connections == 2
+
+    async def test_stale_idle_connection_is_retried(self) -> None:
+        """Test a pooled connection the server dropped is replaced transparently."""
+        async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            # Answer once, then drop the connection without announcing it
+            await _read_request(reader)
+            writer.write(_response({"success": True, "result": "ok"}))
+            await writer.drain()
+
+        async with _LocalServer(handler) as server:
+            transport = AsyncHttpTransport(server.config())
+            await transport.execute_tool("browser_get_title")
+            await asyncio.sleep(0.05)
+            result = await transport.execute_tool("browser_get_title")
+            await transport.close()
+
+        assert result == "ok"
+        assert server.connections == 2
+
+    @pytest.mark.parametrize(
+        ("status", "payload", "error"),
+        [
+            ("401 Unauthorized", {"error": "bad token"}, AuthenticationError),
+            ("502 Bad Gateway", {"error": "no page"}, OwlBrowserError),
+            ("200 OK", {"success": False, "error": "element not found"}, OwlBrowserError),
+        ],
+    )
+    async def test_errors_are_mapped(
+        self, status: str, payload: dict[str, Any], error: type[Exception]
+    ) -> None:
+        """Test error statuses and failed tools raise the SDK exceptions."""
+        async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await _read_request(reader)
+            writer.write(_response(payload, status=status))
+            await writer.drain()
+
+        async with _LocalServer(handler) as server:
+            transport = AsyncHttpTransport(server.config())
+            with pytest.raises(error):
+                await transport.execute_tool("browser_click")
+            await transport.close()
+
+
+def _server_frame(opcode: int, payload: bytes, fin: bool = True) -> bytes:
+    """Encode an unmasked server WebSocket frame."""
+    header = bytearray([(0x80 if fin else 0) | opcode])
+    if len(payload) < 126:
+        header.append(len(payload))
+    elif len(payload) <= 0xFFFF:
+        header.append(126)
+        header += len(payload).to_bytes(2, "big")
+    else:
+        header.append(127)
+        header += len(payload).to_bytes(8, "big")
+    return bytes(header) + payload
+
+
+async def _read_client_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read a masked client WebSocket frame."""
+    header = await reader.readexactly(2)
+    assert header[1] & 0x80, "client frames must be masked"
+    length = header[1] & 0x7F
+    if length == 126:
+        length = int.from_bytes(await reader.readexactly(2), "big")
+    elif length == 127:
+        length = int.from_bytes(await reader.readexactly(8), "big")
+    mask = await reader.readexactly(4)
+    return header[0] & 0x0F, _apply_ws_mask(await reader.readexactly(length), mask)
+
+
+async def _accept_websocket(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Answer the WebSocket handshake."""
+    _, headers, _ = await _read_request(reader)
+    accept = base64.b64encode(
+        hashlib.sha1(
+            (headers["sec-websocket-key"] + "258EAFA5-E914-47DA-95CA-C5AB0DC85B11").encode()
+        ).digest()
+    ).decode()
+    writer.write((
+        "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+    ).encode())
+    await writer.drain()
+
+
+def _reply(request: bytes, result: Any, success: bool = True) -> bytes:
+    message = json.loads(request)
+    body = {"id": message["id"], "success": success}
+    body["result" if success else "error"] = result
+    return json.dumps(body).encode()
+
+
+class TestAsyncWebSocketTransport:
+    """Tests for AsyncWebSocketTransport against a local WebSocket server."""
+
+    async def test_responses_are_matched_by_id(self) -> None:
+        """Test concurrent requests get their own results, in any order and size."""
+        sizes = {"small": 10, "medium": 1000, "large": 70_000}
+
+        async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await _accept_websocket(reader, writer)
+            requests = [(await _read_client_frame(reader))[1] for _ in sizes]
+            for request in reversed(requests):
+                name = json.loads(request)["params"]["name"]
+                writer.write(_server_frame(0x1, _reply(request, name * sizes[name])))
+            await writer.drain()
+            await reader.read()
+
+        async with _LocalServer(handler) as server:
+            transport = AsyncWebSocketTransport(server.config(TransportMode.WEBSOCKET))
+            await transport.connect()
+            results = await asyncio.gather(*(
+                transport.execute_tool("browser_evaluate", {"name": name}) for name in sizes
+            ))
+            await transport.close()
+
+        assert results == [name * size for name, size in sizes.items()]
+
+    async def test_fragmented_message_with_interleaved_ping(self) -> None:
+        """Test continuation frames are reassembled and pings answered meanwhile."""
+        pongs: list[bytes] = []
+
+        async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await _accept_websocket(reader, writer)
+            _, request = await _read_client_frame(reader)
+            reply = _reply(request, "fragmented result")
+            writer.write(_server_frame(0x1, reply[:10], fin=False))
+            writer.write(_server_frame(0x9, b"ping!"))
+            writer.write(_server_frame(0x0, reply[10:20], fin=False))
+            writer.write(_server_frame(0x0, reply[20:]))
+            await writer.drain()
+            opcode, payload = await _read_client_frame(reader)
+            if opcode == 0xA:
+                pongs.append(payload)
+            await reader.read()
+
+        async with _LocalServer(handler) as server:
+            transport = AsyncWebSocketTransport(server.config(TransportMode.WEBSOCKET))
+            await transport.connect()
+            result = await transport.execute_tool("browser_get_title")
+            await asyncio.sleep(0.05)
+            await transport.close()
+
+        assert result == "fragmented result"
+        assert pongs == [b"ping!"]
+
+    async def test_close_fails_pending_and_reconnects(self) -> None:
+        """Test a server close fails in-flight requests; the next one reconnects."""
+        async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await _accept_websocket(reader, writer)
+            _, request = await _read_client_frame(reader)
+            if json.loads(request)["method"] == "browser_slow":
+                writer.write(_server_frame(0x8, b""))
+            else:
+                writer.write(_server_frame(0x1, _reply(request, "after reconnect")))
+                await writer.drain()
+                await reader.read()
+            await writer.drain()
+
+        async with _LocalServer(handler) as server:
+            transport = AsyncWebSocketTransport(server.config(TransportMode.WEBSOCKET))
+            await transport.connect()
+            with pytest.raises(OwlBrowserError, match="Connection closed"):
+                await transport.execute_tool("browser_slow")
+            result = await transport.execute_tool("browser_get_title")
+            await transport.close()
+
+        assert result == "after reconnect"
+        assert server.connections == 2
+
+    async def test_tool_failure_raises(self) -> None:
+        """Test an unsuccessful response raises for its request only."""
+        async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await _accept_websocket(reader, writer)
+            _, request = await _read_client_frame(reader)
+            writer.write(_server_frame(0x1, _reply(request, "element not found", success=False)))
+            await writer.drain()
+            await reader.read()
+
+        async with _LocalServer(handler) as server:
+            transport = AsyncWebSocketTransport(server.config(TransportMode.WEBSOCKET))
+            await transport.connect()
+            with pytest.raises(OwlBrowserError, match="element not found"):
+                await transport.execute_tool("browser_click")
+            await transport.close()
+
+    async def test_rejected_handshake_raises(self) -> None:
+        """Test a 401 handshake response raises AuthenticationError."""
+        async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await _read_request(reader)
+            writer.write(b"HTTP/1.1 401 Unauthorized\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+
+        async with _LocalServer(handler) as server:
+            transport = AsyncWebSocketTransport(server.config(TransportMode.WEBSOCKET))
+            with pytest.raises(AuthenticationError):
+                await transport.connect()
+
+
+class TestAsyncBrowserCoreReplay:
+    """Tests for replaying synchronous SDK methods over the async core."""
+
+    @staticmethod
+    def _core(results: dict[str, Any]) -> AsyncBrowserCore:
+        core = AsyncBrowserCore(remote=RemoteConfig(url="http://127.0.0.1:1", token="t"))
+
+        async def send_command(method: str, _params: Any = None, _timeout: float = 30.0) -> Any:
+            value = results[method]
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        core.send_command = AsyncMock(side_effect=send_command)  # type: ignore[method-assign]
+        return core
+
+    async def test_except_exception_does_not_swallow_replay(self) -> None:
+        """Test SDK methods catching Exception still get their command sent."""
+        core = self._core({"getTitle": "Home"})
+
+        def get_title(sync_core: Any) -> str:
+            try:
+                return sync_core.send_command("getTitle")
+            except Exception:
+                return "fallback"
+
+        assert await core.replay(get_title, lambda c: c) == "Home"
+        core.send_command.assert_awaited_once()
+
+    async def test_each_command_is_sent_once(self) -> None:
+        """Test multi-command methods neither resend commands nor rerun per command."""
+        core = self._core({f"step{i}": i for i in range(6)} | {"fail": RuntimeError("boom")})
+        runs = 0
+
+        def many_steps(sync_core: Any) -> list[Any]:
+            nonlocal runs
+            runs += 1
+            values: list[Any] = [sync_core.send_command("step0")]
+            try:
+                sync_core.send_command("fail")
+            except RuntimeError as e:
+                values.append(str(e))
+            values += [sync_core.send_command(f"step{i}") for i in range(1, 6)]
+            return values
+
+        result = await core.replay(many_steps, lambda c: c)
+
+        assert result == [0, "boom", 1, 2, 3, 4, 5]
+        sent = [call.args[0] for call in core.send_command.await_args_list]
+        assert sent == ["step0", "fail", *(f"step{i}" for i in range(1, 6))]
+        assert runs <= 3
+
+    async def test_blocking_work_uses_own_executor(self) -> None:
+        """Test blocking SDK logic runs on the core's pool, which shutdown closes."""
+        core = self._core({"getTitle": "Home"})
+
+        def get_title(sync_core: Any) -> tuple[str, str]:
+            return sync_core.send_command("getTitle"), threading.current_thread().name
+
+        title, thread_name = await core.run_blocking(get_title, lambda c: c)
+        executor = core._executor
+        await core.shutdown()
+
+        assert title == "Home"
+        assert thread_name.startswith("owl_async_blocking")
+        assert executor is not None and core._executor is None
+        with pytest.raises(RuntimeError, match="shutdown"):
+            executor.submit(int)
+
+
+class _FakePipelinedTransport:
+    """Remote transport double answering each pipelined call group in reverse order."""
+
+    def __init__(self, replies: dict[str, Any]) -> None:
+        self.replies = replies
+        self.groups: list[list[tuple[str, Any]]] = []
+        self.futures: list[Future[Any]] = []
+
+    def execute_tools_pipelined(self, calls: list[tuple[str, Any]]) -> list[Future[Any]]:
+        self.groups.append(list(calls))
+        futures: list[Future[Any]] = [Future() for _ in calls]
+        self.futures += futures
+        for (tool_name, _), future in reversed(list(zip(calls, futures, strict=True))):
+            if tool_name not in self.replies:
+                continue  # Left pending, like a request the server never answers
+            reply = self.replies[tool_name]
+            if isinstance(reply, Exception):
+                future.set_exception(reply)
+            else:
+                future.set_result(reply)
+        return futures
+
+
+class _FakeStdin:
+    def __init__(self) -> None:
+        self.writes: list[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.writes.append(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class _FakeProcess:
+    def __init__(self) -> None:
+        self.stdin = _FakeStdin()
+
+
+class _FakeSocket:
+    def __init__(self) -> None:
+        self.sent: list[bytes] = []
+
+    def sendall(self, data: bytes) -> None:
+        self.sent.append(data)
+
+
+class TestBrowserCoreBatch:
+    """Tests for BrowserCore.batch and send_commands_async."""
+
+    @staticmethod
+    def _remote_core(transport: _FakePipelinedTransport) -> BrowserCore:
+        core = BrowserCore(remote=RemoteConfig(url="http://127.0.0.1:1", token="t"))
+        core._ws_transport = transport  # type: ignore[assignment]
+        return core
+
+    @staticmethod
+    def _local_core() -> tuple[BrowserCore, _FakeProcess]:
+        core = BrowserCore(config=BrowserConfig(browser_path="/nonexistent/owl_browser"))
+        process = _FakeProcess()
+        core._process = process  # type: ignore[assignment]
+        core._running = True
+        return core, process
+
+    def test_batch_pipelines_commands_in_order(self) -> None:
+        """Test all commands reach the transport together and results keep their order."""
+        transport = _FakePipelinedTransport({
+            "browser_click": True,
+            "browser_get_page_info": {"url": "https://example.com", "title": "Example"},
+            "browser_step": 3,
+        })
+        core = self._remote_core(transport)
+
+        results = core.batch([
+            ("click", {"selector": "#a"}),
+            ("getCurrentURL", None),
+            ("getPageTitle", None),
+            BatchCommand(method="step"),
+        ])
+
+        assert len(transport.groups) == 1
+        assert [tool_name for tool_name, _ in transport.groups[0]] == [
+            "browser_click",
+            "browser_get_page_info",
+            "browser_get_page_info",
+            "browser_step",
+        ]
+        assert [r.method for r in results] == ["click", "getCurrentURL", "getPageTitle", "step"]
+        assert [r.result for r in results] == [True, "https://example.com", "Example", 3]
+        assert all(r.success for r in results)
+
+    def test_failed_command_does_not_abort_batch(self) -> None:
+        """Test a failing command is reported on its own entry only."""
+        error = OwlBrowserError("element not found")
+        transport = _FakePipelinedTransport(
+            {"browser_first": 1, "browser_broken": error, "browser_last": 2}
+        )
+        core = self._remote_core(transport)
+
+        results = core.batch([("first", None), ("broken", None), ("last", None)])
+
+        assert [r.success for r in results] == [True, False, True]
+        assert [r.result for r in results] == [1, None, 2]
+        assert results[1].error is error
+        with pytest.raises(OwlBrowserError, match="element not found"):
+            results[1].unwrap()
+
+    def test_timed_out_command_is_cancelled(self) -> None:
+        """Test an unanswered command times out alone and stops being tracked."""
+        transport = _FakePipelinedTransport({"browser_first": 1, "browser_last": 2})
+        core = self._remote_core(transport)
+
+        results = core.batch([("first", None), ("hangs", None), ("last", None)], timeout=0.05)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert isinstance(results[1].error, CommandTimeoutError)
+        assert transport.futures[1].cancelled()
+
+    def test_local_commands_share_one_write(self) -> None:
+        """Test local commands go out in one stdin write and are matched back by id."""
+        core, process = self._local_core()
+
+        futures = core.send_commands_async(
+            [("first", {"context_id": "ctx_1"}), ("broken", None), ("last", None)]
+        )
+
+        assert len(process.stdin.writes) == 1
+        sent = [json.loads(line) for line in process.stdin.writes[0].decode().splitlines()]
+        assert [command["method"] for command in sent] == ["first", "broken", "last"]
+        assert sent[0]["context_id"] == "ctx_1"
+
+        ids = [command["id"] for command in sent]
+        core._handle_response({"id": ids[2], "result": "last"})
+        core._handle_response({"id": ids[1], "error": "no such method"})
+        core._handle_response({"id": ids[0], "result": "first"})
+
+        assert futures[0].result(timeout=0) == "first"
+        with pytest.raises(RuntimeError, match="no such method"):
+            futures[1].result(timeout=0)
+        assert futures[2].result(timeout=0) == "last"
+        assert core._pending_commands == {}
+
+    def test_local_cancelled_command_is_forgotten(self) -> None:
+        """Test cancelling a local command drops it and ignores its late response."""
+        core, process = self._local_core()
+
+        futures = core.send_commands_async([("first", None), ("slow", None)])
+        ids = [json.loads(line)["id"] for line in process.stdin.writes[0].decode().splitlines()]
+        futures[1].cancel()
+
+        assert list(core._pending_commands) == [ids[0]]
+        core._handle_response({"id": ids[1], "result": "late"})
+        core._handle_response({"id": ids[0], "result": "first"})
+        assert futures[0].result(timeout=0) == "first"
+
+
+class TestTransportPipelining:
+    """Tests for execute_tools_pipelined on the blocking transports."""
+
+    async def test_websocket_sends_all_frames_at_once(self) -> None:
+        """Test pipelined requests share one send and resolve by id in any order."""
+        transport = WebSocketTransport(
+            RemoteConfig(url="http://127.0.0.1:1", token="t", transport=TransportMode.WEBSOCKET)
+        )
+        sock = _FakeSocket()
+        transport._socket = sock  # type: ignore[assignment]
+        transport._connected = True
+
+        futures = transport.execute_tools_pipelined(
+            [("browser_first", None), ("browser_broken", {"selector": "#x"}), ("browser_last", None)]
+        )
+
+        assert len(sock.sent) == 1
+        reader = asyncio.StreamReader()
+        reader.feed_data(sock.sent[0])
+        reader.feed_eof()
+        requests = [json.loads((await _read_client_frame(reader))[1]) for _ in futures]
+        assert [r["method"] for r in requests] == ["browser_first", "browser_broken", "browser_last"]
+        assert requests[1]["params"] == {"selector": "#x"}
+
+        ids = [r["id"] for r in requests]
+        transport._handle_message(json.dumps({"id": ids[2], "success": True, "result": 2}))
+        transport._handle_message(json.dumps({"id": ids[1], "success": False, "error": "gone"}))
+        transport._handle_message(
+            json.dumps({"id": ids[0], "success": True, "result": {"id": 9, "result": 1}})
+        )
+
+        assert futures[0].result(timeout=0) == 1
+        with pytest.raises(OwlBrowserError, match="gone"):
+            futures[1].result(timeout=0)
+        assert futures[2].result(timeout=0) == 2
+        assert transport._pending_requests == {}
+
+    def test_http_calls_are_in_flight_together(self) -> None:
+        """Test HTTP pipelining issues calls concurrently and keeps failures per call."""
+        transport = HttpTransport(RemoteConfig(url="http://127.0.0.1:1", token="t"), max_concurrent=3)
+        # Every call must be running at the same time to get past the barrier
+        barrier = threading.Barrier(3, timeout=5)
+
+        def execute_tool(tool_name: str, _params: Any = None) -> Any:
+            barrier.wait()
+            if tool_name == "browser_broken":
+                raise OwlBrowserError("boom")
+            return tool_name
+
+        transport.execute_tool = execute_tool  # type: ignore[method-assign]
+        try:
+            futures = transport.execute_tools_pipelined(
+                [("browser_first", None), ("browser_broken", None), ("browser_last", None)]
+            )
+            assert futures[0].result(timeout=5) == "browser_first"
+            with pytest.raises(OwlBrowserError, match="boom"):
+                futures[1].result(timeout=5)
+            assert futures[2].result(timeout=5) == "browser_last"
+        finally:
+            transport.close()
+
+
+class TestAsyncBrowserCoreBatch:
+    """Tests for AsyncBrowserCore.batch."""
+
+    @staticmethod
+    def _core(delays: dict[str, float]) -> tuple[AsyncBrowserCore, list[int]]:
+        core = AsyncBrowserCore(remote=RemoteConfig(url="http://127.0.0.1:1", token="t"))
+        in_flight = [0, 0]  # current, peak
+
+        async def send_command(method: str, _params: Any = None, _timeout: float = 30.0) -> Any:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            try:
+                await asyncio.sleep(delays[method])
+                if method == "broken":
+                    raise OwlBrowserError("boom")
+                return method
+            finally:
+                in_flight[0] -= 1
+
+        core.send_command = AsyncMock(side_effect=send_command)  # type: ignore[method-assign]
+        return core, in_flight
+
+    async def test_commands_run_concurrently_in_order(self) -> None:
+        """Test commands overlap, results keep their order and failures stay per command."""
+        core, in_flight = self._core({"first": 0.03, "broken": 0.02, "last": 0.01})
+
+        results = await core.batch([("first", None), ("broken", None), ("last", None)])
+
+        assert in_flight[1] == 3
+        assert [r.result for r in results] == ["first", None, "last"]
+        assert [r.success for r in results] == [True, False, True]
+        assert isinstance(results[1].error, OwlBrowserError)
+
+    async def test_timed_out_command_fails_alone(self) -> None:
+        """Test a slow command times out without failing the rest."""
+        core, _ = self._core({"first": 0, "hangs": 10, "last": 0})
+
+        results = await core.batch([("first", None), ("hangs", None), ("last", None)], timeout=0.05)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert isinstance(results[1].error, CommandTimeoutError)
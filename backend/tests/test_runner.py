@@ -0,0 +1,274 @@
+"""
+Unit tests for the runner module.
+
+Tests cover:
+- SelfHealingEngine batched selector probing
+- Sequential fallback when the page cannot run the probe script
+- Shared healing store (SQLite) across engines and threads
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+from owl_browser import BatchResult
+
+from web2api.runner.healing_store import (
+    SQLiteHealingStore,
+    create_healing_store,
+    healing_namespace,
+)
+from web2api.runner.self_healing import HealingStrategy, SelectorHistory, SelfHealingEngine
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _FakeHealingPage:
+    """Page stub answering probe scripts, batches and is_visible from a selector table."""
+
+    def __init__(
+        self,
+        elements: dict[str, dict[str, Any]],
+        supports_probe: bool = True,
+        supports_batch: bool = True,
+    ) -> None:
+        self._elements = elements
+        self._supports_probe = supports_probe
+        self._supports_batch = supports_batch
+        self.expression_calls = 0
+        self.batch_calls: list[list[str]] = []
+        self.is_visible_calls: list[str] = []
+
+    def expression(self, script: str) -> Any:
+        self.expression_calls += 1
+        if not self._supports_probe:
+            raise RuntimeError("evaluate not supported")
+        match = re.search(r"const selectors = (\[.*\]);", script)
+        assert match is not None
+        results = []
+        for selector in json.loads(match.group(1)):
+            if ":contains(" in selector:
+                results.append({"error": "not a valid selector"})
+            else:
+                results.append(self._elements.get(selector, {"count": 0, "visible": False}))
+        return results
+
+    def batch(self, commands: list[tuple[str, dict[str, Any]]]) -> list[BatchResult]:
+        if not self._supports_batch:
+            raise RuntimeError("batch not supported")
+        assert all(method == "isVisible" for method, _ in commands)
+        selectors = [params["selector"] for _, params in commands]
+        self.batch_calls.append(selectors)
+        return [
+            BatchResult(method="isVisible", success=True, result=self._visible(selector))
+            for selector in selectors
+        ]
+
+    def is_visible(self, selector: str) -> bool:
+        self.is_visible_calls.append(selector)
+        return self._visible(selector)
+
+    def _visible(self, selector: str) -> bool:
+        return bool(self._elements.get(selector, {}).get("visible"))
+
+
+def _visible(count: int = 1, tag: str = "button", text: str = "Submit") -> dict[str, Any]:
+    return {
+        "count": count,
+        "visible": True,
+        "tag": tag,
+        "text": text,
+        "box": {"x": 10.0, "y": 20.0, "width": 80.0, "height": 30.0},
+    }
+
+
+class TestSelfHealingBatchedProbing:
+    """Tests for single-evaluation candidate probing."""
+
+    def test_heals_with_one_round_trip(self) -> None:
+        """All candidates are probed in one script evaluation."""
+        page = _FakeHealingPage({
+            "[name='email']": _visible(tag="input", text=""),
+            "[data-testid='email-field']": _visible(tag="input", text=""),
+        })
+        engine = SelfHealingEngine()
+
+        result = engine.heal_selector(
+            page, "input#email-old[name='email'][data-testid='email-field']"
+        )
+
+        assert result.success
+        assert result.healed_selector == "[data-testid='email-field']"
+        assert result.strategy_used == HealingStrategy.DATA_TESTID
+        assert page.expression_calls == 1
+        assert page.is_visible_calls == []
+        assert result.candidates_evaluated >= 8
+
+        stats = engine.get_healing_stats()
+        assert stats["batched_probes"] == 1
+        assert stats["single_probes"] == 0
+
+        # The cached selector wins on the next failure, again in one probe
+        again = engine.heal_selector(
+            page, "input#email-old[name='email'][data-testid='email-field']"
+        )
+        assert again.strategy_used == HealingStrategy.CACHED_HISTORY
+        assert page.expression_calls == 2
+
+    def test_prefers_unique_match_matching_signature(self) -> None:
+        """Close candidates are ranked by match uniqueness and stored signature."""
+        original = "button.primary.submit-btn"
+        page = _FakeHealingPage({
+            "button.primary": _visible(count=6, text="Cancel"),
+            "button.submit-btn": _visible(count=1, text="Submit"),
+        })
+        engine = SelfHealingEngine()
+        engine._selector_history[original] = SelectorHistory(
+            original_selector=original,
+            last_working_selector=original,
+            element_signature={"tag": "button", "text": "Submit"},
+        )
+
+        result = engine.heal_selector(page, original)
+
+        assert result.healed_selector == "button.submit-btn"
+        history = engine._selector_history[original]
+        assert history.element_signature is not None
+        assert history.element_signature["bounding_box"] == {
+            "x": 10.0, "y": 20.0, "width": 80.0, "height": 30.0,
+        }
+
+    def test_unsupported_selectors_use_browser_probe(self) -> None:
+        """Selectors the page script rejects are checked by the browser in one batch."""
+        page = _FakeHealingPage({
+            "label:contains('Email') + input": {"visible": True},
+        })
+        engine = SelfHealingEngine()
+
+        result = engine.heal_selector(page, "#missing", element_description="Email")
+
+        assert result.success
+        assert result.healed_selector == "label:contains('Email') + input"
+        assert page.expression_calls == 1
+        assert len(page.batch_calls) == 1
+        assert "label:contains('Email') + input" in page.batch_calls[0]
+        assert page.is_visible_calls == []
+
+    def test_falls_back_to_pipelined_probing(self) -> None:
+        """Without script support all selectors are checked in one batch."""
+        elements = {"[name='q']": _visible(tag="input", text="")}
+        batched = SelfHealingEngine().heal_selector(
+            _FakeHealingPage(elements), "input[name='q']#search-old"
+        )
+
+        page = _FakeHealingPage(elements, supports_probe=False)
+        fallback = SelfHealingEngine().heal_selector(page, "input[name='q']#search-old")
+        sequential = SelfHealingEngine(batch_probing=False).heal_selector(
+            _FakeHealingPage(elements), "input[name='q']#search-old"
+        )
+
+        assert batched.healed_selector == "[name='q']"
+        assert fallback.healed_selector == sequential.healed_selector == "[name='q']"
+        assert len(page.batch_calls) == 1
+        assert page.is_visible_calls == []
+
+    def test_falls_back_to_single_probes_without_batching(self) -> None:
+        """Pages that cannot batch are probed one selector at a time."""
+        page = _FakeHealingPage(
+            {"[name='q']": _visible(tag="input", text="")},
+            supports_probe=False,
+            supports_batch=False,
+        )
+        engine = SelfHealingEngine()
+
+        result = engine.heal_selector(page, "input[name='q']#search-old")
+
+        assert result.healed_selector == "[name='q']"
+        assert len(page.is_visible_calls) > 1
+        assert engine.get_healing_stats()["pipelined_probes"] == 0
+
+
+class TestSharedHealingStore:
+    """Tests for the shared selector-healing knowledge base."""
+
+    def test_heal_is_reused_by_other_engines(self, temp_dir: Path) -> None:
+        """A heal recorded by one worker is the first probe of another."""
+        path = temp_dir / "healing.db"
+        page = _FakeHealingPage({"[name='email']": _visible(tag="input", text="")})
+        namespace = healing_namespace("https://shop.example.com/login", "Login")
+
+        first = SelfHealingEngine(store=SQLiteHealingStore(path))
+        result = first.heal_selector(page, "#email[name='email']", namespace=namespace)
+        assert result.healed_selector == "[name='email']"
+
+        second = SelfHealingEngine(store=create_healing_store(f"sqlite:///{path}"))
+        reused = second.heal_selector(page, "#email[name='email']", namespace=namespace)
+        assert reused.healed_selector == "[name='email']"
+        assert reused.strategy_used == HealingStrategy.DOM_STRUCTURE
+        assert reused.confidence == 0.95
+
+        other = SelfHealingEngine(store=SQLiteHealingStore(path))
+        isolated = other.heal_selector(page, "#email[name='email']", namespace="other.com")
+        assert isolated.strategy_used == HealingStrategy.NAME_FALLBACK
+
+        stats = second.get_healing_stats()
+        assert stats["total_tracked_selectors"] == 2
+        for engine in (first, second, other):
+            engine.close()
+
+    def test_concurrent_updates_are_atomic(self, temp_dir: Path) -> None:
+        """Updates from several connections and threads are not lost."""
+        path = temp_dir / "healing.db"
+        stores = [SQLiteHealingStore(path), SQLiteHealingStore(path)]
+        stores[0].record_heal("ns", "#old", "#new")
+
+        def work(store: SQLiteHealingStore, worker: int) -> None:
+            for i in range(25):
+                store.record_failure("ns", "#old")
+                store.record_heal("ns", "#old", f"#healed-{(worker + i) % 3}")
+
+        threads = [
+            threading.Thread(target=work, args=(stores[i % 2], i)) for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        history = stores[1].get("ns", "#old")
+        assert history is not None
+        assert history.failure_count == 200
+        assert sorted(history.healed_selectors) == [
+            "#healed-0", "#healed-1", "#healed-2", "#new",
+        ]
+        assert history.healed_selectors[0] == "#new"
+        for store in stores:
+            store.close()
+
+    def test_signature_survives_store_failure(self, temp_dir: Path) -> None:
+        """A store that cannot be written still leaves the captured signature."""
+        store = SQLiteHealingStore(temp_dir / "healing.db")
+        store.close()
+        page = MagicMock()
+        page.get_bounding_box.return_value = {"x": 1, "y": 2, "width": 3, "height": 4}
+        page.extract_text.return_value = "Submit"
+
+        engine = SelfHealingEngine(store=store)
+        signature = engine.capture_element_signature(page, "#submit", namespace="ns")
+
+        assert signature is not None
+        assert signature["bounding_box"] == {"x": 1, "y": 2, "width": 3, "height": 4}
+        assert signature["text"] == "Submit"
+
+    def test_healing_namespace(self) -> None:
+        """Namespaces combine target domain and spec name."""
+        assert healing_namespace("https://Shop.Example.com/cart", "Checkout") == (
+            "shop.example.com/Checkout"
+        )
+        assert healing_namespace(None, "Checkout") == "Checkout"
+        assert healing_namespace() == "default"
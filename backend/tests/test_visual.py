@@ -0,0 +1,571 @@
+"""
+Unit tests for visual comparison.
+
+Tests cover:
+- Vectorised dynamic-region statistics match the per-cell reference
+- Vectorised region diffs in RegionDiffAnalyzer
+- Batched ML assertions sharing one decoded screenshot
+- Shared OCR service: batching, coalescing and region-hash cache
+- Tiled comparison with identical-image fast path and memory budget
+- Baseline cache: LRU budget, content-hash keys and .npy sidecars
+- Benchmark of dynamic-region detection across screenshot sizes
+"""
+
+from __future__ import annotations
+
+import gc
+import io
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from web2api.assertions.ml_engine import (
+    ColorAnalyzer,
+    DecodedImage,
+    MLAssertionEngine,
+    MLBatchAssertion,
+    OCRAssertion,
+    OCRResult,
+    RegionDiffAnalyzer,
+)
+from web2api.assertions.ocr_service import OCRService
+from web2api.visual.baseline_cache import BaselineCache
+from web2api.visual.regression_engine import (
+    ComparisonMode,
+    ComparisonResult,
+    VisualRegressionEngine,
+    _tile_edges,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _reference_cell_stats(
+    img_array: np.ndarray, grid_size: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-cell entropy and variance, computed one cell at a time."""
+    h, w = img_array.shape[:2]
+    grid_h = (h + grid_size - 1) // grid_size
+    grid_w = (w + grid_size - 1) // grid_size
+    entropy_map = np.zeros((grid_h, grid_w))
+    variance_map = np.zeros((grid_h, grid_w))
+
+    for gy in range(grid_h):
+        for gx in range(grid_w):
+            cell = img_array[
+                gy * grid_size:min((gy + 1) * grid_size, h),
+                gx * grid_size:min((gx + 1) * grid_size, w),
+            ]
+            gray_cell = np.mean(cell, axis=2).astype(np.uint8)
+            hist, _ = np.histogram(gray_cell, bins=256, range=(0, 256))
+            hist = hist[hist > 0]
+            probs = hist / hist.sum()
+            entropy_map[gy, gx] = -np.sum(probs * np.log2(probs))
+            variance_map[gy, gx] = np.var(cell)
+
+    return entropy_map, variance_map
+
+
+def _screenshot(height: int, width: int, seed: int = 0) -> np.ndarray:
+    """Flat page with a few noisy blocks standing in for dynamic content."""
+    rng = np.random.default_rng(seed)
+    img = np.full((height, width, 3), 240, dtype=np.uint8)
+    img[: height // 8, :, :] = 40
+    for _ in range(max(1, height * width // 200_000)):
+        y = int(rng.integers(0, max(1, height - 120)))
+        x = int(rng.integers(0, max(1, width - 160)))
+        img[y:y + 120, x:x + 160] = rng.integers(0, 256, (120, 160, 3), dtype=np.uint8)[
+            : height - y, : width - x
+        ]
+    return img
+
+
+@pytest.fixture
+def engine(temp_dir: Path) -> VisualRegressionEngine:
+    """Visual regression engine with a temporary baseline directory."""
+    return VisualRegressionEngine(baseline_dir=temp_dir)
+
+
+class TestDynamicRegionStats:
+    """Tests for vectorised grid statistics."""
+
+    @pytest.mark.parametrize(
+        ("height", "width", "grid_size"),
+        [(256, 256, 32), (301, 257, 32), (95, 70, 16), (20, 20, 32), (1000, 333, 24)],
+    )
+    def test_matches_per_cell_reference(
+        self, engine: VisualRegressionEngine, height: int, width: int, grid_size: int
+    ) -> None:
+        """Entropy and variance maps match the cell-by-cell computation."""
+        img = _screenshot(height, width, seed=height)
+        entropy, variance = engine._grid_cell_stats(img, grid_size)
+        ref_entropy, ref_variance = _reference_cell_stats(img, grid_size)
+
+        np.testing.assert_allclose(entropy, ref_entropy, rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(variance, ref_variance, rtol=1e-9, atol=1e-6)
+
+    def test_banding_does_not_change_result(
+        self, engine: VisualRegressionEngine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Processing in many small bands gives the same maps."""
+        img = _screenshot(700, 410)
+        expected = engine._grid_cell_stats(img, 32)
+        monkeypatch.setattr("web2api.visual.regression_engine.GRID_BAND_PIXELS", 1)
+        banded = engine._grid_cell_stats(img, 32)
+
+        np.testing.assert_array_equal(banded[0], expected[0])
+        np.testing.assert_array_equal(banded[1], expected[1])
+
+    def test_detects_noisy_block(self, engine: VisualRegressionEngine) -> None:
+        """A noisy block on a flat page is reported as a dynamic region."""
+        img = np.full((512, 512, 3), 255, dtype=np.uint8)
+        rng = np.random.default_rng(1)
+        img[128:256, 192:384] = rng.integers(0, 256, (128, 192, 3), dtype=np.uint8)
+
+        regions = engine.auto_detect_dynamic_regions(Image.fromarray(img))
+
+        assert [(r.x, r.y, r.width, r.height) for r in regions] == [(192, 128, 192, 128)]
+
+
+class TestRegionDiffAnalyzer:
+    """Tests for block-wise region comparison."""
+
+    def test_matches_per_region_reference(self) -> None:
+        """Changed regions and scores match region-by-region diffs."""
+        rng = np.random.default_rng(2)
+        img1 = rng.integers(0, 256, (203, 150, 3), dtype=np.uint8)
+        img2 = img1.copy()
+        img2[10:40, 100:140] = 255 - img2[10:40, 100:140]
+        img2[160:200, 0:30] = 0
+
+        changed = RegionDiffAnalyzer().compare_regions(img1, img2, (4, 3), threshold=0.01)
+
+        rh, rw = 203 // 4, 150 // 3
+        expected = []
+        for row in range(4):
+            for col in range(3):
+                r1 = img1[row * rh:(row + 1) * rh, col * rw:(col + 1) * rw].astype(int)
+                r2 = img2[row * rh:(row + 1) * rh, col * rw:(col + 1) * rw].astype(int)
+                score = np.mean(np.abs(r1 - r2)) / 255
+                if score > 0.01:
+                    expected.append(((col * rw, row * rh, rw, rh), score))
+
+        assert [bbox for bbox, _ in changed] == [bbox for bbox, _ in expected]
+        for (_, score), (_, ref) in zip(changed, expected, strict=True):
+            assert score == pytest.approx(ref)
+
+    def test_image_smaller_than_grid(self) -> None:
+        """Images with fewer pixels than grid cells report no regions."""
+        img = np.zeros((2, 2, 3), dtype=np.uint8)
+        assert RegionDiffAnalyzer().compare_regions(img, img + 1, (4, 4)) == []
+
+
+def _ui_screenshot() -> np.ndarray:
+    """Small BGR page with a header, form boxes and a red error banner."""
+    img = np.full((240, 320, 3), 255, dtype=np.uint8)
+    img[:30] = (60, 40, 20)
+    for y in (60, 110, 160):
+        img[y:y + 30, 40:280] = 90
+        img[y + 2:y + 28, 42:278] = 250
+    img[200:225, 40:280] = (30, 30, 220)
+    return img
+
+
+BATCH = [
+    MLBatchAssertion("classifier", {"expected_state": "error"}),
+    MLBatchAssertion("color_analyzer", {"has_color": "#dc1e1e", "color_tolerance": 40}),
+    MLBatchAssertion("color_analyzer", {}),
+    MLBatchAssertion("layout_analyzer", {"min_count": 1}),
+    MLBatchAssertion("form_detector", {"min_fields": 1}),
+    MLBatchAssertion("accessibility_checker", {"min_contrast_ratio": 3.0}),
+]
+
+
+class TestMLAssertionBatch:
+    """Tests for MLAssertionEngine.validate_batch."""
+
+    def test_matches_individual_assertions(self) -> None:
+        """Batch results equal running each assertion on its own."""
+        engine = MLAssertionEngine()
+        buf = io.BytesIO()
+        Image.fromarray(_ui_screenshot()[:, :, ::-1]).save(buf, format="PNG")
+        png = buf.getvalue()
+
+        results = engine.validate_batch(png, BATCH)
+
+        for assertion, result in zip(BATCH, results, strict=True):
+            single = getattr(engine, assertion.analyzer).validate(png, **assertion.options)
+            assert (result.passed, result.message, result.actual) == (
+                single.passed,
+                single.message,
+                single.actual,
+            )
+
+    def test_shares_intermediates(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Color clusters and OCR text are computed once per image."""
+        calls = {"cluster": 0, "ocr": 0}
+        cluster = ColorAnalyzer._cluster_colors
+
+        def counting_cluster(self: ColorAnalyzer, image: object, n: int) -> object:
+            calls["cluster"] += 1
+            return cluster(self, image, n)
+
+        def fake_ocr(_self: OCRAssertion, _image: object, _region: object) -> OCRResult:
+            calls["ocr"] += 1
+            return OCRResult(text="Sign in", confidence=0.9)
+
+        monkeypatch.setattr(ColorAnalyzer, "_cluster_colors", counting_cluster)
+        monkeypatch.setattr(OCRAssertion, "_extract", fake_ocr)
+
+        decoded = DecodedImage(_ui_screenshot())
+        results = MLAssertionEngine().validate_batch(decoded, [
+            MLBatchAssertion("color_analyzer", {}),
+            MLBatchAssertion("color_analyzer", {}),
+            MLBatchAssertion("ocr", {"contains": "Sign"}),
+            MLBatchAssertion("ocr", {"expected_text": "Sign in"}),
+        ])
+
+        assert all(r.passed for r in results)
+        assert calls == {"cluster": 1, "ocr": 1}
+        assert decoded.edges is decoded.edges
+
+    def test_unknown_analyzer(self) -> None:
+        """Unknown analyzer names are rejected before any work is done."""
+        with pytest.raises(ValueError, match="Unknown ML analyzer"):
+            MLAssertionEngine().validate_batch(_ui_screenshot(), [MLBatchAssertion("nope")])
+
+    def test_unclosed_engine_shuts_down_pool(self) -> None:
+        """The worker pool stops once its engine is garbage collected."""
+        engine = MLAssertionEngine(max_workers=1)
+        pool = engine._get_process_pool()
+
+        del engine
+        gc.collect()
+
+        with pytest.raises(RuntimeError, match="shutdown"):
+            pool.submit(int)
+
+    @pytest.mark.slow
+    def test_parallel_matches_sequential(self) -> None:
+        """Assertions run in worker processes give the sequential results."""
+        engine = MLAssertionEngine(max_workers=2)
+        image = _ui_screenshot()
+        try:
+            parallel = engine.validate_batch(image, BATCH, parallel=True)
+        finally:
+            engine.close()
+
+        sequential = MLAssertionEngine().validate_batch(image, BATCH)
+        assert [(r.passed, r.message, r.actual) for r in parallel] == [
+            (r.passed, r.message, r.actual) for r in sequential
+        ]
+
+
+class _FakeReader:
+    """Stand-in for an EasyOCR reader that records inference calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def readtext(self, image: np.ndarray, **_options: object) -> list:
+        self.calls.append(1)
+        return [(None, f"text{int(image.mean())}", 0.9)]
+
+    def readtext_batched(self, images: list[np.ndarray], **_options: object) -> list:
+        self.calls.append(len(images))
+        return [[(None, f"text{int(image.mean())}", 0.9)] for image in images]
+
+
+def _solid(value: int, size: tuple[int, int] = (40, 20)) -> Image.Image:
+    return Image.new("RGB", size, (value, value, value))
+
+
+class TestOCRService:
+    """Tests for the shared OCR service."""
+
+    @pytest.fixture
+    def reader(self) -> _FakeReader:
+        return _FakeReader()
+
+    @pytest.fixture
+    def service(self, reader: _FakeReader, monkeypatch: pytest.MonkeyPatch):
+        service = OCRService(batch_window=0.2)
+        monkeypatch.setattr(service, "_load_reader", lambda _key: reader)
+        yield service
+        service.close()
+
+    def test_repeated_region_is_cached(self, service: OCRService, reader: _FakeReader) -> None:
+        """OCR of an unchanged region runs the model once."""
+        first = service.recognize(_solid(10))
+        second = service.recognize(_solid(10))
+
+        assert first == second
+        assert first.text == "text10"
+        assert reader.calls == [1]
+        assert service.statistics["hits"] == 1
+
+    def test_batches_same_sized_regions(self, service: OCRService, reader: _FakeReader) -> None:
+        """Queued regions of one size share an inference call."""
+        futures = [service.submit(_solid(v)) for v in (1, 2, 3)]
+        futures.append(service.submit(_solid(4, size=(10, 10))))
+
+        assert [f.result().text for f in futures] == ["text1", "text2", "text3", "text4"]
+        assert sorted(reader.calls) == [1, 3]
+        assert service.statistics["batches"] == 1
+
+    def test_coalesces_in_flight_requests(self, service: OCRService, reader: _FakeReader) -> None:
+        """Identical requests queued together are recognized once."""
+        first = service.submit(_solid(7))
+        second = service.submit(_solid(7))
+
+        assert first is second
+        assert first.result().text == "text7"
+        assert reader.calls == [1]
+        assert service.statistics["coalesced"] == 1
+
+    def test_failures_propagate_uncached(
+        self, service: OCRService, reader: _FakeReader, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Model errors reach the caller and are not cached."""
+        monkeypatch.setattr(reader, "readtext", lambda _image, **_options: 1 / 0)
+
+        with pytest.raises(ZeroDivisionError):
+            service.recognize(_solid(5))
+        assert service.statistics["cache_size"] == 0
+
+    def test_assertions_share_one_model(self, service: OCRService) -> None:
+        """OCR assertions using one service load the model once."""
+        ocr1 = OCRAssertion(service=service)
+        ocr2 = OCRAssertion(service=service)
+
+        assert ocr1._get_reader() is ocr2._get_reader()
+        assert ocr1.extract_text(_solid(9)).text == "text9"
+        assert service.statistics["models_loaded"] == 1
+
+
+class TestTiledComparison:
+    """Tests for the tiled comparison pipeline."""
+
+    @staticmethod
+    def _pair(seed: int = 3) -> tuple[Image.Image, Image.Image]:
+        """Baseline and a current image differing in a single small area."""
+        baseline = _screenshot(900, 700, seed=seed)
+        current = baseline.copy()
+        current[600:640, 300:360] = 255 - current[600:640, 300:360]
+        return Image.fromarray(baseline), Image.fromarray(current)
+
+    def test_tile_edges_merge_short_remainder(self) -> None:
+        """Remainders under half a tile join the last tile."""
+        assert _tile_edges(600, 256) == [(0, 256), (256, 600)]
+        assert _tile_edges(700, 256) == [(0, 256), (256, 512), (512, 700)]
+        assert _tile_edges(100, 256) == [(0, 100)]
+
+    def test_identical_images_skip_comparison(
+        self, engine: VisualRegressionEngine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Byte-identical images pass without running any algorithm."""
+        baseline, _ = self._pair()
+        engine.update_baseline("page", baseline)
+
+        def fail(*_args: object) -> ComparisonResult:
+            raise AssertionError("comparison should be skipped")
+
+        monkeypatch.setattr(engine, "_compare_structural", fail)
+        result = engine.compare(
+            "page", baseline.copy(), mode=ComparisonMode.STRUCTURAL, normalize_scroll=False
+        )
+
+        assert result.passed
+        assert result.details == {"method": "structural", "identical": True}
+        assert result.changed_pixel_count == 0
+
+    def test_only_changed_tiles_are_compared(
+        self, engine: VisualRegressionEngine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The pixel comparison runs once, on the one changed tile."""
+        baseline, current = self._pair()
+        engine.update_baseline("page", baseline)
+
+        sizes: list[tuple[int, int]] = []
+        compare_pixel = engine._compare_pixel
+
+        def record(b: Image.Image, c: Image.Image, threshold: float) -> ComparisonResult:
+            sizes.append(b.size)
+            return compare_pixel(b, c, threshold)
+
+        monkeypatch.setattr(engine, "_compare_pixel", record)
+        result = engine.compare(
+            "page", current, mode=ComparisonMode.PIXEL, normalize_scroll=False
+        )
+
+        assert sizes == [(256, 256)]
+        assert result.details is not None
+        assert result.details["tiles_changed"] == 1
+        assert result.details["tiles_total"] == 12
+        assert 0 < result.diff_percentage < 256 * 256 / (900 * 700)
+
+    def test_pixel_mode_matches_whole_image(self, temp_dir: Path) -> None:
+        """Tiled pixel comparison and changed regions equal the untiled ones."""
+        baseline, current = self._pair()
+        tiled = VisualRegressionEngine(temp_dir / "tiled", memory_budget_mb=0.5)
+        whole = VisualRegressionEngine(temp_dir / "whole", tile_size=None)
+
+        results = []
+        for engine in (tiled, whole):
+            engine.update_baseline("page", baseline)
+            results.append(engine.compare(
+                "page", current, mode=ComparisonMode.PIXEL, threshold=0.0,
+                normalize_scroll=False,
+            ))
+
+        tiled_result, whole_result = results
+        assert not tiled_result.passed and not whole_result.passed
+        assert tiled_result.diff_percentage == pytest.approx(whole_result.diff_percentage)
+        assert tiled_result.changed_pixel_count == whole_result.changed_pixel_count == 2400
+        assert tiled_result.changed_regions == whole_result.changed_regions
+        assert tiled_result.details is not None and whole_result.details is not None
+        assert tiled_result.details["diff_pixels"] == whole_result.details["diff_pixels"]
+
+        # The diff image is built band by band under the small budget
+        tiled_diff = np.asarray(Image.open(tiled_result.diff_path))
+        whole_diff = np.asarray(Image.open(whole_result.diff_path))
+        np.testing.assert_array_equal(tiled_diff, whole_diff)
+
+    def test_untiled_mask_is_built_in_bands(self, temp_dir: Path) -> None:
+        """The whole-image changed-pixel mask does not depend on the band height."""
+        baseline, current = self._pair()
+        engine = VisualRegressionEngine(temp_dir, tile_size=None, memory_budget_mb=0.1)
+        assert engine._band_height(baseline.width) < baseline.height
+
+        np.testing.assert_array_equal(
+            engine._banded_diff_mask(baseline, current), engine._diff_mask(baseline, current)
+        )
+
+    @pytest.mark.parametrize("mode", list(ComparisonMode))
+    def test_tiling_keeps_whole_image_verdict(self, temp_dir: Path, mode: ComparisonMode) -> None:
+        """A small changed banner gives every mode its whole-image score and details."""
+        baseline = _screenshot(960, 540, seed=5)
+        current = baseline.copy()
+        current[20:40, 400:500] = 255 - current[20:40, 400:500]
+        tiled = VisualRegressionEngine(temp_dir / "tiled", tile_size=64)
+        whole = VisualRegressionEngine(temp_dir / "whole", tile_size=None)
+
+        results = []
+        for engine in (tiled, whole):
+            engine.update_baseline("page", Image.fromarray(baseline))
+            results.append(engine.compare(
+                "page", Image.fromarray(current), mode=mode, threshold=0.01,
+                normalize_scroll=False,
+            ))
+
+        tiled_result, whole_result = results
+        assert tiled_result.passed == whole_result.passed
+        assert tiled_result.diff_percentage == pytest.approx(whole_result.diff_percentage)
+        assert tiled_result.changed_pixel_count == whole_result.changed_pixel_count
+        assert tiled_result.details is not None and whole_result.details is not None
+        assert whole_result.details.items() <= tiled_result.details.items()
+
+
+class TestBaselineCache:
+    """Tests for the decoded baseline cache."""
+
+    def test_repeat_comparisons_decode_once(self, temp_dir: Path) -> None:
+        """Baselines are decoded once and their tile digests reused."""
+        cache = BaselineCache()
+        engine = VisualRegressionEngine(temp_dir, baseline_cache=cache)
+        baseline, current = TestTiledComparison._pair()
+        engine.update_baseline("page", baseline)
+
+        first = engine.compare("page", current, mode=ComparisonMode.PIXEL, normalize_scroll=False)
+        second = engine.compare("page", current, mode=ComparisonMode.PIXEL, normalize_scroll=False)
+
+        assert first.diff_percentage == second.diff_percentage
+        assert cache.statistics["misses"] == 1
+        assert cache.statistics["hits"] == 1
+        entry = cache.load(temp_dir / "page.png")
+        assert entry.key == engine.get_baseline_hash("page")
+        assert entry.image_digest is not None
+        assert list(entry.tile_digests) == [256]
+
+    def test_updated_baseline_is_not_stale(self, temp_dir: Path) -> None:
+        """A rewritten baseline gets a new key and is decoded again."""
+        cache = BaselineCache()
+        engine = VisualRegressionEngine(temp_dir, baseline_cache=cache)
+        baseline, current = TestTiledComparison._pair()
+        engine.update_baseline("page", baseline)
+        assert not engine.compare("page", current, threshold=0.0, normalize_scroll=False).passed
+
+        engine.update_baseline("page", current)
+        result = engine.compare("page", current, threshold=0.0, normalize_scroll=False)
+
+        assert result.passed
+        assert result.details is not None and result.details["identical"]
+        assert cache.statistics["misses"] == 2
+
+    def test_memory_budget_evicts_least_recently_used(self, temp_dir: Path) -> None:
+        """Entries over the memory budget are evicted oldest first."""
+        paths = []
+        for i in range(3):
+            path = temp_dir / f"b{i}.png"
+            Image.fromarray(np.full((512, 512, 3), i, dtype=np.uint8)).save(path)
+            paths.append(path)
+
+        cache = BaselineCache(max_memory_mb=1.6)  # room for two 768 KiB baselines
+        cache.load(paths[0])
+        cache.load(paths[1])
+        cache.load(paths[0])
+        cache.load(paths[2])
+
+        assert cache.statistics["evictions"] == 1
+        cache.load(paths[0])
+        assert cache.statistics["hits"] == 2
+        cache.load(paths[1])
+        assert cache.statistics["misses"] == 4
+
+    def test_sidecars_are_memory_mapped(self, temp_dir: Path) -> None:
+        """A second cache loads the decoded pixels from the .npy sidecar."""
+        baseline, _ = TestTiledComparison._pair()
+        path = temp_dir / "page.png"
+        baseline.save(path)
+
+        writer = BaselineCache(sidecar_dir=temp_dir / "sidecars")
+        expected = np.asarray(writer.load(path).pixels)
+
+        reader = BaselineCache(sidecar_dir=temp_dir / "sidecars")
+        entry = reader.load(path)
+
+        assert reader.statistics["sidecar_hits"] == 1
+        assert isinstance(entry.pixels, np.memmap)
+        np.testing.assert_array_equal(np.asarray(entry.pixels), expected)
+        assert entry.image().size == baseline.size
+
+
+@pytest.mark.slow
+class TestDynamicRegionBenchmark:
+    """Benchmark vectorised grid statistics against the per-cell loop."""
+
+    @pytest.mark.parametrize(
+        ("height", "width"), [(1080, 1920), (4000, 1920), (8000, 1920)]
+    )
+    def test_faster_than_per_cell_loop(
+        self, engine: VisualRegressionEngine, height: int, width: int
+    ) -> None:
+        img = _screenshot(height, width)
+
+        start = time.perf_counter()
+        engine._grid_cell_stats(img, 32)
+        vectorised = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _reference_cell_stats(img, 32)
+        reference = time.perf_counter() - start
+
+        print(
+            f"\n{width}x{height}: vectorised {vectorised * 1000:.1f}ms, "
+            f"per-cell {reference * 1000:.1f}ms ({reference / vectorised:.1f}x)"
+        )
+        assert vectorised < reference
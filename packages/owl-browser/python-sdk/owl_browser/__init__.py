@@ -104,6 +104,7 @@ from .exceptions import (
 )
 
 # Async classes
+from .async_core import AsyncBrowserCore
 from .async_browser import (
     AsyncBrowser,
     AsyncBrowserContext,
@@ -221,6 +222,10 @@ from .types import (
     Flow,
     FlowExecutionResult,
 
+    # Batch types
+    BatchCommand,
+    BatchResult,
+
     # Type aliases
     ContextId,
 )
@@ -249,6 +254,7 @@ __all__ = [
     # Async classes
     "AsyncBrowser",
     "AsyncBrowserContext",
+    "AsyncBrowserCore",
     "AsyncPage",  # Alias
 
     # Exceptions
@@ -391,6 +397,10 @@ __all__ = [
     "get_value_at_path",
     "execute_flow",
 
+    # Batch types
+    "BatchCommand",
+    "BatchResult",
+
     # Type aliases
     "ContextId",
 ]
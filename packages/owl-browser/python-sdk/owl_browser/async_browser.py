@@ -7,16 +7,23 @@ with async/await syntax and asyncio event loops.
 Supports dual mode:
 - LOCAL: Connect to local browser binary via stdin/stdout IPC
 - REMOTE: Connect to remote browser HTTP server via REST API
+
+Commands go over the native asyncio transports of AsyncBrowserCore.
+Method semantics are shared with the sync API: each async method runs the
+corresponding sync method's logic via ``AsyncBrowserCore.replay``, which
+only uses a worker thread for methods sending several commands.
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional, Union
+import json
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from .browser import Browser as SyncBrowser
+from .async_core import AsyncBrowserCore
 from .context import BrowserContext as SyncBrowserContext
 from .core import BrowserCore
 from .types import (
+    BatchResult,
+    BrowserConfig,
     ContextId,
     ContextOptions,
     LLMStatus,
@@ -52,28 +59,44 @@ class AsyncBrowserContext:
         ```
     """
 
-    def __init__(self, sync_context: SyncBrowserContext, executor: ThreadPoolExecutor):
-        self._sync = sync_context
-        self._executor = executor
+    def __init__(self, context_id: ContextId, core: AsyncBrowserCore):
+        self._context_id = context_id
+        self._core = core
 
     @property
     def id(self) -> ContextId:
         """Get the context ID."""
-        return self._sync.id
+        return self._context_id
+
+    def _sync_context(self, core: BrowserCore) -> SyncBrowserContext:
+        return SyncBrowserContext(self._context_id, core)
 
     async def _run(self, func, *args, **kwargs) -> Any:
-        """Run a sync function in the thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self._executor,
-            lambda: func(*args, **kwargs)
+        """Run a sync BrowserContext method over the async core."""
+        return await self._core.replay(func, self._sync_context, *args, **kwargs)
+
+    async def send_command(self, method: str, **params) -> Any:
+        """Send a raw command for this context."""
+        return await self._core.send_command(
+            method, {"context_id": self._context_id, **params}
+        )
+
+    async def batch(
+        self,
+        commands: List[Tuple[str, Dict[str, Any]]],
+        timeout: float = 30.0
+    ) -> List[BatchResult]:
+        """Send several raw commands for this context concurrently."""
+        return await self._core.batch(
+            [(method, {"context_id": self._context_id, **(params or {})}) for method, params in commands],
+            timeout=timeout
         )
 
     # ==================== NAVIGATION ====================
 
     async def goto(self, url: str, wait_until: str = "load", timeout: int = 30000) -> None:
         """Navigate to a URL."""
-        await self._run(self._sync.goto, url, wait_until, timeout)
+        await self._run(SyncBrowserContext.goto, url, wait_until, timeout)
 
     async def reload(
         self,
@@ -82,45 +105,45 @@ class AsyncBrowserContext:
         timeout: int = 30000
     ) -> None:
         """Reload the current page."""
-        await self._run(self._sync.reload, ignore_cache, wait_until, timeout)
+        await self._run(SyncBrowserContext.reload, ignore_cache, wait_until, timeout)
 
     async def go_back(self, wait_until: str = "load", timeout: int = 30000) -> None:
         """Navigate back in history."""
-        await self._run(self._sync.go_back, wait_until, timeout)
+        await self._run(SyncBrowserContext.go_back, wait_until, timeout)
 
     async def go_forward(self, wait_until: str = "load", timeout: int = 30000) -> None:
         """Navigate forward in history."""
-        await self._run(self._sync.go_forward, wait_until, timeout)
+        await self._run(SyncBrowserContext.go_forward, wait_until, timeout)
 
     async def can_go_back(self) -> bool:
         """Check if navigation back is possible."""
-        return await self._run(self._sync.can_go_back)
+        return await self._run(SyncBrowserContext.can_go_back)
 
     async def can_go_forward(self) -> bool:
         """Check if navigation forward is possible."""
-        return await self._run(self._sync.can_go_forward)
+        return await self._run(SyncBrowserContext.can_go_forward)
 
     # ==================== INTERACTIONS ====================
 
     async def click(self, selector: str) -> None:
         """Click an element."""
-        await self._run(self._sync.click, selector)
+        await self._run(SyncBrowserContext.click, selector)
 
     async def type(self, selector: str, text: str) -> None:
         """Type text into an input field."""
-        await self._run(self._sync.type, selector, text)
+        await self._run(SyncBrowserContext.type, selector, text)
 
     async def pick(self, selector: str, value: str) -> None:
         """Select an option from a dropdown."""
-        await self._run(self._sync.pick, selector, value)
+        await self._run(SyncBrowserContext.pick, selector, value)
 
     async def press_key(self, key: Union[KeyName, str]) -> None:
         """Press a special key."""
-        await self._run(self._sync.press_key, key)
+        await self._run(SyncBrowserContext.press_key, key)
 
     async def submit_form(self) -> None:
         """Submit the currently focused form."""
-        await self._run(self._sync.submit_form)
+        await self._run(SyncBrowserContext.submit_form)
 
     async def highlight(
         self,
@@ -129,7 +152,7 @@ class AsyncBrowserContext:
         background_color: str = "rgba(255, 0, 0, 0.2)"
     ) -> None:
         """Highlight an element for debugging."""
-        await self._run(self._sync.highlight, selector, border_color, background_color)
+        await self._run(SyncBrowserContext.highlight, selector, border_color, background_color)
 
     async def show_grid_overlay(
         self,
@@ -144,7 +167,7 @@ class AsyncBrowserContext:
         Useful for debugging and understanding element positions.
         """
         await self._run(
-            self._sync.show_grid_overlay,
+            SyncBrowserContext.show_grid_overlay,
             horizontal_lines,
             vertical_lines,
             line_color,
@@ -173,7 +196,7 @@ class AsyncBrowserContext:
             end_y: End Y coordinate for the drop
             mid_points: Optional list of [x, y] waypoints to pass through during drag
         """
-        await self._run(self._sync.drag_drop, start_x, start_y, end_x, end_y, mid_points)
+        await self._run(SyncBrowserContext.drag_drop, start_x, start_y, end_x, end_y, mid_points)
 
     async def html5_drag_drop(
         self,
@@ -190,7 +213,7 @@ class AsyncBrowserContext:
             source_selector: CSS selector for the source element to drag
             target_selector: CSS selector for the target element to drop onto
         """
-        await self._run(self._sync.html5_drag_drop, source_selector, target_selector)
+        await self._run(SyncBrowserContext.html5_drag_drop, source_selector, target_selector)
 
     async def mouse_move(
         self,
@@ -215,17 +238,17 @@ class AsyncBrowserContext:
             steps: Number of intermediate points (0 = auto-calculate based on distance)
             stop_points: Optional list of [x, y] coordinates where cursor pauses briefly (50-150ms)
         """
-        await self._run(self._sync.mouse_move, start_x, start_y, end_x, end_y, steps, stop_points)
+        await self._run(SyncBrowserContext.mouse_move, start_x, start_y, end_x, end_y, steps, stop_points)
 
     # ==================== CONTENT EXTRACTION ====================
 
     async def extract_text(self, selector: str = "body") -> str:
         """Extract text content from the page."""
-        return await self._run(self._sync.extract_text, selector)
+        return await self._run(SyncBrowserContext.extract_text, selector)
 
     async def get_html(self, clean_level: Union[CleanLevel, str] = CleanLevel.BASIC) -> str:
         """Get HTML content from the page."""
-        return await self._run(self._sync.get_html, clean_level)
+        return await self._run(SyncBrowserContext.get_html, clean_level)
 
     async def get_markdown(
         self,
@@ -235,7 +258,7 @@ class AsyncBrowserContext:
     ) -> str:
         """Get page content as Markdown."""
         return await self._run(
-            self._sync.get_markdown, include_links, include_images, max_length
+            SyncBrowserContext.get_markdown, include_links, include_images, max_length
         )
 
     async def extract_json(
@@ -243,115 +266,115 @@ class AsyncBrowserContext:
         template: Union[ExtractionTemplate, str] = ExtractionTemplate.AUTO
     ) -> Dict[str, Any]:
         """Extract structured JSON data using templates."""
-        return await self._run(self._sync.extract_json, template)
+        return await self._run(SyncBrowserContext.extract_json, template)
 
     async def detect_website_type(self) -> str:
         """Detect website type for template matching."""
-        return await self._run(self._sync.detect_website_type)
+        return await self._run(SyncBrowserContext.detect_website_type)
 
     async def summarize_page(self, force_refresh: bool = False) -> Dict[str, Any]:
         """Get intelligent, structured summary of the current page."""
-        return await self._run(self._sync.summarize_page, force_refresh)
+        return await self._run(SyncBrowserContext.summarize_page, force_refresh)
 
     async def list_templates(self) -> List[str]:
         """List available extraction templates."""
-        return await self._run(self._sync.list_templates)
+        return await self._run(SyncBrowserContext.list_templates)
 
     # ==================== AI FEATURES ====================
 
     async def query_page(self, query: str) -> str:
         """Query the page using on-device LLM."""
-        return await self._run(self._sync.query_page, query)
+        return await self._run(SyncBrowserContext.query_page, query)
 
     async def llm_status(self) -> str:
         """Check if the on-device LLM is ready."""
-        return await self._run(self._sync.llm_status)
+        return await self._run(SyncBrowserContext.llm_status)
 
     async def execute_nla(self, command: str) -> str:
         """Execute natural language automation command."""
-        return await self._run(self._sync.execute_nla, command)
+        return await self._run(SyncBrowserContext.execute_nla, command)
 
     async def ai_click(self, description: str) -> bool:
         """AI-powered click by natural language description."""
-        return await self._run(self._sync.ai_click, description)
+        return await self._run(SyncBrowserContext.ai_click, description)
 
     async def ai_type(self, description: str, text: str) -> bool:
         """AI-powered type by natural language description."""
-        return await self._run(self._sync.ai_type, description, text)
+        return await self._run(SyncBrowserContext.ai_type, description, text)
 
     async def ai_extract(self, what: str):
         """AI-powered content extraction."""
-        return await self._run(self._sync.ai_extract, what)
+        return await self._run(SyncBrowserContext.ai_extract, what)
 
     async def ai_query(self, query: str) -> str:
         """AI-powered page query."""
-        return await self._run(self._sync.ai_query, query)
+        return await self._run(SyncBrowserContext.ai_query, query)
 
     async def ai_analyze(self):
         """AI-powered page analysis."""
-        return await self._run(self._sync.ai_analyze)
+        return await self._run(SyncBrowserContext.ai_analyze)
 
     async def find_element(self, description: str, max_results: int = 10) -> List:
         """Find elements using AI/natural language description."""
-        return await self._run(self._sync.find_element, description, max_results)
+        return await self._run(SyncBrowserContext.find_element, description, max_results)
 
     # ==================== SCREENSHOT & VIDEO ====================
 
     async def screenshot(self, path: Optional[str] = None) -> bytes:
         """Take a screenshot."""
-        return await self._run(self._sync.screenshot, path)
+        return await self._run(SyncBrowserContext.screenshot, path)
 
     async def start_video_recording(self, fps: int = 30, codec: str = "libx264") -> None:
         """Start video recording."""
-        await self._run(self._sync.start_video_recording, fps, codec)
+        await self._run(SyncBrowserContext.start_video_recording, fps, codec)
 
     async def pause_video_recording(self) -> None:
         """Pause video recording."""
-        await self._run(self._sync.pause_video_recording)
+        await self._run(SyncBrowserContext.pause_video_recording)
 
     async def resume_video_recording(self) -> None:
         """Resume video recording."""
-        await self._run(self._sync.resume_video_recording)
+        await self._run(SyncBrowserContext.resume_video_recording)
 
     async def stop_video_recording(self) -> str:
         """Stop video recording and get video path."""
-        return await self._run(self._sync.stop_video_recording)
+        return await self._run(SyncBrowserContext.stop_video_recording)
 
     async def get_video_stats(self) -> str:
         """Get video recording statistics."""
-        return await self._run(self._sync.get_video_stats)
+        return await self._run(SyncBrowserContext.get_video_stats)
 
     # ==================== SCROLLING ====================
 
     async def scroll_by(self, x: int = 0, y: int = 0, verification_level: str = "none") -> None:
         """Scroll by specified pixels."""
-        await self._run(self._sync.scroll_by, x, y, verification_level)
+        await self._run(SyncBrowserContext.scroll_by, x, y, verification_level)
 
     async def scroll_to(self, x: int, y: int, verification_level: str = "none") -> None:
         """Scroll to absolute position."""
-        await self._run(self._sync.scroll_to, x, y, verification_level)
+        await self._run(SyncBrowserContext.scroll_to, x, y, verification_level)
 
     async def scroll_to_element(self, selector: str) -> None:
         """Scroll element into view."""
-        await self._run(self._sync.scroll_to_element, selector)
+        await self._run(SyncBrowserContext.scroll_to_element, selector)
 
     async def scroll_to_top(self) -> None:
         """Scroll to top of page."""
-        await self._run(self._sync.scroll_to_top)
+        await self._run(SyncBrowserContext.scroll_to_top)
 
     async def scroll_to_bottom(self) -> None:
         """Scroll to bottom of page."""
-        await self._run(self._sync.scroll_to_bottom)
+        await self._run(SyncBrowserContext.scroll_to_bottom)
 
     # ==================== WAITING ====================
 
     async def wait_for_selector(self, selector: str, timeout: int = 5000) -> None:
         """Wait for element to appear."""
-        await self._run(self._sync.wait_for_selector, selector, timeout)
+        await self._run(SyncBrowserContext.wait_for_selector, selector, timeout)
 
     async def wait(self, timeout: int) -> None:
         """Wait for specified time."""
-        await self._run(self._sync.wait, timeout)
+        await self._run(SyncBrowserContext.wait, timeout)
 
     async def wait_for_network_idle(
         self,
@@ -359,7 +382,7 @@ class AsyncBrowserContext:
         timeout: int = 30000
     ) -> None:
         """Wait for network activity to become idle."""
-        await self._run(self._sync.wait_for_network_idle, idle_time, timeout)
+        await self._run(SyncBrowserContext.wait_for_network_idle, idle_time, timeout)
 
     async def wait_for_function(
         self,
@@ -368,7 +391,7 @@ class AsyncBrowserContext:
         timeout: int = 30000
     ) -> None:
         """Wait for a JavaScript function to return a truthy value."""
-        await self._run(self._sync.wait_for_function, js_function, polling, timeout)
+        await self._run(SyncBrowserContext.wait_for_function, js_function, polling, timeout)
 
     async def wait_for_url(
         self,
@@ -377,63 +400,63 @@ class AsyncBrowserContext:
         timeout: int = 30000
     ) -> str:
         """Wait for URL to match a pattern."""
-        return await self._run(self._sync.wait_for_url, url_pattern, is_regex, timeout)
+        return await self._run(SyncBrowserContext.wait_for_url, url_pattern, is_regex, timeout)
 
     # ==================== PAGE STATE ====================
 
     async def get_current_url(self) -> str:
         """Get current URL."""
-        return await self._run(self._sync.get_current_url)
+        return await self._run(SyncBrowserContext.get_current_url)
 
     async def get_title(self) -> str:
         """Get page title."""
-        return await self._run(self._sync.get_title)
+        return await self._run(SyncBrowserContext.get_title)
 
     async def get_page_info(self) -> PageInfo:
         """Get comprehensive page information."""
-        return await self._run(self._sync.get_page_info)
+        return await self._run(SyncBrowserContext.get_page_info)
 
     # ==================== VIEWPORT ====================
 
     async def set_viewport(self, width: int, height: int) -> None:
         """Set viewport size."""
-        await self._run(self._sync.set_viewport, width, height)
+        await self._run(SyncBrowserContext.set_viewport, width, height)
 
     async def get_viewport(self) -> Viewport:
         """Get current viewport size."""
-        return await self._run(self._sync.get_viewport)
+        return await self._run(SyncBrowserContext.get_viewport)
 
     # ==================== DEMOGRAPHICS ====================
 
     async def get_demographics(self) -> Dict[str, Any]:
         """Get user demographics and context."""
-        return await self._run(self._sync.get_demographics)
+        return await self._run(SyncBrowserContext.get_demographics)
 
     async def get_location(self) -> Dict[str, Any]:
         """Get user's current location."""
-        return await self._run(self._sync.get_location)
+        return await self._run(SyncBrowserContext.get_location)
 
     async def get_datetime(self) -> Dict[str, Any]:
         """Get current date and time information."""
-        return await self._run(self._sync.get_datetime)
+        return await self._run(SyncBrowserContext.get_datetime)
 
     async def get_weather(self) -> Dict[str, Any]:
         """Get current weather."""
-        return await self._run(self._sync.get_weather)
+        return await self._run(SyncBrowserContext.get_weather)
 
     # ==================== CAPTCHA SOLVING ====================
 
     async def detect_captcha(self) -> Dict[str, Any]:
         """Detect if the current page has a CAPTCHA."""
-        return await self._run(self._sync.detect_captcha)
+        return await self._run(SyncBrowserContext.detect_captcha)
 
     async def classify_captcha(self) -> Dict[str, Any]:
         """Classify the type of CAPTCHA on the page."""
-        return await self._run(self._sync.classify_captcha)
+        return await self._run(SyncBrowserContext.classify_captcha)
 
     async def solve_text_captcha(self, max_attempts: int = 3) -> Dict[str, Any]:
         """Solve a text-based CAPTCHA."""
-        return await self._run(self._sync.solve_text_captcha, max_attempts)
+        return await self._run(SyncBrowserContext.solve_text_captcha, max_attempts)
 
     async def solve_image_captcha(
         self,
@@ -447,7 +470,7 @@ class AsyncBrowserContext:
             max_attempts: Maximum number of attempts
             provider: CAPTCHA provider to use ('auto', 'owl', 'recaptcha', 'cloudflare', 'hcaptcha')
         """
-        return await self._run(self._sync.solve_image_captcha, max_attempts, provider)
+        return await self._run(SyncBrowserContext.solve_image_captcha, max_attempts, provider)
 
     async def solve_captcha(
         self,
@@ -461,13 +484,13 @@ class AsyncBrowserContext:
             max_attempts: Maximum number of attempts
             provider: CAPTCHA provider to use for image CAPTCHAs ('auto', 'owl', 'recaptcha', 'cloudflare', 'hcaptcha')
         """
-        return await self._run(self._sync.solve_captcha, max_attempts, provider)
+        return await self._run(SyncBrowserContext.solve_captcha, max_attempts, provider)
 
     # ==================== COOKIE MANAGEMENT ====================
 
     async def get_cookies(self, url: Optional[str] = None) -> List[Cookie]:
         """Get all cookies from the browser context."""
-        return await self._run(self._sync.get_cookies, url)
+        return await self._run(SyncBrowserContext.get_cookies, url)
 
     async def set_cookie(
         self,
@@ -483,31 +506,31 @@ class AsyncBrowserContext:
     ) -> bool:
         """Set a cookie in the browser context."""
         return await self._run(
-            self._sync.set_cookie,
+            SyncBrowserContext.set_cookie,
             url, name, value, domain, path, secure, http_only, same_site, expires
         )
 
     async def delete_cookies(self, url: Optional[str] = None, name: Optional[str] = None) -> bool:
         """Delete cookies from the browser context."""
-        return await self._run(self._sync.delete_cookies, url, name)
+        return await self._run(SyncBrowserContext.delete_cookies, url, name)
 
     # ==================== PROXY MANAGEMENT ====================
 
     async def set_proxy(self, config: ProxyConfig) -> bool:
         """Configure proxy settings for this browser context."""
-        return await self._run(self._sync.set_proxy, config)
+        return await self._run(SyncBrowserContext.set_proxy, config)
 
     async def get_proxy_status(self) -> ProxyStatus:
         """Get current proxy configuration and connection status."""
-        return await self._run(self._sync.get_proxy_status)
+        return await self._run(SyncBrowserContext.get_proxy_status)
 
     async def connect_proxy(self) -> bool:
         """Enable/connect the configured proxy."""
-        return await self._run(self._sync.connect_proxy)
+        return await self._run(SyncBrowserContext.connect_proxy)
 
     async def disconnect_proxy(self) -> bool:
         """Disable/disconnect the proxy."""
-        return await self._run(self._sync.disconnect_proxy)
+        return await self._run(SyncBrowserContext.disconnect_proxy)
 
     # ==================== TEST EXECUTION ====================
 
@@ -519,37 +542,41 @@ class AsyncBrowserContext:
         verbose: bool = False
     ) -> TestExecutionResult:
         """Execute a test from Developer Playground JSON template."""
-        return await self._run(
-            self._sync.run_test, test, continue_on_error, screenshot_on_error, verbose
+        # Many commands per call: run in a worker thread against a blocking
+        # bridge instead of replaying every step
+        return await self._core.run_blocking(
+            SyncBrowserContext.run_test,
+            self._sync_context,
+            test, continue_on_error, screenshot_on_error, verbose
         )
 
     # ==================== ADDITIONAL METHODS ====================
 
     async def get_blocker_stats(self):
         """Get ad/tracker blocker statistics for this context."""
-        return await self._run(self._sync.get_blocker_stats)
+        return await self._run(SyncBrowserContext.get_blocker_stats)
 
     async def get_active_downloads(self) -> List:
         """Get list of currently active (in-progress) downloads."""
-        return await self._run(self._sync.get_active_downloads)
+        return await self._run(SyncBrowserContext.get_active_downloads)
 
     async def get_dialogs(self) -> List:
         """Get all pending dialogs for this context."""
-        return await self._run(self._sync.get_dialogs)
+        return await self._run(SyncBrowserContext.get_dialogs)
 
     async def enable_network_logging(self, enable: bool) -> None:
         """Enable or disable network logging for this context."""
-        await self._run(self._sync.enable_network_logging, enable)
+        await self._run(SyncBrowserContext.enable_network_logging, enable)
 
     async def get_live_frame(self) -> bytes:
         """Get a single frame from the live stream."""
-        return await self._run(self._sync.get_live_frame)
+        return await self._run(SyncBrowserContext.get_live_frame)
 
     # ==================== CLEANUP ====================
 
     async def close(self) -> None:
         """Close this context and release resources."""
-        await self._run(self._sync.close)
+        await self._run(SyncBrowserContext.close)
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -636,40 +663,40 @@ class AsyncBrowser:
             headless: Enable headless mode (default: True, ignored for remote mode)
             verbose: Enable verbose logging (default: False)
             init_timeout: Initialization timeout in milliseconds (default: 30000)
-            max_workers: Maximum thread pool workers for async operations
+            max_workers: Unused; kept for backwards compatibility (commands no
+                        longer run on a thread pool)
             remote: Remote server configuration. If provided, connects to a remote
                    browser server instead of launching a local browser process.
         """
-        self._sync_browser = SyncBrowser(
-            browser_path=browser_path,
-            headless=headless,
-            verbose=verbose,
-            init_timeout=init_timeout,
+        self._core = AsyncBrowserCore(
+            BrowserConfig(
+                browser_path=browser_path,
+                headless=headless,
+                verbose=verbose,
+                init_timeout=init_timeout
+            ),
             remote=remote
         )
-        self._executor = ThreadPoolExecutor(
-            max_workers=max_workers,
-            thread_name_prefix="owl_async"
-        )
         self._contexts: Dict[ContextId, AsyncBrowserContext] = {}
+        self._is_launched = False
 
     @property
     def mode(self) -> ConnectionMode:
         """Get the connection mode (LOCAL or REMOTE)."""
-        return self._sync_browser.mode
+        return self._core.mode
 
     @property
     def is_remote(self) -> bool:
         """Check if running in remote mode."""
-        return self._sync_browser.is_remote
+        return self._core.is_remote
 
     async def _run(self, func, *args, **kwargs) -> Any:
-        """Run a sync function in the thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self._executor,
-            lambda: func(*args, **kwargs)
-        )
+        """Run a sync BrowserCore method over the async core."""
+        return await self._core.replay(func, lambda core: core, *args, **kwargs)
+
+    def _require_launched(self) -> None:
+        if not self._is_launched:
+            raise RuntimeError("Browser not launched. Call launch() first.")
 
     async def launch(self) -> "AsyncBrowser":
         """
@@ -678,7 +705,8 @@ class AsyncBrowser:
         Returns:
             self for method chaining
         """
-        await self._run(self._sync_browser.launch)
+        await self._core.initialize()
+        self._is_launched = True
         return self
 
     async def new_page(
@@ -696,9 +724,15 @@ class AsyncBrowser:
         Returns:
             New AsyncBrowserContext instance
         """
-        sync_context = await self._run(self._sync_browser.new_page, proxy, llm)
-        async_context = AsyncBrowserContext(sync_context, self._executor)
-        self._contexts[sync_context.id] = async_context
+        self._require_launched()
+
+        options = None
+        if proxy or llm:
+            options = ContextOptions(llm=llm, proxy=proxy)
+
+        context_id = await self._core.create_context(options)
+        async_context = AsyncBrowserContext(context_id, self._core)
+        self._contexts[context_id] = async_context
         return async_context
 
     def pages(self) -> List[AsyncBrowserContext]:
@@ -707,49 +741,61 @@ class AsyncBrowser:
 
     async def list_contexts(self) -> List[str]:
         """List all active context IDs from the browser."""
-        return await self._run(self._sync_browser.list_contexts)
+        self._require_launched()
+        result = await self._core.send_command("listContexts", {})
+        if isinstance(result, str):
+            result = json.loads(result)
+        return result if isinstance(result, list) else []
 
     async def get_llm_status(self) -> LLMStatus:
         """Check if on-device LLM is ready."""
-        return await self._run(self._sync_browser.get_llm_status)
+        return await self._run(BrowserCore.get_llm_status)
 
     async def list_templates(self) -> List[str]:
         """List available extraction templates."""
-        return await self._run(self._sync_browser.list_templates)
+        return await self._run(BrowserCore.list_templates)
 
     async def get_demographics(self) -> Dict[str, Any]:
         """Get complete demographics information."""
-        return await self._run(self._sync_browser.get_demographics)
+        return await self._run(BrowserCore.get_demographics)
 
     async def get_location(self) -> Dict[str, Any]:
         """Get geographic location information."""
-        return await self._run(self._sync_browser.get_location)
+        return await self._run(BrowserCore.get_location)
 
     async def get_datetime(self) -> Dict[str, Any]:
         """Get current date and time information."""
-        return await self._run(self._sync_browser.get_datetime)
+        return await self._run(BrowserCore.get_datetime)
 
     async def get_weather(self) -> Dict[str, Any]:
         """Get current weather."""
-        return await self._run(self._sync_browser.get_weather)
+        return await self._run(BrowserCore.get_weather)
 
     async def get_homepage(self) -> str:
         """Get the custom browser homepage HTML."""
-        return await self._run(self._sync_browser.get_homepage)
+        return await self._run(BrowserCore.get_homepage)
 
     async def close(self) -> None:
         """Close all contexts and shutdown browser."""
-        await self._run(self._sync_browser.close)
+        if not self._is_launched:
+            return
+
+        contexts = list(self._contexts.values())
         self._contexts.clear()
-        self._executor.shutdown(wait=False)
+        await asyncio.gather(
+            *(context.close() for context in contexts), return_exceptions=True
+        )
+
+        await self._core.shutdown()
+        self._is_launched = False
 
     def is_running(self) -> bool:
         """Check if browser is running."""
-        return self._sync_browser.is_running()
+        return self._is_launched and self._core.is_running()
 
     async def __aenter__(self) -> "AsyncBrowser":
         """Async context manager entry - auto-launch."""
-        if not self._sync_browser.is_running():
+        if not self.is_running():
             await self.launch()
         return self
 
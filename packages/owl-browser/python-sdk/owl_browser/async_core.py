@@ -0,0 +1,1068 @@
+"""
+Native asyncio browser core.
+
+Async counterpart of BrowserCore that talks to the browser without worker
+threads, so the number of in-flight commands is bounded by the browser,
+not by a thread pool:
+
+- LOCAL: asyncio subprocess pipes; responses are matched to their
+  commands by id, so any number of commands can be in flight
+- REMOTE (HTTP): keep-alive HTTP/1.1 connections on asyncio streams
+- REMOTE (WebSocket): one persistent connection, id-multiplexed
+
+Command semantics (method/parameter mapping, result unwrapping and
+ActionResult failures) are the same as BrowserCore's.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import ssl
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
+
+from .core import BrowserCore, StderrScanner
+from .exceptions import (
+    AuthenticationError,
+    BrowserInitializationError,
+    CommandTimeoutError,
+    LicenseError,
+    OwlBrowserError,
+    is_action_result,
+    throw_if_action_failed,
+)
+from .http_client import (
+    HttpTransport,
+    calculate_retry_delay,
+    map_method_to_tool,
+    map_params_for_http,
+)
+from .types import (
+    BatchCommand,
+    BatchResult,
+    BrowserConfig,
+    ConnectionMode,
+    RemoteConfig,
+    TransportMode,
+)
+from .ws_client import (
+    WS_OPCODE_CLOSE,
+    WS_OPCODE_PING,
+    WS_OPCODE_PONG,
+    WS_OPCODE_TEXT,
+    WebSocketTransport,
+)
+
+# Screenshots and page HTML arrive as single (large) lines on stdout
+_STREAM_LIMIT = 256 * 1024 * 1024
+
+# Continuation frames carry the rest of a fragmented WebSocket message
+_WS_OPCODE_CONTINUATION = 0x0
+
+# Commands ``replay`` sends before finishing a method in a worker thread
+_MAX_REPLAYED_COMMANDS = 1
+
+# Worker threads per core for ``run_blocking`` and long replays
+_MAX_BLOCKING_WORKERS = 8
+
+
+class AsyncIpcTransport:
+    """
+    Local browser process driven over asyncio subprocess pipes.
+
+    A single reader task dispatches JSON responses to per-command futures
+    keyed by command id.
+    """
+
+    def __init__(self, config: BrowserConfig, instance_id: str):
+        self._config = config
+        self._instance_id = instance_id
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._command_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ready: Optional[asyncio.Future] = None
+        self._scanner = StderrScanner()
+        self._license_error: Optional[LicenseError] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Start the browser process and wait for its READY signal."""
+        browser_path = self._config.browser_path
+        if not browser_path or not Path(browser_path).exists():
+            raise FileNotFoundError(f"Browser binary not found at: {browser_path}")
+
+        env = os.environ.copy()
+        env["OLIB_INSTANCE_ID"] = self._instance_id
+
+        loop = asyncio.get_running_loop()
+        self._ready = loop.create_future()
+        self._process = await asyncio.create_subprocess_exec(
+            browser_path, "--instance-id", self._instance_id,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+            limit=_STREAM_LIMIT,
+        )
+        self._tasks = [
+            asyncio.ensure_future(self._read_stdout()),
+            asyncio.ensure_future(self._read_stderr()),
+        ]
+
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(self._ready), timeout=self._config.init_timeout / 1000.0
+            )
+        except asyncio.TimeoutError:
+            await self.close()
+            if self._license_error:
+                raise self._license_error
+            raise BrowserInitializationError("Browser initialization timeout")
+        except BaseException:
+            await self.close()
+            raise
+
+        if self._config.verbose:
+            print(f"[Browser] Ready (instance: {self._instance_id}, PID: {self._process.pid})")
+
+    def _set_ready(self, error: Optional[BaseException] = None) -> None:
+        if self._ready is not None and not self._ready.done():
+            if error is None:
+                self._ready.set_result(None)
+            else:
+                self._ready.set_exception(error)
+
+    async def _read_stdout(self) -> None:
+        """Dispatch responses from stdout to their pending futures."""
+        assert self._process is not None and self._process.stdout is not None
+        try:
+            while True:
+                line = await self._process.stdout.readline()
+                if not line:
+                    break
+
+                decoded = line.decode('utf-8', errors='ignore').strip()
+                if not decoded:
+                    continue
+
+                if decoded == "READY":
+                    self._set_ready()
+                    continue
+
+                try:
+                    response = json.loads(decoded)
+                except json.JSONDecodeError:
+                    if self._config.verbose:
+                        print(f"[Browser] {decoded}")
+                    continue
+
+                self._handle_response(response)
+        except Exception as e:
+            if self._config.verbose:
+                print(f"[Browser] Read error: {e}")
+        finally:
+            self._set_ready(
+                self._license_error or BrowserInitializationError(
+                    "Browser process terminated unexpectedly"
+                )
+            )
+            self._fail_pending(RuntimeError("Browser process terminated"))
+
+    async def _read_stderr(self) -> None:
+        """Watch stderr for READY and license errors."""
+        assert self._process is not None and self._process.stderr is not None
+        while True:
+            line = await self._process.stderr.readline()
+            if not line:
+                break
+
+            decoded = line.decode('utf-8', errors='ignore').strip()
+            if not decoded:
+                continue
+
+            license_error = self._scanner.feed(decoded)
+            if self._scanner.ready:
+                self._set_ready()
+            if license_error:
+                self._license_error = license_error
+                # Give the browser a moment to log more details (like fingerprint)
+                asyncio.get_running_loop().call_later(0.2, self._fail_ready_with_license)
+
+            if self._config.verbose:
+                print(f"[Browser stderr] {decoded}")
+
+    def _fail_ready_with_license(self) -> None:
+        error = self._license_error
+        if error is not None:
+            if not error.fingerprint and self._scanner.fingerprint:
+                error = LicenseError(
+                    message=error.message,
+                    status=error.status,
+                    fingerprint=self._scanner.fingerprint
+                )
+                self._license_error = error
+            self._set_ready(error)
+
+    def _handle_response(self, response: Dict[str, Any]) -> None:
+        cmd_id = response.get("id")
+        future = self._pending.pop(cmd_id, None) if cmd_id is not None else None
+        if future is None or future.done():
+            return
+
+        if "error" in response:
+            future.set_exception(RuntimeError(response["error"]))
+            return
+
+        result = response.get("result")
+        # Check if result is an ActionResult with success=false
+        if is_action_result(result) and not result.get("success", True):
+            try:
+                throw_if_action_failed(result)
+            except Exception as e:
+                future.set_exception(e)
+                return
+        future.set_result(result)
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    async def send(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 30.0
+    ) -> Any:
+        """Send a command and wait for its response."""
+        if not self.is_running():
+            raise RuntimeError("Browser not initialized. Call initialize() first.")
+
+        self._command_id += 1
+        cmd_id = self._command_id
+
+        command = {"id": cmd_id, "method": method}
+        if params:
+            command.update(params)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[cmd_id] = future
+
+        try:
+            # Use separators without spaces - browser parser expects "key":"value"
+            payload = json.dumps(command, separators=(',', ':')) + "\n"
+            if self._config.verbose:
+                print(f"[Browser] Sending: {method}", params or "")
+            self._process.stdin.write(payload.encode('utf-8'))
+            await self._process.stdin.drain()
+        except Exception as e:
+            self._pending.pop(cmd_id, None)
+            raise RuntimeError(f"Failed to send command: {e}")
+
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"Command timeout: {method}")
+        finally:
+            self._pending.pop(cmd_id, None)
+
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def close(self) -> None:
+        """Shut the browser process down gracefully, killing it if needed."""
+        process = self._process
+        if process is None:
+            return
+
+        if process.returncode is None:
+            try:
+                await self.send("shutdown", timeout=3.0)
+            except Exception:
+                pass
+            try:
+                if process.stdin:
+                    process.stdin.close()
+            except Exception:
+                pass
+            try:
+                await asyncio.wait_for(process.wait(), timeout=3.0)
+            except asyncio.TimeoutError:
+                try:
+                    process.kill()
+                    await asyncio.wait_for(process.wait(), timeout=1.0)
+                except Exception:
+                    pass
+
+        for task in self._tasks:
+            task.cancel()
+        self._fail_pending(RuntimeError("Browser process terminated"))
+        self._process = None
+
+
+class AsyncHttpTransport:
+    """
+    HTTP transport on asyncio streams with a keep-alive connection pool.
+
+    Authentication, TLS settings, retry policy and error mapping are those
+    of HttpTransport; only the I/O is asynchronous. There is no
+    concurrency semaphore: requests beyond the idle pool open new
+    connections, and the extra connections are closed when returned.
+    """
+
+    def __init__(self, config: RemoteConfig, max_idle_connections: int = 32):
+        self._http = HttpTransport(config)
+        parsed = urlparse(config.url)
+        self._use_ssl = parsed.scheme == "https"
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or (443 if self._use_ssl else 80)
+        self._max_idle = max_idle_connections
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+
+        return await asyncio.open_connection(
+            self._host,
+            self._port,
+            ssl=self._http.ssl_context if self._use_ssl else None,
+            limit=_STREAM_LIMIT,
+        )
+
+    def _release(
+        self,
+        connection: Tuple[asyncio.StreamReader, asyncio.StreamWriter],
+        keep_alive: bool
+    ) -> None:
+        if keep_alive and len(self._idle) < self._max_idle:
+            self._idle.append(connection)
+        else:
+            connection[1].close()
+
+    async def _roundtrip(
+        self,
+        connection: Tuple[asyncio.StreamReader, asyncio.StreamWriter],
+        request: bytes
+    ) -> Tuple[int, bytes, bool]:
+        """Send one request and read the response (status, body, keep_alive)."""
+        reader, writer = connection
+        writer.write(request)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Server closed the connection")
+        status = int(status_line.split()[1])
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip(), 16)
+                if size == 0:
+                    # Trailers end with an empty line
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            keep_alive = False
+
+        return status, body, keep_alive
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        require_auth: bool = True,
+        long_running: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Make an HTTP request with HttpTransport's retry and error semantics.
+
+        Returns:
+            Response data as dictionary
+        """
+        body = json.dumps(data).encode('utf-8') if data is not None else b""
+        lines = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self._host}:{self._port}",
+            "Content-Type: application/json",
+            "Accept: application/json",
+            "Connection: keep-alive",
+            f"Content-Length: {len(body)}",
+        ]
+        if require_auth:
+            lines.append(f"Authorization: Bearer {self._http.get_auth_token()}")
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode('utf-8') + body
+
+        timeout = self._http.long_timeout if long_running else self._http.timeout
+        retry_config = self._http.retry_config
+        max_retries = retry_config.max_retries
+
+        for attempt in range(max_retries):
+            connection = None
+            try:
+                connection = await asyncio.wait_for(self._connect(), timeout=timeout)
+                status, response_body, keep_alive = await asyncio.wait_for(
+                    self._roundtrip(connection, request), timeout=timeout
+                )
+                self._release(connection, keep_alive)
+                connection = None
+
+                response_data = response_body.decode('utf-8')
+                if status >= 400:
+                    return self._http.handle_error_status(status, response_data, path)
+                return json.loads(response_data) if response_data else {}
+
+            except asyncio.TimeoutError:
+                raise CommandTimeoutError(f"Request timed out: {path}")
+
+            except (OSError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(calculate_retry_delay(retry_config, attempt))
+                    continue
+                raise OwlBrowserError(
+                    f"Connection failed after {max_retries} retries: {e}"
+                )
+
+            finally:
+                if connection is not None:
+                    connection[1].close()
+
+        raise OwlBrowserError(f"Request failed: {path}")
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Check server health status."""
+        return await self.request("GET", "/health", require_auth=False)
+
+    async def execute_tool(self, tool_name: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Execute a browser tool."""
+        response = await self.request(
+            "POST",
+            f"/execute/{tool_name}",
+            data=params or {},
+            long_running=tool_name in HttpTransport.LONG_RUNNING_TOOLS
+        )
+
+        if not response.get("success", False):
+            error_msg = response.get("error", "Unknown error")
+            raise OwlBrowserError(f"Tool execution failed: {error_msg}")
+
+        result = response.get("result")
+
+        # Handle nested response format from browser IPC
+        if isinstance(result, dict) and "id" in result and "result" in result:
+            result = result["result"]
+
+        return result
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+def _encode_ws_frame(opcode: int, payload: bytes) -> bytes:
+    """Encode a masked client WebSocket frame."""
+    header = bytearray([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header.append(0x80 | length)
+    elif length <= 0xFFFF:
+        header.append(0x80 | 126)
+        header += length.to_bytes(2, "big")
+    else:
+        header.append(0x80 | 127)
+        header += length.to_bytes(8, "big")
+
+    mask = os.urandom(4)
+    header += mask
+    return bytes(header) + _apply_ws_mask(payload, mask)
+
+
+def _apply_ws_mask(payload: bytes, mask: bytes) -> bytes:
+    """XOR a payload with a 4-byte WebSocket mask."""
+    if not payload:
+        return payload
+    repeated = (mask * (len(payload) // 4 + 1))[:len(payload)]
+    return (
+        int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")
+    ).to_bytes(len(payload), "big")
+
+
+class AsyncWebSocketTransport:
+    """
+    WebSocket transport on asyncio streams.
+
+    One connection carries all requests; a reader task resolves each
+    request's future by id. A dropped connection fails in-flight requests
+    and is re-established on the next request.
+    """
+
+    def __init__(self, config: RemoteConfig):
+        # URL parsing, auth tokens and timeouts come from the threaded transport
+        self._ws = WebSocketTransport(config)
+        self._config = config
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._request_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    def is_connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> None:
+        """Connect and perform the WebSocket handshake."""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self.is_connected():
+                return
+
+            ssl_context = None
+            if self._ws.use_ssl:
+                ssl_context = ssl.create_default_context()
+                if not self._config.verify_ssl:
+                    ssl_context.check_hostname = False
+                    ssl_context.verify_mode = ssl.CERT_NONE
+
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(
+                        self._ws.host, self._ws.port, ssl=ssl_context, limit=_STREAM_LIMIT
+                    ),
+                    timeout=self._ws.timeout,
+                )
+                await asyncio.wait_for(self._handshake(reader, writer), timeout=self._ws.timeout)
+            except (OSError, asyncio.TimeoutError) as e:
+                raise BrowserInitializationError(
+                    f"Failed to connect to WebSocket server at "
+                    f"{self._ws.host}:{self._ws.port}: {e}"
+                )
+
+            self._reader, self._writer = reader, writer
+            self._reader_task = asyncio.ensure_future(self._receive_loop(reader, writer))
+
+    async def _handshake(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        ws_key = self._ws.create_websocket_key()
+        writer.write((
+            f"GET /ws HTTP/1.1\r\n"
+            f"Host: {self._ws.host}:{self._ws.port}\r\n"
+            f"Upgrade: websocket\r\n"
+            f"Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {ws_key}\r\n"
+            f"Sec-WebSocket-Version: 13\r\n"
+            f"Authorization: Bearer {self._ws.get_auth_token()}\r\n"
+            f"\r\n"
+        ).encode('utf-8'))
+        await writer.drain()
+
+        try:
+            response = (await reader.readuntil(b"\r\n\r\n")).decode('utf-8')
+        except asyncio.IncompleteReadError:
+            raise OwlBrowserError("Connection closed during handshake")
+
+        if "101 Switching Protocols" not in response:
+            if "401" in response:
+                raise AuthenticationError("WebSocket authentication failed")
+            raise OwlBrowserError(f"WebSocket handshake failed: {response[:200]}")
+
+        expected_accept = base64.b64encode(
+            hashlib.sha1(
+                (ws_key + "258EAFA5-E914-47DA-95CA-C5AB0DC85B11").encode()
+            ).digest()
+        ).decode('utf-8')
+        if f"Sec-WebSocket-Accept: {expected_accept}" not in response:
+            raise OwlBrowserError("Invalid WebSocket accept key")
+
+    async def _read_frame(self, reader: asyncio.StreamReader) -> Tuple[bool, int, bytes]:
+        header = await reader.readexactly(2)
+        fin = (header[0] & 0x80) != 0
+        opcode = header[0] & 0x0F
+        masked = (header[1] & 0x80) != 0
+        length = header[1] & 0x7F
+        if length == 126:
+            length = int.from_bytes(await reader.readexactly(2), "big")
+        elif length == 127:
+            length = int.from_bytes(await reader.readexactly(8), "big")
+
+        mask = await reader.readexactly(4) if masked else None
+        payload = await reader.readexactly(length)
+        if mask:
+            payload = _apply_ws_mask(payload, mask)
+        return fin, opcode, payload
+
+    async def _receive_loop(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Fragments of a text message; control frames may arrive in between
+        fragments: Optional[List[bytes]] = None
+        try:
+            while True:
+                fin, opcode, payload = await self._read_frame(reader)
+                if opcode == WS_OPCODE_TEXT:
+                    fragments = [payload]
+                elif opcode == _WS_OPCODE_CONTINUATION and fragments is not None:
+                    fragments.append(payload)
+                elif opcode == WS_OPCODE_PING:
+                    writer.write(_encode_ws_frame(WS_OPCODE_PONG, payload))
+                    continue
+                elif opcode == WS_OPCODE_CLOSE:
+                    break
+                else:
+                    continue
+
+                if fin:
+                    self._handle_message(b"".join(fragments).decode('utf-8'))
+                    fragments = None
+        except (asyncio.IncompleteReadError, OSError):
+            pass
+        finally:
+            writer.close()
+            if self._writer is writer:
+                self._reader = self._writer = None
+            self._fail_pending(OwlBrowserError("Connection closed"))
+
+    def _handle_message(self, message: str) -> None:
+        try:
+            data = json.loads(message)
+        except json.JSONDecodeError:
+            return
+
+        future = self._pending.pop(data.get("id"), None)
+        if future is None or future.done():
+            return
+
+        if data.get("success", False):
+            future.set_result(data.get("result"))
+        else:
+            future.set_exception(
+                OwlBrowserError(f"Tool execution failed: {data.get('error', 'Unknown error')}")
+            )
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    async def execute_tool(self, tool_name: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Execute a browser tool, reconnecting first if the connection dropped."""
+        if not self.is_connected():
+            await self.connect()
+
+        self._request_id += 1
+        req_id = self._request_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = future
+
+        message = {"id": req_id, "method": tool_name, "params": params or {}}
+        try:
+            self._writer.write(_encode_ws_frame(WS_OPCODE_TEXT, json.dumps(message).encode('utf-8')))
+            await self._writer.drain()
+
+            long_running = tool_name in WebSocketTransport.LONG_RUNNING_TOOLS
+            timeout = self._ws.long_timeout if long_running else self._ws.timeout
+            result = await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise CommandTimeoutError(f"Request timed out: {tool_name}")
+        finally:
+            self._pending.pop(req_id, None)
+
+        # Handle nested response format from browser IPC
+        if isinstance(result, dict) and "id" in result and "result" in result:
+            result = result["result"]
+
+        return result
+
+    async def close(self) -> None:
+        """Close the connection."""
+        writer = self._writer
+        self._reader = self._writer = None
+        if writer is not None:
+            try:
+                writer.write(_encode_ws_frame(WS_OPCODE_CLOSE, b""))
+                writer.close()
+            except Exception:
+                pass
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+        self._fail_pending(OwlBrowserError("Connection closed"))
+
+
+class _CommandNeeded(BaseException):
+    """
+    Raised by a replay core when the next command has not been sent yet.
+
+    A BaseException, so ``except Exception`` blocks in the replayed SDK
+    methods let it through.
+    """
+
+    def __init__(self, method: str, params: Optional[Dict[str, Any]], timeout: float):
+        super().__init__(method)
+        self.method = method
+        self.params = params
+        self.timeout = timeout
+
+
+class _ReplayCore(BrowserCore):
+    """
+    Stand-in core that answers commands from already awaited results.
+
+    Lets the synchronous parameter building and result parsing of
+    BrowserCore, Browser and BrowserContext drive the async transports.
+    """
+
+    def __init__(self, mode: ConnectionMode, config: BrowserConfig, results: List[Tuple[bool, Any]]):
+        # Deliberately not calling BrowserCore.__init__: no process, no threads
+        self._mode = mode
+        self._config = config
+        self._results = results
+        self._index = 0
+
+    def send_command(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 30.0
+    ) -> Any:
+        if self._index < len(self._results):
+            ok, value = self._results[self._index]
+            self._index += 1
+            if not ok:
+                raise value
+            return value
+        raise _CommandNeeded(method, params, timeout)
+
+
+class _BlockingBridgeCore(BrowserCore):
+    """
+    Blocking core for worker threads that forwards commands to the event loop.
+
+    Commands already answered in ``results`` (by an earlier replay of the
+    same method) are answered from there instead of being sent again.
+    """
+
+    def __init__(
+        self,
+        core: "AsyncBrowserCore",
+        loop: asyncio.AbstractEventLoop,
+        results: Optional[List[Tuple[bool, Any]]] = None
+    ):
+        # Deliberately not calling BrowserCore.__init__: no process, no threads
+        self._mode = core.mode
+        self._config = core._config
+        self._async_core = core
+        self._loop = loop
+        self._results = results or []
+        self._index = 0
+
+    def send_command(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 30.0
+    ) -> Any:
+        if self._index < len(self._results):
+            ok, value = self._results[self._index]
+            self._index += 1
+            if not ok:
+                raise value
+            return value
+        return asyncio.run_coroutine_threadsafe(
+            self._async_core.send_command(method, params, timeout), self._loop
+        ).result()
+
+
+class AsyncBrowserCore:
+    """
+    Asyncio browser core for LOCAL and REMOTE modes.
+
+    Example:
+        ```python
+        core = AsyncBrowserCore(remote=RemoteConfig(url="http://localhost:8080", token="t"))
+        await core.initialize()
+        context_id = await core.create_context()
+        await core.send_command("navigate", {"context_id": context_id, "url": "https://example.com"})
+        ```
+    """
+
+    def __init__(
+        self,
+        config: Optional[BrowserConfig] = None,
+        remote: Optional[RemoteConfig] = None
+    ):
+        """
+        Initialize AsyncBrowserCore.
+
+        Args:
+            config: Local browser configuration (for LOCAL mode)
+            remote: Remote server configuration (for REMOTE mode)
+        """
+        self._config = config or BrowserConfig()
+        self._remote_config = remote
+        self._mode = ConnectionMode.REMOTE if remote else ConnectionMode.LOCAL
+        self._instance_id = f"browser_{int(time.time())}_{uuid.uuid4().hex[:9]}"
+
+        self._ipc: Optional[AsyncIpcTransport] = None
+        self._http: Optional[AsyncHttpTransport] = None
+        self._ws: Optional[AsyncWebSocketTransport] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._running = False
+
+        if self._mode == ConnectionMode.LOCAL and not self._config.browser_path:
+            self._config.browser_path = BrowserCore._detect_browser_path(self)
+
+    @property
+    def mode(self) -> ConnectionMode:
+        """Get the connection mode (LOCAL or REMOTE)."""
+        return self._mode
+
+    @property
+    def is_remote(self) -> bool:
+        """Check if running in remote mode."""
+        return self._mode == ConnectionMode.REMOTE
+
+    async def initialize(self) -> None:
+        """Start the browser process or connect to the remote server."""
+        if self._running:
+            raise RuntimeError("Browser already initialized")
+
+        if self._mode == ConnectionMode.LOCAL:
+            self._ipc = AsyncIpcTransport(self._config, self._instance_id)
+            await self._ipc.start()
+        elif self._remote_config.transport in (TransportMode.WEBSOCKET, TransportMode.WS):
+            self._ws = AsyncWebSocketTransport(self._remote_config)
+            await self._ws.connect()
+            if self._config.verbose:
+                print(f"[Browser] Connected to remote server at {self._remote_config.url} (WebSocket)")
+        else:
+            self._http = AsyncHttpTransport(self._remote_config)
+            try:
+                health = await self._http.health_check()
+            except (LicenseError, BrowserInitializationError):
+                raise
+            except Exception as e:
+                raise BrowserInitializationError(
+                    f"Failed to connect to remote browser server: {e}"
+                )
+
+            if health.get("status") != "healthy":
+                raise BrowserInitializationError(
+                    f"Remote browser server is not healthy: {health}"
+                )
+            if not health.get("browser_ready"):
+                browser_state = health.get("browser_state", "unknown")
+                if browser_state == "license_error":
+                    raise LicenseError(
+                        message="Remote browser has license error",
+                        status="license_error"
+                    )
+                raise BrowserInitializationError(
+                    f"Remote browser not ready. State: {browser_state}"
+                )
+            if self._config.verbose:
+                print(f"[Browser] Connected to remote server at {self._remote_config.url} (HTTP)")
+
+        self._running = True
+
+    async def send_command(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 30.0
+    ) -> Any:
+        """
+        Send a command and await its result.
+
+        Args:
+            method: Command method name
+            params: Command parameters
+            timeout: Timeout in seconds (LOCAL mode; remote transports use
+                the RemoteConfig timeouts)
+
+        Returns:
+            Command result
+        """
+        if self._ipc is not None:
+            return await self._ipc.send(method, params, timeout)
+
+        transport = self._ws or self._http
+        if transport is None:
+            raise RuntimeError("Browser not initialized. Call initialize() first.")
+
+        tool_name = map_method_to_tool(method)
+        tool_params = map_params_for_http(params) if params else {}
+        if self._config.verbose:
+            print(f"[Browser] {'WebSocket' if self._ws else 'HTTP'}: {tool_name}", tool_params or "")
+
+        result = await transport.execute_tool(tool_name, tool_params)
+        return BrowserCore._normalize_remote_result(method, result)
+
+    async def batch(
+        self,
+        commands: Sequence[Union[BatchCommand, Tuple[str, Optional[Dict[str, Any]]]]],
+        timeout: float = 30.0
+    ) -> List[BatchResult]:
+        """
+        Send many commands concurrently and wait for all of them.
+
+        Every transport here multiplexes requests, so the commands are in
+        flight together. Errors are reported per command.
+
+        Args:
+            commands: BatchCommand objects or (method, params) pairs
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            One BatchResult per command, in order
+        """
+        normalized = [BrowserCore._coerce_batch_command(command) for command in commands]
+
+        async def run(command: BatchCommand) -> BatchResult:
+            try:
+                value = await asyncio.wait_for(
+                    self.send_command(command.method, command.params, timeout), timeout
+                )
+                return BatchResult(method=command.method, success=True, result=value)
+            except asyncio.TimeoutError:
+                return BatchResult(
+                    method=command.method,
+                    success=False,
+                    error=CommandTimeoutError(f"Command timeout: {command.method}")
+                )
+            except Exception as e:
+                return BatchResult(method=command.method, success=False, error=e)
+
+        return list(await asyncio.gather(*(run(command) for command in normalized)))
+
+    async def replay(self, func: Callable[..., Any], owner: Callable[[BrowserCore], Any], *args, **kwargs) -> Any:
+        """
+        Run synchronous SDK logic against this core.
+
+        ``func`` is called as ``func(owner(core), *args, **kwargs)`` where
+        ``core`` answers commands from results awaited so far. When it
+        needs a command that has not been sent yet, the command is awaited
+        on the async transport and ``func`` is run again from the start.
+        Methods needing more than ``_MAX_REPLAYED_COMMANDS`` commands are
+        finished by ``run_blocking`` instead, with the commands sent so far
+        answered from their results, so no command is sent twice and the
+        work stays linear in the number of commands. Suitable for SDK
+        methods that are pure apart from their commands, which holds for
+        BrowserCore, Browser and BrowserContext methods.
+
+        Args:
+            func: Unbound synchronous SDK method
+            owner: Builds the ``self`` for ``func`` from the replay core
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            ``func``'s return value
+        """
+        results: List[Tuple[bool, Any]] = []
+        while True:
+            core = _ReplayCore(self._mode, self._config, results)
+            try:
+                return func(owner(core), *args, **kwargs)
+            except _CommandNeeded as needed:
+                if len(results) >= _MAX_REPLAYED_COMMANDS:
+                    return await self._run_in_thread(func, owner, results, args, kwargs)
+                try:
+                    value = await self.send_command(needed.method, needed.params, needed.timeout)
+                    results.append((True, value))
+                except Exception as e:
+                    results.append((False, e))
+
+    async def run_blocking(self, func: Callable[..., Any], owner: Callable[[BrowserCore], Any], *args, **kwargs) -> Any:
+        """
+        Run synchronous SDK logic in a worker thread, sending its commands
+        over this core.
+
+        For long multi-command methods (like ``run_test``) where replaying
+        from the start for every command would repeat work.
+
+        Args:
+            func: Unbound synchronous SDK method
+            owner: Builds the ``self`` for ``func`` from the bridge core
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            ``func``'s return value
+        """
+        return await self._run_in_thread(func, owner, [], args, kwargs)
+
+    async def _run_in_thread(
+        self,
+        func: Callable[..., Any],
+        owner: Callable[[BrowserCore], Any],
+        results: List[Tuple[bool, Any]],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=_MAX_BLOCKING_WORKERS,
+                thread_name_prefix="owl_async_blocking"
+            )
+        loop = asyncio.get_running_loop()
+        core = _BlockingBridgeCore(self, loop, results)
+        return await loop.run_in_executor(
+            self._executor, lambda: func(owner(core), *args, **kwargs)
+        )
+
+    async def create_context(self, options: Any = None) -> Any:
+        """Create a new browser context (same parameters as BrowserCore.create_context)."""
+        return await self.replay(BrowserCore.create_context, lambda core: core, options)
+
+    async def release_context(self, context_id: str) -> None:
+        """Release a browser context."""
+        await self.send_command("releaseContext", {"context_id": context_id})
+
+    def is_running(self) -> bool:
+        """Check if browser connection is active."""
+        if not self._running:
+            return False
+        if self._ipc is not None:
+            return self._ipc.is_running()
+        return True
+
+    async def shutdown(self) -> None:
+        """Terminate the local browser or close the remote connection."""
+        self._running = False
+        for transport in (self._ipc, self._http, self._ws):
+            if transport is not None:
+                await transport.close()
+        self._ipc = self._http = self._ws = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -8,12 +8,13 @@ storage, and session state.
 import json
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from concurrent.futures import Future
 
 from .core import BrowserCore
 from .types import (
     ContextId,
+    BatchResult,
     Viewport,
     PageInfo,
     CleanLevel,
@@ -95,6 +96,37 @@ class BrowserContext:
         params = {"context_id": self._context_id, **kwargs}
         return self._core.send_command(method, params)
 
+    def batch(
+        self,
+        commands: List[Tuple[str, Dict[str, Any]]],
+        timeout: float = 30.0
+    ) -> List[BatchResult]:
+        """
+        Pipeline several raw commands for this context in one round-trip.
+
+        ``context_id`` is added to each command's params. See
+        BrowserCore.batch for transport details.
+
+        Args:
+            commands: (method, params) pairs
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            One BatchResult per command, in order
+
+        Example:
+            ```python
+            results = page.batch([
+                ("isVisible", {"selector": "#login"}),
+                ("isVisible", {"selector": "#signup"}),
+            ])
+            ```
+        """
+        return self._core.batch(
+            [(method, {"context_id": self._context_id, **(params or {})}) for method, params in commands],
+            timeout=timeout
+        )
+
     # ==================== NAVIGATION ====================
 
     def goto(self, url: str, wait_until: str = "load", timeout: int = 30000) -> None:
@@ -18,8 +18,9 @@ import time
 import uuid
 import atexit
 from pathlib import Path
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Sequence, Tuple, Union
 from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import queue
 
 from .types import (
@@ -36,10 +37,13 @@ from .types import (
     RemoteConfig,
     TransportMode,
     VmProfile,
+    BatchCommand,
+    BatchResult,
 )
 from .exceptions import (
     LicenseError,
     BrowserInitializationError,
+    CommandTimeoutError,
     is_action_result,
     throw_if_action_failed,
 )
@@ -47,6 +51,92 @@ from .http_client import HttpTransport, map_method_to_tool, map_params_for_http
 from .ws_client import WebSocketTransport
 
 
+class StderrScanner:
+    """
+    Scans browser stderr lines for the READY signal, the hardware
+    fingerprint and license errors.
+
+    Shared by the threaded and the asyncio process readers.
+    """
+
+    _LICENSE_ERROR = re.compile(
+        r'\[License\].*(?:Validation|validation).*[:]\s*(\w+)',
+        re.IGNORECASE
+    )
+    _LICENSE_FAILED = re.compile(
+        r'License validation failed:\s*(\w+)',
+        re.IGNORECASE
+    )
+    _FINGERPRINT = re.compile(
+        r'Hardware Fingerprint:\s*([a-f0-9]+)',
+        re.IGNORECASE
+    )
+    _ACTIVATION_FAILED = re.compile(
+        r'Failed to activate license:\s*(\w+)',
+        re.IGNORECASE
+    )
+    _LICENSE_REQUIRED = re.compile(
+        r'Owl Browser requires a valid license',
+        re.IGNORECASE
+    )
+
+    def __init__(self):
+        self.ready = False
+        self.fingerprint: Optional[str] = None
+
+    def feed(self, decoded: str) -> Optional[LicenseError]:
+        """
+        Scan one decoded stderr line.
+
+        Returns:
+            LicenseError if the line reports a license problem, else None
+        """
+        if 'READY' in decoded:
+            self.ready = True
+
+        # Check for hardware fingerprint
+        fp_match = self._FINGERPRINT.search(decoded)
+        if fp_match:
+            self.fingerprint = fp_match.group(1)
+
+        # Check for license errors
+        license_status = None
+        license_message = None
+
+        # Pattern 1: [License] Validation: status
+        match = self._LICENSE_ERROR.search(decoded)
+        if match:
+            status = match.group(1).lower()
+            if status not in ('ok', 'valid'):
+                license_status = status
+                license_message = f"License validation failed: {status}"
+
+        # Pattern 2: License validation failed: status
+        match = self._LICENSE_FAILED.search(decoded)
+        if match:
+            license_status = match.group(1).lower()
+            license_message = f"License validation failed: {license_status}"
+
+        # Pattern 3: Failed to activate license: status
+        match = self._ACTIVATION_FAILED.search(decoded)
+        if match:
+            license_status = match.group(1).lower()
+            license_message = f"Failed to activate license: {license_status}"
+
+        # Pattern 4: Generic license required message
+        if self._LICENSE_REQUIRED.search(decoded):
+            license_status = license_status or LicenseError.NOT_FOUND
+            license_message = license_message or "Owl Browser requires a valid license to run."
+
+        if license_status and license_message:
+            return LicenseError(
+                message=license_message,
+                status=license_status,
+                fingerprint=self.fingerprint
+            )
+        return None
+
+
 class BrowserCore:
     """
     Core browser process manager.
@@ -347,27 +437,7 @@ class BrowserCore:
 
     def _read_stderr(self):
         """Background thread to read stderr (logs)."""
-        # Patterns for detecting license errors
-        license_error_pattern = re.compile(
-            r'\[License\].*(?:Validation|validation).*[:]\s*(\w+)',
-            re.IGNORECASE
-        )
-        license_failed_pattern = re.compile(
-            r'License validation failed:\s*(\w+)',
-            re.IGNORECASE
-        )
-        fingerprint_pattern = re.compile(
-            r'Hardware Fingerprint:\s*([a-f0-9]+)',
-            re.IGNORECASE
-        )
-        activation_failed_pattern = re.compile(
-            r'Failed to activate license:\s*(\w+)',
-            re.IGNORECASE
-        )
-        license_required_pattern = re.compile(
-            r'Owl Browser requires a valid license',
-            re.IGNORECASE
-        )
+        scanner = StderrScanner()
 
         while self._running and self._process and self._process.stderr:
             try:
@@ -381,51 +451,18 @@ class BrowserCore:
                 if not decoded:
                     continue
 
+                license_error = scanner.feed(decoded)
+
                 # Check for READY signal in stderr too (some builds output it there)
-                if 'READY' in decoded:
+                if scanner.ready:
                     self._ready_event.set()
 
-                # Check for hardware fingerprint
-                fp_match = fingerprint_pattern.search(decoded)
-                if fp_match:
-                    self._hardware_fingerprint = fp_match.group(1)
-
-                # Check for license errors
-                license_status = None
-                license_message = None
-
-                # Pattern 1: [License] Validation: status
-                match = license_error_pattern.search(decoded)
-                if match:
-                    status = match.group(1).lower()
-                    if status not in ('ok', 'valid'):
-                        license_status = status
-                        license_message = f"License validation failed: {status}"
-
-                # Pattern 2: License validation failed: status
-                match = license_failed_pattern.search(decoded)
-                if match:
-                    license_status = match.group(1).lower()
-                    license_message = f"License validation failed: {license_status}"
-
-                # Pattern 3: Failed to activate license: status
-                match = activation_failed_pattern.search(decoded)
-                if match:
-                    license_status = match.group(1).lower()
-                    license_message = f"Failed to activate license: {license_status}"
-
-                # Pattern 4: Generic license required message
-                if license_required_pattern.search(decoded):
-                    license_status = license_status or LicenseError.NOT_FOUND
-                    license_message = license_message or "Owl Browser requires a valid license to run."
+                if scanner.fingerprint:
+                    self._hardware_fingerprint = scanner.fingerprint
 
                 # If we found a license error, set it and signal
-                if license_status and license_message:
-                    self._license_error = LicenseError(
-                        message=license_message,
-                        status=license_status,
-                        fingerprint=self._hardware_fingerprint
-                    )
+                if license_error:
+                    self._license_error = license_error
                     self._license_error_event.set()
                     # Don't break here - continue reading to capture more info
 
@@ -488,7 +525,8 @@ class BrowserCore:
         with self._lock:
             future = self._pending_commands.pop(cmd_id, None)
 
-        if future is None:
+        # Skip futures the caller cancelled (e.g. a timed-out batch entry)
+        if future is None or not future.set_running_or_notify_cancel():
             return
 
         if "error" in response:
@@ -577,14 +615,19 @@ class BrowserCore:
 
         # Execute via HTTP
         result = self._http_transport.execute_tool(tool_name, http_params)
+        return self._normalize_remote_result(method, result)
 
-        # Handle special cases where we need to extract specific fields
-        # The HTTP API returns full objects but SDK methods expect specific values
+    @staticmethod
+    def _normalize_remote_result(method: str, result: Any) -> Any:
+        """
+        Handle special cases where we need to extract specific fields.
+
+        The HTTP API returns full objects but SDK methods expect specific values.
+        """
         if method == "getCurrentURL" and isinstance(result, dict):
             return result.get("url", "")
         if method == "getPageTitle" and isinstance(result, dict):
             return result.get("title", "")
-
         return result
 
     def _send_command_websocket(
@@ -616,14 +659,7 @@ class BrowserCore:
 
         # Execute via WebSocket
         result = self._ws_transport.execute_tool(tool_name, ws_params)
-
-        # Handle special cases where we need to extract specific fields
-        if method == "getCurrentURL" and isinstance(result, dict):
-            return result.get("url", "")
-        if method == "getPageTitle" and isinstance(result, dict):
-            return result.get("title", "")
-
-        return result
+        return self._normalize_remote_result(method, result)
 
     def send_command_async(
         self,
@@ -635,8 +671,9 @@ class BrowserCore:
 
         Thread-safe. Use future.result() to get the result.
 
-        Note: For REMOTE mode, this still executes synchronously in a thread pool
-        because HTTP requests are inherently blocking.
+        Note: For REMOTE mode over HTTP, this still executes in a thread pool
+        because HTTP requests are inherently blocking. WebSocket requests are
+        pipelined on the shared connection.
 
         Args:
             method: Command method name
@@ -645,51 +682,189 @@ class BrowserCore:
         Returns:
             Future that will contain the result
         """
-        # Remote mode - wrap HTTP call in Future
-        if self._mode == ConnectionMode.REMOTE:
-            future: Future = Future()
+        return self.send_commands_async([(method, params)])[0]
 
-            def execute():
-                try:
-                    result = self._send_command_remote(method, params)
-                    future.set_result(result)
-                except Exception as e:
-                    future.set_exception(e)
+    def send_commands_async(
+        self,
+        commands: Sequence[Union[BatchCommand, Tuple[str, Optional[Dict[str, Any]]]]]
+    ) -> List[Future]:
+        """
+        Pipeline several commands without waiting for their responses.
 
-            self._executor.submit(execute)
-            return future
+        - LOCAL: all commands are written to stdin in a single write; the
+          browser answers them by id as they complete.
+        - WEBSOCKET: all request frames are sent in a single write on the
+          multiplexed connection.
+        - HTTP: commands are issued concurrently over the keep-alive pool
+          (the server has no batch endpoint).
 
-        # Local mode - use IPC
-        if not self._process or not self._running:
-            future = Future()
-            future.set_exception(RuntimeError("Browser not initialized. Call initialize() first."))
-            return future
+        Args:
+            commands: BatchCommand objects or (method, params) pairs
 
-        with self._lock:
-            self._command_id += 1
-            cmd_id = self._command_id
+        Returns:
+            One Future per command, in order
+        """
+        normalized = [self._coerce_batch_command(command) for command in commands]
+        if not normalized:
+            return []
 
-            command = {"id": cmd_id, "method": method}
-            if params:
-                command.update(params)
+        # Remote mode - hand the whole batch to the transport
+        if self._mode == ConnectionMode.REMOTE:
+            return self._send_commands_remote(normalized)
 
-            future = Future()
-            self._pending_commands[cmd_id] = future
+        # Local mode - use IPC
+        if not self._process or not self._running:
+            futures = []
+            for _ in normalized:
+                future: Future = Future()
+                future.set_exception(RuntimeError("Browser not initialized. Call initialize() first."))
+                futures.append(future)
+            return futures
+
+        futures = []
+        cmd_ids = []
+        lines = []
+        with self._lock:
+            for command in normalized:
+                self._command_id += 1
+                cmd_id = self._command_id
+
+                payload = {"id": cmd_id, "method": command.method}
+                if command.params:
+                    payload.update(command.params)
+
+                future = Future()
+                self._pending_commands[cmd_id] = future
+                future.add_done_callback(
+                    lambda done, cid=cmd_id: done.cancelled() and self._forget_command(cid)
+                )
+                futures.append(future)
+                cmd_ids.append(cmd_id)
+                # Use separators without spaces - browser parser expects "key":"value" not "key": "value"
+                lines.append(json.dumps(payload, separators=(',', ':')) + "\n")
 
-        # Send command
+        # Send all commands in one write
         try:
-            # Use separators without spaces - browser parser expects "key":"value" not "key": "value"
-            command_str = json.dumps(command, separators=(',', ':')) + "\n"
             if self._config.verbose:
-                print(f"[Browser] Sending: {method}", params or "")
-            self._process.stdin.write(command_str.encode('utf-8'))
+                for command in normalized:
+                    print(f"[Browser] Sending: {command.method}", command.params or "")
+            self._process.stdin.write("".join(lines).encode('utf-8'))
             self._process.stdin.flush()
         except Exception as e:
             with self._lock:
-                self._pending_commands.pop(cmd_id, None)
-            future.set_exception(RuntimeError(f"Failed to send command: {e}"))
+                for cmd_id in cmd_ids:
+                    self._pending_commands.pop(cmd_id, None)
+            for future in futures:
+                if not future.done():
+                    future.set_exception(RuntimeError(f"Failed to send command: {e}"))
+
+        return futures
+
+    def _forget_command(self, cmd_id: int):
+        """Stop tracking a local command whose future was cancelled."""
+        with self._lock:
+            self._pending_commands.pop(cmd_id, None)
+
+    def _send_commands_remote(self, commands: List[BatchCommand]) -> List[Future]:
+        """Pipeline commands over the remote transport, normalizing results."""
+        transport = self._ws_transport or self._http_transport
+        if not transport:
+            raise RuntimeError("Browser not initialized. Call initialize() first.")
 
-        return future
+        calls = []
+        for command in commands:
+            tool_name = map_method_to_tool(command.method)
+            tool_params = map_params_for_http(command.params) if command.params else {}
+            if self._config.verbose:
+                print(f"[Browser] Pipelined: {tool_name}", tool_params or "")
+            calls.append((tool_name, tool_params))
+
+        return [
+            self._chain_remote_future(future, command.method)
+            for future, command in zip(transport.execute_tools_pipelined(calls), commands)
+        ]
+
+    def _chain_remote_future(self, source: Future, method: str) -> Future:
+        """Wrap a transport future so its result is normalized for ``method``."""
+        target: Future = Future()
+
+        def on_source_done(done: Future):
+            if done.cancelled():
+                target.cancel()
+            elif not target.set_running_or_notify_cancel():
+                return
+            elif done.exception() is not None:
+                target.set_exception(done.exception())
+            else:
+                target.set_result(self._normalize_remote_result(method, done.result()))
+
+        def on_target_done(done: Future):
+            # Cancelling the caller's future stops tracking the request
+            if done.cancelled():
+                source.cancel()
+
+        target.add_done_callback(on_target_done)
+        source.add_done_callback(on_source_done)
+        return target
+
+    @staticmethod
+    def _coerce_batch_command(
+        command: Union[BatchCommand, Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> BatchCommand:
+        """Accept BatchCommand objects or (method, params) pairs."""
+        if isinstance(command, BatchCommand):
+            return command
+        method, params = command
+        return BatchCommand(method=method, params=params or {})
+
+    def batch(
+        self,
+        commands: Sequence[Union[BatchCommand, Tuple[str, Optional[Dict[str, Any]]]]],
+        timeout: float = 30.0
+    ) -> List[BatchResult]:
+        """
+        Send many commands at once and wait for all of them.
+
+        Commands are pipelined (see send_commands_async), so a batch of N
+        commands costs about one round-trip instead of N. Errors are
+        reported per command and never abort the rest of the batch.
+
+        Example:
+            ```python
+            results = core.batch([
+                ("isVisible", {"context_id": ctx, "selector": "#login"}),
+                ("isVisible", {"context_id": ctx, "selector": "#signup"}),
+            ])
+            visible = [r.result for r in results if r.success]
+            ```
+
+        Args:
+            commands: BatchCommand objects or (method, params) pairs
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            One BatchResult per command, in order
+        """
+        normalized = [self._coerce_batch_command(command) for command in commands]
+        futures = self.send_commands_async(normalized)
+        deadline = time.monotonic() + timeout
+
+        results = []
+        for command, future in zip(normalized, futures):
+            try:
+                remaining = max(0.0, deadline - time.monotonic())
+                value = future.result(timeout=remaining)
+                results.append(BatchResult(method=command.method, success=True, result=value))
+            except FutureTimeoutError:
+                future.cancel()
+                results.append(BatchResult(
+                    method=command.method,
+                    success=False,
+                    error=CommandTimeoutError(f"Command timeout: {command.method}")
+                ))
+            except Exception as e:
+                results.append(BatchResult(method=command.method, success=False, error=e))
+        return results
 
     def create_context(self, options: Optional[ContextOptions] = None) -> ContextInfo:
         """Create a new browser context.
@@ -20,7 +20,8 @@ import time
 import random
 import threading
 import http.client
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from urllib.parse import urlparse
 
@@ -253,6 +254,11 @@ class HttpTransport:
         # Concurrency limiter
         self._semaphore = Semaphore(max_concurrent)
 
+        # Workers for pipelined tool calls (created on first use)
+        self._max_concurrent = max_concurrent
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
         # Parse URL for connection pool
         parsed = urlparse(self._base_url)
         use_ssl = parsed.scheme == "https"
@@ -281,7 +287,27 @@ class HttpTransport:
                 claims=config.jwt.claims
             )
 
-    def _get_auth_token(self) -> str:
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        """SSL context used for HTTPS connections."""
+        return self._ssl_context
+
+    @property
+    def timeout(self) -> float:
+        """Request timeout in seconds."""
+        return self._timeout
+
+    @property
+    def long_timeout(self) -> float:
+        """Request timeout in seconds for LONG_RUNNING_TOOLS."""
+        return self._long_timeout
+
+    @property
+    def retry_config(self) -> RetryConfig:
+        """Retry policy for failed requests."""
+        return self._retry_config
+
+    def get_auth_token(self) -> str:
         """Get the current authentication token (static or JWT)."""
         if self._jwt_manager:
             return self._jwt_manager.get_token()
@@ -331,7 +357,7 @@ class HttpTransport:
         }
 
         if require_auth:
-            headers["Authorization"] = f"Bearer {self._get_auth_token()}"
+            headers["Authorization"] = f"Bearer {self.get_auth_token()}"
 
         body = None
         if data is not None:
@@ -364,7 +390,7 @@ class HttpTransport:
                         # Return connection to pool before handling error
                         self._pool.return_connection(conn)
                         conn = None
-                        return self._handle_http_error_status(
+                        return self.handle_error_status(
                             response.status, response_data, path
                         )
 
@@ -417,7 +443,7 @@ class HttpTransport:
         if last_error:
             raise OwlBrowserError(f"Request failed: {last_error}")
 
-    def _handle_http_error_status(
+    def handle_error_status(
         self,
         status: int,
         response_body: str,
@@ -488,6 +514,9 @@ class HttpTransport:
 
     def close(self):
         """Close the transport and all pooled connections."""
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         self._pool.close_all()
 
     def health_check(self) -> Dict[str, Any]:
@@ -561,6 +590,37 @@ class HttpTransport:
 
         return result
 
+    def execute_tools_pipelined(
+        self,
+        calls: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[Future]:
+        """
+        Start several tool calls without waiting for their responses.
+
+        The HTTP server has no batch endpoint, so calls are issued
+        concurrently over the keep-alive connection pool, bounded by the
+        transport's concurrency limit. A batch of N calls therefore costs
+        roughly ceil(N / max_concurrent) round-trips instead of N.
+
+        Args:
+            calls: (tool_name, params) pairs
+
+        Returns:
+            One Future per call, in order
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrent,
+                    thread_name_prefix="owl_http"
+                )
+            executor = self._executor
+
+        return [
+            executor.submit(self.execute_tool, tool_name, params)
+            for tool_name, params in calls
+        ]
+
     def send_raw_command(self, command: Dict[str, Any]) -> Any:
         """
         Send a raw command to the browser (advanced usage).
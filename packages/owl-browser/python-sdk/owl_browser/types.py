@@ -1190,6 +1190,35 @@ class ContextInfo:
     has_profile: bool = False
 
 
+# ==================== BATCH TYPES ====================
+
+@dataclass
+class BatchCommand:
+    """A single command in a pipelined batch (see BrowserCore.batch)"""
+    method: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of one command in a batch.
+
+    Failures are reported per command instead of aborting the batch,
+    so callers can inspect every result once the batch completes.
+    """
+    method: str
+    success: bool
+    result: Any = None
+    error: Optional[Exception] = None
+
+    def unwrap(self) -> Any:
+        """Return the result, re-raising the command's error if it failed."""
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
 # ==================== FLOW TYPES ====================
 
 class ConditionOperator(str, Enum):
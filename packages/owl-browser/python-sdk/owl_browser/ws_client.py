@@ -26,8 +26,9 @@ import socket
 import ssl
 import struct
 import random
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from queue import Queue, Empty
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 
 from .types import RemoteConfig, AuthMode, ReconnectConfig
@@ -64,6 +65,7 @@ class PendingRequest:
     event: threading.Event = field(default_factory=threading.Event)
     result: Any = None
     error: Optional[str] = None
+    future: Optional[Future] = None  # Set for pipelined requests
 
 
 class WebSocketTransport:
@@ -188,7 +190,32 @@ class WebSocketTransport:
             self._host = url
             self._port = 443 if self._use_ssl else 80
 
-    def _get_auth_token(self) -> str:
+    @property
+    def host(self) -> str:
+        """Server host name."""
+        return self._host
+
+    @property
+    def port(self) -> int:
+        """Server port."""
+        return self._port
+
+    @property
+    def use_ssl(self) -> bool:
+        """Whether the connection uses TLS."""
+        return self._use_ssl
+
+    @property
+    def timeout(self) -> float:
+        """Request timeout in seconds."""
+        return self._timeout
+
+    @property
+    def long_timeout(self) -> float:
+        """Request timeout in seconds for LONG_RUNNING_TOOLS."""
+        return self._long_timeout
+
+    def get_auth_token(self) -> str:
         """Get the current authentication token (static or JWT)."""
         if self._jwt_manager:
             return self._jwt_manager.get_token()
@@ -196,7 +223,7 @@ class WebSocketTransport:
             return self._static_token
         raise OwlBrowserError("No authentication token available")
 
-    def _create_websocket_key(self) -> str:
+    def create_websocket_key(self) -> str:
         """Generate a random WebSocket key for handshake."""
         return base64.b64encode(os.urandom(16)).decode('utf-8')
 
@@ -208,7 +235,7 @@ class WebSocketTransport:
             True if handshake successful
         """
         # Generate WebSocket key
-        ws_key = self._create_websocket_key()
+        ws_key = self.create_websocket_key()
 
         # Build handshake request
         handshake = (
@@ -218,7 +245,7 @@ class WebSocketTransport:
             f"Connection: Upgrade\r\n"
             f"Sec-WebSocket-Key: {ws_key}\r\n"
             f"Sec-WebSocket-Version: 13\r\n"
-            f"Authorization: Bearer {self._get_auth_token()}\r\n"
+            f"Authorization: Bearer {self.get_auth_token()}\r\n"
             f"\r\n"
         )
 
@@ -315,13 +342,20 @@ class WebSocketTransport:
 
         # Clear pending requests
         with self._lock:
-            for req in self._pending_requests.values():
-                req.error = "Connection closed"
-                req.event.set()
+            pending = list(self._pending_requests.values())
             self._pending_requests.clear()
+        for req in pending:
+            req.error = "Connection closed"
+            req.event.set()
+            if req.future and not req.future.done():
+                req.future.set_exception(OwlBrowserError("Connection closed"))
 
     def _send_frame(self, opcode: int, payload: bytes):
         """Send a WebSocket frame."""
+        self._socket.sendall(self._build_frame(opcode, payload))
+
+    def _build_frame(self, opcode: int, payload: bytes) -> bytes:
+        """Build a masked client WebSocket frame."""
         # Build frame header
         frame = bytearray()
 
@@ -349,7 +383,7 @@ class WebSocketTransport:
             masked_payload[i] = payload[i] ^ mask_key[i % 4]
         frame.extend(masked_payload)
 
-        self._socket.sendall(bytes(frame))
+        return bytes(frame)
 
     def _recv_frame(self) -> tuple:
         """
@@ -563,13 +597,24 @@ class WebSocketTransport:
             return
 
         with self._lock:
-            if req_id in self._pending_requests:
-                req = self._pending_requests[req_id]
-                if data.get("success", False):
-                    req.result = data.get("result")
-                else:
-                    req.error = data.get("error", "Unknown error")
-                req.event.set()
+            req = self._pending_requests.get(req_id)
+            if req is None:
+                return
+            if data.get("success", False):
+                req.result = data.get("result")
+            else:
+                req.error = data.get("error", "Unknown error")
+            req.event.set()
+
+        # Resolve pipelined requests outside the lock: done callbacks
+        # unregister the request and need to take it themselves.
+        if req.future and req.future.set_running_or_notify_cancel():
+            if req.error:
+                req.future.set_exception(
+                    OwlBrowserError(f"Tool execution failed: {req.error}")
+                )
+            else:
+                req.future.set_result(self._unwrap_result(req.result))
 
     def _next_request_id(self) -> int:
         """Get the next request ID."""
@@ -652,11 +697,63 @@ class WebSocketTransport:
         """
         long_running = tool_name in self.LONG_RUNNING_TOOLS
         result = self._send_request(tool_name, params, long_running)
+        return self._unwrap_result(result)
 
-        # Handle nested response format from browser IPC
-        if isinstance(result, dict) and "id" in result and "result" in result:
-            result = result["result"]
+    def execute_tools_pipelined(
+        self,
+        calls: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[Future]:
+        """
+        Send several tool calls without waiting for their responses.
 
+        All request frames are written with a single send, and each
+        response is matched back to its call by request id. Per-call
+        timeouts are left to the caller (``future.result(timeout)``);
+        cancelling a future stops tracking its request.
+
+        Args:
+            calls: (tool_name, params) pairs
+
+        Returns:
+            One Future per call, in order, resolving to the tool result
+            or raising OwlBrowserError
+        """
+        if not self._connected:
+            raise OwlBrowserError("Not connected to WebSocket server")
+
+        futures: List[Future] = []
+        frames = bytearray()
+        for tool_name, params in calls:
+            req_id = self._next_request_id()
+            future: Future = Future()
+            with self._lock:
+                self._pending_requests[req_id] = PendingRequest(id=req_id, future=future)
+            future.add_done_callback(
+                lambda _f, rid=req_id: self._forget_request(rid)
+            )
+            message = {"id": req_id, "method": tool_name, "params": params or {}}
+            frames.extend(self._build_frame(WS_OPCODE_TEXT, json.dumps(message).encode('utf-8')))
+            futures.append(future)
+
+        try:
+            self._socket.sendall(bytes(frames))
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(OwlBrowserError(f"Failed to send requests: {e}"))
+
+        return futures
+
+    def _forget_request(self, req_id: int):
+        """Stop tracking a pipelined request once its future is done."""
+        with self._lock:
+            self._pending_requests.pop(req_id, None)
+
+    @staticmethod
+    def _unwrap_result(result: Any) -> Any:
+        """Handle nested response format from browser IPC."""
+        if isinstance(result, dict) and "id" in result and "result" in result:
+            return result["result"]
         return result
 
     def health_check(self) -> Dict[str, Any]: